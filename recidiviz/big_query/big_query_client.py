@@ -18,8 +18,11 @@
 tables and views.
 """
 import abc
+import hashlib
 import logging
-from typing import List, Optional, Iterator, Dict, Callable
+import re
+from concurrent import futures
+from typing import List, Optional, Iterator, Dict, Callable, Tuple, Set
 
 from google.cloud import bigquery, exceptions
 
@@ -29,6 +32,18 @@ from recidiviz.utils import metadata
 
 _clients_by_project_id = {}
 
+# Label set on a materialized view table recording a fingerprint of the view query and the last-modified times of the
+# source tables that the table was built from.
+MATERIALIZATION_FINGERPRINT_LABEL = 'materialization_fingerprint'
+
+# Functions whose results can change between runs of a query even when none of the tables it reads from have changed
+_NON_DETERMINISTIC_FUNCTIONS_REGEX = re.compile(
+    r'\b(CURRENT_DATE|CURRENT_DATETIME|CURRENT_TIME|CURRENT_TIMESTAMP|RAND|GENERATE_UUID|SESSION_USER)\b',
+    re.IGNORECASE)
+
+# Matches fully-qualified table and view references, e.g. `project.dataset.table`
+_TABLE_REFERENCE_REGEX = re.compile(r'`([\w-]+\.\w+\.\w+)`')
+
 
 def client(project_id: str) -> bigquery.Client:
     global _clients_by_project_id
@@ -187,14 +202,19 @@ class BigQueryClient:
     def export_query_results_to_cloud_storage(self, export_configs: List[ExportQueryConfig]) -> None:
         """Exports the queries to cloud storage according to the given configs.
 
-        This is a three-step process. First, each query is executed and the entire result is loaded into a temporary
-        table in BigQuery. Then, for each table, the contents are exported to the cloud storage bucket in the format
-        specified in the config. Finally, once all exports are complete, the temporary tables are deleted.
+        This is a three-step process for each export. First, the query is executed and the entire result is loaded
+        into a temporary table in BigQuery. Then, the contents of that table are exported to the cloud storage bucket
+        in the format specified in the config. Finally, the temporary table is deleted.
 
         The query output must be materialized in a table first because BigQuery doesn't support exporting a view or
         query directly.
 
-        This runs synchronously and waits for the jobs to complete.
+        Each export runs through these steps independently and concurrently with the others, so that one slow query
+        does not hold up the extraction of results that are already available. A failed export is retried, and does
+        not prevent the other exports from completing.
+
+        This runs synchronously and waits for the jobs to complete. If any export still fails after retrying, the error
+        from the first failed export is raised once all other exports have finished.
 
         Args:
             export_configs: List of queries along with how to export their results.
@@ -221,13 +241,28 @@ class BigQueryClient:
             A QueryJob which will contain the results once the query is complete.
         """
 
+    @abc.abstractmethod
+    def paged_read(self, query_job: bigquery.QueryJob, page_size: int) -> Iterator[List[bigquery.table.Row]]:
+        """Reads the result set from the given query job one page at a time, following the page tokens returned by
+        BigQuery. While the caller is working on one page, the next page is fetched in the background, so at most two
+        pages of results are held in memory at any given time.
+
+        Args:
+            query_job: the query job from which to read results.
+            page_size: the maximum number of rows to read in per page.
+
+        Returns:
+            An iterator over the pages of the result set, where each page is a list of rows.
+        """
+
     @abc.abstractmethod
     def paged_read_and_process(self,
                                query_job: bigquery.QueryJob,
                                page_size: int,
                                process_fn: Callable[[bigquery.table.Row], None]) -> None:
         """Reads the given result set from the given query job in pages to limit how many rows are read into memory at
-        any given time, processing the results of each row with the given callable.
+        any given time, processing the results of each row with the given callable. The next page is prefetched while
+        the rows of the current page are being processed.
 
         Args:
             query_job: the query job from which to process results.
@@ -349,6 +384,10 @@ class BigQueryClient:
         set. The resulting table is put in the same project and dataset as the view, and it overwrites any previous
         materialization of the view.
 
+        The materialization is skipped if neither the view query nor any of the tables it reads from have changed
+        since the table was last materialized. Views whose queries (or the queries of any views they read from) use
+        non-deterministic functions such as CURRENT_DATE are always rematerialized.
+
         Args:
             view: The BigQueryView to materialize into a table.
         """
@@ -399,6 +438,9 @@ class BigQueryClientImpl(BigQueryClient):
     # Location of the GCP project that must be the same for bigquery.Client calls
     LOCATION = 'US'
 
+    # Number of times a single export in export_query_results_to_cloud_storage is attempted before it is failed
+    EXPORT_QUERY_RESULTS_MAX_ATTEMPTS = 2
+
     def __init__(self, project_id: Optional[str] = None):
         if not project_id:
             project_id = metadata.project_id()
@@ -536,8 +578,46 @@ class BigQueryClientImpl(BigQueryClient):
 
     def export_query_results_to_cloud_storage(self,
                                               export_configs: List[ExportQueryConfig]) -> None:
-        query_jobs = []
-        for export_config in export_configs:
+        logging.info('Starting [%d] query result exports.', len(export_configs))
+
+        failed_exports: List[Tuple[ExportQueryConfig, Exception]] = []
+        with futures.ThreadPoolExecutor() as executor:
+            future_to_config = {
+                executor.submit(self._export_query_results_with_retry, export_config): export_config
+                for export_config in export_configs
+            }
+
+            for future in futures.as_completed(future_to_config):
+                export_config = future_to_config[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    logging.error('Failed to export query results to [%s] due to error: %s',
+                                  export_config.output_uri, e)
+                    failed_exports.append((export_config, e))
+
+        if failed_exports:
+            logging.error('Failed [%d] of [%d] query result exports.', len(failed_exports), len(export_configs))
+            _, first_error = failed_exports[0]
+            raise first_error
+
+        logging.info('Completed [%d] query result exports.', len(export_configs))
+
+    def _export_query_results_with_retry(self, export_config: ExportQueryConfig) -> None:
+        for attempt in range(1, self.EXPORT_QUERY_RESULTS_MAX_ATTEMPTS + 1):
+            try:
+                self._export_query_results(export_config)
+                return
+            except exceptions.GoogleCloudError as e:
+                if attempt == self.EXPORT_QUERY_RESULTS_MAX_ATTEMPTS:
+                    raise
+                logging.warning('Attempt [%d] to export query results to [%s] failed, retrying: %s',
+                                attempt, export_config.output_uri, e)
+
+    def _export_query_results(self, export_config: ExportQueryConfig) -> None:
+        """Runs the query for a single export into its intermediate table, extracts that table to cloud storage as soon
+        as the query completes, and then deletes the intermediate table."""
+        try:
             query_job = self.create_table_from_query_async(
                 dataset_id=export_config.intermediate_dataset_id,
                 table_id=export_config.intermediate_table_name,
@@ -545,17 +625,8 @@ class BigQueryClientImpl(BigQueryClient):
                 query_parameters=export_config.query_parameters,
                 overwrite=True
             )
-            if query_job is not None:
-                query_jobs.append(query_job)
-
-        logging.info('Waiting on [%d] query jobs to finish', len(query_jobs))
-        for job in query_jobs:
-            job.result()
+            query_job.result()
 
-        logging.info('Completed [%d] query jobs.', len(query_jobs))
-
-        extract_jobs = []
-        for export_config in export_configs:
             extract_job = self.export_table_to_cloud_storage_async(
                 self.dataset_ref_for_id(export_config.intermediate_dataset_id),
                 export_config.intermediate_table_name,
@@ -563,18 +634,14 @@ class BigQueryClientImpl(BigQueryClient):
                 export_config.output_format
             )
             if extract_job is not None:
-                extract_jobs.append(extract_job)
-
-        logging.info('Waiting on [%d] extract jobs to finish', len(extract_jobs))
-        for job in extract_jobs:
-            job.result()
-        logging.info('Completed [%d] extract jobs.', len(extract_jobs))
-
-        logging.info('Deleting [%d] temporary intermediate tables.', len(export_configs))
-        for export_config in export_configs:
-            self.delete_table(dataset_id=export_config.intermediate_dataset_id,
-                              table_id=export_config.intermediate_table_name)
-        logging.info('Done deleting temporary intermediate tables.')
+                extract_job.result()
+        finally:
+            try:
+                self.delete_table(dataset_id=export_config.intermediate_dataset_id,
+                                  table_id=export_config.intermediate_table_name)
+            except exceptions.NotFound:
+                logging.warning('Temporary table [%s] in dataset [%s] was not found for deletion.',
+                                export_config.intermediate_table_name, export_config.intermediate_dataset_id)
 
     def delete_table(self, dataset_id: str, table_id: str):
         dataset_ref = self.dataset_ref_for_id(dataset_id)
@@ -593,29 +660,42 @@ class BigQueryClientImpl(BigQueryClient):
             job_config=job_config,
         )
 
+    def paged_read(self, query_job: bigquery.QueryJob, page_size: int) -> Iterator[List[bigquery.table.Row]]:
+        row_iterator: bigquery.table.RowIterator = query_job.result(page_size=page_size)
+        pages = iter(row_iterator.pages)
+
+        def _read_next_page() -> Optional[List[bigquery.table.Row]]:
+            # Advancing the pages iterator issues the request for the page at the next page token
+            page = next(pages, None)
+            return list(page) if page is not None else None
+
+        with futures.ThreadPoolExecutor(max_workers=1) as executor:
+            next_page_future = executor.submit(_read_next_page)
+            while True:
+                page_rows = next_page_future.result()
+                if page_rows is None:
+                    return
+
+                next_page_future = executor.submit(_read_next_page)
+                yield page_rows
+
     def paged_read_and_process(self,
                                query_job: bigquery.QueryJob,
                                page_size: int,
                                process_fn: Callable[[bigquery.table.Row], None]) -> None:
         logging.info("Querying for first page of results to perform %s...", process_fn.__name__)
 
-        start_index = 0
-
-        while True:
-            page_rows: bigquery.table.RowIterator = query_job.result(max_results=page_size, start_index=start_index)
+        rows_processed = 0
+        for page_rows in self.paged_read(query_job, page_size):
             logging.debug("Retrieved result set from query page of size [%d] starting at index [%d]",
-                          page_size, start_index)
+                          len(page_rows), rows_processed)
 
-            rows_processed = 0
             for row in page_rows:
                 process_fn(row)
-                rows_processed += 1
 
-            logging.debug("Processed [%d] rows from query page starting at index [%d]", rows_processed, start_index)
-            if rows_processed == 0:
-                break
-
-            start_index += rows_processed
+            logging.debug("Processed [%d] rows from query page starting at index [%d]",
+                          len(page_rows), rows_processed)
+            rows_processed += len(page_rows)
 
     def copy_view(self,
                   view: BigQueryView,
@@ -729,6 +809,12 @@ class BigQueryClientImpl(BigQueryClient):
         if view.materialized_view_table_id is None:
             raise ValueError("Trying to materialize a view that does not have a set materialized_view_table_id.")
 
+        fingerprint = self._materialization_fingerprint(view)
+        if fingerprint is not None and fingerprint == self._materialized_table_fingerprint(view):
+            logging.info("Skipping materialization of %s: the view query and its source tables have not changed since "
+                         "the table %s was last materialized.", view.view_id, view.materialized_view_table_id)
+            return
+
         logging.info("Materializing %s into a table with the table_id: %s",
                      view.view_id, view.materialized_view_table_id)
 
@@ -736,6 +822,75 @@ class BigQueryClientImpl(BigQueryClient):
             view.dataset_id, view.materialized_view_table_id, view.select_query, query_parameters=[], overwrite=True)
         create_job.result()
 
+        if fingerprint is not None:
+            table = self.get_table(self.dataset_ref_for_id(view.dataset_id), view.materialized_view_table_id)
+            table.labels = {MATERIALIZATION_FINGERPRINT_LABEL: fingerprint}
+            self.client.update_table(table, ['labels'])
+
+    def _materialization_fingerprint(self, view: BigQueryView) -> Optional[str]:
+        """Returns a fingerprint of the view's query, the queries of all of the views it reads from (directly or
+        through other views), and the last-modified times of all of the tables the view reads from, or None if the
+        results of the view may change even when none of these have changed."""
+        nested_view_queries: Dict[str, str] = {}
+        if self._query_is_non_deterministic(view.view_query, visited_table_addresses=set(),
+                                            nested_view_queries=nested_view_queries):
+            return None
+
+        # A dry run resolves all nested views down to the tables they read from, without running the query
+        job_config = bigquery.QueryJobConfig()
+        job_config.dry_run = True
+        job_config.use_query_cache = False
+        dry_run_job = self.client.query(query=view.select_query, location=self.LOCATION, job_config=job_config)
+
+        referenced_tables = dry_run_job.referenced_tables
+        if not referenced_tables:
+            return None
+
+        fingerprint = hashlib.sha1(view.view_query.encode())
+        # Redefining a nested view does not change the modified time of any table, so its query has to be hashed too
+        for table_address, nested_view_query in sorted(nested_view_queries.items()):
+            fingerprint.update(f'{table_address}:{nested_view_query}'.encode())
+        for table_ref in sorted(referenced_tables, key=str):
+            table = self.client.get_table(table_ref)
+            if table.modified is None:
+                return None
+            fingerprint.update(f'{table_ref}:{table.modified.isoformat()}'.encode())
+
+        return fingerprint.hexdigest()
+
+    def _query_is_non_deterministic(self, query: str, visited_table_addresses: Set[str],
+                                    nested_view_queries: Dict[str, str]) -> bool:
+        """Returns whether the query, or the query of any view it references, uses a non-deterministic function. The
+        query of every view reached along the way is recorded in nested_view_queries, keyed by table address."""
+        if _NON_DETERMINISTIC_FUNCTIONS_REGEX.search(query):
+            return True
+
+        for table_address in _TABLE_REFERENCE_REGEX.findall(query):
+            if table_address in visited_table_addresses:
+                continue
+            visited_table_addresses.add(table_address)
+
+            table = self.client.get_table(table_address)
+            if not table.view_query:
+                continue
+            nested_view_queries[table_address] = table.view_query
+            if self._query_is_non_deterministic(table.view_query, visited_table_addresses, nested_view_queries):
+                return True
+
+        return False
+
+    def _materialized_table_fingerprint(self, view: BigQueryView) -> Optional[str]:
+        """Returns the fingerprint recorded on the view's materialized table, if the table exists."""
+        if view.materialized_view_table_id is None:
+            return None
+
+        try:
+            table = self.get_table(self.dataset_ref_for_id(view.dataset_id), view.materialized_view_table_id)
+        except exceptions.NotFound:
+            return None
+
+        return (table.labels or {}).get(MATERIALIZATION_FINGERPRINT_LABEL)
+
     def create_table_with_schema(self, dataset_id, table_id, schema_fields: List[bigquery.SchemaField]) -> \
             bigquery.Table:
         dataset_ref = self.dataset_ref_for_id(dataset_id)
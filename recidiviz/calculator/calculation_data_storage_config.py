@@ -17,14 +17,17 @@
 """Calculation data storage configuration."""
 
 # The maximum number days of output that should be stored in a dataflow metrics table before being moved to cold storage
-from typing import Dict, Type
+from typing import Dict, List, Type
+
+import attr
 
 from recidiviz.calculator.pipeline.incarceration.metrics import IncarcerationAdmissionMetric, \
-    IncarcerationPopulationMetric, IncarcerationReleaseMetric
-from recidiviz.calculator.pipeline.program.metrics import ProgramReferralMetric, ProgramParticipationMetric
+    IncarcerationPopulationMetric, IncarcerationReleaseMetric, IncarcerationMetric
+from recidiviz.calculator.pipeline.program.metrics import ProgramReferralMetric, ProgramParticipationMetric, \
+    ProgramMetric
 from recidiviz.calculator.pipeline.recidivism.metrics import ReincarcerationRecidivismCountMetric, \
-    ReincarcerationRecidivismRateMetric
-from recidiviz.calculator.pipeline.supervision.metrics import \
+    ReincarcerationRecidivismRateMetric, ReincarcerationRecidivismMetric
+from recidiviz.calculator.pipeline.supervision.metrics import SupervisionMetric, \
     SupervisionPopulationMetric, SupervisionRevocationMetric, SupervisionRevocationAnalysisMetric, \
     SupervisionRevocationViolationTypeAnalysisMetric, SupervisionSuccessMetric, \
     SuccessfulSupervisionSentenceDaysServedMetric, SupervisionCaseComplianceMetric, SupervisionTerminationMetric
@@ -58,3 +61,57 @@ DATAFLOW_METRICS_TO_TABLES: Dict[Type[RecidivizMetric], str] = {
     SuccessfulSupervisionSentenceDaysServedMetric: 'successful_supervision_sentence_days_served_metrics',
     SupervisionTerminationMetric: 'supervision_termination_metrics'
 }
+
+# The table in the incremental metrics dataset that stores the people whose metrics were recalculated by each
+# incremental Dataflow job
+INCREMENTAL_CHANGED_PERSONS_TABLE: str = 'incremental_changed_persons'
+
+# A map from each calculation pipeline to the base class of the metrics it produces
+DATAFLOW_PIPELINES_TO_METRIC_CLASSES: Dict[str, Type[RecidivizMetric]] = {
+    'incarceration': IncarcerationMetric,
+    'program': ProgramMetric,
+    'recidivism': ReincarcerationRecidivismMetric,
+    'supervision': SupervisionMetric,
+    'combined': RecidivizMetric
+}
+
+
+def incremental_dataflow_metrics_dataset(dataflow_metrics_dataset: str) -> str:
+    """Returns the dataset where incremental Dataflow jobs write their output before it is merged into the tables in
+    the given |dataflow_metrics_dataset|."""
+    return f'{dataflow_metrics_dataset}_incremental'
+
+
+def dataflow_metric_tables_for_pipeline(pipeline: str) -> List[str]:
+    """Returns the names of the tables where the output of the given calculation pipeline is stored."""
+    pipeline_metric_class = DATAFLOW_PIPELINES_TO_METRIC_CLASSES.get(pipeline)
+
+    if not pipeline_metric_class:
+        raise ValueError(f"Unexpected pipeline {pipeline}")
+
+    return [table_id for metric_class, table_id in DATAFLOW_METRICS_TO_TABLES.items()
+            if issubclass(metric_class, pipeline_metric_class)]
+
+
+def dataflow_metric_tables_without_person_id(pipeline: str) -> List[str]:
+    """Returns the names of the tables of the given calculation pipeline that store metrics without a person_id, whose
+    rows cannot be attributed to the people who contributed to them."""
+    pipeline_tables = dataflow_metric_tables_for_pipeline(pipeline)
+
+    return [table_id for metric_class, table_id in DATAFLOW_METRICS_TO_TABLES.items()
+            if table_id in pipeline_tables and 'person_id' not in attr.fields_dict(metric_class)]
+
+
+def validate_pipeline_supports_incremental_runs(pipeline: str) -> None:
+    """Raises a ValueError if the output of an incremental run of the given calculation pipeline cannot be merged into
+    its metric tables.
+
+    The output of an incremental run replaces the metrics of the people it recalculates, so every metric the pipeline
+    writes must have a person_id. Metrics without one cannot be removed for the recalculated people, and the
+    incremental run only counts those people towards them.
+    """
+    tables_without_person_id = dataflow_metric_tables_without_person_id(pipeline)
+
+    if tables_without_person_id:
+        raise ValueError(f"Incremental runs are not supported for the {pipeline} pipeline, which writes metrics "
+                         f"without a person_id to the tables: {tables_without_person_id}.")
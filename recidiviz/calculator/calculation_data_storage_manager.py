@@ -20,24 +20,32 @@ Run locally with the following command:
 
     python -m recidiviz.calculator.calculation_data_storage_manager \
         --project_id [PROJECT_ID]
-        --function_to_execute [cold_storage_export, update_schemas]
+        --function_to_execute [cold_storage_export, update_schemas, merge_incremental_metrics]
+        [--job_id [JOB_ID] --pipeline [PIPELINE]]
 
 """
 import argparse
 import logging
 import sys
 from http import HTTPStatus
+from typing import List
 
 import flask
 
 from recidiviz.big_query.big_query_client import BigQueryClientImpl
 from recidiviz.calculator.calculation_data_storage_config import DATAFLOW_METRICS_COLD_STORAGE_DATASET, \
-    MAX_DAYS_IN_DATAFLOW_METRICS_TABLE, DATAFLOW_METRICS_TO_TABLES
+    MAX_DAYS_IN_DATAFLOW_METRICS_TABLE, DATAFLOW_METRICS_TO_TABLES, INCREMENTAL_CHANGED_PERSONS_TABLE, \
+    dataflow_metric_tables_for_pipeline, incremental_dataflow_metrics_dataset, \
+    validate_pipeline_supports_incremental_runs
 from recidiviz.calculator.query.state.dataset_config import DATAFLOW_METRICS_DATASET
 from recidiviz.utils.auth import authenticate_request
 from recidiviz.utils.environment import GCP_PROJECT_STAGING, GCP_PROJECT_PRODUCTION
 from recidiviz.utils.metadata import local_project_id_override
 
+# The columns that identify the output of a single job for a given metric, as read by the
+# most_recent_job_id_by_metric_and_state_code view
+_DATAFLOW_METRICS_PARTITION_COLUMNS = ['state_code', 'metric_type', 'year', 'month', 'metric_period_months']
+
 calculation_data_storage_manager_blueprint = flask.Blueprint('calculation_data_storage_manager', __name__)
 
 
@@ -110,20 +118,117 @@ def update_dataflow_metric_tables_schemas() -> None:
     """For each table that stores Dataflow metric output, ensures that all attributes on the corresponding metric are
     present in the table in BigQuery."""
     bq_client = BigQueryClientImpl()
-    dataflow_metrics_dataset_id = DATAFLOW_METRICS_DATASET
-    dataflow_metrics_dataset_ref = bq_client.dataset_ref_for_id(dataflow_metrics_dataset_id)
 
-    bq_client.create_dataset_if_necessary(dataflow_metrics_dataset_ref)
+    # The output of incremental jobs is staged in tables with the same schemas as the metric tables
+    for dataflow_metrics_dataset_id in [DATAFLOW_METRICS_DATASET,
+                                        incremental_dataflow_metrics_dataset(DATAFLOW_METRICS_DATASET)]:
+        dataflow_metrics_dataset_ref = bq_client.dataset_ref_for_id(dataflow_metrics_dataset_id)
 
-    for metric_class, table_id in DATAFLOW_METRICS_TO_TABLES.items():
-        schema_for_metric_class = metric_class.bq_schema_for_metric_table()
+        bq_client.create_dataset_if_necessary(dataflow_metrics_dataset_ref)
 
-        if bq_client.table_exists(dataflow_metrics_dataset_ref, table_id):
-            # Add any missing fields to the table's schema
-            bq_client.add_missing_fields_to_schema(dataflow_metrics_dataset_id, table_id, schema_for_metric_class)
-        else:
-            # Create a table with this schema
-            bq_client.create_table_with_schema(dataflow_metrics_dataset_id, table_id, schema_for_metric_class)
+        for metric_class, table_id in DATAFLOW_METRICS_TO_TABLES.items():
+            schema_for_metric_class = metric_class.bq_schema_for_metric_table()
+
+            if bq_client.table_exists(dataflow_metrics_dataset_ref, table_id):
+                # Add any missing fields to the table's schema
+                bq_client.add_missing_fields_to_schema(dataflow_metrics_dataset_id, table_id, schema_for_metric_class)
+            else:
+                # Create a table with this schema
+                bq_client.create_table_with_schema(dataflow_metrics_dataset_id, table_id, schema_for_metric_class)
+
+
+def merge_incremental_dataflow_metrics(job_id: str,
+                                       pipeline: str,
+                                       dataflow_metrics_dataset: str = DATAFLOW_METRICS_DATASET) -> None:
+    """Merges the output of the incremental Dataflow job with the given |job_id| into the metric tables of the given
+    |pipeline|.
+
+    Dashboards read the output of the most recent job for each state_code, metric_type and metric period. For each of
+    these partitions, the metrics of the people recalculated by the incremental job are replaced by the metrics the
+    job produced for them, which are attributed to the job that produced the rest of the partition. Partitions that
+    have not yet been populated by a full pipeline run are left untouched.
+
+    All statements run in a single transaction that also clears the staged output of the job, so that a retried merge
+    does not apply the output twice.
+
+    Raises a ValueError for pipelines that write metrics without a person_id, whose output cannot be merged this way.
+    """
+    validate_pipeline_supports_incremental_runs(pipeline)
+
+    bq_client = BigQueryClientImpl()
+    project_id = bq_client.project_id
+    incremental_dataset = incremental_dataflow_metrics_dataset(dataflow_metrics_dataset)
+
+    changed_person_ids_query = f"SELECT person_id FROM " \
+                               f"`{project_id}.{incremental_dataset}.{INCREMENTAL_CHANGED_PERSONS_TABLE}` " \
+                               f"WHERE job_id = '{job_id}'"
+
+    table_ids = dataflow_metric_tables_for_pipeline(pipeline)
+    metric_classes_by_table_id = {table_id: metric_class
+                                  for metric_class, table_id in DATAFLOW_METRICS_TO_TABLES.items()}
+
+    latest_job_statements: List[str] = []
+    merge_statements: List[str] = []
+
+    for table_id in table_ids:
+        schema = metric_classes_by_table_id[table_id].bq_schema_for_metric_table()
+        columns = [field.name for field in schema]
+        partition_columns = [column for column in _DATAFLOW_METRICS_PARTITION_COLUMNS if column in columns]
+
+        metrics_table = f"`{project_id}.{dataflow_metrics_dataset}.{table_id}`"
+        incremental_table = f"`{project_id}.{incremental_dataset}.{table_id}`"
+        latest_jobs_table = f"latest_jobs_{table_id}"
+
+        latest_job_statements.append(f"""
+        CREATE TEMP TABLE {latest_jobs_table} AS
+        SELECT partition_key, job_id, created_on FROM (
+            SELECT partition_key, job_id, created_on,
+                ROW_NUMBER() OVER (PARTITION BY partition_key ORDER BY job_id DESC) AS recency_rank
+            FROM (SELECT DISTINCT {_partition_key('metrics', partition_columns)} AS partition_key, job_id, created_on
+                  FROM {metrics_table} metrics)
+        )
+        WHERE recency_rank = 1;""")
+
+        inserted_columns = [f'latest_jobs.{column}' if column in ('job_id', 'created_on') else f'incremental.{column}'
+                            for column in columns]
+
+        merge_statements.append(f"""
+        DELETE FROM {metrics_table} metrics
+        WHERE person_id IN ({changed_person_ids_query})
+        AND EXISTS (SELECT 1 FROM {latest_jobs_table} latest_jobs
+                    WHERE latest_jobs.partition_key = {_partition_key('metrics', partition_columns)}
+                    AND latest_jobs.job_id = metrics.job_id);
+
+        INSERT INTO {metrics_table} ({', '.join(columns)})
+        SELECT {', '.join(inserted_columns)}
+        FROM {incremental_table} incremental
+        JOIN {latest_jobs_table} latest_jobs
+        ON latest_jobs.partition_key = {_partition_key('incremental', partition_columns)}
+        WHERE incremental.job_id = '{job_id}';
+
+        DELETE FROM {incremental_table} WHERE job_id = '{job_id}';""")
+
+    merge_script = ''.join(latest_job_statements) + """
+
+        BEGIN TRANSACTION;""" + ''.join(merge_statements) + f"""
+
+        DELETE FROM `{project_id}.{incremental_dataset}.{INCREMENTAL_CHANGED_PERSONS_TABLE}`
+        WHERE job_id = '{job_id}';
+
+        COMMIT TRANSACTION;
+    """
+
+    logging.info("Merging the output of incremental job %s into the %s metric tables.", job_id, pipeline)
+
+    merge_job = bq_client.run_query_async(merge_script)
+
+    # Wait for the merge to complete
+    merge_job.result()
+
+
+def _partition_key(table_alias: str, partition_columns: List[str]) -> str:
+    """Returns a NULL-safe expression identifying the partition of each row of the table with the given alias."""
+    return "TO_JSON_STRING(STRUCT(" + ', '.join(f'{table_alias}.{column}' for column in partition_columns) + "))"
 
 
 def parse_arguments(argv):
@@ -138,8 +243,16 @@ def parse_arguments(argv):
     parser.add_argument('--function_to_execute',
                         dest='function_to_execute',
                         type=str,
-                        choices=['cold_storage_export', 'update_schemas'],
+                        choices=['cold_storage_export', 'update_schemas', 'merge_incremental_metrics'],
                         required=True)
+    parser.add_argument('--job_id',
+                        dest='job_id',
+                        type=str,
+                        help='The id of the incremental job to merge, for merge_incremental_metrics.')
+    parser.add_argument('--pipeline',
+                        dest='pipeline',
+                        type=str,
+                        help='The pipeline of the incremental job to merge, for merge_incremental_metrics.')
 
     return parser.parse_known_args(argv)
 
@@ -153,3 +266,5 @@ if __name__ == '__main__':
             move_old_dataflow_metrics_to_cold_storage()
         elif known_args.function_to_execute == 'update_schemas':
             update_dataflow_metric_tables_schemas()
+        elif known_args.function_to_execute == 'merge_incremental_metrics':
+            merge_incremental_dataflow_metrics(known_args.job_id, known_args.pipeline)
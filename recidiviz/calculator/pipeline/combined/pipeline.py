@@ -0,0 +1,462 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2020 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Runs the incarceration, recidivism, supervision and program calculations in a single pipeline. See
+recidiviz/tools/run_calculation_pipelines.py for details on how to run.
+
+Each of the single-metric pipelines loads and hydrates its own copy of a person's entities from BigQuery. This pipeline
+loads and hydrates every entity type once, groups them by person once, and then fans each person out to the identifier
+and calculator steps of every requested calculation. The metrics are written to the same tables that the single-metric
+pipelines write to.
+"""
+import argparse
+import copy
+import datetime
+import logging
+from typing import Any, Dict, List, Optional, Set, Type
+
+import apache_beam as beam
+import attr
+from apache_beam.options.pipeline_options import SetupOptions, PipelineOptions
+from apache_beam.pvalue import AsDict
+from apache_beam.typehints import with_input_types, with_output_types
+
+from recidiviz.calculator.calculation_data_storage_config import DATAFLOW_METRICS_TO_TABLES, \
+    incremental_dataflow_metrics_dataset
+from recidiviz.calculator.pipeline.incarceration import pipeline as incarceration_pipeline
+from recidiviz.calculator.pipeline.incarceration.metrics import IncarcerationMetricType
+from recidiviz.calculator.pipeline.program import pipeline as program_pipeline
+from recidiviz.calculator.pipeline.program.metrics import ProgramMetricType
+from recidiviz.calculator.pipeline.recidivism import pipeline as recidivism_pipeline
+from recidiviz.calculator.pipeline.recidivism.metrics import ReincarcerationRecidivismMetricType
+from recidiviz.calculator.pipeline.supervision import pipeline as supervision_pipeline
+from recidiviz.calculator.pipeline.supervision.metrics import SupervisionMetricType
+from recidiviz.calculator.pipeline.utils.beam_utils import ConvertDictToKVTuple, RecidivizMetricWritableDict, \
+    WriteIncrementalChangedPersons
+from recidiviz.calculator.pipeline.utils.entity_hydration_utils import SetSentencesOnSentenceGroup, \
+    SetViolationResponseOnIncarcerationPeriod, SetViolationOnViolationsResponse, ConvertSentencesToStateSpecificType
+from recidiviz.calculator.pipeline.utils.extractor_utils import BuildRootEntity
+from recidiviz.calculator.pipeline.utils.incarceration_period_utils import PreProcessedIncarcerationPeriods
+from recidiviz.calculator.pipeline.utils.execution_utils import select_all_by_person_query, \
+    incremental_run_person_id_filter_query
+from recidiviz.calculator.pipeline.utils.metric_utils import RecidivizMetricType
+from recidiviz.calculator.pipeline.utils.pipeline_args_utils import add_shared_pipeline_arguments
+from recidiviz.calculator.query.state.views.reference.incarceration_period_judicial_district_association import \
+    INCARCERATION_PERIOD_JUDICIAL_DISTRICT_ASSOCIATION_VIEW_NAME
+from recidiviz.calculator.query.state.views.reference.persons_to_recent_county_of_residence import \
+    PERSONS_TO_RECENT_COUNTY_OF_RESIDENCE_VIEW_NAME
+from recidiviz.calculator.query.state.views.reference.ssvr_to_agent_association import \
+    SSVR_TO_AGENT_ASSOCIATION_VIEW_NAME
+from recidiviz.calculator.query.state.views.reference.supervision_period_judicial_district_association import \
+    SUPERVISION_PERIOD_JUDICIAL_DISTRICT_ASSOCIATION_VIEW_NAME
+from recidiviz.calculator.query.state.views.reference.supervision_period_to_agent_association import \
+    SUPERVISION_PERIOD_TO_AGENT_ASSOCIATION_VIEW_NAME
+from recidiviz.calculator.query.state.views.reference.us_mo_sentence_statuses import US_MO_SENTENCE_STATUSES_VIEW_NAME
+from recidiviz.persistence.database.schema.state import schema
+from recidiviz.persistence.entity.entity_utils import get_single_state_code
+from recidiviz.persistence.entity.state import entities
+
+INCARCERATION = 'incarceration'
+RECIDIVISM = 'recidivism'
+SUPERVISION = 'supervision'
+PROGRAM = 'program'
+
+# The metric types produced by each calculation in this pipeline
+CALCULATION_METRIC_TYPES: Dict[str, Type[RecidivizMetricType]] = {
+    INCARCERATION: IncarcerationMetricType,
+    RECIDIVISM: ReincarcerationRecidivismMetricType,
+    SUPERVISION: SupervisionMetricType,
+    PROGRAM: ProgramMetricType,
+}
+
+# The keys of the grouped person entities that are sent to the identifier of each calculation. These match the keys
+# that each of the single-metric pipelines groups on.
+CALCULATION_ENTITY_KEYS: Dict[str, List[str]] = {
+    INCARCERATION: ['person',
+                    'sentence_groups',
+                    'incarceration_period_judicial_district_association'],
+    RECIDIVISM: ['person',
+                 'incarceration_periods'],
+    SUPERVISION: ['person',
+                  'assessments',
+                  'incarceration_periods',
+                  'supervision_periods',
+                  'supervision_sentences',
+                  'incarceration_sentences',
+                  'violation_responses',
+                  'supervision_contacts',
+                  'supervision_period_judicial_district_association'],
+    PROGRAM: ['person',
+              'program_assignments',
+              'assessments',
+              'supervision_periods'],
+}
+
+# The keys of the grouped person entities whose entities are modified by the identifier of each calculation. Each
+# calculation gets its own copy of these entities, so that the changes made by one identifier are never seen by
+# another. The person's incarceration_periods are instead pre-processed once and shared, see
+# SplitPersonEntitiesByCalculation.
+CALCULATION_MUTATED_ENTITY_KEYS: Dict[str, List[str]] = {
+    # Backedges to the sentences are added to the periods hanging off of the sentence groups, and the incarceration
+    # periods among them are pre-processed by the identifier
+    INCARCERATION: ['sentence_groups'],
+    RECIDIVISM: [],
+    # Violations on the responses are normalized for some states
+    SUPERVISION: ['violation_responses'],
+    PROGRAM: [],
+}
+
+# The calculations whose identifiers accept the pre-processed versions of the person's incarceration_periods
+CALCULATIONS_WITH_PRE_PROCESSED_INCARCERATION_PERIODS: Set[str] = {RECIDIVISM, SUPERVISION}
+
+
+def calculations_for_metric_types(metric_types: Set[str]) -> List[str]:
+    """Returns the calculations that produce at least one of the given metric types, in the order they are defined in
+    CALCULATION_METRIC_TYPES."""
+    return [calculation for calculation, metric_type_enum in CALCULATION_METRIC_TYPES.items()
+            if 'ALL' in metric_types or any(metric_type.value in metric_types for metric_type in metric_type_enum)]
+
+
+@with_input_types(beam.typehints.Tuple[int, Dict[str, Any]], beam.typehints.List[str])
+@with_output_types(beam.typehints.Tuple[int, Dict[str, Any]])
+class SplitPersonEntitiesByCalculation(beam.DoFn):
+    """Splits the entities grouped for a person into one output per calculation, each tagged with the calculation name
+    and containing only the entities that calculation's identifier expects."""
+
+    # pylint: disable=arguments-differ
+    def process(self, element, calculations):
+        """Yields a TaggedOutput for each calculation in |calculations|.
+
+        The person's incarceration_periods are validated and sorted once, and the resulting
+        PreProcessedIncarcerationPeriods are shared by the identifiers that accept them. Each calculation receives its
+        own deep copy of the entities its identifier modifies (see CALCULATION_MUTATED_ENTITY_KEYS), and shares all
+        other entities. This keeps the output of each calculation identical to the output of its single-metric
+        pipeline.
+        """
+        person_id, person_entities = element
+
+        incarceration_periods = list(person_entities.get('incarceration_periods', []))
+
+        pre_processed_incarceration_periods = None
+        if incarceration_periods and CALCULATIONS_WITH_PRE_PROCESSED_INCARCERATION_PERIODS.intersection(calculations):
+            pre_processed_incarceration_periods = PreProcessedIncarcerationPeriods(
+                get_single_state_code(incarceration_periods), incarceration_periods)
+
+        for calculation in calculations:
+            calculation_entities = {
+                key: (copy.deepcopy(list(person_entities.get(key, [])))
+                      if key in CALCULATION_MUTATED_ENTITY_KEYS[calculation]
+                      else list(person_entities.get(key, [])))
+                for key in CALCULATION_ENTITY_KEYS[calculation]
+            }
+
+            if pre_processed_incarceration_periods and \
+                    calculation in CALCULATIONS_WITH_PRE_PROCESSED_INCARCERATION_PERIODS:
+                calculation_entities['pre_processed_incarceration_periods'] = [pre_processed_incarceration_periods]
+
+            yield beam.pvalue.TaggedOutput(calculation, (person_id, calculation_entities))
+
+    def to_runner_api_parameter(self, _):
+        pass  # Passing unused abstract method.
+
+
+def get_arg_parser() -> argparse.ArgumentParser:
+    """Returns the parser for the command-line arguments for this pipeline."""
+    parser = argparse.ArgumentParser()
+
+    # Parse arguments
+    add_shared_pipeline_arguments(parser, include_calculation_limit_args=True)
+
+    metric_type_options: List[str] = [
+        metric_type.value
+        for metric_type_enum in CALCULATION_METRIC_TYPES.values()
+        for metric_type in metric_type_enum
+    ]
+
+    metric_type_options.append('ALL')
+
+    parser.add_argument('--metric_types',
+                        dest='metric_types',
+                        type=str,
+                        nargs='+',
+                        choices=metric_type_options,
+                        help='A list of the types of metric to calculate.',
+                        default={'ALL'})
+
+    return parser
+
+
+def run(apache_beam_pipeline_options: PipelineOptions,
+        data_input: str,
+        reference_input: str,
+        output: str,
+        calculation_month_count: int,
+        metric_types: List[str],
+        state_code: Optional[str],
+        calculation_end_month: Optional[str],
+        person_filter_ids: Optional[List[int]],
+        incremental_lookback_days: Optional[int] = None):
+    """Runs the combined calculation pipeline."""
+
+    # Workaround to load SQLAlchemy objects at start of pipeline. This is necessary because the BuildRootEntity
+    # function tries to access attributes of relationship properties on the SQLAlchemy room_schema_class before they
+    # have been loaded. However, if *any* SQLAlchemy objects have been instantiated, then the relationship properties
+    # are loaded and their attributes can be successfully accessed.
+    _ = schema.StatePerson()
+
+    apache_beam_pipeline_options.view_as(SetupOptions).save_main_session = True
+
+    # Get pipeline job details
+    all_pipeline_options = apache_beam_pipeline_options.get_all_options()
+
+    input_dataset = all_pipeline_options['project'] + '.' + data_input
+    reference_dataset = all_pipeline_options['project'] + '.' + reference_input
+
+    person_id_filter_set = set(person_filter_ids) if person_filter_ids else None
+
+    # Incremental runs only recalculate metrics for the people whose entities have changed
+    person_id_filter_query = incremental_run_person_id_filter_query(
+        'combined', input_dataset, state_code, metric_types, incremental_lookback_days)
+
+    # Get the type of metric to calculate
+    metric_types_set = set(metric_types)
+
+    calculations = calculations_for_metric_types(metric_types_set)
+
+    with beam.Pipeline(options=apache_beam_pipeline_options) as p:
+        def load_root_entities(label: str, root_entity_class: Type[entities.Entity], build_related_entities: bool):
+            return p | label >> BuildRootEntity(dataset=input_dataset,
+                                                root_entity_class=root_entity_class,
+                                                unifying_id_field=entities.StatePerson.get_class_id_name(),
+                                                build_related_entities=build_related_entities,
+                                                unifying_id_field_filter_set=person_id_filter_set,
+                                                unifying_id_field_filter_query=person_id_filter_query,
+                                                state_code=state_code)
+
+        def load_reference_kv(label: str, view_name: str, key: str, state_code_filter: Optional[str]):
+            query = select_all_by_person_query(reference_dataset, view_name, state_code_filter, person_id_filter_set,
+                                               person_id_filter_query=person_id_filter_query)
+
+            return (p
+                    | f"Read {label} table from BigQuery" >>
+                    beam.io.Read(beam.io.BigQuerySource(query=query, use_standard_sql=True))
+                    | f"Convert {label} table to KV tuples" >>
+                    beam.ParDo(ConvertDictToKVTuple(), key))
+
+        persons = load_root_entities('Load Persons', entities.StatePerson, True)
+        sentence_groups = load_root_entities('Load SentenceGroups', entities.StateSentenceGroup, True)
+        incarceration_sentences = load_root_entities(
+            'Load IncarcerationSentences', entities.StateIncarcerationSentence, True)
+        supervision_sentences = load_root_entities(
+            'Load SupervisionSentences', entities.StateSupervisionSentence, True)
+        incarceration_periods = load_root_entities(
+            'Load IncarcerationPeriods', entities.StateIncarcerationPeriod, True)
+        supervision_periods = load_root_entities('Load SupervisionPeriods', entities.StateSupervisionPeriod, True)
+        supervision_violations = load_root_entities(
+            'Load SupervisionViolations', entities.StateSupervisionViolation, True)
+        # TODO(2769): Don't bring this in as a root entity
+        supervision_violation_responses = load_root_entities(
+            'Load SupervisionViolationResponses', entities.StateSupervisionViolationResponse, True)
+        program_assignments = load_root_entities('Load ProgramAssignments', entities.StateProgramAssignment, True)
+        assessments = load_root_entities('Load Assessments', entities.StateAssessment, False)
+        supervision_contacts = load_root_entities('Load SupervisionContacts', entities.StateSupervisionContact, False)
+
+        if state_code is None or state_code == 'US_MO':
+            us_mo_sentence_status_rankings_as_kv = load_reference_kv(
+                'MO sentence status', US_MO_SENTENCE_STATUSES_VIEW_NAME, 'person_id', state_code)
+        else:
+            us_mo_sentence_status_rankings_as_kv = (
+                p | f"Generate empty MO statuses list for non-MO state run: {state_code} " >> beam.Create([]))
+
+        sentences_converted = (
+            {'incarceration_sentences': incarceration_sentences,
+             'supervision_sentences': supervision_sentences,
+             'sentence_statuses': us_mo_sentence_status_rankings_as_kv}
+            | 'Group sentences to the sentence statuses for that person' >> beam.CoGroupByKey()
+            | 'Convert to state-specific sentences' >>
+            beam.ParDo(ConvertSentencesToStateSpecificType()).with_outputs('incarceration_sentences',
+                                                                           'supervision_sentences')
+        )
+
+        # Set hydrated sentences on the corresponding sentence groups
+        sentence_groups_with_hydrated_sentences = (
+            {'sentence_groups': sentence_groups,
+             'incarceration_sentences': sentences_converted.incarceration_sentences,
+             'supervision_sentences': sentences_converted.supervision_sentences}
+            | 'Group sentences to sentence groups' >> beam.CoGroupByKey()
+            | 'Set hydrated sentences on sentence groups' >> beam.ParDo(SetSentencesOnSentenceGroup())
+        )
+
+        # Set the fully hydrated StateSupervisionViolation entities on the corresponding
+        # StateSupervisionViolationResponses
+        violation_responses_with_hydrated_violations = (
+            {'violations': supervision_violations,
+             'violation_responses': supervision_violation_responses}
+            | 'Group StateSupervisionViolationResponses to StateSupervisionViolations' >> beam.CoGroupByKey()
+            | 'Set hydrated StateSupervisionViolations on the StateSupervisionViolationResponses' >>
+            beam.ParDo(SetViolationOnViolationsResponse())
+        )
+
+        # Set the fully hydrated StateSupervisionViolationResponse entities on the corresponding
+        # StateIncarcerationPeriods
+        incarceration_periods_with_source_violations = (
+            {'incarceration_periods': incarceration_periods,
+             'violation_responses': violation_responses_with_hydrated_violations}
+            | 'Group StateIncarcerationPeriods to StateSupervisionViolationResponses' >> beam.CoGroupByKey()
+            | 'Set hydrated StateSupervisionViolationResponses on the StateIncarcerationPeriods' >>
+            beam.ParDo(SetViolationResponseOnIncarcerationPeriod())
+        )
+
+        ip_to_judicial_district_kv = load_reference_kv(
+            'incarceration_period to judicial_district association',
+            INCARCERATION_PERIOD_JUDICIAL_DISTRICT_ASSOCIATION_VIEW_NAME, 'person_id', state_code)
+
+        sp_to_judicial_district_kv = load_reference_kv(
+            'supervision_period to judicial_district association',
+            SUPERVISION_PERIOD_JUDICIAL_DISTRICT_ASSOCIATION_VIEW_NAME, 'person_id', state_code)
+
+        # Group each StatePerson with all of the entities needed by any of the calculations
+        person_entities = (
+            {'person': persons,
+             'sentence_groups': sentence_groups_with_hydrated_sentences,
+             'incarceration_period_judicial_district_association': ip_to_judicial_district_kv,
+             'incarceration_periods': incarceration_periods_with_source_violations,
+             'supervision_periods': supervision_periods,
+             'supervision_sentences': sentences_converted.supervision_sentences,
+             'incarceration_sentences': sentences_converted.incarceration_sentences,
+             'violation_responses': violation_responses_with_hydrated_violations,
+             'assessments': assessments,
+             'supervision_contacts': supervision_contacts,
+             'supervision_period_judicial_district_association': sp_to_judicial_district_kv,
+             'program_assignments': program_assignments}
+            | 'Group StatePerson to all entities' >> beam.CoGroupByKey()
+        )
+
+        person_entities_by_calculation = (
+            person_entities
+            | 'Split person entities by calculation' >>
+            beam.ParDo(SplitPersonEntitiesByCalculation(), calculations).with_outputs(*calculations)
+        )
+
+        # TODO(3602): Once we put state_code on StatePerson objects, we can update the
+        # persons_to_recent_county_of_residence query to have a state_code field, allowing us to also filter the
+        # output by state_code.
+        person_id_to_county_kv = load_reference_kv(
+            'person_id to county association', PERSONS_TO_RECENT_COUNTY_OF_RESIDENCE_VIEW_NAME, 'person_id', None)
+
+        ssvr_agent_associations_as_kv = load_reference_kv(
+            'SSVR to Agent', SSVR_TO_AGENT_ASSOCIATION_VIEW_NAME, 'supervision_violation_response_id', state_code)
+
+        supervision_period_to_agent_associations_as_kv = load_reference_kv(
+            'Supervision Period to Agent', SUPERVISION_PERIOD_TO_AGENT_ASSOCIATION_VIEW_NAME, 'supervision_period_id',
+            state_code)
+
+        # Add timestamp for local jobs
+        job_timestamp = datetime.datetime.now().strftime('%Y-%m-%d_%H_%M_%S.%f')
+        all_pipeline_options['job_timestamp'] = job_timestamp
+
+        metrics_by_calculation = []
+
+        if INCARCERATION in calculations:
+            metrics_by_calculation.append(
+                person_entities_by_calculation[INCARCERATION]
+                | 'Classify Incarceration Events' >>
+                beam.ParDo(incarceration_pipeline.ClassifyIncarcerationEvents(), AsDict(person_id_to_county_kv))
+                | 'Get Incarceration Metrics' >>
+                incarceration_pipeline.GetIncarcerationMetrics(
+                    pipeline_options=all_pipeline_options,
+                    metric_types=metric_types_set,
+                    calculation_end_month=calculation_end_month,
+                    calculation_month_count=calculation_month_count))
+
+        if RECIDIVISM in calculations:
+            metrics_by_calculation.append(
+                person_entities_by_calculation[RECIDIVISM]
+                | 'Classify Release Events' >>
+                beam.ParDo(recidivism_pipeline.ClassifyReleaseEvents(), AsDict(person_id_to_county_kv))
+                | 'Get Recidivism Metrics' >>
+                recidivism_pipeline.GetRecidivismMetrics(
+                    pipeline_options=all_pipeline_options,
+                    metric_types=metric_types_set))
+
+        if SUPERVISION in calculations:
+            metrics_by_calculation.append(
+                person_entities_by_calculation[SUPERVISION]
+                | 'Get SupervisionTimeBuckets' >>
+                beam.ParDo(supervision_pipeline.ClassifySupervisionTimeBuckets(),
+                           AsDict(ssvr_agent_associations_as_kv),
+                           AsDict(supervision_period_to_agent_associations_as_kv))
+                | 'Get Supervision Metrics' >>
+                supervision_pipeline.GetSupervisionMetrics(
+                    pipeline_options=all_pipeline_options,
+                    metric_types=metric_types_set,
+                    calculation_end_month=calculation_end_month,
+                    calculation_month_count=calculation_month_count))
+
+        if PROGRAM in calculations:
+            metrics_by_calculation.append(
+                person_entities_by_calculation[PROGRAM]
+                | 'Classify Program Assignments' >>
+                beam.ParDo(program_pipeline.ClassifyProgramAssignments(),
+                           AsDict(supervision_period_to_agent_associations_as_kv))
+                | 'Get Program Metrics' >>
+                program_pipeline.GetProgramMetrics(
+                    pipeline_options=all_pipeline_options,
+                    metric_types=metric_types_set,
+                    calculation_end_month=calculation_end_month,
+                    calculation_month_count=calculation_month_count))
+
+        if person_id_filter_set:
+            logging.warning("Non-empty person filter set - returning before writing metrics.")
+            return
+
+        if person_id_filter_query:
+            # Incremental runs write to the incremental metrics dataset, from which the output is merged into the
+            # metric tables once the job has completed
+            output = incremental_dataflow_metrics_dataset(output)
+
+            _ = (p | 'Write changed persons to BQ' >>
+                 WriteIncrementalChangedPersons(changed_person_ids_query=person_id_filter_query,
+                                                dataset=output,
+                                                pipeline_options=all_pipeline_options))
+
+        # The metric classes produced by the requested calculations, keyed by the value of their metric_type
+        calculated_metric_type_enums = tuple(CALCULATION_METRIC_TYPES[calculation] for calculation in calculations)
+        metric_classes_by_type = {}
+        for metric_class in DATAFLOW_METRICS_TO_TABLES:
+            metric_type = attr.fields_dict(metric_class)['metric_type'].default
+            if isinstance(metric_type, calculated_metric_type_enums):
+                metric_classes_by_type[metric_type.value] = metric_class
+
+        # Convert the metrics into a format that's writable to BQ
+        writable_metrics = (metrics_by_calculation
+                            | 'Flatten metrics' >> beam.Flatten()
+                            | 'Convert to dict to be written to BQ' >>
+                            beam.ParDo(RecidivizMetricWritableDict()).with_outputs(*metric_classes_by_type.keys()))
+
+        # Write the metrics to the output tables in BigQuery
+        for metric_type_value, metric_class in metric_classes_by_type.items():
+            table_id = DATAFLOW_METRICS_TO_TABLES[metric_class]
+
+            _ = (writable_metrics[metric_type_value]
+                 | f"Write {metric_type_value} metrics to BQ table: {table_id}" >>
+                 beam.io.WriteToBigQuery(
+                     table=table_id,
+                     dataset=output,
+                     create_disposition=beam.io.BigQueryDisposition.CREATE_NEVER,
+                     write_disposition=beam.io.BigQueryDisposition.WRITE_APPEND,
+                     method=beam.io.WriteToBigQuery.Method.FILE_LOADS
+                 ))
@@ -27,13 +27,13 @@ from typing import List, Dict, Tuple, Any, Type, Sequence, Optional
 
 from recidiviz.calculator.pipeline.incarceration.incarceration_event import \
     IncarcerationEvent, IncarcerationAdmissionEvent,\
-    IncarcerationReleaseEvent, IncarcerationStayEvent
+    IncarcerationReleaseEvent, IncarcerationStayEvent, IncarcerationStaySpanEvent
 from recidiviz.calculator.pipeline.incarceration.metrics import \
     IncarcerationMetricType, IncarcerationMetric, IncarcerationAdmissionMetric, IncarcerationPopulationMetric, \
     IncarcerationReleaseMetric
 from recidiviz.calculator.pipeline.utils.calculator_utils import last_day_of_month, relevant_metric_periods, \
     augmented_combo_for_calculations, get_calculation_month_lower_bound_date, include_in_historical_metrics, \
-    get_calculation_month_upper_bound_date, characteristics_dict_builder
+    get_calculation_month_upper_bound_date, characteristics_dict_builder, PersonCharacteristicsCache
 from recidiviz.calculator.pipeline.utils.metric_utils import \
     MetricMethodologyType
 from recidiviz.common.constants.state.state_incarceration_period import is_revocation_admission
@@ -83,8 +83,19 @@ def map_incarceration_combinations(person: StatePerson,
     metrics: List[Tuple[Dict[str, Any], Any]] = []
     periods_and_events: Dict[int, List[IncarcerationEvent]] = defaultdict()
 
+    person_characteristics_cache = PersonCharacteristicsCache(person=person, pipeline='incarceration')
+
     calculation_month_upper_bound = get_calculation_month_upper_bound_date(calculation_end_month)
 
+    calculation_month_lower_bound = get_calculation_month_lower_bound_date(
+        calculation_month_upper_bound, calculation_month_count)
+
+    incarceration_events = expand_stay_span_events(
+        incarceration_events,
+        include_stay_events=bool(metric_inclusions.get(IncarcerationMetricType.INCARCERATION_POPULATION)),
+        calculation_month_lower_bound=calculation_month_lower_bound,
+        calculation_month_upper_bound=calculation_month_upper_bound)
+
     # If the calculations include the current month, then we will calculate person-based metrics for each metric
     # period in METRIC_PERIOD_MONTHS ending with the current month
     include_metric_period_output = calculation_month_upper_bound == get_calculation_month_upper_bound_date(
@@ -107,9 +118,6 @@ def map_incarceration_combinations(person: StatePerson,
                     else:
                         periods_and_events[period] = [incarceration_event]
 
-    calculation_month_lower_bound = get_calculation_month_lower_bound_date(
-        calculation_month_upper_bound, calculation_month_count)
-
     for incarceration_event in incarceration_events:
         metric_type = METRIC_TYPES.get(type(incarceration_event))
         metric_class = METRIC_CLASSES.get((type(incarceration_event)))
@@ -122,7 +130,8 @@ def map_incarceration_combinations(person: StatePerson,
                 'No metric class mapped to incarceration event of type {}'.format(type(incarceration_event)))
 
         if metric_inclusions.get(metric_type):
-            characteristic_combo = characteristics_dict(person, incarceration_event, metric_class)
+            characteristic_combo = characteristics_dict(
+                person, incarceration_event, metric_class, person_characteristics_cache)
 
             metrics.extend(map_metric_combinations(
                 characteristic_combo, incarceration_event,
@@ -133,9 +142,31 @@ def map_incarceration_combinations(person: StatePerson,
     return metrics
 
 
+def expand_stay_span_events(incarceration_events: List[IncarcerationEvent],
+                            include_stay_events: bool,
+                            calculation_month_lower_bound: Optional[date],
+                            calculation_month_upper_bound: date) -> List[IncarcerationEvent]:
+    """Replaces each IncarcerationStaySpanEvent in |incarceration_events| with an IncarcerationStayEvent for each day of
+    the span that falls within the calculation months. Stay events only contribute to metrics for the day of the stay,
+    so days outside of the calculation months are never expanded. If |include_stay_events| is False, the spans are
+    dropped entirely."""
+    expanded_events: List[IncarcerationEvent] = []
+
+    for incarceration_event in incarceration_events:
+        if not isinstance(incarceration_event, IncarcerationStaySpanEvent):
+            expanded_events.append(incarceration_event)
+        elif include_stay_events:
+            expanded_events.extend(incarceration_event.stay_events(calculation_month_lower_bound,
+                                                                   calculation_month_upper_bound))
+
+    return expanded_events
+
+
 def characteristics_dict(person: StatePerson,
                          incarceration_event: IncarcerationEvent,
-                         metric_class: Type[IncarcerationMetric]) -> Dict[str, Any]:
+                         metric_class: Type[IncarcerationMetric],
+                         person_characteristics_cache: Optional[PersonCharacteristicsCache] = None) -> \
+        Dict[str, Any]:
     """Builds a dictionary that describes the characteristics of the person and event.
 
     Args:
@@ -143,6 +174,8 @@ def characteristics_dict(person: StatePerson,
         incarceration_event: the IncarcerationEvent we are picking characteristics from
         metric_class: The IncarcerationMetric provided determines which fields should be added to the characteristics
             dictionary
+        person_characteristics_cache: The PersonCharacteristicsCache shared across all of the person's events, if
+            available
     Returns:
         A dictionary populated with all relevant characteristics.
     """
@@ -153,7 +186,8 @@ def characteristics_dict(person: StatePerson,
                                                    metric_class=metric_class,
                                                    person=person,
                                                    event_date=event_date,
-                                                   include_person_attributes=True)
+                                                   include_person_attributes=True,
+                                                   person_characteristics_cache=person_characteristics_cache)
     return characteristics
 
 
@@ -19,14 +19,14 @@ import logging
 from datetime import date
 from typing import List, Optional, Any, Dict, Set, Union, Tuple
 
+import attr
 from dateutil.relativedelta import relativedelta
 from pydot import frozendict
 
 from recidiviz.calculator.pipeline.incarceration.incarceration_event import \
-    IncarcerationEvent, IncarcerationAdmissionEvent, IncarcerationReleaseEvent, IncarcerationStayEvent
+    IncarcerationEvent, IncarcerationAdmissionEvent, IncarcerationReleaseEvent, IncarcerationStaySpanEvent
 from recidiviz.calculator.pipeline.utils.execution_utils import list_of_dicts_to_dict_with_keys
-from recidiviz.calculator.pipeline.utils.incarceration_period_utils import \
-    prepare_incarceration_periods_for_calculations
+from recidiviz.calculator.pipeline.utils.incarceration_period_utils import PreProcessedIncarcerationPeriods
 from recidiviz.calculator.pipeline.utils.state_utils.state_calculation_config_manager import \
     get_pre_incarceration_supervision_type, get_post_incarceration_supervision_type
 from recidiviz.common.constants.state.state_incarceration_period import StateIncarcerationPeriodStatus, \
@@ -43,7 +43,7 @@ def find_incarceration_events(
     """Finds instances of admission or release from incarceration.
 
     Transforms the person's StateIncarcerationPeriods, which are connected to their StateSentenceGroups, into
-    IncarcerationAdmissionEvents, IncarcerationStayEvents, and IncarcerationReleaseEvents, representing admissions,
+    IncarcerationAdmissionEvents, IncarcerationStaySpanEvents, and IncarcerationReleaseEvents, representing admissions,
     stays in, and releases from incarceration in a state prison.
 
     Args:
@@ -73,39 +73,37 @@ def find_incarceration_events(
     incarceration_period_to_judicial_district = list_of_dicts_to_dict_with_keys(
         incarceration_period_judicial_district_association, key=StateIncarcerationPeriod.get_class_id_name())
 
+    # The periods are validated and sorted once, and shared by all of the collapsed versions used below
+    pre_processed_incarceration_periods = PreProcessedIncarcerationPeriods(state_code, incarceration_periods)
+
     incarceration_events.extend(find_all_stay_events(
-        state_code,
         incarceration_sentences,
         supervision_sentences,
-        incarceration_periods,
+        pre_processed_incarceration_periods,
         incarceration_period_to_judicial_district,
         county_of_residence))
 
     incarceration_events.extend(find_all_admission_release_events(
-        state_code,
         incarceration_sentences,
         supervision_sentences,
-        incarceration_periods,
+        pre_processed_incarceration_periods,
         county_of_residence))
 
     return incarceration_events
 
 
 def find_all_admission_release_events(
-        state_code: str,
         incarceration_sentences: List[StateIncarcerationSentence],
         supervision_sentences: List[StateSupervisionSentence],
-        original_incarceration_periods: List[StateIncarcerationPeriod],
+        pre_processed_incarceration_periods: PreProcessedIncarcerationPeriods,
         county_of_residence: Optional[str],
 ) -> List[Union[IncarcerationAdmissionEvent, IncarcerationReleaseEvent]]:
-    """Given the |original_incarceration_periods| generates and returns all IncarcerationAdmissionEvents and
+    """Given the |pre_processed_incarceration_periods| generates and returns all IncarcerationAdmissionEvents and
     IncarcerationReleaseEvents.
     """
     incarceration_events: List[Union[IncarcerationAdmissionEvent, IncarcerationReleaseEvent]] = []
 
-    incarceration_periods_for_admissions = prepare_incarceration_periods_for_calculations(
-        state_code,
-        original_incarceration_periods,
+    incarceration_periods_for_admissions = pre_processed_incarceration_periods.periods_for_calculations(
         collapse_transfers=True,
         collapse_temporary_custody_periods_with_revocation=True,
         collapse_transfers_with_different_pfi=True,
@@ -123,9 +121,7 @@ def find_all_admission_release_events(
         if admission_event:
             incarceration_events.append(admission_event)
 
-    incarceration_periods_for_releases = prepare_incarceration_periods_for_calculations(
-        state_code,
-        original_incarceration_periods,
+    incarceration_periods_for_releases = pre_processed_incarceration_periods.periods_for_calculations(
         collapse_transfers=True,
         collapse_temporary_custody_periods_with_revocation=True,
         collapse_transfers_with_different_pfi=True,
@@ -146,21 +142,18 @@ def find_all_admission_release_events(
 
 
 def find_all_stay_events(
-        state_code: str,
         incarceration_sentences: List[StateIncarcerationSentence],
         supervision_sentences: List[StateSupervisionSentence],
-        original_incarceration_periods: List[StateIncarcerationPeriod],
+        pre_processed_incarceration_periods: PreProcessedIncarcerationPeriods,
         incarceration_period_to_judicial_district: Dict[int, Dict[Any, Any]],
         county_of_residence: Optional[str],
-) -> List[IncarcerationStayEvent]:
-    """Given the |original_incarceration_periods| generates and returns all IncarcerationStayEvents based on the
-    final day relevant months.
+) -> List[IncarcerationStaySpanEvent]:
+    """Given the |pre_processed_incarceration_periods| generates and returns all IncarcerationStaySpanEvents covering
+    the days the person was incarcerated.
     """
-    incarceration_stay_events: List[IncarcerationStayEvent] = []
+    incarceration_stay_events: List[IncarcerationStaySpanEvent] = []
 
-    incarceration_periods = prepare_incarceration_periods_for_calculations(
-        state_code,
-        original_incarceration_periods,
+    incarceration_periods = pre_processed_incarceration_periods.periods_for_calculations(
         collapse_transfers=False,
         collapse_temporary_custody_periods_with_revocation=False,
         collapse_transfers_with_different_pfi=False,
@@ -191,9 +184,10 @@ def find_incarceration_stays(
         original_admission_reasons_by_period_id:
         Dict[int, Tuple[StateIncarcerationPeriodAdmissionReason, Optional[str]]],
         incarceration_period_to_judicial_district: Dict[int, Dict[Any, Any]],
-        county_of_residence: Optional[str]) -> List[IncarcerationStayEvent]:
-    """Finds all days for which this person was incarcerated."""
-    incarceration_stay_events: List[IncarcerationStayEvent] = []
+        county_of_residence: Optional[str]) -> List[IncarcerationStaySpanEvent]:
+    """Finds the spans of days for which this person was incarcerated. A new span starts only on days where the most
+    serious prior charge in the sentence group changes."""
+    incarceration_stay_events: List[IncarcerationStaySpanEvent] = []
 
     admission_date = incarceration_period.admission_date
     release_date = incarceration_period.release_date
@@ -217,8 +211,6 @@ def find_incarceration_stays(
     judicial_district_code = _get_judicial_district_code(incarceration_period,
                                                          incarceration_period_to_judicial_district)
 
-    stay_date = admission_date
-
     incarceration_period_id = incarceration_period.incarceration_period_id
 
     if not incarceration_period_id:
@@ -227,15 +219,32 @@ def find_incarceration_stays(
     original_admission_reason, original_admission_reason_raw_text = \
         original_admission_reasons_by_period_id[incarceration_period_id]
 
-    while stay_date < release_date:
-        most_serious_charge = find_most_serious_prior_charge_in_sentence_group(sentence_group, stay_date)
+    span_start_dates = [admission_date] + _most_serious_charge_change_dates(sentence_group,
+                                                                            admission_date,
+                                                                            release_date)
+    span_end_dates = span_start_dates[1:] + [release_date]
+
+    for span_start_date, span_end_date in zip(span_start_dates, span_end_dates):
+        if span_start_date >= span_end_date:
+            continue
+
+        most_serious_charge = find_most_serious_prior_charge_in_sentence_group(sentence_group, span_start_date)
         most_serious_offense_ncic_code = most_serious_charge.ncic_code if most_serious_charge else None
         most_serious_offense_statute = most_serious_charge.statute if most_serious_charge else None
 
+        if incarceration_stay_events \
+                and incarceration_stay_events[-1].most_serious_offense_ncic_code == most_serious_offense_ncic_code \
+                and incarceration_stay_events[-1].most_serious_offense_statute == most_serious_offense_statute:
+            # The most serious charge did not change, so extend the previous span
+            incarceration_stay_events[-1] = attr.evolve(incarceration_stay_events[-1],
+                                                        end_date_exclusive=span_end_date)
+            continue
+
         incarceration_stay_events.append(
-            IncarcerationStayEvent(
+            IncarcerationStaySpanEvent(
                 state_code=incarceration_period.state_code,
-                event_date=stay_date,
+                event_date=span_start_date,
+                end_date_exclusive=span_end_date,
                 facility=incarceration_period.facility,
                 county_of_residence=county_of_residence,
                 most_serious_offense_ncic_code=most_serious_offense_ncic_code,
@@ -247,11 +256,28 @@ def find_incarceration_stays(
             )
         )
 
-        stay_date = stay_date + relativedelta(days=1)
-
     return incarceration_stay_events
 
 
+def _most_serious_charge_change_dates(sentence_group: StateSentenceGroup,
+                                      start_date_exclusive: date,
+                                      end_date_exclusive: date) -> List[date]:
+    """Returns the sorted dates between |start_date_exclusive| and |end_date_exclusive| on which the result of
+    find_most_serious_prior_charge_in_sentence_group may change. Charges only count toward the most serious prior charge
+    on the days after their sentence started, so these are the days after each sentence start date."""
+    sentences: List[Union[StateIncarcerationSentence, StateSupervisionSentence]] = []
+    sentences.extend(sentence_group.incarceration_sentences)
+    sentences.extend(sentence_group.supervision_sentences)
+
+    change_dates = {
+        sentence.start_date + relativedelta(days=1) for sentence in sentences
+        if sentence.start_date and any(charge.ncic_code for charge in sentence.charges)
+    }
+
+    return sorted(change_date for change_date in change_dates
+                  if start_date_exclusive < change_date < end_date_exclusive)
+
+
 def _get_judicial_district_code(
         incarceration_period: StateIncarcerationPeriod,
         incarceration_period_to_judicial_district: Dict[int, Dict[Any, Any]]) -> Optional[str]:
@@ -16,9 +16,11 @@
 # =============================================================================
 """Events related to incarceration."""
 from datetime import date
-from typing import Optional
+from typing import Optional, List
 
 import attr
+
+from recidiviz.calculator.pipeline.utils.event_utils import expand_span_to_day_events
 from recidiviz.common.attr_mixins import BuildableAttr
 from recidiviz.common.constants.state.state_incarceration_period import \
     StateIncarcerationPeriodAdmissionReason, \
@@ -76,6 +78,27 @@ class IncarcerationStayEvent(IncarcerationEvent):
         return self.event_date
 
 
+@attr.s(frozen=True)
+class IncarcerationStaySpanEvent(IncarcerationStayEvent):
+    """Models a span of consecutive days, starting on the event_date, on which a person was incarcerated and all of the
+    attributes of the stay were the same. Spans are expanded into IncarcerationStayEvents for each day only when
+    metrics are calculated."""
+
+    # The day after the last day of the stay span
+    end_date_exclusive: date = attr.ib(default=None)
+
+    @property
+    def start_date(self):
+        return self.event_date
+
+    def stay_events(self,
+                    lower_bound_inclusive: Optional[date] = None,
+                    upper_bound_inclusive: Optional[date] = None) -> List[IncarcerationStayEvent]:
+        """Returns an IncarcerationStayEvent for each day in this span, limited to the days between the optional
+        |lower_bound_inclusive| and |upper_bound_inclusive| dates."""
+        return expand_span_to_day_events(self, IncarcerationStayEvent, lower_bound_inclusive, upper_bound_inclusive)
+
+
 @attr.s(frozen=True)
 class IncarcerationAdmissionEvent(IncarcerationEvent):
     """Models an IncarcerationEvent where a person was admitted to incarceration for any reason."""
@@ -32,18 +32,20 @@ import apache_beam as beam
 from apache_beam.options.pipeline_options import SetupOptions, PipelineOptions
 from apache_beam.typehints import with_input_types, with_output_types
 
-from recidiviz.calculator.calculation_data_storage_config import DATAFLOW_METRICS_TO_TABLES
+from recidiviz.calculator.calculation_data_storage_config import DATAFLOW_METRICS_TO_TABLES, \
+    incremental_dataflow_metrics_dataset
 from recidiviz.calculator.pipeline.incarceration import identifier, calculator
 from recidiviz.calculator.pipeline.incarceration.incarceration_event import \
     IncarcerationEvent
 from recidiviz.calculator.pipeline.incarceration.metrics import \
     IncarcerationMetric, IncarcerationAdmissionMetric, \
     IncarcerationReleaseMetric, IncarcerationPopulationMetric, IncarcerationMetricType
-from recidiviz.calculator.pipeline.utils.beam_utils import ConvertDictToKVTuple, RecidivizMetricWritableDict
+from recidiviz.calculator.pipeline.utils.beam_utils import ConvertDictToKVTuple, RecidivizMetricWritableDict, \
+    WriteIncrementalChangedPersons, register_attr_coder
 from recidiviz.calculator.pipeline.utils.entity_hydration_utils import SetSentencesOnSentenceGroup, \
     ConvertSentencesToStateSpecificType
 from recidiviz.calculator.pipeline.utils.execution_utils import get_job_id, person_and_kwargs_for_identifier, \
-    select_all_by_person_query
+    select_all_by_person_query, incremental_run_person_id_filter_query
 from recidiviz.calculator.pipeline.utils.extractor_utils import BuildRootEntity
 from recidiviz.calculator.pipeline.utils.pipeline_args_utils import add_shared_pipeline_arguments
 from recidiviz.calculator.query.state.views.reference.incarceration_period_judicial_district_association import \
@@ -58,6 +60,10 @@ from recidiviz.utils import environment
 # Cached job_id value
 _job_id = None
 
+# Use the compact coder for the events and metrics of this pipeline wherever they are serialized
+register_attr_coder(IncarcerationEvent)
+register_attr_coder(IncarcerationMetric)
+
 
 def job_id(pipeline_options: Dict[str, str]) -> str:
     global _job_id
@@ -292,7 +298,8 @@ def run(apache_beam_pipeline_options: PipelineOptions,
         metric_types: List[str],
         state_code: Optional[str],
         calculation_end_month: Optional[str],
-        person_filter_ids: Optional[List[int]]):
+        person_filter_ids: Optional[List[int]],
+        incremental_lookback_days: Optional[int] = None):
     """Runs the incarceration calculation pipeline."""
 
     # Workaround to load SQLAlchemy objects at start of pipeline. This is necessary because the BuildRootEntity
@@ -311,12 +318,17 @@ def run(apache_beam_pipeline_options: PipelineOptions,
 
     person_id_filter_set = set(person_filter_ids) if person_filter_ids else None
 
+    # Incremental runs only recalculate metrics for the people whose entities have changed
+    person_id_filter_query = incremental_run_person_id_filter_query(
+        'incarceration', query_dataset, state_code, metric_types, incremental_lookback_days)
+
     with beam.Pipeline(options=apache_beam_pipeline_options) as p:
         # Get StatePersons
         persons = (p | 'Load StatePersons' >>
                    BuildRootEntity(dataset=query_dataset, root_entity_class=entities.StatePerson,
                                    unifying_id_field=entities.StatePerson.get_class_id_name(),
-                                   build_related_entities=True, unifying_id_field_filter_set=person_id_filter_set))
+                                   build_related_entities=True, unifying_id_field_filter_set=person_id_filter_set,
+                                   unifying_id_field_filter_query=person_id_filter_query))
 
         # Get StateSentenceGroups
         sentence_groups = (p | 'Load StateSentenceGroups' >>
@@ -326,6 +338,7 @@ def run(apache_beam_pipeline_options: PipelineOptions,
                                unifying_id_field=entities.StatePerson.get_class_id_name(),
                                build_related_entities=True,
                                unifying_id_field_filter_set=person_id_filter_set,
+                               unifying_id_field_filter_query=person_id_filter_query,
                                state_code=state_code
                            ))
 
@@ -337,6 +350,7 @@ def run(apache_beam_pipeline_options: PipelineOptions,
                                        unifying_id_field=entities.StatePerson.get_class_id_name(),
                                        build_related_entities=True,
                                        unifying_id_field_filter_set=person_id_filter_set,
+                                       unifying_id_field_filter_query=person_id_filter_query,
                                        state_code=state_code
                                    ))
 
@@ -348,13 +362,15 @@ def run(apache_beam_pipeline_options: PipelineOptions,
                                      unifying_id_field=entities.StatePerson.get_class_id_name(),
                                      build_related_entities=True,
                                      unifying_id_field_filter_set=person_id_filter_set,
+                                     unifying_id_field_filter_query=person_id_filter_query,
                                      state_code=state_code
                                  ))
 
         if state_code is None or state_code == 'US_MO':
             # Bring in the reference table that includes sentence status ranking information
             us_mo_sentence_status_query = select_all_by_person_query(
-                reference_dataset, US_MO_SENTENCE_STATUSES_VIEW_NAME, state_code, person_id_filter_set)
+                reference_dataset, US_MO_SENTENCE_STATUSES_VIEW_NAME, state_code, person_id_filter_set,
+                person_id_filter_query=person_id_filter_query)
 
             us_mo_sentence_statuses = (p | "Read MO sentence status table from BigQuery" >>
                                        beam.io.Read(beam.io.BigQuerySource(query=us_mo_sentence_status_query,
@@ -406,7 +422,8 @@ def run(apache_beam_pipeline_options: PipelineOptions,
             # persons_to_recent_county_of_residence query to have a state_code field, allowing us to also filter the
             # output by state_code.
             state_code_filter=None,
-            person_id_filter_set=person_id_filter_set)
+            person_id_filter_set=person_id_filter_set,
+            person_id_filter_query=person_id_filter_query)
 
         person_id_to_county_kv = (
             p | "Read person_id to county associations from BigQuery" >>
@@ -422,7 +439,8 @@ def run(apache_beam_pipeline_options: PipelineOptions,
             reference_dataset,
             INCARCERATION_PERIOD_JUDICIAL_DISTRICT_ASSOCIATION_VIEW_NAME,
             state_code,
-            person_id_filter_set)
+            person_id_filter_set,
+            person_id_filter_query=person_id_filter_query)
 
         ip_to_judicial_district_kv = (
             p | "Read incarceration_period to judicial_district associations from BigQuery" >>
@@ -453,7 +471,7 @@ def run(apache_beam_pipeline_options: PipelineOptions,
 
         # Add timestamp for local jobs
         job_timestamp = datetime.datetime.now().strftime('%Y-%m-%d_%H_%M_%S.%f')
-        all_apache_beam_pipeline_options['job_timestamp'] = job_timestamp
+        all_pipeline_options['job_timestamp'] = job_timestamp
 
         # Get the type of metric to calculate
         metric_types_set = set(metric_types)
@@ -470,6 +488,16 @@ def run(apache_beam_pipeline_options: PipelineOptions,
             logging.warning("Non-empty person filter set - returning before writing metrics.")
             return
 
+        if person_id_filter_query:
+            # Incremental runs write to the incremental metrics dataset, from which the output is merged into the
+            # metric tables once the job has completed
+            output = incremental_dataflow_metrics_dataset(output)
+
+            _ = (p | 'Write changed persons to BQ' >>
+                 WriteIncrementalChangedPersons(changed_person_ids_query=person_id_filter_query,
+                                                dataset=output,
+                                                pipeline_options=all_pipeline_options))
+
         # Convert the metrics into a format that's writable to BQ
         writable_metrics = (incarceration_metrics | 'Convert to dict to be written to BQ' >>
                             beam.ParDo(RecidivizMetricWritableDict()).with_outputs(
@@ -27,10 +27,11 @@ from typing import List, Dict, Tuple, Any, Sequence, Optional, Type
 from recidiviz.calculator.pipeline.program.metrics import ProgramMetricType, ProgramMetric,\
     ProgramParticipationMetric, ProgramReferralMetric
 from recidiviz.calculator.pipeline.program.program_event import ProgramEvent, \
-    ProgramReferralEvent, ProgramParticipationEvent
+    ProgramReferralEvent, ProgramParticipationEvent, ProgramParticipationSpanEvent
 from recidiviz.calculator.pipeline.utils.calculator_utils import last_day_of_month, relevant_metric_periods, \
     augmented_combo_for_calculations, include_in_historical_metrics, \
-    get_calculation_month_lower_bound_date, get_calculation_month_upper_bound_date, characteristics_dict_builder
+    get_calculation_month_lower_bound_date, get_calculation_month_upper_bound_date, characteristics_dict_builder, \
+    PersonCharacteristicsCache
 from recidiviz.calculator.pipeline.utils.metric_utils import \
     MetricMethodologyType
 from recidiviz.calculator.pipeline.utils.state_utils.state_calculation_config_manager import \
@@ -67,8 +68,19 @@ def map_program_combinations(person: StatePerson,
     metrics: List[Tuple[Dict[str, Any], Any]] = []
     periods_and_events: Dict[int, List[ProgramEvent]] = defaultdict()
 
+    person_characteristics_cache = PersonCharacteristicsCache(person=person, pipeline='program')
+
     calculation_month_upper_bound = get_calculation_month_upper_bound_date(calculation_end_month)
 
+    calculation_month_lower_bound = get_calculation_month_lower_bound_date(
+        calculation_month_upper_bound, calculation_month_count)
+
+    program_events = expand_participation_span_events(
+        program_events,
+        include_participation_events=bool(metric_inclusions.get(ProgramMetricType.PROGRAM_PARTICIPATION)),
+        calculation_month_lower_bound=calculation_month_lower_bound,
+        calculation_month_upper_bound=calculation_month_upper_bound)
+
     # If the calculations include the current month, then we will calculate person-based metrics for each metric
     # period in METRIC_PERIOD_MONTHS ending with the current month
     include_metric_period_output = calculation_month_upper_bound == get_calculation_month_upper_bound_date(
@@ -91,13 +103,11 @@ def map_program_combinations(person: StatePerson,
                     else:
                         periods_and_events[period] = [program_event]
 
-    calculation_month_lower_bound = get_calculation_month_lower_bound_date(
-        calculation_month_upper_bound, calculation_month_count)
-
     for program_event in program_events:
         if (isinstance(program_event, ProgramReferralEvent)
                 and metric_inclusions.get(ProgramMetricType.PROGRAM_REFERRAL)):
-            characteristic_combo = characteristics_dict(person, program_event, ProgramReferralMetric)
+            characteristic_combo = characteristics_dict(
+                person, program_event, ProgramReferralMetric, person_characteristics_cache)
 
             program_referral_metrics_event_based = map_metric_combinations(
                 characteristic_combo, program_event,
@@ -109,7 +119,8 @@ def map_program_combinations(person: StatePerson,
             metrics.extend(program_referral_metrics_event_based)
         elif (isinstance(program_event, ProgramParticipationEvent)
               and metric_inclusions.get(ProgramMetricType.PROGRAM_PARTICIPATION)):
-            characteristic_combo = characteristics_dict(person, program_event, ProgramParticipationMetric)
+            characteristic_combo = characteristics_dict(
+                person, program_event, ProgramParticipationMetric, person_characteristics_cache)
 
             program_participation_metrics_event_based = map_metric_combinations(
                 characteristic_combo,
@@ -128,9 +139,31 @@ def map_program_combinations(person: StatePerson,
     return metrics
 
 
+def expand_participation_span_events(program_events: List[ProgramEvent],
+                                     include_participation_events: bool,
+                                     calculation_month_lower_bound: Optional[date],
+                                     calculation_month_upper_bound: date) -> List[ProgramEvent]:
+    """Replaces each ProgramParticipationSpanEvent in |program_events| with a ProgramParticipationEvent for each day of
+    the span that falls within the calculation months. Participation only contributes to metrics for the day of the
+    participation, so days outside of the calculation months are never expanded. If |include_participation_events| is
+    False, the spans are dropped entirely."""
+    expanded_events: List[ProgramEvent] = []
+
+    for program_event in program_events:
+        if not isinstance(program_event, ProgramParticipationSpanEvent):
+            expanded_events.append(program_event)
+        elif include_participation_events:
+            expanded_events.extend(program_event.participation_events(calculation_month_lower_bound,
+                                                                      calculation_month_upper_bound))
+
+    return expanded_events
+
+
 def characteristics_dict(person: StatePerson,
                          program_event: ProgramEvent,
-                         metric_class: Type[ProgramMetric]) -> Dict[str, Any]:
+                         metric_class: Type[ProgramMetric],
+                         person_characteristics_cache: Optional[PersonCharacteristicsCache] = None) -> \
+        Dict[str, Any]:
     """Builds a dictionary that describes the characteristics of the person and event.
 
     Args:
@@ -138,6 +171,8 @@ def characteristics_dict(person: StatePerson,
         program_event: the ProgramEvent we are picking characteristics from
         metric_class: The ProgramMetric provided determines which fields should be added to the characteristics
             dictionary
+        person_characteristics_cache: The PersonCharacteristicsCache shared across all of the person's events, if
+            available
     Returns:
         A dictionary populated with all relevant characteristics.
     """
@@ -148,7 +183,8 @@ def characteristics_dict(person: StatePerson,
                                                    metric_class=metric_class,
                                                    person=person,
                                                    event_date=event_date,
-                                                   include_person_attributes=True)
+                                                   include_person_attributes=True,
+                                                   person_characteristics_cache=person_characteristics_cache)
 
     return characteristics
 
@@ -15,14 +15,16 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # =============================================================================
 """Identifies instances of interaction with a program."""
+import bisect
 import logging
 from datetime import date
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
+import attr
 from dateutil.relativedelta import relativedelta
 
 from recidiviz.calculator.pipeline.program.program_event import \
-    ProgramReferralEvent, ProgramEvent, ProgramParticipationEvent
+    ProgramReferralEvent, ProgramEvent, ProgramParticipationSpanEvent
 from recidiviz.calculator.pipeline.utils.assessment_utils import \
     most_recent_assessment_attributes
 from recidiviz.calculator.pipeline.utils.state_utils.state_calculation_config_manager import \
@@ -31,6 +33,7 @@ from recidiviz.calculator.pipeline.utils.supervision_period_utils import prepare
 from recidiviz.common.constants.state.state_assessment import \
     StateAssessmentType
 from recidiviz.common.constants.state.state_program_assignment import StateProgramAssignmentParticipationStatus
+from recidiviz.common.constants.state.state_supervision import StateSupervisionType
 from recidiviz.persistence.entity.entity_utils import is_placeholder, get_single_state_code
 from recidiviz.persistence.entity.state.entities import \
     StateProgramAssignment, StateAssessment, StateSupervisionPeriod
@@ -38,6 +41,19 @@ from recidiviz.persistence.entity.state.entities import \
 EXTERNAL_UNKNOWN_VALUE = 'EXTERNAL_UNKNOWN'
 
 
+@attr.s(frozen=True)
+class SupervisionPeriodInterval:
+    """A range of dates on which the same set of supervision periods overlap."""
+
+    start_date: date = attr.ib()
+
+    # The day after the last day of the interval. Unset if the interval does not end.
+    end_date_exclusive: Optional[date] = attr.ib()
+
+    # The supervision periods overlapping with every day of the interval
+    supervision_periods: List[StateSupervisionPeriod] = attr.ib()
+
+
 def find_program_events(
         program_assignments: List[StateProgramAssignment],
         assessments: List[StateAssessment],
@@ -74,6 +90,8 @@ def find_program_events(
         supervision_periods,
         drop_non_state_custodial_authority_periods=should_drop_non_state_custodial_authority_periods)
 
+    supervision_period_intervals = build_supervision_period_intervals(supervision_periods)
+
     for program_assignment in program_assignments:
         program_referrals = find_program_referrals(
             program_assignment,
@@ -85,7 +103,7 @@ def find_program_events(
 
         program_participation_events = find_program_participation_events(
             program_assignment,
-            supervision_periods
+            supervision_period_intervals
         )
 
         program_events.extend(program_participation_events)
@@ -137,22 +155,23 @@ def find_program_referrals(
 
 
 def find_program_participation_events(program_assignment: StateProgramAssignment,
-                                      supervision_periods: List[StateSupervisionPeriod]) -> \
-        List[ProgramParticipationEvent]:
-    """Finds instances of actively participating in a program. Produces a ProgramParticipationEvent for each day that
-    the person was actively participating in the program. If the program_assignment has a participation_status of
-    IN_PROGRESS and has a set start_date, produces a ProgramParticipationEvent for every day between the start_date and
-    today. If the program_assignment has a participation_status of DISCHARGED, produces a ProgramParticipationEvent for
-    every day between the start_date and discharge_date, end date exclusive.
+                                      supervision_period_intervals: List[SupervisionPeriodInterval]) -> \
+        List[ProgramParticipationSpanEvent]:
+    """Finds instances of actively participating in a program. Produces ProgramParticipationSpanEvents covering each
+    day that the person was actively participating in the program. If the program_assignment has a participation_status
+    of IN_PROGRESS and has a set start_date, the spans cover every day between the start_date and today. If the
+    program_assignment has a participation_status of DISCHARGED, the spans cover every day between the start_date and
+    discharge_date, end date exclusive.
 
-    Where possible, identifies what types of supervision the person is on on the date of the participation.
+    Where possible, identifies what types of supervision the person is on during the participation, using the sorted
+    |supervision_period_intervals| built by build_supervision_period_intervals.
 
-    If there are multiple overlapping supervision periods, returns one ProgramParticipationEvent for each supervision
-    period that overlaps.
+    If there are multiple overlapping supervision periods, returns one ProgramParticipationSpanEvent for each
+    supervision period that overlaps. A new span starts only when the overlapping supervision periods change.
 
-    Returns a list of ProgramReferralEvents.
+    Returns a list of ProgramParticipationSpanEvents.
     """
-    program_participation_events: List[ProgramParticipationEvent] = []
+    program_participation_events: List[ProgramParticipationSpanEvent] = []
 
     state_code = program_assignment.state_code
     participation_status = program_assignment.participation_status
@@ -181,33 +200,112 @@ def find_program_participation_events(program_assignment: StateProgramAssignment
     program_location_id = (program_assignment.program_location_id
                            if program_assignment.program_location_id else EXTERNAL_UNKNOWN_VALUE)
 
-    participation_date = start_date
-
-    while participation_date < discharge_date:
-        overlapping_supervision_periods = find_supervision_periods_overlapping_with_date(participation_date,
-                                                                                         supervision_periods)
-        if overlapping_supervision_periods:
-            for supervision_period in supervision_periods:
-                program_participation_events.append(
-                    ProgramParticipationEvent(
-                        state_code=state_code,
-                        event_date=participation_date,
-                        program_id=program_id,
-                        program_location_id=program_location_id,
-                        # TODO(2891): Use supervision_period_supervision_type
-                        supervision_type=supervision_period.supervision_type
-                    ))
+    for span_start_date, span_end_date, supervision_types in _supervision_types_during_range(
+            start_date, discharge_date, supervision_period_intervals):
+        for supervision_type in supervision_types:
+            program_participation_events.append(
+                ProgramParticipationSpanEvent(
+                    state_code=state_code,
+                    event_date=span_start_date,
+                    end_date_exclusive=span_end_date,
+                    program_id=program_id,
+                    program_location_id=program_location_id,
+                    supervision_type=supervision_type
+                ))
+
+    return program_participation_events
+
+
+def _supervision_types_during_range(
+        start_date: date,
+        end_date_exclusive: date,
+        supervision_period_intervals: List[SupervisionPeriodInterval]
+) -> List[Tuple[date, date, List[Optional[StateSupervisionType]]]]:
+    """Returns consecutive date ranges covering the time between |start_date| and |end_date_exclusive|, with the
+    supervision types of the supervision periods overlapping with each range. Has one None supervision type for ranges
+    that do not overlap with any supervision period. Adjacent ranges with the same supervision types are combined."""
+    ranges: List[Tuple[date, date, List[Optional[StateSupervisionType]]]] = []
+
+    def _add_range(range_start: date, range_end: date, supervision_types: List[Optional[StateSupervisionType]]):
+        if range_start >= range_end:
+            return
+        if ranges and ranges[-1][1] == range_start and ranges[-1][2] == supervision_types:
+            ranges[-1] = (ranges[-1][0], range_end, supervision_types)
         else:
-            program_participation_events.append(ProgramParticipationEvent(
-                state_code=state_code,
-                event_date=participation_date,
-                program_id=program_id,
-                program_location_id=program_location_id
-            ))
+            ranges.append((range_start, range_end, supervision_types))
+
+    interval_start_dates = [interval.start_date for interval in supervision_period_intervals]
+    index = bisect.bisect_right(interval_start_dates, start_date) - 1
+
+    if index < 0:
+        # The range starts before any supervision periods
+        first_interval_start = interval_start_dates[0] if interval_start_dates else end_date_exclusive
+        _add_range(start_date, min(first_interval_start, end_date_exclusive), [None])
+        index = 0
+
+    while index < len(supervision_period_intervals) \
+            and supervision_period_intervals[index].start_date < end_date_exclusive:
+        interval = supervision_period_intervals[index]
+        range_end = min(interval.end_date_exclusive, end_date_exclusive) \
+            if interval.end_date_exclusive else end_date_exclusive
+
+        # TODO(2891): Use supervision_period_supervision_type
+        supervision_types: List[Optional[StateSupervisionType]] = \
+            [supervision_period.supervision_type for supervision_period in interval.supervision_periods] \
+            if interval.supervision_periods else [None]
+
+        _add_range(max(interval.start_date, start_date), range_end, supervision_types)
+        index += 1
+
+    return ranges
+
+
+def build_supervision_period_intervals(
+        supervision_periods: List[StateSupervisionPeriod]) -> List[SupervisionPeriodInterval]:
+    """Splits the time from the start of the earliest supervision period onwards into sorted, consecutive
+    SupervisionPeriodIntervals, on each of which the same set of supervision periods overlap. A supervision period
+    overlaps with the days from its start date through the day before its termination date. Overlapping supervision
+    periods are listed in the order they appear in |supervision_periods|."""
+    relevant_periods = [
+        (index, sp) for index, sp in enumerate(supervision_periods)
+        if not is_placeholder(sp)
+        and sp.start_date is not None
+        and (sp.termination_date is None or sp.start_date < sp.termination_date)
+    ]
 
-        participation_date = participation_date + relativedelta(days=1)
+    boundary_dates = sorted(
+        {sp.start_date for _, sp in relevant_periods if sp.start_date} |
+        {sp.termination_date for _, sp in relevant_periods if sp.termination_date}
+    )
 
-    return program_participation_events
+    periods_by_start_date = sorted(relevant_periods, key=lambda indexed_sp: indexed_sp[1].start_date or date.min)
+
+    supervision_period_intervals: List[SupervisionPeriodInterval] = []
+    active_periods: List[Tuple[int, StateSupervisionPeriod]] = []
+    next_period_index = 0
+
+    for boundary_index, boundary_date in enumerate(boundary_dates):
+        active_periods = [
+            (index, sp) for index, sp in active_periods
+            if sp.termination_date is None or boundary_date < sp.termination_date
+        ]
+
+        while next_period_index < len(periods_by_start_date) \
+                and periods_by_start_date[next_period_index][1].start_date == boundary_date:
+            active_periods.append(periods_by_start_date[next_period_index])
+            next_period_index += 1
+
+        active_periods.sort(key=lambda indexed_sp: indexed_sp[0])
+
+        supervision_period_intervals.append(
+            SupervisionPeriodInterval(
+                start_date=boundary_date,
+                end_date_exclusive=(boundary_dates[boundary_index + 1]
+                                    if boundary_index + 1 < len(boundary_dates) else None),
+                supervision_periods=[sp for _, sp in active_periods]
+            ))
+
+    return supervision_period_intervals
 
 
 def referrals_for_supervision_periods(
@@ -27,15 +27,17 @@ from apache_beam.options.pipeline_options import SetupOptions, PipelineOptions
 from apache_beam.pvalue import AsDict
 from apache_beam.typehints import with_input_types, with_output_types
 
-from recidiviz.calculator.calculation_data_storage_config import DATAFLOW_METRICS_TO_TABLES
+from recidiviz.calculator.calculation_data_storage_config import DATAFLOW_METRICS_TO_TABLES, \
+    incremental_dataflow_metrics_dataset
 from recidiviz.calculator.pipeline.program import identifier, calculator
 from recidiviz.calculator.pipeline.program.metrics import ProgramMetric, \
     ProgramReferralMetric, ProgramParticipationMetric
 from recidiviz.calculator.pipeline.program.metrics import ProgramMetricType
 from recidiviz.calculator.pipeline.program.program_event import ProgramEvent
-from recidiviz.calculator.pipeline.utils.beam_utils import ConvertDictToKVTuple, RecidivizMetricWritableDict
+from recidiviz.calculator.pipeline.utils.beam_utils import ConvertDictToKVTuple, RecidivizMetricWritableDict, \
+    WriteIncrementalChangedPersons, register_attr_coder
 from recidiviz.calculator.pipeline.utils.execution_utils import get_job_id, person_and_kwargs_for_identifier, \
-    select_all_by_person_query
+    select_all_by_person_query, incremental_run_person_id_filter_query
 from recidiviz.calculator.pipeline.utils.extractor_utils import BuildRootEntity
 from recidiviz.calculator.pipeline.utils.pipeline_args_utils import add_shared_pipeline_arguments
 from recidiviz.calculator.query.state.views.reference.supervision_period_to_agent_association import \
@@ -47,6 +49,10 @@ from recidiviz.utils import environment
 # Cached job_id value
 _job_id = None
 
+# Use the compact coder for the events and metrics of this pipeline wherever they are serialized
+register_attr_coder(ProgramEvent)
+register_attr_coder(ProgramMetric)
+
 
 def job_id(pipeline_options: Dict[str, str]) -> str:
     global _job_id
@@ -276,7 +282,8 @@ def run(apache_beam_pipeline_options: PipelineOptions,
         metric_types: List[str],
         state_code: Optional[str],
         calculation_end_month: Optional[str],
-        person_filter_ids: Optional[List[int]]):
+        person_filter_ids: Optional[List[int]],
+        incremental_lookback_days: Optional[int] = None):
     """Runs the program calculation pipeline."""
 
     # Workaround to load SQLAlchemy objects at start of pipeline. This is necessary because the BuildRootEntity
@@ -295,12 +302,17 @@ def run(apache_beam_pipeline_options: PipelineOptions,
 
     person_id_filter_set = set(person_filter_ids) if person_filter_ids else None
 
+    # Incremental runs only recalculate metrics for the people whose entities have changed
+    person_id_filter_query = incremental_run_person_id_filter_query(
+        'program', input_dataset, state_code, metric_types, incremental_lookback_days)
+
     with beam.Pipeline(options=apache_beam_pipeline_options) as p:
         # Get StatePersons
         persons = (p | 'Load Persons' >>
                    BuildRootEntity(dataset=input_dataset, root_entity_class=entities.StatePerson,
                                    unifying_id_field=entities.StatePerson.get_class_id_name(),
-                                   build_related_entities=True, unifying_id_field_filter_set=person_id_filter_set))
+                                   build_related_entities=True, unifying_id_field_filter_set=person_id_filter_set,
+                                   unifying_id_field_filter_query=person_id_filter_query))
 
         # Get StateProgramAssignments
         program_assignments = (p | 'Load Program Assignments' >>
@@ -310,6 +322,7 @@ def run(apache_beam_pipeline_options: PipelineOptions,
                                                unifying_id_field=entities.StatePerson.get_class_id_name(),
                                                build_related_entities=True,
                                                unifying_id_field_filter_set=person_id_filter_set,
+                                               unifying_id_field_filter_query=person_id_filter_query,
                                                state_code=state_code))
 
         # Get StateAssessments
@@ -318,6 +331,7 @@ def run(apache_beam_pipeline_options: PipelineOptions,
                                        unifying_id_field=entities.StatePerson.get_class_id_name(),
                                        build_related_entities=False,
                                        unifying_id_field_filter_set=person_id_filter_set,
+                                       unifying_id_field_filter_query=person_id_filter_query,
                                        state_code=state_code))
 
         # Get StateSupervisionPeriods
@@ -326,10 +340,12 @@ def run(apache_beam_pipeline_options: PipelineOptions,
                                                unifying_id_field=entities.StatePerson.get_class_id_name(),
                                                build_related_entities=False,
                                                unifying_id_field_filter_set=person_id_filter_set,
+                                               unifying_id_field_filter_query=person_id_filter_query,
                                                state_code=state_code))
 
         supervision_period_to_agent_association_query = select_all_by_person_query(
-            reference_dataset, SUPERVISION_PERIOD_TO_AGENT_ASSOCIATION_VIEW_NAME, state_code, person_id_filter_set)
+            reference_dataset, SUPERVISION_PERIOD_TO_AGENT_ASSOCIATION_VIEW_NAME, state_code, person_id_filter_set,
+            person_id_filter_query=person_id_filter_query)
 
         supervision_period_to_agent_associations = (
             p | "Read Supervision Period to Agent table from BigQuery" >>
@@ -383,6 +399,16 @@ def run(apache_beam_pipeline_options: PipelineOptions,
             logging.warning("Non-empty person filter set - returning before writing metrics.")
             return
 
+        if person_id_filter_query:
+            # Incremental runs write to the incremental metrics dataset, from which the output is merged into the
+            # metric tables once the job has completed
+            output = incremental_dataflow_metrics_dataset(output)
+
+            _ = (p | 'Write changed persons to BQ' >>
+                 WriteIncrementalChangedPersons(changed_person_ids_query=person_id_filter_query,
+                                                dataset=output,
+                                                pipeline_options=all_pipeline_options))
+
         # Convert the metrics into a format that's writable to BQ
         writable_metrics = (program_metrics
                             | 'Convert to dict to be written to BQ' >>
@@ -16,11 +16,11 @@
 # =============================================================================
 """Events related to programs."""
 from datetime import date
-from typing import Optional
+from typing import Optional, List
 
 import attr
 
-from recidiviz.calculator.pipeline.utils.event_utils import AssessmentEventMixin
+from recidiviz.calculator.pipeline.utils.event_utils import AssessmentEventMixin, expand_span_to_day_events
 from recidiviz.common.attr_mixins import BuildableAttr
 from recidiviz.common.constants.state.state_assessment import StateAssessmentType, StateAssessmentLevel
 from recidiviz.common.constants.state.state_program_assignment import StateProgramAssignmentParticipationStatus
@@ -87,3 +87,24 @@ class ProgramParticipationEvent(ProgramEvent):
     @property
     def date_of_participation(self):
         return self.event_date
+
+
+@attr.s(frozen=True)
+class ProgramParticipationSpanEvent(ProgramParticipationEvent):
+    """Models a span of consecutive days, starting on the event_date, on which a person was actively participating in a
+    program with the same supervision type. Spans are expanded into ProgramParticipationEvents for each day only when
+    metrics are calculated."""
+
+    # The day after the last day of the participation span
+    end_date_exclusive: date = attr.ib(default=None)
+
+    @property
+    def start_date(self):
+        return self.event_date
+
+    def participation_events(self,
+                             lower_bound_inclusive: Optional[date] = None,
+                             upper_bound_inclusive: Optional[date] = None) -> List[ProgramParticipationEvent]:
+        """Returns a ProgramParticipationEvent for each day in this span, limited to the days between the optional
+        |lower_bound_inclusive| and |upper_bound_inclusive| dates."""
+        return expand_span_to_day_events(self, ProgramParticipationEvent, lower_bound_inclusive, upper_bound_inclusive)
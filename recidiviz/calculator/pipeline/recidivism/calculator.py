@@ -27,11 +27,14 @@ Attributes:
     FOLLOW_UP_PERIODS: a list of integers, the follow-up periods that we measure
         recidivism over, from 1 to 10.
 """
+import bisect
 import logging
 from typing import Any, Dict, List, Optional, Tuple, Type
 
 import datetime
 from datetime import date
+
+import attr
 from dateutil.relativedelta import relativedelta
 
 from recidiviz.calculator.pipeline.recidivism.metrics import \
@@ -43,7 +46,7 @@ from recidiviz.calculator.pipeline.recidivism.release_event import \
 from recidiviz.calculator.pipeline.utils.metric_utils import \
     MetricMethodologyType
 from recidiviz.calculator.pipeline.utils.calculator_utils import augment_combination, last_day_of_month, \
-    relevant_metric_periods, characteristics_dict_builder
+    relevant_metric_periods, characteristics_dict_builder, PersonCharacteristicsCache
 from recidiviz.common.constants.state.state_supervision_period import StateSupervisionPeriodSupervisionType
 from recidiviz.common.constants.state.state_supervision_violation import \
     StateSupervisionViolationType
@@ -92,29 +95,31 @@ def map_recidivism_combinations(person: StatePerson,
         the recidivism value corresponding to that metric.
     """
     metrics = []
-    all_reincarcerations = reincarcerations(release_events)
+    timeline = RecidivismTimeline(release_events)
 
     metric_period_end_date = last_day_of_month(date.today())
 
+    person_characteristics_cache = PersonCharacteristicsCache(person=person, pipeline='recidivism')
+
     for _, events in release_events.items():
         for event in events:
             if metric_inclusions.get(ReincarcerationRecidivismMetricType.REINCARCERATION_RATE):
                 characteristic_combo_rate = \
-                    characteristics_dict(person, event, ReincarcerationRecidivismRateMetric)
+                    characteristics_dict(
+                        person, event, ReincarcerationRecidivismRateMetric, person_characteristics_cache)
 
-                rate_metrics = map_recidivism_rate_combinations(
-                    characteristic_combo_rate, event,
-                    release_events, all_reincarcerations)
+                rate_metrics = map_recidivism_rate_combinations(characteristic_combo_rate, event, timeline)
 
                 metrics.extend(rate_metrics)
 
             if metric_inclusions.get(ReincarcerationRecidivismMetricType.REINCARCERATION_COUNT):
                 characteristic_combo_count = \
-                    characteristics_dict(person, event, ReincarcerationRecidivismCountMetric)
+                    characteristics_dict(
+                        person, event, ReincarcerationRecidivismCountMetric, person_characteristics_cache)
 
                 count_metrics = map_recidivism_count_combinations(characteristic_combo_count,
                                                                   event,
-                                                                  all_reincarcerations,
+                                                                  timeline,
                                                                   metric_period_end_date)
                 metrics.extend(count_metrics)
 
@@ -124,8 +129,7 @@ def map_recidivism_combinations(person: StatePerson,
 def map_recidivism_rate_combinations(
         characteristic_combo: Dict[str, Any],
         event: ReleaseEvent,
-        all_release_events: Dict[int, List[ReleaseEvent]],
-        all_reincarcerations: Dict[date, Dict[str, Any]]) -> \
+        timeline: 'RecidivismTimeline') -> \
         List[Tuple[Dict[str, Any], Any]]:
     """Maps the given event and characteristic combinations to a variety of
     metrics that track rate-based recidivism.
@@ -133,12 +137,8 @@ def map_recidivism_rate_combinations(
     Args:
         characteristic_combo: A dictionary describing the person and event
         event: the recidivism event from which the combination was derived
-        all_release_events: A dictionary mapping release cohorts to a list of
-            ReleaseEvents for the given StatePerson.
-        all_reincarcerations: dictionary where the keys are all dates of
-            reincarceration for the person's ReleaseEvents, and the values
-            are a dictionary containing return type and from supervision type
-            information
+        timeline: the RecidivismTimeline of the person's release events and
+            reincarcerations
 
     Returns:
         A list of key-value tuples representing specific metric combinations and
@@ -146,21 +146,13 @@ def map_recidivism_rate_combinations(
     """
     metrics = []
 
-    if isinstance(event, RecidivismReleaseEvent):
-        earliest_recidivism_period = earliest_recidivated_follow_up_period(
-            event.release_date, event.reincarceration_date)
-    else:
-        earliest_recidivism_period = None
-
     relevant_periods = relevant_follow_up_periods(event.release_date, date.today(), FOLLOW_UP_PERIODS)
 
     combo = characteristic_combo.copy()
 
     combo['metric_type'] = ReincarcerationRecidivismMetricType.REINCARCERATION_RATE
 
-    metrics.extend(combination_rate_metrics(
-        combo, event, all_release_events, all_reincarcerations,
-        earliest_recidivism_period, relevant_periods))
+    metrics.extend(combination_rate_metrics(combo, event, timeline, relevant_periods))
 
     return metrics
 
@@ -168,7 +160,7 @@ def map_recidivism_rate_combinations(
 def map_recidivism_count_combinations(
         characteristic_combo: Dict[str, Any],
         event: ReleaseEvent,
-        all_reincarcerations: Dict[date, Dict[str, Any]],
+        timeline: 'RecidivismTimeline',
         metric_period_end_date: date) -> \
         List[Tuple[Dict[str, Any], Any]]:
     """Maps the given event and characteristic combinations to a variety of metrics that track count-based recidivism.
@@ -179,8 +171,7 @@ def map_recidivism_count_combinations(
     Args:
         characteristic_combo: A dictionary describing the person and event
         event: the recidivism event from which the combination was derived
-        all_reincarcerations: dictionary where the keys are all dates of reincarceration for the person's ReleaseEvents,
-            and the values are a dictionary containing return type and from supervision type information
+        timeline: the RecidivismTimeline of the person's release events and reincarcerations
         metric_period_end_date: The day the metric periods end
 
     Returns:
@@ -207,7 +198,7 @@ def map_recidivism_count_combinations(
 
         end_of_event_month = last_day_of_month(reincarceration_date)
 
-        metrics.extend(combination_count_metrics(combo, event, all_reincarcerations, end_of_event_month))
+        metrics.extend(combination_count_metrics(combo, event, timeline, end_of_event_month))
 
         # Bucket for each of the relevant metric period month lengths
         for relevant_period in relevant_periods:
@@ -218,7 +209,7 @@ def map_recidivism_count_combinations(
             metric_period_combo['metric_period_months'] = relevant_period
 
             metrics.extend(combination_count_metrics(
-                metric_period_combo, event, all_reincarcerations, metric_period_end_date))
+                metric_period_combo, event, timeline, metric_period_end_date))
 
     return metrics
 
@@ -256,46 +247,83 @@ def reincarcerations(release_events: Dict[int, List[ReleaseEvent]]) \
     return reincarcerations_dict
 
 
-def reincarcerations_in_window(start_date: date,
-                               end_date: date,
-                               all_reincarcerations:
-                               Dict[date, Dict[str, Any]]) \
-        -> List[Dict[str, Any]]:
-    """Finds the number of reincarceration dates during the given window.
-
-    Returns how many of the given reincarceration dates fall within the given
-    follow-up period after the given start date, end point exclusive, including
-    the start date itself if it is within the given array.
-
-    Example:
-        count_reincarcerations_in_window("2016-05-13", 6,
-            {"2012-04-30": {'return_type': 'NEW_ADMISSION',
-                            'from_supervision_type': None},
-             "2016-05-13": {'return_type': 'REVOCATION',
-                            'from_supervision_type': 'PAROLE'},
-             "2020-11-20": {'return_type': 'NEW_ADMISSION',
-                            'from_supervision_type': None},
-             "2021-01-12": {'return_type': 'REVOCATION',
-                            'from_supervision_type': 'PROBATION'},
-             "2022-05-13": {'return_type': 'NEW_ADMISSION',
-                            'from_supervision_type': None}
-             }) = 3
-
-    Args:
-        start_date: a Date to start tracking from
-        end_date: a Date to stop tracking
-        all_reincarcerations: the dictionary of reincarcerations to check
+@attr.s
+class RecidivismTimeline:
+    """A per-person index over release events and reincarcerations for use in the recidivism calculations.
 
-    Returns:
-        How many of the given reincarcerations are within the window
-        specified by the given start date and end date.
+    Built once per person so that the follow-up window and release cohort lookups made for every release event and
+    follow-up period do not re-scan the reincarcerations or re-sort the release cohorts.
     """
-    reincarcerations_in_window_dict = \
-        [reincarceration for reincarceration_date, reincarceration
-         in all_reincarcerations.items()
-         if end_date > reincarceration_date >= start_date]
 
-    return reincarcerations_in_window_dict
+    # A dictionary mapping release cohorts to a list of ReleaseEvents for the person
+    release_events: Dict[int, List[ReleaseEvent]] = attr.ib()
+
+    # A dictionary where the keys are all dates of reincarceration for the person's ReleaseEvents, and the values are a
+    # dictionary containing return type and from supervision type information
+    all_reincarcerations: Dict[date, Dict[str, Any]] = attr.ib(init=False)
+
+    # The dates of all reincarcerations for the person's ReleaseEvents, in ascending order
+    reincarceration_dates: List[date] = attr.ib(init=False)
+
+    # The return details of each reincarceration, aligned by index with reincarceration_dates
+    reincarceration_details: List[Dict[str, Any]] = attr.ib(init=False)
+
+    # A dictionary mapping release cohorts to the ReleaseEvents in that cohort, sorted by release date
+    sorted_releases_by_cohort: Dict[int, List[ReleaseEvent]] = attr.ib(init=False)
+
+    # A dictionary mapping the id() of each RecidivismReleaseEvent to the earliest follow-up period under which the
+    # person recidivated after that release
+    earliest_follow_up_periods_by_event_id: Dict[int, Optional[int]] = attr.ib(init=False)
+
+    @all_reincarcerations.default
+    def _all_reincarcerations(self) -> Dict[date, Dict[str, Any]]:
+        return reincarcerations(self.release_events)
+
+    @reincarceration_dates.default
+    def _reincarceration_dates(self) -> List[date]:
+        return sorted(self.all_reincarcerations)
+
+    @reincarceration_details.default
+    def _reincarceration_details(self) -> List[Dict[str, Any]]:
+        return [self.all_reincarcerations[reincarceration_date] for reincarceration_date in self.reincarceration_dates]
+
+    @sorted_releases_by_cohort.default
+    def _sorted_releases_by_cohort(self) -> Dict[int, List[ReleaseEvent]]:
+        return {cohort: sorted(events, key=lambda b: b.release_date)
+                for cohort, events in self.release_events.items()}
+
+    @earliest_follow_up_periods_by_event_id.default
+    def _earliest_follow_up_periods_by_event_id(self) -> Dict[int, Optional[int]]:
+        return {id(event): earliest_recidivated_follow_up_period(event.release_date, event.reincarceration_date)
+                for events in self.release_events.values()
+                for event in events
+                if isinstance(event, RecidivismReleaseEvent)}
+
+    def reincarcerations_in_window(self, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+        """Returns the details of all reincarcerations on or after the start_date and before the end_date, in order
+        of reincarceration date."""
+        start_index = bisect.bisect_left(self.reincarceration_dates, start_date)
+        end_index = bisect.bisect_left(self.reincarceration_dates, end_date, lo=start_index)
+
+        return self.reincarceration_details[start_index:end_index]
+
+    def is_first_release_in_cohort(self, event: ReleaseEvent) -> bool:
+        """Returns whether the given event is the earliest release in its release cohort year."""
+        year_of_release = event.release_date.year
+
+        releases_in_year = self.sorted_releases_by_cohort.get(year_of_release)
+
+        if not releases_in_year:
+            raise ValueError(f"Release year {year_of_release} should be present in release_events: "
+                             f"{self.release_events}. Identifier code is not correctly classifying all release events "
+                             f"by release cohort year.")
+
+        return id(event) == id(releases_in_year[0])
+
+    def earliest_follow_up_period(self, event: ReleaseEvent) -> Optional[int]:
+        """Returns the earliest follow-up period under which the person recidivated after the given release, or None
+        if the release did not result in a reincarceration."""
+        return self.earliest_follow_up_periods_by_event_id.get(id(event))
 
 
 def returned_within_follow_up_period(event: ReleaseEvent, period: int) -> bool:
@@ -394,7 +422,9 @@ def relevant_follow_up_periods(release_date: date, current_date: date,
 
 def characteristics_dict(person: StatePerson,
                          event: ReleaseEvent,
-                         metric_class: Type[ReincarcerationRecidivismMetric]) -> Dict[str, Any]:
+                         metric_class: Type[ReincarcerationRecidivismMetric],
+                         person_characteristics_cache: Optional[PersonCharacteristicsCache] = None) -> \
+        Dict[str, Any]:
     """Builds a dictionary that describes the characteristics of the person and the release event.
 
     Release cohort, follow-up period, and methodology are not included in the output here. They are added into
@@ -405,6 +435,8 @@ def characteristics_dict(person: StatePerson,
         event: the ReleaseEvent we are picking characteristics from
         metric_class: The ReincarcerationRecidivismMetric provided determines which fields should be added to the
             characteristics dictionary
+        person_characteristics_cache: The PersonCharacteristicsCache shared across all of the person's events, if
+            available
     Returns:
         A dictionary populated with all relevant characteristics.
     """
@@ -415,32 +447,15 @@ def characteristics_dict(person: StatePerson,
                                                    metric_class=metric_class,
                                                    person=person,
                                                    event_date=event_date,
-                                                   include_person_attributes=True)
+                                                   include_person_attributes=True,
+                                                   person_characteristics_cache=person_characteristics_cache)
 
     return characteristics
 
 
-def sorted_releases_in_year(release_date: date, all_release_events: Dict[int, List[ReleaseEvent]]) -> \
-        List[ReleaseEvent]:
-    """Returns the releases in a given year, sorted by release date."""
-    year_of_release = release_date.year
-
-    releases_in_year = all_release_events.get(year_of_release)
-
-    if not releases_in_year:
-        raise ValueError(f"Release year {year_of_release} should be present in release_events: {all_release_events}. "
-                         f"Identifier code is not correctly classifying all release events by release cohort year.")
-
-    releases_in_year.sort(key=lambda b: b.release_date)
-
-    return releases_in_year
-
-
 def combination_rate_metrics(combo: Dict[str, Any],
                              event: ReleaseEvent,
-                             all_release_events: Dict[int, List[ReleaseEvent]],
-                             all_reincarcerations: Dict[date, Dict[str, Any]],
-                             earliest_recidivism_period: Optional[int],
+                             timeline: 'RecidivismTimeline',
                              relevant_periods: List[int]) -> List[Tuple[Dict[str, Any], int]]:
     """Returns all unique recidivism rate metrics for the given combination.
 
@@ -451,10 +466,7 @@ def combination_rate_metrics(combo: Dict[str, Any],
     Args:
         combo: a characteristic combination to convert into metrics
         event: the release event from which the combination was derived
-        all_release_events: A dictionary mapping release cohorts to a list of ReleaseEvents for the given StatePerson.
-        all_reincarcerations: dictionary where the keys are all dates of reincarceration for the person's ReleaseEvents,
-            and the values are a dictionary containing return type and from supervision type information
-        earliest_recidivism_period: the earliest follow-up period under which recidivism occurred
+        timeline: the RecidivismTimeline of the person's release events and reincarcerations
         relevant_periods: the list of periods relevant for measurement
 
     Returns:
@@ -463,14 +475,9 @@ def combination_rate_metrics(combo: Dict[str, Any],
     """
     metrics = []
 
-    releases_in_year = sorted_releases_in_year(event.release_date, all_release_events)
-
-    # There will always be at least one release in this list that represents the current release event.
-    # `sorted_releases_in_year` should fail if that is not the case.
-    if not releases_in_year:
-        raise ValueError("Function `sorted_releases_in_year` should not be returning empty lists.")
+    is_first_release_in_year = timeline.is_first_release_in_cohort(event)
 
-    is_first_release_in_year = (id(event) == id(releases_in_year[0]))
+    earliest_recidivism_period = timeline.earliest_follow_up_period(event)
 
     for period in relevant_periods:
         person_based_augmented_combo = person_level_augmented_combo(combo, event, MetricMethodologyType.PERSON, period)
@@ -502,9 +509,8 @@ def combination_rate_metrics(combo: Dict[str, Any],
 
             end_of_follow_up_period = event.release_date + relativedelta(years=period)
 
-            all_reincarcerations_in_window = reincarcerations_in_window(event.release_date,
-                                                                        end_of_follow_up_period,
-                                                                        all_reincarcerations)
+            all_reincarcerations_in_window = timeline.reincarcerations_in_window(event.release_date,
+                                                                                 end_of_follow_up_period)
 
             for reincarceration in all_reincarcerations_in_window:
                 event_combo_copy = event_based_augmented_combo.copy()
@@ -520,8 +526,7 @@ def combination_rate_metrics(combo: Dict[str, Any],
 
 def combination_count_metrics(combo: Dict[str, Any], event:
                               RecidivismReleaseEvent,
-                              all_reincarcerations:
-                              Dict[date, Dict[str, Any]],
+                              timeline: 'RecidivismTimeline',
                               metric_period_end_date: date) \
         -> List[Tuple[Dict[str, Any], int]]:
     """"Returns all unique recidivism count metrics for the given event and combination.
@@ -532,8 +537,7 @@ def combination_count_metrics(combo: Dict[str, Any], event:
     Args:
         combo: a characteristic combination to convert into metrics
         event: the release event from which the combination was derived
-        all_reincarcerations: dictionary where the keys are all dates of reincarceration for the person's ReleaseEvents,
-            and the values are a dictionary containing return type and from supervision type information
+        timeline: the RecidivismTimeline of the person's release events and reincarcerations
         metric_period_end_date: The day the metric periods end
 
     Returns:
@@ -552,8 +556,7 @@ def combination_count_metrics(combo: Dict[str, Any], event:
     # to include reincarcerations that happen on the last day of this count window.
     end_date = metric_period_end_date + datetime.timedelta(days=1)
 
-    all_reincarcerations_in_window = reincarcerations_in_window(
-        event.reincarceration_date, end_date, all_reincarcerations)
+    all_reincarcerations_in_window = timeline.reincarcerations_in_window(event.reincarceration_date, end_date)
 
     if len(all_reincarcerations_in_window) == 1:
         # This function will be called for every single one of the person's release events that resulted in a
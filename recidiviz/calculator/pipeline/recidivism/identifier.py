@@ -33,7 +33,7 @@ from recidiviz.calculator.pipeline.recidivism.release_event import \
 from recidiviz.calculator.pipeline.utils.calculator_utils import \
     identify_most_severe_violation_type_and_subtype
 from recidiviz.calculator.pipeline.utils.incarceration_period_utils import \
-    prepare_incarceration_periods_for_calculations, drop_temporary_custody_periods
+    PreProcessedIncarcerationPeriods, drop_temporary_custody_periods
 from recidiviz.common.constants.state.state_incarceration_period import \
     StateIncarcerationPeriodStatus, is_revocation_admission
 from recidiviz.common.constants.state.state_incarceration_period import \
@@ -50,7 +50,9 @@ from recidiviz.persistence.entity.state.entities import \
 
 def find_release_events_by_cohort_year(
         incarceration_periods: List[StateIncarcerationPeriod],
-        county_of_residence: Optional[str]) -> Dict[int, List[ReleaseEvent]]:
+        county_of_residence: Optional[str],
+        pre_processed_incarceration_periods: Optional[PreProcessedIncarcerationPeriods] = None) \
+        -> Dict[int, List[ReleaseEvent]]:
     """Finds instances of release and determines if they resulted in recidivism.
 
     Transforms each StateIncarcerationPeriod from which the person has been released into a mapping from its release
@@ -70,6 +72,8 @@ def find_release_events_by_cohort_year(
     Args:
         incarceration_periods: list of StateIncarcerationPeriods for a person
         county_of_residence: the county that the incarcerated person lives in (prior to incarceration).
+        pre_processed_incarceration_periods: the PreProcessedIncarcerationPeriods for the person's
+            |incarceration_periods|, if they have already been pre-processed for another calculation
 
     Returns:
         A dictionary mapping release cohorts to a list of ReleaseEvents for the given person in that cohort.
@@ -79,10 +83,12 @@ def find_release_events_by_cohort_year(
     if not incarceration_periods:
         return release_events
 
-    state_code = get_single_state_code(incarceration_periods)
+    if pre_processed_incarceration_periods is None:
+        state_code = get_single_state_code(incarceration_periods)
+        pre_processed_incarceration_periods = PreProcessedIncarcerationPeriods(state_code, incarceration_periods)
 
     incarceration_periods = prepare_incarceration_periods_for_recidivism_calculations(
-        state_code, incarceration_periods)
+        pre_processed_incarceration_periods)
 
     for index, incarceration_period in enumerate(incarceration_periods):
         state_code = incarceration_period.state_code
@@ -135,12 +141,10 @@ def find_release_events_by_cohort_year(
 
 
 def prepare_incarceration_periods_for_recidivism_calculations(
-        state_code: str, incarceration_periods: List[StateIncarcerationPeriod]) -> List[StateIncarcerationPeriod]:
-    """Returns a filtered list of the provided |incarceration_periods| to be used for recidivism calculation."""
+        pre_processed_incarceration_periods: PreProcessedIncarcerationPeriods) -> List[StateIncarcerationPeriod]:
+    """Returns a filtered list of the |pre_processed_incarceration_periods| to be used for recidivism calculation."""
 
-    incarceration_periods = prepare_incarceration_periods_for_calculations(
-        state_code,
-        incarceration_periods,
+    incarceration_periods = pre_processed_incarceration_periods.periods_for_calculations(
         collapse_transfers=True,
         collapse_temporary_custody_periods_with_revocation=True,
         collapse_transfers_with_different_pfi=True,
@@ -33,7 +33,8 @@ import apache_beam as beam
 from apache_beam.options.pipeline_options import SetupOptions, PipelineOptions
 from apache_beam.typehints import with_input_types, with_output_types
 
-from recidiviz.calculator.calculation_data_storage_config import DATAFLOW_METRICS_TO_TABLES
+from recidiviz.calculator.calculation_data_storage_config import DATAFLOW_METRICS_TO_TABLES, \
+    incremental_dataflow_metrics_dataset
 from recidiviz.calculator.pipeline.recidivism import identifier
 from recidiviz.calculator.pipeline.recidivism import calculator
 from recidiviz.calculator.pipeline.recidivism.release_event import ReleaseEvent
@@ -41,11 +42,12 @@ from recidiviz.calculator.pipeline.recidivism.metrics import \
     ReincarcerationRecidivismRateMetric, ReincarcerationRecidivismCountMetric, \
     ReincarcerationRecidivismMetric
 from recidiviz.calculator.pipeline.recidivism.metrics import ReincarcerationRecidivismMetricType
-from recidiviz.calculator.pipeline.utils.beam_utils import ConvertDictToKVTuple, RecidivizMetricWritableDict
+from recidiviz.calculator.pipeline.utils.beam_utils import ConvertDictToKVTuple, RecidivizMetricWritableDict, \
+    WriteIncrementalChangedPersons, register_attr_coder
 from recidiviz.calculator.pipeline.utils.entity_hydration_utils import \
     SetViolationResponseOnIncarcerationPeriod, SetViolationOnViolationsResponse
 from recidiviz.calculator.pipeline.utils.execution_utils import get_job_id, person_and_kwargs_for_identifier, \
-    select_all_by_person_query
+    select_all_by_person_query, incremental_run_person_id_filter_query
 from recidiviz.calculator.pipeline.utils.extractor_utils import BuildRootEntity
 from recidiviz.calculator.pipeline.utils.pipeline_args_utils import add_shared_pipeline_arguments
 from recidiviz.calculator.query.state.views.reference.persons_to_recent_county_of_residence import \
@@ -57,6 +59,10 @@ from recidiviz.utils import environment
 # Cached job_id value
 _job_id = None
 
+# Use the compact coder for the events and metrics of this pipeline wherever they are serialized
+register_attr_coder(ReleaseEvent)
+register_attr_coder(ReincarcerationRecidivismMetric)
+
 
 def job_id(pipeline_options: Dict[str, str]) -> str:
     global _job_id
@@ -287,7 +293,8 @@ def run(apache_beam_pipeline_options: PipelineOptions,
         output: str,
         metric_types: List[str],
         state_code: Optional[str],
-        person_filter_ids: Optional[List[int]]):
+        person_filter_ids: Optional[List[int]],
+        incremental_lookback_days: Optional[int] = None):
     """Runs the recidivism calculation pipeline."""
 
     # Workaround to load SQLAlchemy objects at start of pipeline. This is
@@ -308,13 +315,18 @@ def run(apache_beam_pipeline_options: PipelineOptions,
 
     person_id_filter_set = set(person_filter_ids) if person_filter_ids else None
 
+    # Incremental runs only recalculate metrics for the people whose entities have changed
+    person_id_filter_query = incremental_run_person_id_filter_query(
+        'recidivism', query_dataset, state_code, metric_types, incremental_lookback_days)
+
     with beam.Pipeline(options=apache_beam_pipeline_options) as p:
         # Get StatePersons
         persons = (p
                    | 'Load Persons' >>
                    BuildRootEntity(dataset=query_dataset, root_entity_class=entities.StatePerson,
                                    unifying_id_field=entities.StatePerson.get_class_id_name(),
-                                   build_related_entities=True, unifying_id_field_filter_set=person_id_filter_set))
+                                   build_related_entities=True, unifying_id_field_filter_set=person_id_filter_set,
+                                   unifying_id_field_filter_query=person_id_filter_query))
 
         # Get StateIncarcerationPeriods
         incarceration_periods = (p
@@ -324,6 +336,7 @@ def run(apache_beam_pipeline_options: PipelineOptions,
                                                  unifying_id_field=entities.StatePerson.get_class_id_name(),
                                                  build_related_entities=True,
                                                  unifying_id_field_filter_set=person_id_filter_set,
+                                                 unifying_id_field_filter_query=person_id_filter_query,
                                                  state_code=state_code
                                                  ))
 
@@ -334,6 +347,7 @@ def run(apache_beam_pipeline_options: PipelineOptions,
              BuildRootEntity(dataset=query_dataset, root_entity_class=entities.StateSupervisionViolation,
                              unifying_id_field=entities.StatePerson.get_class_id_name(), build_related_entities=True,
                              unifying_id_field_filter_set=person_id_filter_set,
+                             unifying_id_field_filter_query=person_id_filter_query,
                              state_code=state_code
                              ))
 
@@ -345,6 +359,7 @@ def run(apache_beam_pipeline_options: PipelineOptions,
              BuildRootEntity(dataset=query_dataset, root_entity_class=entities.StateSupervisionViolationResponse,
                              unifying_id_field=entities.StatePerson.get_class_id_name(), build_related_entities=True,
                              unifying_id_field_filter_set=person_id_filter_set,
+                             unifying_id_field_filter_query=person_id_filter_query,
                              state_code=state_code
                              ))
 
@@ -402,7 +417,8 @@ def run(apache_beam_pipeline_options: PipelineOptions,
             # persons_to_recent_county_of_residence query to have a state_code field, allowing us to also filter the
             # output by state_code.
             state_code_filter=None,
-            person_id_filter_set=person_id_filter_set)
+            person_id_filter_set=person_id_filter_set,
+            person_id_filter_query=person_id_filter_query)
 
         person_id_to_county_kv = (
             p
@@ -443,6 +459,16 @@ def run(apache_beam_pipeline_options: PipelineOptions,
             logging.warning("Non-empty person filter set - returning before writing metrics.")
             return
 
+        if person_id_filter_query:
+            # Incremental runs write to the incremental metrics dataset, from which the output is merged into the
+            # metric tables once the job has completed
+            output = incremental_dataflow_metrics_dataset(output)
+
+            _ = (p | 'Write changed persons to BQ' >>
+                 WriteIncrementalChangedPersons(changed_person_ids_query=person_id_filter_query,
+                                                dataset=output,
+                                                pipeline_options=all_pipeline_options))
+
         # Convert the metrics into a format that's writable to BQ
         writable_metrics = (recidivism_metrics
                             | 'Convert to dict to be written to BQ' >>
@@ -32,7 +32,8 @@ from recidiviz.calculator.pipeline.supervision.supervision_time_bucket import \
 from recidiviz.calculator.pipeline.utils.calculator_utils import \
     augmented_combo_for_calculations, relevant_metric_periods, \
     augment_combination, include_in_historical_metrics, \
-    get_calculation_month_lower_bound_date, get_calculation_month_upper_bound_date, characteristics_dict_builder
+    get_calculation_month_lower_bound_date, get_calculation_month_upper_bound_date, characteristics_dict_builder, \
+    PersonCharacteristicsCache
 from recidiviz.calculator.pipeline.supervision.metrics import \
     SupervisionMetricType, SupervisionSuccessMetric, SupervisionMetric, SupervisionPopulationMetric, \
     SupervisionRevocationMetric, SupervisionTerminationMetric, SupervisionCaseComplianceMetric, \
@@ -40,7 +41,7 @@ from recidiviz.calculator.pipeline.supervision.metrics import \
     SupervisionRevocationViolationTypeAnalysisMetric
 from recidiviz.calculator.pipeline.utils.metric_utils import MetricMethodologyType
 from recidiviz.calculator.pipeline.utils.state_utils.state_calculation_config_manager import \
-    supervision_types_distinct_for_state
+    StateCalculationConfig, get_state_calculation_config
 from recidiviz.persistence.entity.state.entities import StatePerson
 
 
@@ -88,17 +89,21 @@ def map_supervision_combinations(person: StatePerson,
     calculation_month_lower_bound = get_calculation_month_lower_bound_date(
         calculation_month_upper_bound, calculation_month_count)
 
+    person_characteristics_cache = PersonCharacteristicsCache(person=person, pipeline='supervision')
+
     for supervision_time_bucket in supervision_time_buckets:
+        state_config = get_state_calculation_config(supervision_time_bucket.state_code)
+
         if isinstance(supervision_time_bucket, ProjectedSupervisionCompletionBucket):
             if metric_inclusions.get(SupervisionMetricType.SUPERVISION_SUCCESS):
                 characteristic_combo_success = characteristics_dict(
-                    person, supervision_time_bucket, SupervisionSuccessMetric)
+                    person, supervision_time_bucket, SupervisionSuccessMetric, person_characteristics_cache)
 
                 supervision_success_metrics = map_metric_combinations(
                     characteristic_combo_success, supervision_time_bucket,
                     calculation_month_upper_bound, calculation_month_lower_bound,
                     supervision_time_buckets, periods_and_buckets,
-                    SupervisionMetricType.SUPERVISION_SUCCESS, include_metric_period_output)
+                    SupervisionMetricType.SUPERVISION_SUCCESS, include_metric_period_output, state_config)
 
                 metrics.extend(supervision_success_metrics)
 
@@ -108,34 +113,36 @@ def map_supervision_combinations(person: StatePerson,
                 # Only include successful sentences where the person was not incarcerated during the sentence in this
                 # metric
                 characteristic_combo_successful_sentence_length = characteristics_dict(
-                    person, supervision_time_bucket, SuccessfulSupervisionSentenceDaysServedMetric
+                    person, supervision_time_bucket, SuccessfulSupervisionSentenceDaysServedMetric,
+                    person_characteristics_cache
                 )
 
                 successful_sentence_length_metrics = map_metric_combinations(
                     characteristic_combo_successful_sentence_length, supervision_time_bucket,
                     calculation_month_upper_bound, calculation_month_lower_bound,
                     supervision_time_buckets, periods_and_buckets,
-                    SupervisionMetricType.SUPERVISION_SUCCESSFUL_SENTENCE_DAYS_SERVED, include_metric_period_output)
+                    SupervisionMetricType.SUPERVISION_SUCCESSFUL_SENTENCE_DAYS_SERVED, include_metric_period_output,
+                    state_config)
 
                 metrics.extend(successful_sentence_length_metrics)
 
         elif isinstance(supervision_time_bucket, SupervisionTerminationBucket):
             if metric_inclusions.get(SupervisionMetricType.SUPERVISION_TERMINATION):
                 characteristic_combo_termination = characteristics_dict(
-                    person, supervision_time_bucket, SupervisionTerminationMetric)
+                    person, supervision_time_bucket, SupervisionTerminationMetric, person_characteristics_cache)
 
                 termination_metrics = map_metric_combinations(
                     characteristic_combo_termination, supervision_time_bucket,
                     calculation_month_upper_bound, calculation_month_lower_bound,
                     supervision_time_buckets, periods_and_buckets,
-                    SupervisionMetricType.SUPERVISION_TERMINATION, include_metric_period_output)
+                    SupervisionMetricType.SUPERVISION_TERMINATION, include_metric_period_output, state_config)
 
                 metrics.extend(termination_metrics)
         elif isinstance(supervision_time_bucket,
                         (NonRevocationReturnSupervisionTimeBucket, RevocationReturnSupervisionTimeBucket)):
             if metric_inclusions.get(SupervisionMetricType.SUPERVISION_POPULATION):
                 characteristic_combo_population = characteristics_dict(
-                    person, supervision_time_bucket, SupervisionPopulationMetric)
+                    person, supervision_time_bucket, SupervisionPopulationMetric, person_characteristics_cache)
 
                 population_metrics = map_metric_combinations(
                     characteristic_combo_population, supervision_time_bucket,
@@ -143,7 +150,8 @@ def map_supervision_combinations(person: StatePerson,
                     supervision_time_buckets, periods_and_buckets,
                     SupervisionMetricType.SUPERVISION_POPULATION,
                     # The SupervisionPopulationMetric metric is explicitly a daily metric
-                    include_metric_period_output=False)
+                    include_metric_period_output=False,
+                    state_config=state_config)
 
                 metrics.extend(population_metrics)
 
@@ -151,7 +159,7 @@ def map_supervision_combinations(person: StatePerson,
                     and isinstance(supervision_time_bucket, NonRevocationReturnSupervisionTimeBucket)
                     and supervision_time_bucket.case_compliance is not None):
                 characteristic_combo_compliance = characteristics_dict(
-                    person, supervision_time_bucket, SupervisionCaseComplianceMetric)
+                    person, supervision_time_bucket, SupervisionCaseComplianceMetric, person_characteristics_cache)
 
                 compliance_metrics = map_metric_combinations(
                     characteristic_combo_compliance, supervision_time_bucket,
@@ -159,14 +167,15 @@ def map_supervision_combinations(person: StatePerson,
                     supervision_time_buckets, periods_and_buckets,
                     SupervisionMetricType.SUPERVISION_COMPLIANCE,
                     # The SupervisionCaseComplianceMetric metric is explicitly a daily metric
-                    include_metric_period_output=False)
+                    include_metric_period_output=False,
+                    state_config=state_config)
 
                 metrics.extend(compliance_metrics)
 
             if isinstance(supervision_time_bucket, RevocationReturnSupervisionTimeBucket):
                 if metric_inclusions.get(SupervisionMetricType.SUPERVISION_REVOCATION):
                     characteristic_combo_revocation = characteristics_dict(
-                        person, supervision_time_bucket, SupervisionRevocationMetric)
+                        person, supervision_time_bucket, SupervisionRevocationMetric, person_characteristics_cache)
 
                     revocation_metrics = map_metric_combinations(
                         characteristic_combo_revocation,
@@ -176,13 +185,15 @@ def map_supervision_combinations(person: StatePerson,
                         supervision_time_buckets,
                         periods_and_buckets,
                         SupervisionMetricType.SUPERVISION_REVOCATION,
-                        include_metric_period_output)
+                        include_metric_period_output,
+                        state_config)
 
                     metrics.extend(revocation_metrics)
 
                 if metric_inclusions.get(SupervisionMetricType.SUPERVISION_REVOCATION_ANALYSIS):
                     characteristic_combo_revocation_analysis = characteristics_dict(
-                        person, supervision_time_bucket, SupervisionRevocationAnalysisMetric)
+                        person, supervision_time_bucket, SupervisionRevocationAnalysisMetric,
+                        person_characteristics_cache)
 
                     revocation_analysis_metrics = map_metric_combinations(
                         characteristic_combo_revocation_analysis,
@@ -192,7 +203,8 @@ def map_supervision_combinations(person: StatePerson,
                         supervision_time_buckets,
                         periods_and_buckets,
                         SupervisionMetricType.SUPERVISION_REVOCATION_ANALYSIS,
-                        include_metric_period_output
+                        include_metric_period_output,
+                        state_config
                     )
 
                     metrics.extend(revocation_analysis_metrics)
@@ -202,13 +214,14 @@ def map_supervision_combinations(person: StatePerson,
                     characteristic_combo_revocation_violation_type_analysis = characteristics_dict(
                         person,
                         supervision_time_bucket,
-                        SupervisionRevocationViolationTypeAnalysisMetric)
+                        SupervisionRevocationViolationTypeAnalysisMetric,
+                        person_characteristics_cache)
 
                     revocation_violation_type_analysis_metrics = get_revocation_violation_type_analysis_metrics(
                         supervision_time_bucket, characteristic_combo_revocation_violation_type_analysis,
                         calculation_month_upper_bound, calculation_month_lower_bound,
                         supervision_time_buckets, periods_and_buckets,
-                        include_metric_period_output
+                        include_metric_period_output, state_config
                     )
 
                     metrics.extend(revocation_violation_type_analysis_metrics)
@@ -220,7 +233,9 @@ def map_supervision_combinations(person: StatePerson,
 
 def characteristics_dict(person: StatePerson,
                          supervision_time_bucket: SupervisionTimeBucket,
-                         metric_class: Type[SupervisionMetric]) -> Dict[str, Any]:
+                         metric_class: Type[SupervisionMetric],
+                         person_characteristics_cache: Optional[PersonCharacteristicsCache] = None) -> \
+        Dict[str, Any]:
     """Builds a dictionary that describes the characteristics of the person and supervision_time_bucket.
 
     Args:
@@ -228,6 +243,8 @@ def characteristics_dict(person: StatePerson,
         supervision_time_bucket: the SupervisionTimeBucket we are picking characteristics from
         metric_class: The SupervisionMetric provided determines which fields should be added to the characteristics
             dictionary
+        person_characteristics_cache: The PersonCharacteristicsCache shared across all of the person's buckets, if
+            available
 
     Returns:
         A dictionary populated with all relevant characteristics.
@@ -247,7 +264,8 @@ def characteristics_dict(person: StatePerson,
                                                    metric_class=metric_class,
                                                    person=person,
                                                    event_date=event_date,
-                                                   include_person_attributes=include_person_attributes)
+                                                   include_person_attributes=include_person_attributes,
+                                                   person_characteristics_cache=person_characteristics_cache)
     return characteristics
 
 
@@ -259,7 +277,8 @@ def map_metric_combinations(
         all_supervision_time_buckets: List[SupervisionTimeBucket],
         periods_and_buckets: Dict[int, List[SupervisionTimeBucket]],
         metric_type: SupervisionMetricType,
-        include_metric_period_output: bool) -> \
+        include_metric_period_output: bool,
+        state_config: StateCalculationConfig) -> \
         List[Tuple[Dict[str, Any], Any]]:
     """Maps the given time bucket and characteristic combinations to a variety of metrics that track supervision
      population and revocation counts.
@@ -275,6 +294,7 @@ def map_metric_combinations(
         metric_type: The metric type to set on each combination.
         include_metric_period_output: Whether or not to include metrics for the various metric periods before the
             current month. If False, will still include metric_period_months = 0 or 1 for the current month.
+        state_config: The StateCalculationConfig for the state of the supervision_time_bucket
 
     Returns:
         A list of key-value tuples representing specific metric combinations and the metric value corresponding to that
@@ -294,7 +314,7 @@ def map_metric_combinations(
 
         metrics.extend(combination_supervision_monthly_metrics(
             characteristic_combo, supervision_time_bucket,
-            all_supervision_time_buckets, metric_type, is_daily_metric))
+            all_supervision_time_buckets, metric_type, is_daily_metric, state_config))
 
     if include_metric_period_output:
         metrics.extend(combination_supervision_metric_period_metrics(
@@ -302,7 +322,8 @@ def map_metric_combinations(
             supervision_time_bucket,
             calculation_month_upper_bound,
             periods_and_buckets,
-            metric_type
+            metric_type,
+            state_config
         ))
 
     return metrics
@@ -315,7 +336,8 @@ def get_revocation_violation_type_analysis_metrics(
         calculation_month_lower_bound: Optional[date],
         all_buckets_sorted: List[SupervisionTimeBucket],
         periods_and_buckets: Dict[int, List[SupervisionTimeBucket]],
-        include_metric_period_output: bool) -> List[Tuple[Dict[str, Any], Any]]:
+        include_metric_period_output: bool,
+        state_config: StateCalculationConfig) -> List[Tuple[Dict[str, Any], Any]]:
     """Produces metrics of the type SUPERVISION_REVOCATION_VIOLATION_TYPE_ANALYSIS. For each violation type list in the
     bucket's violation_type_frequency_counter, produces metrics for each violation type in the list, and one with a
     violation_count_type of 'VIOLATION' to keep track of the overall number of violations."""
@@ -335,7 +357,8 @@ def get_revocation_violation_type_analysis_metrics(
                 all_buckets_sorted,
                 periods_and_buckets,
                 SupervisionMetricType.SUPERVISION_REVOCATION_VIOLATION_TYPE_ANALYSIS,
-                include_metric_period_output
+                include_metric_period_output,
+                state_config
             )
 
             metrics.extend(revocation_analysis_metrics_violation_count)
@@ -355,7 +378,8 @@ def get_revocation_violation_type_analysis_metrics(
                     all_buckets_sorted,
                     periods_and_buckets,
                     SupervisionMetricType.SUPERVISION_REVOCATION_VIOLATION_TYPE_ANALYSIS,
-                    include_metric_period_output
+                    include_metric_period_output,
+                    state_config
                 )
 
                 metrics.extend(revocation_analysis_metrics_violation_type)
@@ -368,7 +392,8 @@ def combination_supervision_monthly_metrics(
         supervision_time_bucket: SupervisionTimeBucket,
         all_supervision_time_buckets: List[SupervisionTimeBucket],
         metric_type: SupervisionMetricType,
-        is_daily_metric: bool
+        is_daily_metric: bool,
+        state_config: StateCalculationConfig
 ) -> List[Tuple[Dict[str, Any], int]]:
     """Returns all unique supervision metrics for the given time bucket and combination for the month of the bucket.
 
@@ -383,6 +408,7 @@ def combination_supervision_monthly_metrics(
         metric_type: The type of metric being tracked by this combo
         is_daily_metric:  If True, limits person-based counts to the date of the event. If False, limits person-based
             counts to the month of the event.
+        state_config: The StateCalculationConfig for the state of the supervision_time_bucket
 
     Returns:
         A list of key-value tuples representing specific metric combination dictionaries and the the metric value
@@ -496,7 +522,8 @@ def combination_supervision_monthly_metrics(
             combo,
             supervision_time_bucket,
             buckets_in_period,
-            metric_type):
+            metric_type,
+            state_config):
         person_combo_value = _person_combo_value(combo, supervision_time_bucket, buckets_in_period, metric_type)
 
         # Include this event in the person-based count
@@ -510,7 +537,8 @@ def combination_supervision_metric_period_metrics(
         supervision_time_bucket: SupervisionTimeBucket,
         metric_period_end_date: date,
         periods_and_buckets: Dict[int, List[SupervisionTimeBucket]],
-        metric_type: SupervisionMetricType) \
+        metric_type: SupervisionMetricType,
+        state_config: StateCalculationConfig) \
         -> List[Tuple[Dict[str, Any], int]]:
     """Returns all unique supervision metrics for the given time bucket and combination for each of the relevant
     metric_period_months.
@@ -526,6 +554,7 @@ def combination_supervision_metric_period_metrics(
         periods_and_buckets: Dictionary mapping metric period month lengths to
             the SupervisionTimeBuckets that fall in that period
         metric_type: The type of metric being tracked by this combo
+        state_config: The StateCalculationConfig for the state of the supervision_time_bucket
 
     Returns:
         A list of key-value tuples representing specific metric combination dictionaries and the the metric value
@@ -574,7 +603,8 @@ def combination_supervision_metric_period_metrics(
                     combo,
                     supervision_time_bucket,
                     relevant_buckets_in_period,
-                    metric_type):
+                    metric_type,
+                    state_config):
 
                 person_combo_value = _person_combo_value(
                     combo, supervision_time_bucket, relevant_buckets_in_period, metric_type
@@ -590,7 +620,8 @@ def include_supervision_in_count(combo: Dict[str, Any],
                                  supervision_time_bucket: SupervisionTimeBucket,
                                  all_buckets_in_period:
                                  List[SupervisionTimeBucket],
-                                 metric_type: SupervisionMetricType) -> bool:
+                                 metric_type: SupervisionMetricType,
+                                 state_config: StateCalculationConfig) -> bool:
     """Determines whether the given supervision_time_bucket should be included in a person-based count given the other
     buckets in the period.
 
@@ -616,7 +647,7 @@ def include_supervision_in_count(combo: Dict[str, Any],
     """
     # If supervision types are distinct for a given state, then a person who has events with different types of
     # supervision cannot contribute to counts for more than one type
-    if supervision_types_distinct_for_state(supervision_time_bucket.state_code):
+    if state_config.supervision_types_distinct:
         supervision_type_specific_metric = False
     else:
         # If this combo specifies the supervision type (and it's not a person-level combo), then limit this inclusion
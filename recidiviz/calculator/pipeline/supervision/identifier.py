@@ -31,9 +31,6 @@ from recidiviz.calculator.pipeline.supervision.supervision_time_bucket import \
     NonRevocationReturnSupervisionTimeBucket, \
     ProjectedSupervisionCompletionBucket, SupervisionTerminationBucket
 from recidiviz.calculator.pipeline.utils.execution_utils import list_of_dicts_to_dict_with_keys
-from recidiviz.calculator.pipeline.utils.state_utils.us_id.us_id_revocation_identification import \
-    us_id_revoked_supervision_period_if_revocation_occurred
-from recidiviz.calculator.pipeline.utils.state_utils.us_mo import us_mo_violation_utils
 from recidiviz.calculator.pipeline.utils.calculator_utils import \
     last_day_of_month, identify_most_severe_violation_type_and_subtype, \
     identify_most_severe_response_decision, first_day_of_next_month, VIOLATION_TYPE_SEVERITY_ORDER
@@ -41,29 +38,19 @@ from recidiviz.calculator.pipeline.utils.assessment_utils import \
     find_most_recent_assessment, most_recent_assessment_attributes
 from recidiviz.calculator.pipeline.utils.incarceration_period_index import IncarcerationPeriodIndex
 from recidiviz.calculator.pipeline.utils.state_utils.state_calculation_config_manager import \
-    supervision_types_distinct_for_state, \
-    default_to_supervision_period_officer_for_revocation_details_for_state, get_month_supervision_type, \
-    terminating_supervision_period_supervision_type, \
-    supervision_period_counts_towards_supervision_population_in_date_range_state_specific, \
-    filter_violation_responses_before_revocation, \
-    should_collapse_transfers_different_purpose_for_incarceration, incarceration_period_is_from_revocation, \
-    filter_supervision_periods_for_revocation_identification, get_pre_revocation_supervision_type, \
-    produce_supervision_time_bucket_for_period, only_state_custodial_authority_in_supervision_population, \
-    get_case_compliance_on_date, include_decisions_on_follow_up_responses, \
-    second_assessment_on_supervision_is_more_reliable, get_supervision_district_from_supervision_period
+    StateCalculationConfig, get_state_calculation_config, terminating_supervision_period_supervision_type, \
+    filter_violation_responses_before_revocation, filter_supervision_periods_for_revocation_identification, \
+    produce_supervision_time_bucket_for_period
 from recidiviz.calculator.pipeline.utils.supervision_period_index import SupervisionPeriodIndex
-from recidiviz.calculator.pipeline.utils.supervision_period_utils import prepare_supervision_periods_for_calculations, \
-    get_relevant_supervision_periods_before_admission_date
+from recidiviz.calculator.pipeline.utils.supervision_period_utils import prepare_supervision_periods_for_calculations
 from recidiviz.calculator.pipeline.utils.supervision_type_identification import \
     get_supervision_type_from_sentences
 from recidiviz.calculator.pipeline.utils.time_range_utils import TimeRange, TimeRangeDiff
 from recidiviz.common.constants.state.state_assessment import StateAssessmentLevel, StateAssessmentType
 from recidiviz.common.constants.state.state_case_type import \
     StateSupervisionCaseType
-from recidiviz.common.constants.state.state_incarceration_period import StateSpecializedPurposeForIncarceration, \
-    is_revocation_admission
-from recidiviz.calculator.pipeline.utils.incarceration_period_utils import \
-    prepare_incarceration_periods_for_calculations
+from recidiviz.common.constants.state.state_incarceration_period import StateSpecializedPurposeForIncarceration
+from recidiviz.calculator.pipeline.utils.incarceration_period_utils import PreProcessedIncarcerationPeriods
 from recidiviz.common.constants.state.state_supervision_period import \
     StateSupervisionPeriodTerminationReason, StateSupervisionPeriodSupervisionType
 from recidiviz.common.constants.state.state_supervision_violation import \
@@ -115,6 +102,7 @@ def find_supervision_time_buckets(
         ssvr_agent_associations: Dict[int, Dict[Any, Any]],
         supervision_period_to_agent_associations: Dict[int, Dict[Any, Any]],
         supervision_period_judicial_district_association: List[Dict[str, Any]],
+        pre_processed_incarceration_periods: Optional[PreProcessedIncarcerationPeriods] = None,
 ) -> List[SupervisionTimeBucket]:
     """Finds buckets of time that a person was on supervision and determines if they resulted in revocation return.
 
@@ -148,6 +136,8 @@ def find_supervision_time_buckets(
             about the corresponding StateAgent
         - supervision_period_judicial_district_association: a list of dictionaries with information connecting
             StateSupervisionPeriod ids to the judicial district responsible for the period of supervision
+        - pre_processed_incarceration_periods: the PreProcessedIncarcerationPeriods for the person's
+            |incarceration_periods|, if they have already been pre-processed for another calculation
 
     Returns:
         A list of SupervisionTimeBuckets for the person.
@@ -160,29 +150,28 @@ def find_supervision_time_buckets(
     else:
         state_code = get_single_state_code(incarceration_periods)
 
+    state_config = get_state_calculation_config(state_code)
+
     supervision_period_to_judicial_district_associations = list_of_dicts_to_dict_with_keys(
         supervision_period_judicial_district_association, StateSupervisionPeriod.get_class_id_name())
 
     supervision_time_buckets: List[SupervisionTimeBucket] = []
 
-    should_drop_non_state_custodial_authority_periods = \
-        only_state_custodial_authority_in_supervision_population(state_code)
-
     supervision_periods = prepare_supervision_periods_for_calculations(
         supervision_periods,
-        drop_non_state_custodial_authority_periods=should_drop_non_state_custodial_authority_periods)
-
-    should_collapse_transfers_with_different_pfi = \
-        should_collapse_transfers_different_purpose_for_incarceration(state_code)
+        drop_non_state_custodial_authority_periods=
+        state_config.only_state_custodial_authority_in_supervision_population)
 
     # We don't want to collapse temporary custody periods with revocations because we want to use the actual date
     # of the revocation admission for the revocation buckets
-    incarceration_periods = prepare_incarceration_periods_for_calculations(
-        state_code,
-        incarceration_periods,
+    if pre_processed_incarceration_periods is None:
+        pre_processed_incarceration_periods = PreProcessedIncarcerationPeriods(state_code, incarceration_periods)
+
+    incarceration_periods = pre_processed_incarceration_periods.periods_for_calculations(
         collapse_transfers=True,
         collapse_temporary_custody_periods_with_revocation=False,
-        collapse_transfers_with_different_pfi=should_collapse_transfers_with_different_pfi,
+        collapse_transfers_with_different_pfi=
+        state_config.should_collapse_transfers_different_purpose_for_incarceration,
         overwrite_facility_information_in_transfers=True)
 
     supervision_period_index = SupervisionPeriodIndex(supervision_periods=supervision_periods)
@@ -241,7 +230,7 @@ def find_supervision_time_buckets(
         supervision_period_to_judicial_district_associations,
         incarceration_period_index)
 
-    if supervision_types_distinct_for_state(state_code):
+    if state_config.supervision_types_distinct:
         supervision_time_buckets = _convert_buckets_to_dual(supervision_time_buckets)
     else:
         supervision_time_buckets = _expand_dual_supervision_buckets(supervision_time_buckets)
@@ -281,6 +270,7 @@ def find_time_buckets_for_supervision_period(
     supervision_day_buckets: List[SupervisionTimeBucket] = []
 
     start_date = supervision_period.start_date
+    state_config = get_state_calculation_config(supervision_period.state_code)
     termination_date = supervision_period.termination_date
 
     if start_date is None:
@@ -296,9 +286,10 @@ def find_time_buckets_for_supervision_period(
                 supervision_sentences,
                 incarceration_sentences,
                 supervision_period,
-                incarceration_period_index):
+                incarceration_period_index,
+                state_config):
 
-            supervision_type = get_month_supervision_type(
+            supervision_type = state_config.get_month_supervision_type(
                 bucket_date, supervision_sentences, incarceration_sentences, supervision_period)
 
             assessment_score = None
@@ -313,11 +304,12 @@ def find_time_buckets_for_supervision_period(
                 assessment_type = most_recent_assessment.assessment_type
 
             supervising_officer_external_id, supervising_district_external_id = \
-                _get_supervising_officer_and_district(supervision_period, supervision_period_to_agent_associations)
+                _get_supervising_officer_and_district(supervision_period, supervision_period_to_agent_associations,
+                                                      state_config)
 
             case_type = _identify_most_severe_case_type(supervision_period)
 
-            violation_history = get_violation_and_response_history(supervision_period.state_code,
+            violation_history = get_violation_and_response_history(state_config,
                                                                    bucket_date,
                                                                    violation_responses)
 
@@ -336,12 +328,12 @@ def find_time_buckets_for_supervision_period(
                 if not start_of_supervision:
                     raise ValueError("SupervisionPeriodIndex.supervision_start_dates_by_period_id incomplete.")
 
-                case_compliance = get_case_compliance_on_date(supervision_period,
-                                                              case_type,
-                                                              start_of_supervision,
-                                                              bucket_date,
-                                                              assessments,
-                                                              supervision_contacts)
+                case_compliance = state_config.get_case_compliance_on_date(supervision_period,
+                                                                           case_type,
+                                                                           start_of_supervision,
+                                                                           bucket_date,
+                                                                           assessments,
+                                                                           supervision_contacts)
 
             supervision_day_buckets.append(
                 NonRevocationReturnSupervisionTimeBucket(
@@ -372,34 +364,13 @@ def find_time_buckets_for_supervision_period(
     return supervision_day_buckets
 
 
-def has_revocation_admission_on_date(
-        date_in_month: date,
-        incarceration_period_index: IncarcerationPeriodIndex) -> bool:
-    """Returns whether or not a revocation admission occurred on the |date_in_month|."""
-    incarceration_periods_by_admission_date = incarceration_period_index.incarceration_periods_by_admission_date
-    if date_in_month not in incarceration_periods_by_admission_date:
-        return False
-
-    # An admission to prison happened on this day
-    incarceration_periods = incarceration_periods_by_admission_date[date_in_month]
-    for incarceration_period in incarceration_periods:
-        ip_index = incarceration_period_index.incarceration_periods.index(incarceration_period)
-        preceding_incarceration_period = None
-
-        if ip_index > 0:
-            preceding_incarceration_period = incarceration_period_index.incarceration_periods[ip_index - 1]
-
-        if incarceration_period_is_from_revocation(incarceration_period, preceding_incarceration_period):
-            return True
-    return False
-
-
 def supervision_period_counts_towards_supervision_population_in_date_range(
         date_range: TimeRange,
         incarceration_period_index: IncarcerationPeriodIndex,
         supervision_sentences: List[StateSupervisionSentence],
         incarceration_sentences: List[StateIncarcerationSentence],
-        supervision_period: StateSupervisionPeriod) -> bool:
+        supervision_period: StateSupervisionPeriod,
+        state_config: StateCalculationConfig) -> bool:
     """Returns True if the existence of the |supervision_period| means a person can be counted towards the supervision
     population in the provided date range.
     """
@@ -415,11 +386,11 @@ def supervision_period_counts_towards_supervision_population_in_date_range(
     if not supervision_overlapping_range:
         return False
 
-    return supervision_period_counts_towards_supervision_population_in_date_range_state_specific(
-        date_range=date_range,
-        incarceration_sentences=incarceration_sentences,
-        supervision_sentences=supervision_sentences,
-        supervision_period=supervision_period
+    return state_config.supervision_period_counts_towards_supervision_population_in_date_range(
+        date_range,
+        supervision_sentences,
+        incarceration_sentences,
+        supervision_period
     )
 
 
@@ -428,10 +399,11 @@ def on_supervision_on_date(
         supervision_sentences: List[StateSupervisionSentence],
         incarceration_sentences: List[StateIncarcerationSentence],
         supervision_period: StateSupervisionPeriod,
-        incarceration_period_index: IncarcerationPeriodIndex):
+        incarceration_period_index: IncarcerationPeriodIndex,
+        state_config: StateCalculationConfig):
     """Determines whether the person was on supervision on a given date. We do not count someone as being on supervision
      for a given date if they were incarcerated or revoked that day."""
-    if has_revocation_admission_on_date(evaluation_date, incarceration_period_index):
+    if incarceration_period_index.has_revocation_admission_on_date(evaluation_date):
         return False
 
     # This should never happen
@@ -446,7 +418,8 @@ def on_supervision_on_date(
             supervision_sentences=supervision_sentences,
             incarceration_sentences=incarceration_sentences,
             supervision_period=supervision_period,
-            incarceration_period_index=incarceration_period_index)
+            incarceration_period_index=incarceration_period_index,
+            state_config=state_config)
 
     return supervision_period_counts_towards_supervision_population_on_date
 
@@ -477,13 +450,16 @@ def find_supervision_termination_bucket(
     If this supervision does not have a termination_date, then None is returned.
     """
     if supervision_period.start_date is not None and supervision_period.termination_date is not None:
+        state_config = get_state_calculation_config(supervision_period.state_code)
+
         supervision_period_counts_towards_supervision_population_at_any_point = \
             supervision_period_counts_towards_supervision_population_in_date_range(
                 date_range=TimeRange.for_supervision_period(supervision_period),
                 supervision_sentences=supervision_sentences,
                 incarceration_sentences=incarceration_sentences,
                 supervision_period=supervision_period,
-                incarceration_period_index=incarceration_period_index)
+                incarceration_period_index=incarceration_period_index,
+                state_config=state_config)
 
         if not supervision_period_counts_towards_supervision_population_at_any_point:
             # If no portion of the supervision period counts towards the supervision population at any point, do not
@@ -521,12 +497,13 @@ def find_supervision_termination_bucket(
                 assessment_termination_date,
                 assessments)
 
-        violation_history = get_violation_and_response_history(supervision_period.state_code,
+        violation_history = get_violation_and_response_history(state_config,
                                                                termination_date,
                                                                violation_responses)
 
         supervising_officer_external_id, supervising_district_external_id = \
-            _get_supervising_officer_and_district(supervision_period, supervision_period_to_agent_associations)
+            _get_supervising_officer_and_district(supervision_period, supervision_period_to_agent_associations,
+                                                  state_config)
 
         case_type = _identify_most_severe_case_type(supervision_period)
 
@@ -576,6 +553,7 @@ def _get_revocation_details(incarceration_period: StateIncarcerationPeriod,
     supervising_officer_external_id = None
     supervising_district_external_id = None
 
+    state_config = get_state_calculation_config(incarceration_period.state_code)
     source_violation_response = incarceration_period.source_supervision_violation_response
 
     if source_violation_response:
@@ -601,10 +579,11 @@ def _get_revocation_details(incarceration_period: StateIncarcerationPeriod,
                 supervising_district_external_id = agent_info.get('district_external_id')
 
     if not supervising_officer_external_id and \
-            default_to_supervision_period_officer_for_revocation_details_for_state(incarceration_period.state_code):
+            state_config.default_to_supervision_period_officer_for_revocation_details:
         if supervision_period and supervision_period_to_agent_associations:
             supervising_officer_external_id, supervising_district_external_id = \
-                _get_supervising_officer_and_district(supervision_period, supervision_period_to_agent_associations)
+                _get_supervising_officer_and_district(supervision_period, supervision_period_to_agent_associations,
+                                                      state_config)
 
     if revocation_type is None:
         # TODO(3341): Consider removing revocation_type and always looking at the specialized_purpose_for_incarceration
@@ -635,7 +614,7 @@ ViolationHistory = NamedTuple('ViolationHistory', [
 
 
 def get_violation_and_response_history(
-        state_code: str,
+        state_config: StateCalculationConfig,
         end_date: date,
         violation_responses: List[StateSupervisionViolationResponse]
 ) -> ViolationHistory:
@@ -660,11 +639,7 @@ def get_violation_and_response_history(
     updated_responses: List[StateSupervisionViolationResponse] = []
 
     for response in responses_in_window:
-        # TODO(2995): Formalize state-specific calc logic
-        if state_code == 'US_MO':
-            updated_responses.append(us_mo_violation_utils.normalize_violations_on_responses(response))
-        else:
-            updated_responses.append(response)
+        updated_responses.append(state_config.normalize_violations_on_response(response))
 
     for response in updated_responses:
         violation = response.supervision_violation
@@ -680,7 +655,7 @@ def get_violation_and_response_history(
 
     responses_in_window_for_decision_evaluation = responses_in_window
 
-    if include_decisions_on_follow_up_responses(state_code):
+    if state_config.include_decisions_on_follow_up_responses:
         responses_in_window_for_decision_evaluation = _get_responses_in_window_before_revocation(
             end_date, violation_responses, include_follow_up_responses=True)
 
@@ -704,7 +679,7 @@ def get_violation_and_response_history(
     for violation in violations_in_window:
         violation_type_entries.extend(violation.supervision_violation_types)
 
-    violation_history_description = _get_violation_history_description(violations_in_window)
+    violation_history_description = _get_violation_history_description(violations_in_window, state_config)
 
     violation_type_frequency_counter = _get_violation_type_frequency_counter(violations_in_window)
 
@@ -766,7 +741,8 @@ def _get_responses_in_window_before_revocation(revocation_date: date,
     return responses_in_window
 
 
-def _get_violation_history_description(violations: List[StateSupervisionViolation]) -> Optional[str]:
+def _get_violation_history_description(violations: List[StateSupervisionViolation],
+                                       state_config: StateCalculationConfig) -> Optional[str]:
     """Returns a string description of the violation history given the violation type entries. Tallies the number of
     each violation type, and then builds a string that lists the number of each of the represented types in the order
     listed in the violation_type_shorthand dictionary and separated by a semicolon.
@@ -776,13 +752,8 @@ def _get_violation_history_description(violations: List[StateSupervisionViolatio
     if not violations:
         return None
 
-    state_code = violations[0].state_code
-    ranked_violation_type_and_subtype_counts: Dict[str, int] = {}
-
-    if state_code.upper() == 'US_MO':
-        ranked_violation_type_and_subtype_counts = \
-            us_mo_violation_utils.get_ranked_violation_type_and_subtype_counts(violations,
-                                                                               VIOLATION_TYPE_SEVERITY_ORDER)
+    ranked_violation_type_and_subtype_counts = \
+        state_config.get_ranked_violation_type_and_subtype_counts(violations, VIOLATION_TYPE_SEVERITY_ORDER)
 
     descriptions = [f"{count}{label}" for label, count in
                     ranked_violation_type_and_subtype_counts.items() if count > 0]
@@ -845,7 +816,8 @@ def _get_is_on_supervision_last_day_of_month(
         supervision_sentences=supervision_sentences,
         incarceration_sentences=incarceration_sentences,
         supervision_period=supervision_period,
-        incarceration_period_index=incarceration_period_index)
+        incarceration_period_index=incarceration_period_index,
+        state_config=get_state_calculation_config(supervision_period.state_code))
 
 
 def find_revocation_return_buckets(
@@ -879,8 +851,11 @@ def find_revocation_return_buckets(
         previous_incarceration_period = (incarceration_period_index.incarceration_periods[index - 1]
                                          if index > 0 else None)
 
-        admission_is_revocation, revoked_supervision_periods = _revoked_supervision_periods_if_revocation_occurred(
-            incarceration_period, filtered_supervision_periods, previous_incarceration_period)
+        state_config = get_state_calculation_config(incarceration_period.state_code)
+
+        admission_is_revocation, revoked_supervision_periods = \
+            state_config.revoked_supervision_periods_if_revocation_occurred(
+                incarceration_period, filtered_supervision_periods, previous_incarceration_period)
 
         if not admission_is_revocation:
             continue
@@ -899,7 +874,7 @@ def find_revocation_return_buckets(
                     incarceration_period, supervision_period,
                     ssvr_agent_associations, supervision_period_to_agent_associations)
 
-                pre_revocation_supervision_type = get_pre_revocation_supervision_type(
+                pre_revocation_supervision_type = state_config.get_pre_revocation_supervision_type(
                     incarceration_sentences, supervision_sentences, incarceration_period, supervision_period)
 
                 case_type = _identify_most_severe_case_type(supervision_period)
@@ -907,7 +882,7 @@ def find_revocation_return_buckets(
                 supervision_level_raw_text = supervision_period.supervision_level_raw_text
 
                 # Get details about the violation and response history leading up to the revocation
-                violation_history = get_violation_and_response_history(incarceration_period.state_code,
+                violation_history = get_violation_and_response_history(state_config,
                                                                        admission_date,
                                                                        violation_responses)
 
@@ -951,14 +926,14 @@ def find_revocation_return_buckets(
             revocation_details = _get_revocation_details(
                 incarceration_period, None, ssvr_agent_associations, None)
 
-            pre_revocation_supervision_type = get_pre_revocation_supervision_type(
+            pre_revocation_supervision_type = state_config.get_pre_revocation_supervision_type(
                 incarceration_sentences, supervision_sentences, incarceration_period, None)
 
             # TODO(2853): Don't default to GENERAL once we figure out how to handle unset fields
             case_type = StateSupervisionCaseType.GENERAL
 
             # Get details about the violation and response history leading up to the revocation
-            violation_history = get_violation_and_response_history(incarceration_period.state_code,
+            violation_history = get_violation_and_response_history(state_config,
                                                                    admission_date,
                                                                    violation_responses)
 
@@ -1078,7 +1053,8 @@ def _get_projected_completion_bucket(
                                                                                                      completion_date)
 
     supervising_officer_external_id, supervising_district_external_id = \
-        _get_supervising_officer_and_district(supervision_period, supervision_period_to_agent_associations)
+        _get_supervising_officer_and_district(supervision_period, supervision_period_to_agent_associations,
+                                              get_state_calculation_config(supervision_period.state_code))
 
     case_type = _identify_most_severe_case_type(supervision_period)
 
@@ -1147,10 +1123,11 @@ def _include_termination_in_success_metric(termination_reason: Optional[StateSup
 
 def _get_supervising_officer_and_district(
         supervision_period: StateSupervisionPeriod,
-        supervision_period_to_agent_associations: Dict[int, Dict[Any, Any]]) \
+        supervision_period_to_agent_associations: Dict[int, Dict[Any, Any]],
+        state_config: StateCalculationConfig) \
         -> Tuple[Optional[str], Optional[str]]:
     supervising_officer_external_id = None
-    supervising_district_external_id = get_supervision_district_from_supervision_period(supervision_period)
+    supervising_district_external_id = state_config.get_supervision_district_from_supervision_period(supervision_period)
 
     if supervision_period.supervision_period_id:
         agent_info = supervision_period_to_agent_associations.get(supervision_period.supervision_period_id)
@@ -1316,22 +1293,9 @@ def _revoked_supervision_periods_if_revocation_occurred(
     that were revoked (e.g. the person was serving supervision out-of-state). In these instances, this function will
     return True and an empty list [].
     """
-    revoked_periods: List[StateSupervisionPeriod] = []
-
-    if incarceration_period.state_code == 'US_ID':
-        admission_is_revocation, revoked_period = \
-            us_id_revoked_supervision_period_if_revocation_occurred(
-                incarceration_period, supervision_periods, preceding_incarceration_period
-            )
-
-        if revoked_period:
-            revoked_periods = [revoked_period]
-    else:
-        admission_is_revocation = is_revocation_admission(incarceration_period.admission_reason)
-        revoked_periods = get_relevant_supervision_periods_before_admission_date(incarceration_period.admission_date,
-                                                                                 supervision_periods)
-
-    return admission_is_revocation, revoked_periods
+    return get_state_calculation_config(
+        incarceration_period.state_code).revoked_supervision_periods_if_revocation_occurred(
+            incarceration_period, supervision_periods, preceding_incarceration_period)
 
 
 def _get_judicial_district_code(
@@ -1369,7 +1333,8 @@ def find_assessment_score_change(state_code: str,
             and start_date <= assessment.assessment_date <= termination_date
         ]
 
-        index_of_first_reliable_assessment = 1 if second_assessment_on_supervision_is_more_reliable(state_code) else 0
+        index_of_first_reliable_assessment = \
+            1 if get_state_calculation_config(state_code).second_assessment_on_supervision_is_more_reliable else 0
         min_assessments = 2 + index_of_first_reliable_assessment
 
         # If this person had less than the min number of assessments then we cannot compare the first reliable
@@ -27,7 +27,8 @@ from apache_beam.options.pipeline_options import SetupOptions, PipelineOptions
 from apache_beam.pvalue import AsDict
 from apache_beam.typehints import with_input_types, with_output_types
 
-from recidiviz.calculator.calculation_data_storage_config import DATAFLOW_METRICS_TO_TABLES
+from recidiviz.calculator.calculation_data_storage_config import DATAFLOW_METRICS_TO_TABLES, \
+    incremental_dataflow_metrics_dataset
 from recidiviz.calculator.pipeline.supervision import identifier, calculator
 from recidiviz.calculator.pipeline.supervision.metrics import \
     SupervisionMetric, SupervisionPopulationMetric, \
@@ -38,11 +39,12 @@ from recidiviz.calculator.pipeline.supervision.metrics import \
     SupervisionMetricType
 from recidiviz.calculator.pipeline.supervision.supervision_time_bucket import \
     SupervisionTimeBucket
-from recidiviz.calculator.pipeline.utils.beam_utils import ConvertDictToKVTuple, RecidivizMetricWritableDict
+from recidiviz.calculator.pipeline.utils.beam_utils import ConvertDictToKVTuple, RecidivizMetricWritableDict, \
+    WriteIncrementalChangedPersons, register_attr_coder
 from recidiviz.calculator.pipeline.utils.entity_hydration_utils import \
     SetViolationResponseOnIncarcerationPeriod, SetViolationOnViolationsResponse, ConvertSentencesToStateSpecificType
 from recidiviz.calculator.pipeline.utils.execution_utils import get_job_id, person_and_kwargs_for_identifier, \
-    select_all_by_person_query
+    select_all_by_person_query, incremental_run_person_id_filter_query
 from recidiviz.calculator.pipeline.utils.extractor_utils import BuildRootEntity
 from recidiviz.calculator.pipeline.utils.pipeline_args_utils import add_shared_pipeline_arguments
 from recidiviz.calculator.query.state.views.reference.ssvr_to_agent_association import \
@@ -59,6 +61,10 @@ from recidiviz.utils import environment
 # Cached job_id value
 _job_id = None
 
+# Use the compact coder for the events and metrics of this pipeline wherever they are serialized
+register_attr_coder(SupervisionTimeBucket)
+register_attr_coder(SupervisionMetric)
+
 
 def job_id(pipeline_options: Dict[str, str]) -> str:
     global _job_id
@@ -298,7 +304,8 @@ def run(apache_beam_pipeline_options: PipelineOptions,
         metric_types: List[str],
         state_code: Optional[str],
         calculation_end_month: Optional[str],
-        person_filter_ids: Optional[List[int]]):
+        person_filter_ids: Optional[List[int]],
+        incremental_lookback_days: Optional[int] = None):
     """Runs the supervision calculation pipeline."""
 
     # Workaround to load SQLAlchemy objects at start of pipeline. This is necessary because the BuildRootEntity
@@ -317,6 +324,10 @@ def run(apache_beam_pipeline_options: PipelineOptions,
 
     person_id_filter_set = set(person_filter_ids) if person_filter_ids else None
 
+    # Incremental runs only recalculate metrics for the people whose entities have changed
+    person_id_filter_query = incremental_run_person_id_filter_query(
+        'supervision', input_dataset, state_code, metric_types, incremental_lookback_days)
+
     with beam.Pipeline(options=apache_beam_pipeline_options) as p:
         # Get StatePersons
         persons = (p | 'Load Persons' >> BuildRootEntity(dataset=input_dataset,
@@ -324,6 +335,7 @@ def run(apache_beam_pipeline_options: PipelineOptions,
                                                          unifying_id_field=entities.StatePerson.get_class_id_name(),
                                                          build_related_entities=True,
                                                          unifying_id_field_filter_set=person_id_filter_set,
+                                                         unifying_id_field_filter_query=person_id_filter_query,
                                                          state_code=state_code))
 
         # Get StateIncarcerationPeriods
@@ -333,6 +345,7 @@ def run(apache_beam_pipeline_options: PipelineOptions,
             unifying_id_field=entities.StatePerson.get_class_id_name(),
             build_related_entities=True,
             unifying_id_field_filter_set=person_id_filter_set,
+            unifying_id_field_filter_query=person_id_filter_query,
             state_code=state_code
         ))
 
@@ -343,6 +356,7 @@ def run(apache_beam_pipeline_options: PipelineOptions,
             unifying_id_field=entities.StatePerson.get_class_id_name(),
             build_related_entities=True,
             unifying_id_field_filter_set=person_id_filter_set,
+            unifying_id_field_filter_query=person_id_filter_query,
             state_code=state_code
         ))
 
@@ -354,6 +368,7 @@ def run(apache_beam_pipeline_options: PipelineOptions,
             unifying_id_field=entities.StatePerson.get_class_id_name(),
             build_related_entities=True,
             unifying_id_field_filter_set=person_id_filter_set,
+            unifying_id_field_filter_query=person_id_filter_query,
             state_code=state_code
         ))
 
@@ -364,6 +379,7 @@ def run(apache_beam_pipeline_options: PipelineOptions,
             unifying_id_field=entities.StatePerson.get_class_id_name(),
             build_related_entities=True,
             unifying_id_field_filter_set=person_id_filter_set,
+            unifying_id_field_filter_query=person_id_filter_query,
             state_code=state_code
         ))
 
@@ -374,6 +390,7 @@ def run(apache_beam_pipeline_options: PipelineOptions,
             unifying_id_field=entities.StatePerson.get_class_id_name(),
             build_related_entities=True,
             unifying_id_field_filter_set=person_id_filter_set,
+            unifying_id_field_filter_query=person_id_filter_query,
             state_code=state_code
         ))
 
@@ -384,6 +401,7 @@ def run(apache_beam_pipeline_options: PipelineOptions,
             unifying_id_field=entities.StatePerson.get_class_id_name(),
             build_related_entities=True,
             unifying_id_field_filter_set=person_id_filter_set,
+            unifying_id_field_filter_query=person_id_filter_query,
             state_code=state_code
         ))
 
@@ -394,6 +412,7 @@ def run(apache_beam_pipeline_options: PipelineOptions,
             unifying_id_field=entities.StatePerson.get_class_id_name(),
             build_related_entities=False,
             unifying_id_field_filter_set=person_id_filter_set,
+            unifying_id_field_filter_query=person_id_filter_query,
             state_code=state_code
         ))
 
@@ -403,12 +422,14 @@ def run(apache_beam_pipeline_options: PipelineOptions,
             unifying_id_field=entities.StatePerson.get_class_id_name(),
             build_related_entities=False,
             unifying_id_field_filter_set=person_id_filter_set,
+            unifying_id_field_filter_query=person_id_filter_query,
             state_code=state_code
         ))
 
         # Bring in the table that associates StateSupervisionViolationResponses to information about StateAgents
         ssvr_to_agent_association_query = select_all_by_person_query(
-            reference_dataset, SSVR_TO_AGENT_ASSOCIATION_VIEW_NAME, state_code, person_id_filter_set)
+            reference_dataset, SSVR_TO_AGENT_ASSOCIATION_VIEW_NAME, state_code, person_id_filter_set,
+            person_id_filter_query=person_id_filter_query)
 
         ssvr_to_agent_associations = (p | "Read SSVR to Agent table from BigQuery" >>
                                       beam.io.Read(beam.io.BigQuerySource
@@ -423,7 +444,8 @@ def run(apache_beam_pipeline_options: PipelineOptions,
                                          )
 
         supervision_period_to_agent_association_query = select_all_by_person_query(
-            reference_dataset, SUPERVISION_PERIOD_TO_AGENT_ASSOCIATION_VIEW_NAME, state_code, person_id_filter_set)
+            reference_dataset, SUPERVISION_PERIOD_TO_AGENT_ASSOCIATION_VIEW_NAME, state_code, person_id_filter_set,
+            person_id_filter_query=person_id_filter_query)
 
         supervision_period_to_agent_associations = (p | "Read Supervision Period to Agent table from BigQuery" >>
                                                     beam.io.Read(beam.io.BigQuerySource
@@ -441,7 +463,8 @@ def run(apache_beam_pipeline_options: PipelineOptions,
         if state_code is None or state_code == 'US_MO':
             # Bring in the reference table that includes sentence status ranking information
             us_mo_sentence_status_query = select_all_by_person_query(
-                reference_dataset, US_MO_SENTENCE_STATUSES_VIEW_NAME, state_code, person_id_filter_set)
+                reference_dataset, US_MO_SENTENCE_STATUSES_VIEW_NAME, state_code, person_id_filter_set,
+                person_id_filter_query=person_id_filter_query)
 
             us_mo_sentence_statuses = (p | "Read MO sentence status table from BigQuery" >>
                                        beam.io.Read(beam.io.BigQuerySource(query=us_mo_sentence_status_query,
@@ -476,7 +499,8 @@ def run(apache_beam_pipeline_options: PipelineOptions,
             reference_dataset,
             SUPERVISION_PERIOD_JUDICIAL_DISTRICT_ASSOCIATION_VIEW_NAME,
             state_code,
-            person_id_filter_set)
+            person_id_filter_set,
+            person_id_filter_query=person_id_filter_query)
 
         sp_to_judicial_district_kv = (
             p | "Read supervision_period to judicial_district associations from BigQuery" >>
@@ -568,6 +592,16 @@ def run(apache_beam_pipeline_options: PipelineOptions,
             logging.warning("Non-empty person filter set - returning before writing metrics.")
             return
 
+        if person_id_filter_query:
+            # Incremental runs write to the incremental metrics dataset, from which the output is merged into the
+            # metric tables once the job has completed
+            output = incremental_dataflow_metrics_dataset(output)
+
+            _ = (p | 'Write changed persons to BQ' >>
+                 WriteIncrementalChangedPersons(changed_person_ids_query=person_id_filter_query,
+                                                dataset=output,
+                                                pipeline_options=all_pipeline_options))
+
         # Convert the metrics into a format that's writable to BQ
         writable_metrics = (supervision_metrics | 'Convert to dict to be written to BQ' >>
                             beam.ParDo(
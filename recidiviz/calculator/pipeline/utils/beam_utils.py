@@ -16,12 +16,21 @@
 # =============================================================================
 """Utils for beam calculations."""
 # pylint: disable=abstract-method, arguments-differ, redefined-builtin
-from typing import Any, Dict, NamedTuple
+import datetime
+import sys
+from enum import Enum
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Type
 
+import attr
 import apache_beam as beam
+from apache_beam.coders import coder_impl
 from apache_beam.typehints import with_input_types, with_output_types
 
+from recidiviz.calculator.calculation_data_storage_config import INCREMENTAL_CHANGED_PERSONS_TABLE
+from recidiviz.calculator.pipeline.utils.execution_utils import get_job_id
+from recidiviz.calculator.pipeline.utils.extractor_utils import ReadFromBigQuery
 from recidiviz.calculator.pipeline.utils.metric_utils import RecidivizMetric, json_serializable_metric_key
+from recidiviz.common.attr_utils import is_enum, get_enum_cls, is_list, is_str, is_int, is_float, is_bool, is_date
 
 AverageFnResult = NamedTuple('AverageFnResult', [
         ('average_of_inputs', float),
@@ -120,3 +129,289 @@ class RecidivizMetricWritableDict(beam.DoFn):
 
     def to_runner_api_parameter(self, _):
         pass  # Passing unused abstract method.
+
+
+@with_input_types(beam.typehints.Dict[str, Any])
+@with_output_types(beam.typehints.Dict[str, Any])
+class ChangedPersonWritableDict(beam.DoFn):
+    """Builds a dictionary for a person whose metrics are recalculated by an incremental pipeline run, in the format
+    necessary to write the person to the incremental changed persons table in BigQuery."""
+
+    def __init__(self):
+        super(ChangedPersonWritableDict, self).__init__()
+        self._job_id: Optional[str] = None
+
+    def process(self, element, *args, **kwargs):
+        """Adds the job_id of the current pipeline job to the person_id and state_code of a changed person.
+
+        The pipeline options are sent in as the **kwargs so that the job_id can be retrieved. The job_id is cached on
+        the DoFn instance so that it is only retrieved once per worker.
+
+        Args:
+            element: A dictionary with the person_id and state_code of a changed person
+
+        Yields:
+            A dictionary with the person_id, state_code and job_id of the changed person.
+        """
+        if not self._job_id:
+            self._job_id = get_job_id(kwargs)
+
+        yield {'person_id': element['person_id'],
+               'state_code': element['state_code'],
+               'job_id': self._job_id}
+
+    def to_runner_api_parameter(self, _):
+        pass  # Passing unused abstract method.
+
+
+class WriteIncrementalChangedPersons(beam.PTransform):
+    """Writes the people whose metrics are recalculated by an incremental pipeline run to the incremental changed
+    persons table, so that their prior metrics can be replaced when the output of the run is merged."""
+
+    def __init__(self, changed_person_ids_query: str, dataset: str, pipeline_options: Dict[str, str]):
+        super(WriteIncrementalChangedPersons, self).__init__()
+        self._changed_person_ids_query = changed_person_ids_query
+        self._dataset = dataset
+        self._pipeline_options = pipeline_options
+
+    def expand(self, input_or_inputs):
+        return (input_or_inputs
+                | 'Read changed person ids' >> ReadFromBigQuery(query=self._changed_person_ids_query)
+                | 'Convert changed persons to dicts' >>
+                beam.ParDo(ChangedPersonWritableDict(), **self._pipeline_options)
+                | f"Write changed persons to BQ table: {INCREMENTAL_CHANGED_PERSONS_TABLE}" >>
+                beam.io.WriteToBigQuery(
+                    table=INCREMENTAL_CHANGED_PERSONS_TABLE,
+                    dataset=self._dataset,
+                    schema='person_id:INTEGER,state_code:STRING,job_id:STRING',
+                    create_disposition=beam.io.BigQueryDisposition.CREATE_IF_NEEDED,
+                    write_disposition=beam.io.BigQueryDisposition.WRITE_APPEND,
+                    method=beam.io.WriteToBigQuery.Method.FILE_LOADS
+                ))
+
+
+# Markers written by the RecidivizAttrCoder before each attribute value
+_NONE_VALUE = 0
+_TYPED_VALUE = 1
+_FALLBACK_VALUE = 2
+
+# Functions that check whether a value can be written with the typed encoding of its field, write a value with that
+# encoding, and read a value written with that encoding
+_FieldCodec = Tuple[Callable[[Any], bool], Callable[[Any, Any], None], Callable[[Any], Any]]
+
+
+class RecidivizAttrCoder(beam.coders.Coder):
+    """Coder for the attr classes passed between the steps of the calculation pipelines, i.e. the RecidivizMetric and
+    identifier event classes.
+
+    Each value is encoded as the index of its class among the subclasses of the coder's base class, followed by the
+    value of each of its attributes in field order. Attribute values are encoded according to the type of the attr
+    field: enums as their ordinal within the enum class, dates as their proleptic Gregorian ordinal, ints as varints
+    and strings as UTF-8. Strings are interned when decoded, since the same state codes, job ids and buckets are
+    repeated across many values. Any value that does not match the type of its field, and any object that isn't an
+    instance of a known attr class, is encoded with the fallback coder.
+
+    Enum ordinals and class indices are only stable within a single version of the code, so this coder must not be used
+    to persist values outside of a pipeline job.
+    """
+
+    def __init__(self, base_class: Type):
+        super().__init__()
+        self._base_class = base_class
+        self._classes = _attr_subclasses(base_class)
+        self._class_indices: Dict[Type, int] = {cls: i for i, cls in enumerate(self._classes)}
+        self._fallback_coder = beam.coders.FastPrimitivesCoder()
+        self._fallback_coder_impl: Optional[coder_impl.CoderImpl] = None
+        self._field_codecs: Optional[List[List[Tuple[str, _FieldCodec]]]] = None
+
+    @classmethod
+    def from_type_hint(cls, typehint, _registry):
+        return cls(typehint)
+
+    def encode(self, value) -> bytes:
+        out = coder_impl.create_OutputStream()
+        self.encode_to_stream(value, out)
+        return out.get()
+
+    def decode(self, encoded: bytes):
+        return self.decode_from_stream(coder_impl.create_InputStream(encoded))
+
+    def is_deterministic(self) -> bool:
+        return False
+
+    def __eq__(self, other):
+        return type(self) == type(other) and self._base_class == other._base_class  # pylint: disable=protected-access
+
+    def __hash__(self):
+        return hash((type(self), self._base_class))
+
+    def __getstate__(self):
+        # The coder implementations and field codecs can't be pickled, so they are rebuilt after unpickling
+        state = self.__dict__.copy()
+        state['_fallback_coder_impl'] = None
+        state['_field_codecs'] = None
+        return state
+
+    def _fallback_impl(self) -> coder_impl.CoderImpl:
+        if self._fallback_coder_impl is None:
+            self._fallback_coder_impl = self._fallback_coder.get_impl()
+        return self._fallback_coder_impl
+
+    def _codecs_for_class_index(self, class_index: int) -> List[Tuple[str, _FieldCodec]]:
+        if self._field_codecs is None:
+            self._field_codecs = [[(field.name, _field_codec(field, self._fallback_impl()))
+                                   for field in attr.fields(cls)]
+                                  for cls in self._classes]
+        return self._field_codecs[class_index]
+
+    def encode_to_stream(self, value, out) -> None:
+        """Writes the encoded value to the given output stream."""
+        class_index = self._class_indices.get(type(value))
+
+        # Objects with attributes that are set outside of their attr fields can't use the typed encoding
+        if class_index is None or \
+                len(getattr(value, '__dict__', ())) != len(self._codecs_for_class_index(class_index)):
+            out.write_var_int64(0)
+            self._fallback_impl().encode_to_stream(value, out, True)
+            return
+
+        out.write_var_int64(class_index + 1)
+
+        for field_name, (matches_type, write_value, _) in self._codecs_for_class_index(class_index):
+            field_value = value.__dict__[field_name]
+            if field_value is None:
+                out.write_byte(_NONE_VALUE)
+            elif matches_type(field_value):
+                out.write_byte(_TYPED_VALUE)
+                write_value(field_value, out)
+            else:
+                out.write_byte(_FALLBACK_VALUE)
+                self._fallback_impl().encode_to_stream(field_value, out, True)
+
+    def decode_from_stream(self, in_stream):
+        """Reads an encoded value from the given input stream."""
+        class_index = in_stream.read_var_int64() - 1
+
+        if class_index < 0:
+            return self._fallback_impl().decode_from_stream(in_stream, True)
+
+        cls = self._classes[class_index]
+        value = cls.__new__(cls)
+
+        for field_name, (_, _, read_value) in self._codecs_for_class_index(class_index):
+            marker = in_stream.read_byte()
+            if marker == _NONE_VALUE:
+                field_value = None
+            elif marker == _TYPED_VALUE:
+                field_value = read_value(in_stream)
+            else:
+                field_value = self._fallback_impl().decode_from_stream(in_stream, True)
+
+            value.__dict__[field_name] = field_value
+
+        return value
+
+
+def _attr_subclasses(base_class: Type) -> List[Type]:
+    """Returns the attr classes that are the given class or one of its subclasses, in a stable order."""
+    classes = set()
+    to_visit = [base_class]
+    while to_visit:
+        cls = to_visit.pop()
+        if attr.has(cls) and cls not in classes:
+            classes.add(cls)
+        to_visit.extend(cls.__subclasses__())
+
+    return sorted(classes, key=lambda cls: (cls.__module__, cls.__qualname__))
+
+
+def _field_codec(field: attr.Attribute, fallback_coder_impl) -> _FieldCodec:
+    """Returns the functions used to encode and decode values of the given attr field."""
+    if is_list(field):
+        list_type = next((t for t in getattr(field.type, '__args__', ()) if _is_list_type(t)), field.type)
+        element_enum_cls = getattr(list_type, '__args__', (None,))[0]
+
+        if isinstance(element_enum_cls, type) and issubclass(element_enum_cls, Enum):
+            enum_members = list(element_enum_cls)
+            enum_ordinals = {member: ordinal for ordinal, member in enumerate(enum_members)}
+
+            def write_enum_list(value, out):
+                out.write_var_int64(len(value))
+                for member in value:
+                    out.write_var_int64(enum_ordinals[member])
+
+            return (lambda value: isinstance(value, list) and all(member in enum_ordinals for member in value),
+                    write_enum_list,
+                    lambda in_stream: [enum_members[in_stream.read_var_int64()]
+                                       for _ in range(in_stream.read_var_int64())])
+
+        return _fallback_field_codec(fallback_coder_impl)
+
+    if is_enum(field):
+        enum_cls = get_enum_cls(field)
+        enum_members = list(enum_cls) if enum_cls else []
+        enum_ordinals = {member: ordinal for ordinal, member in enumerate(enum_members)}
+
+        return (lambda value: value in enum_ordinals,
+                lambda value, out: out.write_var_int64(enum_ordinals[value]),
+                lambda in_stream: enum_members[in_stream.read_var_int64()])
+
+    if is_str(field):
+        return (lambda value: _has_type(value, str),
+                lambda value, out: out.write(value.encode('utf-8'), True),
+                lambda in_stream: sys.intern(in_stream.read_all(True).decode('utf-8')))
+
+    if is_bool(field):
+        return (lambda value: _has_type(value, bool),
+                lambda value, out: out.write_byte(1 if value else 0),
+                lambda in_stream: in_stream.read_byte() == 1)
+
+    if is_int(field):
+        return (lambda value: _has_type(value, int) and -2 ** 63 <= value < 2 ** 63,
+                lambda value, out: out.write_var_int64(value),
+                lambda in_stream: in_stream.read_var_int64())
+
+    if is_float(field):
+        return (lambda value: _has_type(value, float),
+                lambda value, out: out.write_bigendian_double(value),
+                lambda in_stream: in_stream.read_bigendian_double())
+
+    if is_date(field):
+        # Datetimes are also dates, but would lose their time when encoded as an ordinal
+        return (lambda value: _has_type(value, datetime.date),
+                lambda value, out: out.write_var_int64(value.toordinal()),
+                lambda in_stream: datetime.date.fromordinal(in_stream.read_var_int64()))
+
+    nested_attr_class = next((t for t in getattr(field.type, '__args__', (field.type,))
+                              if isinstance(t, type) and attr.has(t)), None)
+    if nested_attr_class:
+        nested_coder = RecidivizAttrCoder(nested_attr_class)
+
+        return (lambda value: True,
+                nested_coder.encode_to_stream,
+                nested_coder.decode_from_stream)
+
+    return _fallback_field_codec(fallback_coder_impl)
+
+
+def _is_list_type(field_type) -> bool:
+    return getattr(field_type, '__origin__', None) is list
+
+
+def _has_type(value, value_type: Type) -> bool:
+    """Returns whether the value is exactly of the given type, and not of a subclass that the typed encoding of the
+    type would not preserve (e.g. bools are ints and datetimes are dates)."""
+    return type(value) is value_type  # pylint: disable=unidiomatic-typecheck
+
+
+def _fallback_field_codec(fallback_coder_impl) -> _FieldCodec:
+    return (lambda value: False,
+            lambda value, out: fallback_coder_impl.encode_to_stream(value, out, True),
+            lambda in_stream: fallback_coder_impl.decode_from_stream(in_stream, True))
+
+
+def register_attr_coder(base_class: Type) -> None:
+    """Registers the RecidivizAttrCoder as the coder for the given attr class and each of its subclasses, so that it is
+    used for any PCollection with one of these classes as its element type."""
+    for cls in _attr_subclasses(base_class):
+        beam.coders.registry.register_coder(cls, RecidivizAttrCoder)
@@ -35,7 +35,8 @@ class CalculateCloudTaskManager:
     def create_dataflow_monitor_task(self,
                                      job_id: str,
                                      location: str,
-                                     topic: str) -> None:
+                                     topic: str,
+                                     incremental_pipeline: Optional[str] = None) -> None:
         """Create a task to monitor the progress of a Dataflow job.
 
         Args:
@@ -43,11 +44,16 @@ class CalculateCloudTaskManager:
             location: The region where the job is being run
             topic: Pub/Sub topic where a message will be published if the job
                 completes successfully
+            incremental_pipeline: The calculation pipeline of the job, if the
+                job is an incremental run whose output must be merged into the
+                metric tables once it completes
         """
         body = {'project_id': self.cloud_task_client.project_id,
                 'job_id': job_id,
                 'location': location,
                 'topic': topic}
+        if incremental_pipeline:
+            body['incremental_pipeline'] = incremental_pipeline
         task_id = '{}-{}-{}'.format(
             job_id, str(datetime.datetime.utcnow().date()), uuid.uuid4())
 
@@ -58,3 +64,30 @@ class CalculateCloudTaskManager:
             body=body,
             schedule_delay_seconds=300,  # 5-minute delay
         )
+
+    def create_incremental_metrics_merge_task(self,
+                                              job_id: str,
+                                              pipeline: str,
+                                              topic: str) -> None:
+        """Create a task to merge the output of a completed incremental
+        Dataflow job into the metric tables.
+
+        Args:
+            job_id: The unique id of the Dataflow job
+            pipeline: The calculation pipeline of the job
+            topic: Pub/Sub topic where a message will be published once the
+                output has been merged
+        """
+        body = {'project_id': self.cloud_task_client.project_id,
+                'job_id': job_id,
+                'pipeline': pipeline,
+                'topic': topic}
+        task_id = '{}-merge-{}-{}'.format(
+            job_id, str(datetime.datetime.utcnow().date()), uuid.uuid4())
+
+        self.cloud_task_client.create_task(
+            task_id=task_id,
+            queue_name=JOB_MONITOR_QUEUE_V2,
+            relative_uri='/dataflow_monitor/merge_incremental_metrics',
+            body=body,
+        )
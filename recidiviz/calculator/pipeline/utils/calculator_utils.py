@@ -17,7 +17,8 @@
 """Utils for the various calculation pipelines."""
 import datetime
 from datetime import date
-from typing import Optional, List, Any, Dict, Tuple, Type, Union
+from types import MappingProxyType
+from typing import Optional, List, Any, Dict, Tuple, Type, Union, Mapping
 
 import dateutil
 import attr
@@ -97,6 +98,16 @@ def person_characteristics(person: StatePerson,
     event_age_bucket = age_bucket(event_age)
     if event_age_bucket is not None:
         characteristics['age_bucket'] = event_age_bucket
+
+    characteristics.update(_date_independent_person_characteristics(person, pipeline))
+
+    return characteristics
+
+
+def _date_independent_person_characteristics(person: StatePerson, pipeline: str) -> Dict[str, Any]:
+    """Returns the person's demographic characteristics that do not depend on the date of the event."""
+    characteristics: Dict[str, Any] = {}
+
     if person.gender is not None:
         characteristics['gender'] = person.gender
     if person.races:
@@ -119,6 +130,58 @@ def person_characteristics(person: StatePerson,
     return characteristics
 
 
+@attr.s
+class PersonCharacteristicsCache:
+    """Caches the person-level characteristics of a single StatePerson for a given pipeline. The characteristics that
+    do not depend on the event date are derived once per person and filtered once per metric class, so the
+    characteristics for each event are built by overlaying the event-specific fields on a shared, read-only base."""
+
+    person: StatePerson = attr.ib()
+
+    pipeline: str = attr.ib()
+
+    # The person's characteristics that do not depend on the date of the event
+    base_characteristics: Mapping[str, Any] = attr.ib()
+
+    @base_characteristics.default
+    def _base_characteristics(self) -> Mapping[str, Any]:
+        return MappingProxyType(_date_independent_person_characteristics(self.person, self.pipeline))
+
+    # For each metric class, the base_characteristics relevant to that metric and whether the metric has an
+    # age_bucket dimension. Built lazily.
+    _base_characteristics_by_metric_class: Dict[Type[RecidivizMetric], Tuple[Mapping[str, Any], bool]] = \
+        attr.ib(factory=dict)
+
+    def characteristics_for_metric(self, metric_class: Type[RecidivizMetric], event_date: date) -> Dict[str, Any]:
+        """Returns a new dictionary of the person's characteristics on the event_date that are relevant to the given
+        metric_class."""
+        cached = self._base_characteristics_by_metric_class.get(metric_class)
+
+        if cached is None:
+            metric_attributes = attr.fields_dict(metric_class)
+            cached = (
+                MappingProxyType({
+                    attribute: value for attribute, value in self.base_characteristics.items()
+                    if attribute in metric_attributes
+                }),
+                'age_bucket' in metric_attributes
+            )
+            self._base_characteristics_by_metric_class[metric_class] = cached
+
+        base_for_metric, includes_age_bucket = cached
+
+        characteristics: Dict[str, Any] = {}
+
+        if includes_age_bucket:
+            event_age_bucket = age_bucket(age_at_date(self.person, event_date))
+            if event_age_bucket is not None:
+                characteristics['age_bucket'] = event_age_bucket
+
+        characteristics.update(base_for_metric)
+
+        return characteristics
+
+
 def age_at_date(person: StatePerson, check_date: date) -> Optional[int]:
     """Calculates the age of the StatePerson at the given date.
 
@@ -177,9 +240,7 @@ def augment_combination(characteristic_combo: Dict[str, Any],
         The augmented characteristic combination, ready for tracking.
     """
     augmented_combo = characteristic_combo.copy()
-
-    for key, value in parameters.items():
-        augmented_combo[key] = value
+    augmented_combo.update(parameters)
 
     return augmented_combo
 
@@ -318,17 +379,18 @@ def augmented_combo_for_calculations(combo: Dict[str, Any],
 
     Returns: Returns a dictionary that has been augmented with necessary parameters.
     """
-    parameters: Dict[str, Any] = {'state_code': state_code,
-                                  'methodology': methodology,
-                                  'year': year}
+    augmented_combo = combo.copy()
+    augmented_combo['state_code'] = state_code
+    augmented_combo['methodology'] = methodology
+    augmented_combo['year'] = year
 
     if month:
-        parameters['month'] = month
+        augmented_combo['month'] = month
 
     if metric_period_months is not None:
-        parameters['metric_period_months'] = metric_period_months
+        augmented_combo['metric_period_months'] = metric_period_months
 
-    return augment_combination(combo, parameters)
+    return augmented_combo
 
 
 def person_external_id_to_include(pipeline: str,
@@ -411,36 +473,11 @@ def get_calculation_month_lower_bound_date(calculation_month_upper_bound: date,
     return calculation_month_lower_bound
 
 
-def characteristics_dict_builder(
-        pipeline: str,
-        event: Union[IncarcerationEvent, ProgramEvent, ReleaseEvent, SupervisionTimeBucket],
-        metric_class: Type[RecidivizMetric],
-        person: StatePerson, event_date: date, include_person_attributes: bool) -> Dict[str, Any]:
-    """Builds a dictionary from the provided event and person that will eventually populate the values on the given
-    metric_class. Only adds attributes to the dictionary that are relevant to the metric_class.
-
-    Args:
-        - state_code: The state_code corresponding to the event
-        - pipeline: The name of the pipeline this dictionary is being populated for
-        - event: The event that was a product of the pipeline's identifier step
-        - metric_class: The type of RecidivizMetric that this event will contribute to
-        - person: The StatePerson related to this event
-
-    """
-    characteristics: Dict[str, Any] = {}
-    metric_attributes = attr.fields_dict(metric_class).keys()
-
-    if include_person_attributes:
-        person_attributes = person_characteristics(person, event_date, pipeline)
-
-        # Add relevant demographic and person-level dimensions
-        for attribute, value in person_attributes.items():
-            if attribute in metric_attributes:
-                characteristics[attribute] = value
-
-    fields_not_in_events = list(attr.fields_dict(RecidivizMetric).keys())
-    fields_not_in_events.extend(attr.fields_dict(PersonLevelMetric).keys())
-    fields_not_in_events.extend([
+# Metric fields that are never populated from the attributes of an event
+_FIELDS_NOT_IN_EVENTS = frozenset(
+    list(attr.fields_dict(RecidivizMetric).keys())
+    + list(attr.fields_dict(PersonLevelMetric).keys())
+    + [
         # These are determined by the period of time the metric describes
         'year',
         'month',
@@ -464,14 +501,69 @@ def characteristics_dict_builder(
         'average_days_served',
     ])
 
-    # Add attributes from the event that are relevant to the metric_class
-    for metric_attribute in metric_attributes:
-        if hasattr(event, metric_attribute) and metric_attribute not in fields_not_in_events:
-            attribute_value = getattr(event, metric_attribute)
-            if attribute_value is not None:
-                characteristics[metric_attribute] = attribute_value
-        elif metric_attribute not in fields_not_in_events:
+
+# Cache of the event attributes to copy onto the characteristics for each (metric class, event class) pair
+_EVENT_ATTRIBUTES_FOR_METRIC: Dict[Tuple[type, type], Tuple[str, ...]] = {}
+
+
+def _event_attributes_for_metric(metric_class: Type[RecidivizMetric], event_class: type) -> Tuple[str, ...]:
+    """Returns the names of the attributes on the event_class that should be copied onto the characteristics of the
+    given metric_class. Raises a ValueError if the event_class is missing a field expected by the metric_class."""
+    cached = _EVENT_ATTRIBUTES_FOR_METRIC.get((metric_class, event_class))
+
+    if cached is not None:
+        return cached
+
+    event_fields = attr.fields_dict(event_class) if attr.has(event_class) else {}
+    event_attributes = []
+
+    for metric_attribute in attr.fields_dict(metric_class):
+        if metric_attribute in _FIELDS_NOT_IN_EVENTS:
+            continue
+
+        if metric_attribute not in event_fields and not hasattr(event_class, metric_attribute):
             raise ValueError(
-                f'Did not find expected field [{metric_attribute}] in {event.__class__}. Metric class: {metric_class}')
+                f'Did not find expected field [{metric_attribute}] in {event_class}. Metric class: {metric_class}')
+
+        event_attributes.append(metric_attribute)
+
+    _EVENT_ATTRIBUTES_FOR_METRIC[(metric_class, event_class)] = tuple(event_attributes)
+
+    return _EVENT_ATTRIBUTES_FOR_METRIC[(metric_class, event_class)]
+
+
+def characteristics_dict_builder(
+        pipeline: str,
+        event: Union[IncarcerationEvent, ProgramEvent, ReleaseEvent, SupervisionTimeBucket],
+        metric_class: Type[RecidivizMetric],
+        person: StatePerson, event_date: date, include_person_attributes: bool,
+        person_characteristics_cache: Optional[PersonCharacteristicsCache] = None) -> Dict[str, Any]:
+    """Builds a dictionary from the provided event and person that will eventually populate the values on the given
+    metric_class. Only adds attributes to the dictionary that are relevant to the metric_class.
+
+    Args:
+        - state_code: The state_code corresponding to the event
+        - pipeline: The name of the pipeline this dictionary is being populated for
+        - event: The event that was a product of the pipeline's identifier step
+        - metric_class: The type of RecidivizMetric that this event will contribute to
+        - person: The StatePerson related to this event
+        - person_characteristics_cache: A PersonCharacteristicsCache for the person and pipeline, shared across all
+            of the person's events. If unset, the person's characteristics are derived for this event only.
+
+    """
+    if include_person_attributes:
+        if person_characteristics_cache is None:
+            person_characteristics_cache = PersonCharacteristicsCache(person=person, pipeline=pipeline)
+
+        # Add relevant demographic and person-level dimensions
+        characteristics = person_characteristics_cache.characteristics_for_metric(metric_class, event_date)
+    else:
+        characteristics = {}
+
+    # Add attributes from the event that are relevant to the metric_class
+    for metric_attribute in _event_attributes_for_metric(metric_class, type(event)):
+        attribute_value = getattr(event, metric_attribute)
+        if attribute_value is not None:
+            characteristics[metric_attribute] = attribute_value
 
     return characteristics
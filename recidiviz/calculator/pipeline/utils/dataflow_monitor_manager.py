@@ -23,6 +23,8 @@ import logging
 import flask
 from flask import request
 
+from recidiviz.calculator.calculation_data_storage_manager import \
+    merge_incremental_dataflow_metrics
 from recidiviz.calculator.pipeline.utils.calculate_cloud_task_manager import \
     CalculateCloudTaskManager
 from recidiviz.calculator.pipeline.utils.execution_utils import get_dataflow_job_with_id
@@ -49,13 +51,25 @@ def handle_dataflow_monitor_task():
     location = data['location']
     topic_dashed = data['topic']
     topic = topic_dashed.replace('-', '.')
+    incremental_pipeline = data.get('incremental_pipeline')
 
     job = get_dataflow_job_with_id(project_id, job_id, location)
 
     if job:
         state = job['currentState']
 
-        if state == 'JOB_STATE_DONE':
+        if state == 'JOB_STATE_DONE' and incremental_pipeline:
+            # Incremental job was successful. Merge its output into the metric
+            # tables before publishing the success message.
+            logging.info("Incremental job %s successfully completed. "
+                         "Merging output into the %s metric tables.",
+                         job_id, incremental_pipeline)
+            CalculateCloudTaskManager().create_incremental_metrics_merge_task(
+                job_id,
+                incremental_pipeline,
+                topic_dashed)
+
+        elif state == 'JOB_STATE_DONE':
             # Job was successful. Publish success message.
             logging.info("Job %s successfully completed. Triggering "
                          "dashboard export.", job_id)
@@ -70,7 +84,8 @@ def handle_dataflow_monitor_task():
             CalculateCloudTaskManager().create_dataflow_monitor_task(
                 job_id,
                 location,
-                topic_dashed)
+                topic_dashed,
+                incremental_pipeline=incremental_pipeline)
         else:
             logging.warning("Dataflow job %s has state: %s. Killing the"
                             "monitor tasks.", job_id, state)
@@ -78,3 +93,27 @@ def handle_dataflow_monitor_task():
         logging.warning("Dataflow job %s not found.", job_id)
 
     return '', HTTPStatus.OK
+
+
+@dataflow_monitor_blueprint.route('/merge_incremental_metrics',
+                                  methods=['POST'])
+@authenticate_request
+def handle_merge_incremental_metrics_task():
+    """Worker function to merge the output of the completed incremental
+    Dataflow job with the given `job_id` into the metric tables of the given
+    `pipeline`, and to then publish a message to a Pub/Sub topic.
+    """
+    json_data = request.get_data(as_text=True)
+    data = json.loads(json_data)
+    job_id = data['job_id']
+    pipeline = data['pipeline']
+    topic = data['topic'].replace('-', '.')
+
+    merge_incremental_dataflow_metrics(job_id, pipeline)
+
+    logging.info("Output of incremental job %s merged. Triggering "
+                 "dashboard export.", job_id)
+    message = "Dataflow job {} complete".format(job_id)
+    pubsub_helper.publish_message_to_topic(message, topic)
+
+    return '', HTTPStatus.OK
@@ -16,12 +16,16 @@
 # =============================================================================
 """Utils for events that are a product of each pipeline's identifier step."""
 import logging
-from typing import Optional
+from datetime import date
+from typing import Any, List, Optional, Type, TypeVar
 
 import attr
+from dateutil.relativedelta import relativedelta
 
 from recidiviz.common.constants.state.state_assessment import StateAssessmentType
 
+DayEventT = TypeVar('DayEventT')
+
 
 @attr.s
 class AssessmentEventMixin:
@@ -65,3 +69,28 @@ class AssessmentEventMixin:
         logging.warning("Assessment type %s is unsupported.", assessment_type)
 
         return None
+
+
+def expand_span_to_day_events(span_event: Any,
+                              day_event_class: Type[DayEventT],
+                              lower_bound_inclusive: Optional[date] = None,
+                              upper_bound_inclusive: Optional[date] = None) -> List[DayEventT]:
+    """Returns a |day_event_class| event for each day of the given span event, which starts on its event_date and ends
+    the day before its end_date_exclusive, limited to the days between the optional |lower_bound_inclusive| and
+    |upper_bound_inclusive| dates. Each day event has all of the attributes of the span event other than
+    end_date_exclusive."""
+    event_date = max(span_event.event_date, lower_bound_inclusive) if lower_bound_inclusive \
+        else span_event.event_date
+    end_date_exclusive = min(span_event.end_date_exclusive, upper_bound_inclusive + relativedelta(days=1)) \
+        if upper_bound_inclusive else span_event.end_date_exclusive
+
+    day_event_attributes = attr.asdict(span_event, recurse=False)
+    del day_event_attributes['end_date_exclusive']
+
+    day_events = []
+    while event_date < end_date_exclusive:
+        day_event_attributes['event_date'] = event_date
+        day_events.append(day_event_class(**day_event_attributes))
+        event_date = event_date + relativedelta(days=1)
+
+    return day_events
@@ -27,6 +27,8 @@ from googleapiclient.discovery import build
 from more_itertools import one
 from oauth2client.client import GoogleCredentials
 
+from recidiviz.calculator.calculation_data_storage_config import validate_pipeline_supports_incremental_runs
+from recidiviz.persistence.database.export.export_config import STATE_HISTORY_TABLES_TO_INCLUDE_IN_EXPORT
 from recidiviz.persistence.entity.state.entities import StatePerson
 
 
@@ -178,6 +180,9 @@ def person_and_kwargs_for_identifier(
     for key, values in arg_to_entities_map.items():
         if key == 'person':
             person = one(arg_to_entities_map[key])
+        elif key == 'pre_processed_incarceration_periods':
+            # The person's incarceration periods, already pre-processed once for all of the identifiers that need them
+            kwargs[key] = one(values)
         else:
             kwargs[key] = list(values)
 
@@ -191,36 +196,101 @@ def select_all_by_person_query(
         dataset: str,
         table: str,
         state_code_filter: Optional[str],
-        person_id_filter_set: Optional[Set[int]]) -> str:
-    return select_all_query(dataset, table, state_code_filter, 'person_id', person_id_filter_set)
+        person_id_filter_set: Optional[Set[int]],
+        person_id_filter_query: Optional[str] = None) -> str:
+    return select_all_query(dataset, table, state_code_filter, 'person_id', person_id_filter_set,
+                            person_id_filter_query)
 
 
 def select_all_query(dataset: str,
                      table: str,
                      state_code_filter: Optional[str],
                      unifying_id_field: Optional[str],
-                     unifying_id_field_filter_set: Optional[Set[int]]) -> str:
+                     unifying_id_field_filter_set: Optional[Set[int]],
+                     unifying_id_field_filter_query: Optional[str] = None) -> str:
     """Returns a query string formatted to select all contents of the table in the given dataset, filtering by the
-    provided state code and unifying id filter sets, if necessary."""
+    provided state code and unifying id filter sets, if necessary. If |unifying_id_field_filter_query| is provided, only
+    rows with a unifying id that is returned by that query are selected."""
     entity_query = f"SELECT * FROM `{dataset}.{table}`"
 
-    if unifying_id_field_filter_set:
+    filter_clauses = []
+
+    if unifying_id_field_filter_set or unifying_id_field_filter_query:
         if not unifying_id_field:
             raise ValueError(
                 f'Expected nonnull unifying_id_field for nonnull unifying_id_field_filter_set when querying'
                 f'dataset [{dataset}] and table [{table}].')
 
+    if unifying_id_field_filter_set:
         id_str_set = {str(unifying_id) for unifying_id in unifying_id_field_filter_set if str(unifying_id)}
 
-        entity_query = entity_query + f" WHERE {unifying_id_field} IN ({', '.join(sorted(id_str_set))})"
+        filter_clauses.append(f"{unifying_id_field} IN ({', '.join(sorted(id_str_set))})")
+
+    if unifying_id_field_filter_query:
+        filter_clauses.append(f"{unifying_id_field} IN "
+                              f"(SELECT {unifying_id_field} FROM ({unifying_id_field_filter_query}))")
 
     if state_code_filter:
-        conjunctive_word = 'AND' if unifying_id_field_filter_set else 'WHERE'
-        entity_query = entity_query + f" {conjunctive_word} state_code IN ('{state_code_filter}')"
+        filter_clauses.append(f"state_code IN ('{state_code_filter}')")
+
+    if filter_clauses:
+        entity_query = entity_query + ' WHERE ' + ' AND '.join(filter_clauses)
 
     return entity_query
 
 
+def changed_person_ids_query(dataset: str,
+                             state_code_filter: Optional[str],
+                             lookback_days: int) -> str:
+    """Returns a query string that selects the person_id and state_code of every person with an entity that was
+    created, updated or deleted within the last |lookback_days| days, according to the history tables in the given
+    dataset.
+
+    Days are compared as dates rather than timestamps so that every read in a pipeline job selects the same set of
+    people, regardless of when in the day each read is executed.
+    """
+    if lookback_days < 0:
+        raise ValueError(f"Expected nonnegative lookback_days, found: {lookback_days}.")
+
+    lookback_start = f"DATE_SUB(CURRENT_DATE(), INTERVAL {lookback_days} DAY)"
+
+    history_table_queries = []
+    for history_table in sorted(STATE_HISTORY_TABLES_TO_INCLUDE_IN_EXPORT):
+        history_table_query = \
+            f"SELECT person_id, state_code FROM `{dataset}.{history_table}` " \
+            f"WHERE (DATE(valid_from) >= {lookback_start} OR DATE(valid_to) >= {lookback_start})"
+
+        if state_code_filter:
+            history_table_query = history_table_query + f" AND state_code IN ('{state_code_filter}')"
+
+        history_table_queries.append(history_table_query)
+
+    return "SELECT DISTINCT person_id, state_code FROM (" + ' UNION ALL '.join(history_table_queries) + ")"
+
+
+def incremental_run_person_id_filter_query(pipeline: str,
+                                           dataset: str,
+                                           state_code_filter: Optional[str],
+                                           metric_types: Iterable[str],
+                                           incremental_lookback_days: Optional[int]) -> Optional[str]:
+    """Returns a query that selects the people whose metrics should be recalculated by an incremental run of the given
+    |pipeline|, or None if |incremental_lookback_days| is not set and the pipeline should recalculate metrics for all
+    people.
+
+    The output of an incremental run replaces all prior output for the people it recalculates, so incremental runs
+    must produce all metric types, and are only supported for pipelines whose metrics all have a person_id.
+    """
+    if incremental_lookback_days is None:
+        return None
+
+    validate_pipeline_supports_incremental_runs(pipeline)
+
+    if 'ALL' not in metric_types:
+        raise ValueError(f"Incremental pipeline runs must calculate all metric types, found: {metric_types}.")
+
+    return changed_person_ids_query(dataset, state_code_filter, incremental_lookback_days)
+
+
 def list_of_dicts_to_dict_with_keys(list_of_dicts: List[Dict[str, Any]], key: str) -> Dict[Any, Dict[str, Any]]:
     """Converts a list of dictionaries to a dictionary, where they keys are the values in each dictionary corresponding
     to the |key| argument. Each dictionary must contain the |key| key."""
@@ -47,7 +47,8 @@ class BuildRootEntity(beam.PTransform):
                  unifying_id_field: str,
                  build_related_entities: bool,
                  unifying_id_field_filter_set: Optional[Set[int]] = None,
-                 state_code: Optional[str] = None):
+                 state_code: Optional[str] = None,
+                 unifying_id_field_filter_query: Optional[str] = None):
         """Initializes the PTransform with the required arguments.
 
         Arguments:
@@ -63,6 +64,11 @@ class BuildRootEntity(beam.PTransform):
             unifying_id_field_filter_set: When non-empty, we will only build entity
                 objects that can be connected to root entities with one of these
                 unifying ids.
+            state_code: When set, we will only build entity objects with this
+                state_code.
+            unifying_id_field_filter_query: When set, we will only build entity
+                objects that can be connected to root entities with one of the
+                unifying ids returned by this query.
         """
 
         super(BuildRootEntity, self).__init__()
@@ -79,6 +85,7 @@ class BuildRootEntity(beam.PTransform):
         self._build_related_entities = build_related_entities
         self._unifying_id_field_filter_set = unifying_id_field_filter_set
         self._state_code = state_code
+        self._unifying_id_field_filter_query = unifying_id_field_filter_query
 
         if not dataset:
             raise ValueError("No valid data source passed to the pipeline.")
@@ -108,7 +115,8 @@ class BuildRootEntity(beam.PTransform):
                                         unifying_id_field=self._unifying_id_field,
                                         parent_id_field=None,
                                         unifying_id_field_filter_set=self._unifying_id_field_filter_set,
-                                        state_code=self._state_code))
+                                        state_code=self._state_code,
+                                        unifying_id_field_filter_query=self._unifying_id_field_filter_query))
 
         if self._build_related_entities:
             # Get the related property entities
@@ -122,7 +130,8 @@ class BuildRootEntity(beam.PTransform):
                                    parent_id_field=self._root_entity_class.get_class_id_name(),
                                    unifying_id_field=self._unifying_id_field,
                                    unifying_id_field_filter_set=self._unifying_id_field_filter_set,
-                                   state_code=self._state_code
+                                   state_code=self._state_code,
+                                   unifying_id_field_filter_query=self._unifying_id_field_filter_query
                                ))
         else:
             properties_dict = {}
@@ -171,7 +180,8 @@ class _ExtractEntityBase(beam.PTransform):
                  unifying_id_field: str,
                  parent_id_field: Optional[str],
                  unifying_id_field_filter_set: Optional[Set[int]],
-                 state_code: Optional[str]):
+                 state_code: Optional[str],
+                 unifying_id_field_filter_query: Optional[str] = None):
         super(_ExtractEntityBase, self).__init__()
         self._dataset = dataset
 
@@ -186,6 +196,7 @@ class _ExtractEntityBase(beam.PTransform):
         self._entity_table_name = self._schema_class.__tablename__
         self._entity_id_field = self._entity_class.get_class_id_name()
         self._state_code = state_code
+        self._unifying_id_field_filter_query = unifying_id_field_filter_query
 
     def _entity_has_unifying_id_field(self):
         return hasattr(self._schema_class, self._unifying_id_field)
@@ -212,7 +223,8 @@ class _ExtractEntityBase(beam.PTransform):
                                         self._entity_table_name,
                                         state_code_filter,
                                         self._unifying_id_field,
-                                        unifying_id_field_filter_set)
+                                        unifying_id_field_filter_set,
+                                        self._unifying_id_field_filter_query)
 
         return entity_query
 
@@ -258,9 +270,10 @@ class _ExtractEntity(_ExtractEntityBase):
                  unifying_id_field: str,
                  parent_id_field: Optional[str],
                  unifying_id_field_filter_set: Optional[Set[int]],
-                 state_code: Optional[str]):
+                 state_code: Optional[str],
+                 unifying_id_field_filter_query: Optional[str] = None):
         super(_ExtractEntity, self).__init__(dataset, entity_class, unifying_id_field, parent_id_field,
-                                             unifying_id_field_filter_set, state_code)
+                                             unifying_id_field_filter_set, state_code, unifying_id_field_filter_query)
 
     def expand(self, input_or_inputs):
         entities_raw = self._get_entities_raw_pcollection(input_or_inputs)
@@ -296,7 +309,8 @@ class _ExtractRelationshipPropertyEntities(beam.PTransform):
                  parent_id_field: str,
                  unifying_id_field: str,
                  unifying_id_field_filter_set: Optional[Set[int]],
-                 state_code: Optional[str]):
+                 state_code: Optional[str],
+                 unifying_id_field_filter_query: Optional[str] = None):
         super(_ExtractRelationshipPropertyEntities, self).__init__()
         self._dataset = dataset
         self._parent_schema_class = parent_schema_class
@@ -304,6 +318,7 @@ class _ExtractRelationshipPropertyEntities(beam.PTransform):
         self._unifying_id_field = unifying_id_field
         self._unifying_id_field_filter_set = unifying_id_field_filter_set
         self._state_code = state_code
+        self._unifying_id_field_filter_query = unifying_id_field_filter_query
 
     @staticmethod
     def _property_class_from_property_object(property_object) -> Type:
@@ -344,7 +359,8 @@ class _ExtractRelationshipPropertyEntities(beam.PTransform):
                                     association_table_parent_id_field=self._parent_id_field,
                                     association_table_entity_id_field=entity_id_field,
                                     unifying_id_field_filter_set=self._unifying_id_field_filter_set,
-                                    state_code=self._state_code)
+                                    state_code=self._state_code,
+                                    unifying_id_field_filter_query=self._unifying_id_field_filter_query)
                                 )
 
                 # 1-to-many relationship
@@ -358,7 +374,8 @@ class _ExtractRelationshipPropertyEntities(beam.PTransform):
                                     unifying_id_field=self._unifying_id_field,
                                     parent_id_field=self._parent_id_field,
                                     unifying_id_field_filter_set=self._unifying_id_field_filter_set,
-                                    state_code=self._state_code)
+                                    state_code=self._state_code,
+                                    unifying_id_field_filter_query=self._unifying_id_field_filter_query)
                                 )
 
                 # 1-to-1 relationship (from parent class perspective)
@@ -378,7 +395,8 @@ class _ExtractRelationshipPropertyEntities(beam.PTransform):
                                     association_table_parent_id_field=self._parent_id_field,
                                     association_table_entity_id_field=association_table_entity_id_field,
                                     unifying_id_field_filter_set=self._unifying_id_field_filter_set,
-                                    state_code=self._state_code)
+                                    state_code=self._state_code,
+                                    unifying_id_field_filter_query=self._unifying_id_field_filter_query)
                                 )
 
                 properties_dict[property_name] = entities
@@ -403,9 +421,11 @@ class _ExtractEntityWithAssociationTable(_ExtractEntityBase):
                  association_table_parent_id_field: str,
                  association_table_entity_id_field: str,
                  unifying_id_field_filter_set: Optional[Set[int]],
-                 state_code: Optional[str]):
+                 state_code: Optional[str],
+                 unifying_id_field_filter_query: Optional[str] = None):
         super(_ExtractEntityWithAssociationTable, self).__init__(
-            dataset, entity_class, unifying_id_field, parent_id_field, unifying_id_field_filter_set, state_code)
+            dataset, entity_class, unifying_id_field, parent_id_field, unifying_id_field_filter_set, state_code,
+            unifying_id_field_filter_query)
 
         self._association_table_parent_id_field = association_table_parent_id_field
         self._association_table_entity_id_field = association_table_entity_id_field
@@ -16,14 +16,18 @@
 # =============================================================================
 """A class for caching information about a set of incarceration periods for use in the calculation pipelines."""
 
+import bisect
 from collections import defaultdict
 from datetime import date
-from typing import List, Set, Tuple, Dict
+from typing import List, Set, Tuple, Dict, Optional
 
 import attr
 
+from recidiviz.calculator.pipeline.utils.calculator_utils import first_day_of_next_month
 from recidiviz.calculator.pipeline.utils.incarceration_period_utils import standard_date_sort_for_incarceration_periods
-from recidiviz.calculator.pipeline.utils.time_range_utils import TimeRange, TimeRangeDiff
+from recidiviz.calculator.pipeline.utils.state_utils.state_calculation_config_manager import \
+    incarceration_period_is_from_revocation
+from recidiviz.calculator.pipeline.utils.time_range_utils import TimeRange
 from recidiviz.persistence.entity.state.entities import StateIncarcerationPeriod
 
 
@@ -38,22 +42,35 @@ class IncarcerationPeriodIndex:
 
     incarceration_periods: List[StateIncarcerationPeriod] = attr.ib(converter=_incarceration_periods_converter)
 
-    # A set of tuples in the format (year, month) for each month of which this person has been incarcerated for any
-    # portion of the month.
-    month_to_overlapping_incarceration_periods: Dict[int, Dict[int, List[StateIncarcerationPeriod]]] = attr.ib()
+    # A sorted list of non-overlapping, non-adjacent TimeRanges covering every day on which this person was
+    # incarcerated. Overlapping and back-to-back incarceration periods are merged into a single range.
+    incarceration_coverage: List[TimeRange] = attr.ib()
 
-    @month_to_overlapping_incarceration_periods.default
-    def _month_to_overlapping_incarceration_periods(self) -> Dict[int, Dict[int, List[StateIncarcerationPeriod]]]:
-        month_to_overlapping_incarceration_periods: Dict[int, Dict[int, List[StateIncarcerationPeriod]]] = \
-            defaultdict(lambda: defaultdict(list))
+    @incarceration_coverage.default
+    def _incarceration_coverage(self) -> List[TimeRange]:
+        ip_time_ranges = sorted((TimeRange.for_incarceration_period(incarceration_period)
+                                 for incarceration_period in self.incarceration_periods),
+                                key=lambda time_range: time_range.lower_bound_inclusive_date)
 
-        for incarceration_period in self.incarceration_periods:
-            ip_time_range = TimeRange.for_incarceration_period(incarceration_period)
+        incarceration_coverage: List[TimeRange] = []
+
+        for ip_time_range in ip_time_ranges:
+            if incarceration_coverage and \
+                    ip_time_range.lower_bound_inclusive_date <= incarceration_coverage[-1].upper_bound_exclusive_date:
+                last_range = incarceration_coverage[-1]
+                last_range.upper_bound_exclusive_date = max(last_range.upper_bound_exclusive_date,
+                                                            ip_time_range.upper_bound_exclusive_date)
+            else:
+                incarceration_coverage.append(ip_time_range)
+
+        return incarceration_coverage
 
-            for year, month in ip_time_range.get_months_range_overlaps_at_all():
-                month_to_overlapping_incarceration_periods[year][month].append(incarceration_period)
+    # The lower bounds of each of the ranges in incarceration_coverage, for searching the coverage by date.
+    _coverage_start_dates: List[date] = attr.ib()
 
-        return month_to_overlapping_incarceration_periods
+    @_coverage_start_dates.default
+    def _coverage_start_dates_default(self) -> List[date]:
+        return [time_range.lower_bound_inclusive_date for time_range in self.incarceration_coverage]
 
     # A set of tuples in the format (year, month) for each month of which this person has been incarcerated for the full
     # month.
@@ -61,25 +78,22 @@ class IncarcerationPeriodIndex:
 
     @months_fully_incarcerated.default
     def _months_fully_incarcerated(self) -> Set[Tuple[int, int]]:
-        """For each StateIncarcerationPeriod, identifies months where the person was incarcerated for every day during
-        that month. Returns a set of months in the format (year, month) for which the person spent the entire month in a
-        prison.
+        """Identifies months where the person was incarcerated for every day during that month. Returns a set of months
+        in the format (year, month) for which the person spent the entire month in a prison.
         """
         months_fully_incarcerated: Set[Tuple[int, int]] = set()
 
-        for incarceration_period in self.incarceration_periods:
-            ip_range = TimeRange.for_incarceration_period(incarceration_period)
-            months_overlaps_at_all = ip_range.get_months_range_overlaps_at_all()
+        for time_range in self.incarceration_coverage:
+            month_start = time_range.lower_bound_inclusive_date
+            if month_start.day != 1:
+                month_start = first_day_of_next_month(month_start)
 
-            for year, month in months_overlaps_at_all:
-                overlapping_periods = self.month_to_overlapping_incarceration_periods[year][month]
+            next_month_start = first_day_of_next_month(month_start)
 
-                remaining_ranges_to_cover = self._get_portions_of_range_not_covered_by_periods_subset(
-                    TimeRange.for_month(year, month),
-                    overlapping_periods
-                )
-                if not remaining_ranges_to_cover:
-                    months_fully_incarcerated.add((year, month))
+            while next_month_start <= time_range.upper_bound_exclusive_date:
+                months_fully_incarcerated.add((month_start.year, month_start.month))
+                month_start = next_month_start
+                next_month_start = first_day_of_next_month(month_start)
 
         return months_fully_incarcerated
 
@@ -99,65 +113,51 @@ class IncarcerationPeriodIndex:
 
         return incarceration_periods_by_admission_date
 
-    def is_fully_incarcerated_for_range(self, range_to_cover: TimeRange) -> bool:
-        """Returns True if this person is incarcerated for the full duration of the time range."""
+    # The sorted admission dates of all incarceration periods with an admission_date.
+    _sorted_admission_dates: List[date] = attr.ib()
 
-        months_range_overlaps = range_to_cover.get_months_range_overlaps_at_all()
+    @_sorted_admission_dates.default
+    def _sorted_admission_dates_default(self) -> List[date]:
+        return sorted(self.incarceration_periods_by_admission_date)
 
-        if not months_range_overlaps:
-            return False
+    # The set of dates on which a person was admitted to prison because of a revocation.
+    revocation_admission_dates: Set[date] = attr.ib()
+
+    @revocation_admission_dates.default
+    def _revocation_admission_dates(self) -> Set[date]:
+        revocation_admission_dates: Set[date] = set()
+
+        preceding_incarceration_period: Optional[StateIncarcerationPeriod] = None
+        for incarceration_period in self.incarceration_periods:
+            if incarceration_period.admission_date and \
+                    incarceration_period_is_from_revocation(incarceration_period, preceding_incarceration_period):
+                revocation_admission_dates.add(incarceration_period.admission_date)
+            preceding_incarceration_period = incarceration_period
 
-        months_without_complete_incarceration = []
-        for year, month in months_range_overlaps:
-            was_incarcerated_all_month = (year, month) in self.months_fully_incarcerated
-            if not was_incarcerated_all_month:
-                months_without_complete_incarceration.append((year, month))
+        return revocation_admission_dates
 
-        for year, month in months_without_complete_incarceration:
-            overlapping_periods = self.month_to_overlapping_incarceration_periods[year][month]
+    def is_fully_incarcerated_for_range(self, range_to_cover: TimeRange) -> bool:
+        """Returns True if this person is incarcerated for the full duration of the time range."""
+        if range_to_cover.lower_bound_inclusive_date >= range_to_cover.upper_bound_exclusive_date:
+            return False
 
-            range_portion_overlapping_month = range_to_cover.portion_overlapping_with_month(year, month)
-            if not range_portion_overlapping_month:
-                raise ValueError(
-                    f'Expecting only months that overlap with the range, month ({year}, {month}) does not.')
+        coverage_index = bisect.bisect_right(self._coverage_start_dates, range_to_cover.lower_bound_inclusive_date) - 1
+
+        if coverage_index < 0:
+            return False
 
-            remaining_ranges_to_cover = self._get_portions_of_range_not_covered_by_periods_subset(
-                range_portion_overlapping_month,
-                overlapping_periods
-            )
-            if remaining_ranges_to_cover:
-                return False
+        return (self.incarceration_coverage[coverage_index].upper_bound_exclusive_date
+                >= range_to_cover.upper_bound_exclusive_date)
 
-        return True
+    def has_revocation_admission_on_date(self, date_in_question: date) -> bool:
+        """Returns whether or not a revocation admission occurred on the |date_in_question|."""
+        return date_in_question in self.revocation_admission_dates
 
     def incarceration_admissions_between_dates(
             self, start_date: date, end_date: date) -> bool:
         """Returns whether there were incarceration admissions between the start_date and end_date, not inclusive of
         the end date."""
-        return any(ip.admission_date and start_date <= ip.admission_date < end_date
-                   for ip in self.incarceration_periods)
-
-    @staticmethod
-    def _get_portions_of_range_not_covered_by_periods_subset(
-            time_range_to_cover: TimeRange,
-            incarceration_periods_subset: List[StateIncarcerationPeriod]) -> List[TimeRange]:
-        """Returns a list of time ranges within the provided |time_range_to_cover| which the provided set of
-        incarceration periods does not fully overlap.
-        """
-
-        remaining_ranges_to_cover = [time_range_to_cover]
-
-        for incarceration_period in incarceration_periods_subset:
-            ip_time_range = TimeRange.for_incarceration_period(incarceration_period)
-
-            new_remaining_ranges_to_cover = []
-            for time_range in remaining_ranges_to_cover:
-                new_remaining_ranges_to_cover.extend(
-                    TimeRangeDiff(range_1=ip_time_range,
-                                  range_2=time_range).range_2_non_overlapping_parts)
-
-            remaining_ranges_to_cover = new_remaining_ranges_to_cover
-            if not remaining_ranges_to_cover:
-                break
+        admission_index = bisect.bisect_left(self._sorted_admission_dates, start_date)
 
-        return remaining_ranges_to_cover
+        return admission_index < len(self._sorted_admission_dates) \
+            and self._sorted_admission_dates[admission_index] < end_date
@@ -21,8 +21,9 @@ import logging
 from copy import deepcopy
 from datetime import date
 
-from functools import cmp_to_key
-from typing import List
+from typing import List, Tuple, Dict
+
+import attr
 
 from recidiviz.calculator.pipeline.utils.state_utils.state_calculation_config_manager import \
     temporary_custody_periods_under_state_authority, non_prison_periods_under_state_authority
@@ -227,19 +228,68 @@ def prepare_incarceration_periods_for_calculations(
     Ensures the necessary dates and fields are set on each incarceration period. If an incarceration period is found
     with missing data, drops the incarceration period from the calculations. Then, sorts the list of valid
     StateIncarcerationPeriods by admission_date, and collapses the ones connected by a transfer.
-    """
-
-    updated_periods = _filter_and_update_incarceration_periods_for_calculations(state_code, incarceration_periods)
-
-    sorted_periods = standard_date_sort_for_incarceration_periods(updated_periods)
 
-    collapsed_periods = _collapse_incarceration_periods_for_calculations(
-        sorted_periods,
+    Callers that need more than one collapsed version of the same person's incarceration periods should use a
+    PreProcessedIncarcerationPeriods instead, which only validates and sorts the periods once.
+    """
+    return PreProcessedIncarcerationPeriods(state_code, incarceration_periods).periods_for_calculations(
         collapse_transfers=collapse_transfers,
         collapse_temporary_custody_periods_with_revocation=collapse_temporary_custody_periods_with_revocation,
         collapse_transfers_with_different_pfi=collapse_transfers_with_different_pfi,
         overwrite_facility_information_in_transfers=overwrite_facility_information_in_transfers)
-    return collapsed_periods
+
+
+@attr.s
+class PreProcessedIncarcerationPeriods:
+    """A class for caching the validated, sorted and collapsed versions of a single person's incarceration periods.
+
+    The periods are validated and sorted once. Each combination of collapsing options is computed from the sorted
+    periods the first time it is requested, and is cached for later requests.
+    """
+
+    state_code: str = attr.ib()
+
+    incarceration_periods: List[StateIncarcerationPeriod] = attr.ib()
+
+    # The valid incarceration periods, with all necessary fields set, sorted by admission_date
+    sorted_periods: List[StateIncarcerationPeriod] = attr.ib(init=False)
+
+    @sorted_periods.default
+    def _sorted_periods(self) -> List[StateIncarcerationPeriod]:
+        updated_periods = _filter_and_update_incarceration_periods_for_calculations(self.state_code,
+                                                                                    self.incarceration_periods)
+
+        return standard_date_sort_for_incarceration_periods(updated_periods)
+
+    # A dictionary mapping the collapsing options to the periods collapsed with those options
+    _collapsed_periods_by_options: Dict[Tuple[bool, bool, bool, bool], List[StateIncarcerationPeriod]] = \
+        attr.ib(init=False, factory=dict)
+
+    def periods_for_calculations(self,
+                                 collapse_transfers: bool,
+                                 collapse_temporary_custody_periods_with_revocation: bool,
+                                 collapse_transfers_with_different_pfi: bool,
+                                 overwrite_facility_information_in_transfers: bool) -> List[StateIncarcerationPeriod]:
+        """Returns the sorted incarceration periods, collapsed according to the given options."""
+        options = (collapse_transfers,
+                   collapse_temporary_custody_periods_with_revocation,
+                   collapse_transfers_with_different_pfi,
+                   overwrite_facility_information_in_transfers)
+
+        collapsed_periods = self._collapsed_periods_by_options.get(options)
+
+        if collapsed_periods is None:
+            collapsed_periods = _collapse_incarceration_periods_for_calculations(
+                self.sorted_periods,
+                collapse_transfers=collapse_transfers,
+                collapse_temporary_custody_periods_with_revocation=collapse_temporary_custody_periods_with_revocation,
+                collapse_transfers_with_different_pfi=collapse_transfers_with_different_pfi,
+                overwrite_facility_information_in_transfers=overwrite_facility_information_in_transfers)
+
+            self._collapsed_periods_by_options[options] = collapsed_periods
+
+        # Callers may re-sort or filter the list they are given, so they each get their own copy
+        return list(collapsed_periods)
 
 
 def _filter_and_update_incarceration_periods_for_calculations(
@@ -264,82 +314,36 @@ def _filter_and_update_incarceration_periods_for_calculations(
 def _sort_ips_by_set_dates_and_statuses(incarceration_periods: List[StateIncarcerationPeriod]):
     """Sorts incarceration periods chronologically by the admission and release dates according to this logic:
         - Sorts by admission_date, if set, else by release_date
+        - Periods with only a release_date sort after periods with an admission_date on that same day, whether or not
+          the period with the admission_date has a release_date. (The comparator this replaced fell back to external_id
+          here when both periods had a release_date, which was not a consistent ordering once a third period with the
+          same admission_date and no release_date was involved.)
         - For periods with the same admission_date:
-            - If neither have a release_date, sorts by custody status
-            - Else, sorts by release_date, with unset release_dates before set release_dates
+            - Periods released on the day of admission sort first, then periods without a release_date, then all
+              other periods by release_date
+            - If neither have a release_date, sorts by custody status, ordering IN_CUSTODY after all other statuses
+        - Periods that are otherwise equal are sorted by external_id
     """
-    def _sort_by_external_id(ip_a: StateIncarcerationPeriod, ip_b: StateIncarcerationPeriod) -> int:
-        if ip_a.external_id is None or ip_b.external_id is None:
-            raise ValueError("Expect no placeholder periods in this function.")
-
-        # Alphabetic sort by external_id
-        return -1 if ip_a.external_id < ip_b.external_id else 1
-
-    def _sort_by_nonnull_release_dates(ip_a: StateIncarcerationPeriod, ip_b: StateIncarcerationPeriod) -> int:
-        if not ip_a.release_date or not ip_b.release_date:
-            raise ValueError('Expected nonnull release dates')
-        if ip_a.release_date != ip_b.release_date:
-            return (ip_a.release_date - ip_b.release_date).days
-        # They have the same admission and release dates. Sort by external_id.
-        return _sort_by_external_id(ip_a, ip_b)
-
-    def _sort_by_custody_status(ip_a: StateIncarcerationPeriod, ip_b: StateIncarcerationPeriod) -> int:
-        normalized_status_a = (StateIncarcerationPeriodStatus.IN_CUSTODY
-                               if ip_a.status == StateIncarcerationPeriodStatus.IN_CUSTODY
-                               else StateIncarcerationPeriodStatus.NOT_IN_CUSTODY)
-        normalized_status_b = (StateIncarcerationPeriodStatus.IN_CUSTODY
-                               if ip_b.status == StateIncarcerationPeriodStatus.IN_CUSTODY
-                               else StateIncarcerationPeriodStatus.NOT_IN_CUSTODY)
-        if normalized_status_a == normalized_status_b:
-            return _sort_by_external_id(ip_a, ip_b)
-        # Sort by custody status. Order IN_CUSTODY after all other statuses.
-        if normalized_status_a == StateIncarcerationPeriodStatus.IN_CUSTODY:
-            return 1
-        if normalized_status_b == StateIncarcerationPeriodStatus.IN_CUSTODY:
-            return -1
-        raise ValueError('One status should have IN_CUSTODY at this point')
-
-    def _sort_equal_admission_date(ip_a: StateIncarcerationPeriod, ip_b: StateIncarcerationPeriod) -> int:
-        if ip_a.admission_date != ip_b.admission_date:
-            raise ValueError('Expected equal admission dates')
-        if ip_a.release_date and ip_b.release_date:
-            return _sort_by_nonnull_release_dates(ip_a, ip_b)
-        if ip_a.admission_date is None or ip_b.admission_date is None:
-            raise ValueError(
-                'Admission reasons expected to be equal and nonnull at this point otherwise we would have a'
-                'period that has a null release and null admission reason.')
-        if ip_a.release_date is None and ip_b.release_date is None:
-            return _sort_by_custody_status(ip_a, ip_b)
-        # Sort by release dates, with unset release dates coming first if the following period is greater than 0 days
-        # long (we assume in this case that we forgot to close this open period).
-        if ip_a.release_date:
-            return 1 if (ip_a.release_date - ip_a.admission_date).days else -1
-        if ip_b.release_date:
-            return -1 if (ip_b.release_date - ip_b.admission_date).days else 1
-        raise ValueError("At least one of the periods is expected to have a release_date at this point.")
-
-    def _sort_function(ip_a: StateIncarcerationPeriod, ip_b: StateIncarcerationPeriod) -> int:
-        if ip_a.admission_date == ip_b.admission_date:
-            return _sort_equal_admission_date(ip_a, ip_b)
-
-        # Sort by admission_date, if set, or release_date if not set
-        date_a = ip_a.admission_date if ip_a.admission_date else ip_a.release_date
-        date_b = ip_b.admission_date if ip_b.admission_date else ip_b.release_date
-        if not date_a:
-            raise ValueError(f'Found period with no admission or release date {ip_a}')
-        if not date_b:
-            raise ValueError(f'Found period with no admission or release date {ip_b}')
-        if date_a == date_b:
-            if ip_a.release_date and ip_b.release_date:
-                # These share a release date. Sort by external_id.
-                return _sort_by_external_id(ip_a, ip_b)
-
-            # One has an admission date and the other has a release date on the same day. Order the admission before
-            # the release.
-            return -1 if ip_a.admission_date else 1
-        return (date_a - date_b).days
-
-    incarceration_periods.sort(key=cmp_to_key(_sort_function))
+    incarceration_periods.sort(key=_set_dates_and_statuses_sort_key)
+
+
+def _set_dates_and_statuses_sort_key(ip: StateIncarcerationPeriod) -> Tuple[date, bool, date, bool, bool, str]:
+    """Returns the key used to sort incarceration periods in _sort_ips_by_set_dates_and_statuses."""
+    external_id = ip.external_id or ''
+
+    if ip.admission_date:
+        if ip.release_date:
+            return ip.admission_date, False, ip.release_date, False, False, external_id
+
+        # Periods without a release date sort after periods released on the day they were admitted, and before all
+        # periods released after that day (we assume in this case that we forgot to close this open period).
+        return (ip.admission_date, False, ip.admission_date, True,
+                ip.status == StateIncarcerationPeriodStatus.IN_CUSTODY, external_id)
+
+    if not ip.release_date:
+        raise ValueError(f'Found period with no admission or release date {ip}')
+
+    return ip.release_date, True, ip.release_date, False, False, external_id
 
 
 def _infer_missing_dates_and_statuses(
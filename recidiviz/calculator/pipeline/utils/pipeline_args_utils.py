@@ -53,6 +53,14 @@ def add_shared_pipeline_arguments(parser: argparse.ArgumentParser, include_calcu
                         help='An optional list of DB person_id values. When present, the pipeline will only calculate '
                              'metrics for these people and will not output to BQ.')
 
+    parser.add_argument('--incremental_lookback_days',
+                        dest='incremental_lookback_days',
+                        type=int,
+                        help='When set, the pipeline only recalculates metrics for the people with entities that have '
+                             'changed in this many days, according to the state history tables. The output is written '
+                             'to the incremental metrics dataset, from which it is merged into the output tables once '
+                             'the job completes. When unset, the pipeline recalculates metrics for all people.')
+
     if include_calculation_limit_args:
         # Only for pipelines that may receive these arguments
         parser.add_argument('--calculation_end_month',
@@ -17,13 +17,16 @@
 """Manages state-specific methodology decisions made throughout the calculation pipelines."""
 # TODO(2995): Make a state config file for every state and every one of these state-specific calculation methodologies
 from datetime import date
+from functools import lru_cache
 import logging
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
+
+import attr
 
 from recidiviz.calculator.pipeline.supervision.supervision_case_compliance import SupervisionCaseCompliance
 from recidiviz.calculator.pipeline.utils.state_utils.us_id.us_id_revocation_identification import \
     us_id_filter_supervision_periods_for_revocation_identification, us_id_get_pre_revocation_supervision_type, \
-    us_id_is_revocation_admission
+    us_id_is_revocation_admission, us_id_revoked_supervision_period_if_revocation_occurred
 from recidiviz.calculator.pipeline.utils.state_utils.us_id.us_id_supervision_compliance import \
     us_id_case_compliance_on_date
 from recidiviz.calculator.pipeline.utils.state_utils.us_id.us_id_supervision_type_identification import \
@@ -37,14 +40,18 @@ from recidiviz.calculator.pipeline.utils.state_utils.us_mo.us_mo_supervision_typ
     us_mo_get_month_supervision_type, us_mo_get_pre_incarceration_supervision_type, \
     us_mo_get_most_recent_supervision_period_supervision_type_before_upper_bound_day, \
     us_mo_get_post_incarceration_supervision_type
+from recidiviz.calculator.pipeline.utils.state_utils.us_mo import us_mo_violation_utils
 from recidiviz.calculator.pipeline.utils.state_utils.us_mo.us_mo_violation_utils import us_mo_filter_violation_responses
+from recidiviz.calculator.pipeline.utils.supervision_period_utils import \
+    get_relevant_supervision_periods_before_admission_date
 from recidiviz.common.constants.state.state_case_type import StateSupervisionCaseType
 from recidiviz.common.constants.state.state_incarceration_period import is_revocation_admission
 from recidiviz.common.constants.state.state_supervision import StateSupervisionType
 from recidiviz.common.constants.state.state_supervision_period import StateSupervisionPeriodSupervisionType
+from recidiviz.common.constants.state.state_supervision_violation import StateSupervisionViolationType
 from recidiviz.persistence.entity.state.entities import StateSupervisionSentence, StateIncarcerationSentence, \
     StateSupervisionPeriod, StateIncarcerationPeriod, StateSupervisionViolationResponse, StateAssessment, \
-    StateSupervisionContact
+    StateSupervisionContact, StateSupervisionViolation
 
 
 def supervision_types_distinct_for_state(state_code: str) -> bool:
@@ -150,6 +157,141 @@ def second_assessment_on_supervision_is_more_reliable(state_code: str) -> bool:
     return state_code in ('US_ID', 'US_MO', 'US_ND')
 
 
+@attr.s(frozen=True)
+class StateCalculationConfig:
+    """The state-specific calculation methodology for a single state. Holds the value of every state-specific flag and
+    the state-specific implementation of every dispatched calculation, so that callers can resolve the config once per
+    person and avoid re-evaluating state_code comparisons in per-day or per-combination loops."""
+    state_code: str = attr.ib()
+
+    # Flags
+    supervision_types_distinct: bool = attr.ib()
+    default_to_supervision_period_officer_for_revocation_details: bool = attr.ib()
+    temporary_custody_periods_under_state_authority: bool = attr.ib()
+    non_prison_periods_under_state_authority: bool = attr.ib()
+    investigation_periods_in_supervision_population: bool = attr.ib()
+    only_state_custodial_authority_in_supervision_population: bool = attr.ib()
+    should_collapse_transfers_different_purpose_for_incarceration: bool = attr.ib()
+    include_decisions_on_follow_up_responses: bool = attr.ib()
+    second_assessment_on_supervision_is_more_reliable: bool = attr.ib()
+
+    # Strategies
+    get_month_supervision_type: Callable[
+        [date, List[StateSupervisionSentence], List[StateIncarcerationSentence], StateSupervisionPeriod],
+        StateSupervisionPeriodSupervisionType] = attr.ib()
+    get_pre_incarceration_supervision_type: Callable[
+        [List[StateIncarcerationSentence], List[StateSupervisionSentence], StateIncarcerationPeriod],
+        Optional[StateSupervisionPeriodSupervisionType]] = attr.ib()
+    get_post_incarceration_supervision_type: Callable[
+        [List[StateIncarcerationSentence], List[StateSupervisionSentence], StateIncarcerationPeriod],
+        Optional[StateSupervisionPeriodSupervisionType]] = attr.ib()
+    get_pre_revocation_supervision_type: Callable[
+        [List[StateIncarcerationSentence], List[StateSupervisionSentence], StateIncarcerationPeriod,
+         Optional[StateSupervisionPeriod]],
+        Optional[StateSupervisionPeriodSupervisionType]] = attr.ib()
+    supervision_period_counts_towards_supervision_population_in_date_range: Callable[
+        [TimeRange, List[StateSupervisionSentence], List[StateIncarcerationSentence], StateSupervisionPeriod],
+        bool] = attr.ib()
+    terminating_supervision_period_supervision_type: Callable[
+        [StateSupervisionPeriod, List[StateSupervisionSentence], List[StateIncarcerationSentence]],
+        StateSupervisionPeriodSupervisionType] = attr.ib()
+    filter_violation_responses_before_revocation: Callable[
+        [List[StateSupervisionViolationResponse], bool], List[StateSupervisionViolationResponse]] = attr.ib()
+    filter_supervision_periods_for_revocation_identification: Callable[
+        [List[StateSupervisionPeriod]], List[StateSupervisionPeriod]] = attr.ib()
+    incarceration_period_is_from_revocation: Callable[
+        [StateIncarcerationPeriod, Optional[StateIncarcerationPeriod]], bool] = attr.ib()
+    revoked_supervision_periods_if_revocation_occurred: Callable[
+        [StateIncarcerationPeriod, List[StateSupervisionPeriod], Optional[StateIncarcerationPeriod]],
+        Tuple[bool, List[StateSupervisionPeriod]]] = attr.ib()
+    get_case_compliance_on_date: Callable[
+        [StateSupervisionPeriod, StateSupervisionCaseType, date, date, List[StateAssessment],
+         List[StateSupervisionContact]],
+        Optional[SupervisionCaseCompliance]] = attr.ib()
+    get_supervision_district_from_supervision_period: Callable[[StateSupervisionPeriod], Optional[str]] = attr.ib()
+    normalize_violations_on_response: Callable[
+        [StateSupervisionViolationResponse], StateSupervisionViolationResponse] = attr.ib()
+    get_ranked_violation_type_and_subtype_counts: Callable[
+        [List[StateSupervisionViolation], List[StateSupervisionViolationType]], Dict[str, int]] = attr.ib()
+
+
+@lru_cache(maxsize=None)
+def get_state_calculation_config(state_code: str) -> StateCalculationConfig:
+    """Returns the StateCalculationConfig for the given state_code. Configs are built once per state and cached for the
+    lifetime of the process."""
+    # Entities without a state_code fall back to the default methodology
+    flag_state_code = state_code or ''
+
+    return StateCalculationConfig(
+        state_code=state_code,
+        supervision_types_distinct=supervision_types_distinct_for_state(flag_state_code),
+        default_to_supervision_period_officer_for_revocation_details=
+        default_to_supervision_period_officer_for_revocation_details_for_state(flag_state_code),
+        temporary_custody_periods_under_state_authority=
+        temporary_custody_periods_under_state_authority(flag_state_code),
+        non_prison_periods_under_state_authority=non_prison_periods_under_state_authority(flag_state_code),
+        investigation_periods_in_supervision_population=
+        investigation_periods_in_supervision_population(flag_state_code),
+        only_state_custodial_authority_in_supervision_population=
+        only_state_custodial_authority_in_supervision_population(flag_state_code),
+        should_collapse_transfers_different_purpose_for_incarceration=
+        should_collapse_transfers_different_purpose_for_incarceration(flag_state_code),
+        include_decisions_on_follow_up_responses=include_decisions_on_follow_up_responses(flag_state_code),
+        second_assessment_on_supervision_is_more_reliable=second_assessment_on_supervision_is_more_reliable(
+            flag_state_code),
+        get_month_supervision_type={
+            'US_MO': us_mo_get_month_supervision_type,
+            'US_ID': _supervision_type_from_supervision_period,
+        }.get(state_code, get_month_supervision_type_default),
+        get_pre_incarceration_supervision_type={
+            'US_MO': us_mo_get_pre_incarceration_supervision_type,
+            'US_ID': us_id_get_pre_incarceration_supervision_type,
+        }.get(state_code, _default_pre_incarceration_supervision_type),
+        get_post_incarceration_supervision_type={
+            'US_ID': us_id_get_post_incarceration_supervision_type,
+            'US_MO': us_mo_get_post_incarceration_supervision_type,
+            'US_ND': _us_nd_post_incarceration_supervision_type,
+        }.get(state_code, _unimplemented_post_incarceration_supervision_type),
+        get_pre_revocation_supervision_type={
+            'US_ID': _us_id_pre_revocation_supervision_type,
+        }.get(state_code, _default_pre_revocation_supervision_type),
+        supervision_period_counts_towards_supervision_population_in_date_range={
+            'US_MO': _us_mo_supervision_period_counts_towards_supervision_population_in_date_range,
+        }.get(state_code, _default_supervision_period_counts_towards_supervision_population_in_date_range),
+        terminating_supervision_period_supervision_type={
+            'US_MO': _us_mo_terminating_supervision_period_supervision_type,
+            'US_ID': _us_id_terminating_supervision_period_supervision_type,
+        }.get(state_code, _default_terminating_supervision_period_supervision_type),
+        filter_violation_responses_before_revocation={
+            'US_MO': us_mo_filter_violation_responses,
+        }.get(state_code, _default_filter_violation_responses_before_revocation),
+        filter_supervision_periods_for_revocation_identification={
+            'US_ID': us_id_filter_supervision_periods_for_revocation_identification,
+        }.get(state_code, _default_filter_supervision_periods_for_revocation_identification),
+        incarceration_period_is_from_revocation={
+            'US_ID': us_id_is_revocation_admission,
+        }.get(state_code, _default_incarceration_period_is_from_revocation),
+        revoked_supervision_periods_if_revocation_occurred={
+            'US_ID': _us_id_revoked_supervision_periods_if_revocation_occurred,
+        }.get(state_code, _default_revoked_supervision_periods_if_revocation_occurred),
+        get_case_compliance_on_date={
+            'US_ID': us_id_case_compliance_on_date,
+        }.get(state_code, _default_case_compliance_on_date),
+        # In some states we have squashed the notion of district and site into one field, so all filled in supervision
+        # sites are in the format "{supervision district}|{location/office within district}".
+        get_supervision_district_from_supervision_period={
+            'US_ID': _supervision_district_from_combined_supervision_site,
+            'US_PA': _supervision_district_from_combined_supervision_site,
+        }.get(state_code, _default_supervision_district_from_supervision_period),
+        normalize_violations_on_response={
+            'US_MO': us_mo_violation_utils.normalize_violations_on_responses,
+        }.get(state_code, _default_normalize_violations_on_response),
+        get_ranked_violation_type_and_subtype_counts={
+            'US_MO': us_mo_violation_utils.get_ranked_violation_type_and_subtype_counts,
+        }.get(state_code, _default_ranked_violation_type_and_subtype_counts),
+    )
+
+
 def get_month_supervision_type(
         any_date_in_month: date,
         supervision_sentences: List[StateSupervisionSentence],
@@ -165,20 +307,19 @@ def get_month_supervision_type(
     supervision_period: (StateSupervisionPeriod) The supervision period we want to associate a supervision type with
     supervision_sentences: (List[StateSupervisionSentence]) All supervision sentences for a given person.
     """
+    return get_state_calculation_config(supervision_period.state_code).get_month_supervision_type(
+        any_date_in_month, supervision_sentences, incarceration_sentences, supervision_period)
 
-    if supervision_period.state_code == 'US_MO':
-        return us_mo_get_month_supervision_type(any_date_in_month,
-                                                supervision_sentences,
-                                                incarceration_sentences,
-                                                supervision_period)
-
-    if supervision_period.state_code == 'US_ID':
-        return (supervision_period.supervision_period_supervision_type
-                if supervision_period.supervision_period_supervision_type
-                else StateSupervisionPeriodSupervisionType.INTERNAL_UNKNOWN)
 
-    return get_month_supervision_type_default(
-        any_date_in_month, supervision_sentences, incarceration_sentences, supervision_period)
+def _supervision_type_from_supervision_period(
+        _any_date: date,
+        _supervision_sentences: List[StateSupervisionSentence],
+        _incarceration_sentences: List[StateIncarcerationSentence],
+        supervision_period: StateSupervisionPeriod
+) -> StateSupervisionPeriodSupervisionType:
+    return (supervision_period.supervision_period_supervision_type
+            if supervision_period.supervision_period_supervision_type
+            else StateSupervisionPeriodSupervisionType.INTERNAL_UNKNOWN)
 
 
 def get_pre_incarceration_supervision_type(
@@ -195,19 +336,14 @@ def get_pre_incarceration_supervision_type(
         incarceration_period: (StateIncarcerationPeriod) The incarceration period where the person was first
             reincarcerated.
     """
+    return get_state_calculation_config(incarceration_period.state_code).get_pre_incarceration_supervision_type(
+        incarceration_sentences, supervision_sentences, incarceration_period)
 
-    state_code = incarceration_period.state_code
-
-    if state_code == 'US_MO':
-        return us_mo_get_pre_incarceration_supervision_type(incarceration_sentences,
-                                                            supervision_sentences,
-                                                            incarceration_period)
-
-    if state_code == 'US_ID':
-        return us_id_get_pre_incarceration_supervision_type(incarceration_sentences,
-                                                            supervision_sentences,
-                                                            incarceration_period)
 
+def _default_pre_incarceration_supervision_type(
+        _incarceration_sentences: List[StateIncarcerationSentence],
+        _supervision_sentences: List[StateSupervisionSentence],
+        incarceration_period: StateIncarcerationPeriod) -> Optional[StateSupervisionPeriodSupervisionType]:
     # TODO(2938): Decide if we want date matching/supervision period lookback logic for US_ND
     return get_pre_incarceration_supervision_type_from_incarceration_period(incarceration_period)
 
@@ -226,20 +362,23 @@ def get_post_incarceration_supervision_type(
         supervision_sentences: (List[StateSupervisionSentence]) All SupervisionSentences associated with this person.
         incarceration_period: (StateIncarcerationPeriod) The incarceration period the person was released from.
     """
-    state_code = incarceration_period.state_code
-
-    if state_code == 'US_ID':
-        return us_id_get_post_incarceration_supervision_type(incarceration_sentences,
-                                                             supervision_sentences,
-                                                             incarceration_period)
-    if state_code == 'US_MO':
-        return us_mo_get_post_incarceration_supervision_type(incarceration_sentences,
-                                                             supervision_sentences,
-                                                             incarceration_period)
-    if state_code == 'US_ND':
-        return us_nd_get_post_incarceration_supervision_type(incarceration_period)
-
-    logging.warning("get_post_incarceration_supervision_type not implemented for state: %s", state_code)
+    return get_state_calculation_config(incarceration_period.state_code).get_post_incarceration_supervision_type(
+        incarceration_sentences, supervision_sentences, incarceration_period)
+
+
+def _us_nd_post_incarceration_supervision_type(
+        _incarceration_sentences: List[StateIncarcerationSentence],
+        _supervision_sentences: List[StateSupervisionSentence],
+        incarceration_period: StateIncarcerationPeriod) -> Optional[StateSupervisionPeriodSupervisionType]:
+    return us_nd_get_post_incarceration_supervision_type(incarceration_period)
+
+
+def _unimplemented_post_incarceration_supervision_type(  # pylint: disable=useless-return
+        _incarceration_sentences: List[StateIncarcerationSentence],
+        _supervision_sentences: List[StateSupervisionSentence],
+        incarceration_period: StateIncarcerationPeriod) -> Optional[StateSupervisionPeriodSupervisionType]:
+    logging.warning("get_post_incarceration_supervision_type not implemented for state: %s",
+                    incarceration_period.state_code)
     return None
 
 
@@ -250,9 +389,25 @@ def get_pre_revocation_supervision_type(
         revoked_supervision_period: Optional[StateSupervisionPeriod]) -> \
         Optional[StateSupervisionPeriodSupervisionType]:
     """Returns the supervision type the person was on before they had their supervision revoked."""
-    if incarceration_period.state_code == 'US_ID':
-        return us_id_get_pre_revocation_supervision_type(revoked_supervision_period)
+    return get_state_calculation_config(incarceration_period.state_code).get_pre_revocation_supervision_type(
+        incarceration_sentences, supervision_sentences, incarceration_period, revoked_supervision_period)
+
+
+def _us_id_pre_revocation_supervision_type(
+        _incarceration_sentences: List[StateIncarcerationSentence],
+        _supervision_sentences: List[StateSupervisionSentence],
+        _incarceration_period: StateIncarcerationPeriod,
+        revoked_supervision_period: Optional[StateSupervisionPeriod]) -> \
+        Optional[StateSupervisionPeriodSupervisionType]:
+    return us_id_get_pre_revocation_supervision_type(revoked_supervision_period)
 
+
+def _default_pre_revocation_supervision_type(
+        incarceration_sentences: List[StateIncarcerationSentence],
+        supervision_sentences: List[StateSupervisionSentence],
+        incarceration_period: StateIncarcerationPeriod,
+        _revoked_supervision_period: Optional[StateSupervisionPeriod]) -> \
+        Optional[StateSupervisionPeriodSupervisionType]:
     return get_pre_incarceration_supervision_type(
         incarceration_sentences,
         supervision_sentences,
@@ -269,21 +424,35 @@ def supervision_period_counts_towards_supervision_population_in_date_range_state
     towards the supervision population in a range. Returns True if either there is a state-specific check that indicates
     that the supervision period should count or if there is no state-specific check to perform.
     """
+    state_config = get_state_calculation_config(supervision_period.state_code)
+    return state_config.supervision_period_counts_towards_supervision_population_in_date_range(
+        date_range, supervision_sentences, incarceration_sentences, supervision_period)
+
+
+def _us_mo_supervision_period_counts_towards_supervision_population_in_date_range(
+        date_range: TimeRange,
+        supervision_sentences: List[StateSupervisionSentence],
+        incarceration_sentences: List[StateIncarcerationSentence],
+        supervision_period: StateSupervisionPeriod) -> bool:
+    sp_range = TimeRange.for_supervision_period(supervision_period)
+    overlapping_range = TimeRangeDiff(range_1=date_range, range_2=sp_range).overlapping_range
 
-    if supervision_period.state_code == 'US_MO':
-        sp_range = TimeRange.for_supervision_period(supervision_period)
-        overlapping_range = TimeRangeDiff(range_1=date_range, range_2=sp_range).overlapping_range
+    if not overlapping_range:
+        return False
 
-        if not overlapping_range:
-            return False
+    return us_mo_get_most_recent_supervision_period_supervision_type_before_upper_bound_day(
+        upper_bound_exclusive_date=overlapping_range.upper_bound_exclusive_date,
+        lower_bound_inclusive_date=overlapping_range.lower_bound_inclusive_date,
+        incarceration_sentences=incarceration_sentences,
+        supervision_sentences=supervision_sentences
+    ) is not None
 
-        return us_mo_get_most_recent_supervision_period_supervision_type_before_upper_bound_day(
-            upper_bound_exclusive_date=overlapping_range.upper_bound_exclusive_date,
-            lower_bound_inclusive_date=overlapping_range.lower_bound_inclusive_date,
-            incarceration_sentences=incarceration_sentences,
-            supervision_sentences=supervision_sentences
-        ) is not None
 
+def _default_supervision_period_counts_towards_supervision_population_in_date_range(
+        _date_range: TimeRange,
+        _supervision_sentences: List[StateSupervisionSentence],
+        _incarceration_sentences: List[StateIncarcerationSentence],
+        _supervision_period: StateSupervisionPeriod) -> bool:
     return True
 
 
@@ -302,20 +471,47 @@ def terminating_supervision_period_supervision_type(
         raise ValueError(f'Expected a terminated supervision period for period '
                          f'[{supervision_period.supervision_period_id}]')
 
-    if supervision_period.state_code == 'US_MO':
-        supervision_type = us_mo_get_most_recent_supervision_period_supervision_type_before_upper_bound_day(
-            upper_bound_exclusive_date=supervision_period.termination_date,
-            lower_bound_inclusive_date=supervision_period.start_date,
-            incarceration_sentences=incarceration_sentences,
-            supervision_sentences=supervision_sentences
-        )
+    return get_state_calculation_config(supervision_period.state_code).terminating_supervision_period_supervision_type(
+        supervision_period, supervision_sentences, incarceration_sentences)
+
 
-        return supervision_type if supervision_type else StateSupervisionPeriodSupervisionType.INTERNAL_UNKNOWN
+def _us_mo_terminating_supervision_period_supervision_type(
+        supervision_period: StateSupervisionPeriod,
+        supervision_sentences: List[StateSupervisionSentence],
+        incarceration_sentences: List[StateIncarcerationSentence],
+) -> StateSupervisionPeriodSupervisionType:
+    if not supervision_period.termination_date:
+        raise ValueError(f'Expected a terminated supervision period for period '
+                         f'[{supervision_period.supervision_period_id}]')
+
+    supervision_type = us_mo_get_most_recent_supervision_period_supervision_type_before_upper_bound_day(
+        upper_bound_exclusive_date=supervision_period.termination_date,
+        lower_bound_inclusive_date=supervision_period.start_date,
+        incarceration_sentences=incarceration_sentences,
+        supervision_sentences=supervision_sentences
+    )
 
-    if supervision_period.state_code == 'US_ID':
-        return (supervision_period.supervision_period_supervision_type
-                if supervision_period.supervision_period_supervision_type
-                else StateSupervisionPeriodSupervisionType.INTERNAL_UNKNOWN)
+    return supervision_type if supervision_type else StateSupervisionPeriodSupervisionType.INTERNAL_UNKNOWN
+
+
+def _us_id_terminating_supervision_period_supervision_type(
+        supervision_period: StateSupervisionPeriod,
+        _supervision_sentences: List[StateSupervisionSentence],
+        _incarceration_sentences: List[StateIncarcerationSentence],
+) -> StateSupervisionPeriodSupervisionType:
+    return (supervision_period.supervision_period_supervision_type
+            if supervision_period.supervision_period_supervision_type
+            else StateSupervisionPeriodSupervisionType.INTERNAL_UNKNOWN)
+
+
+def _default_terminating_supervision_period_supervision_type(
+        supervision_period: StateSupervisionPeriod,
+        supervision_sentences: List[StateSupervisionSentence],
+        incarceration_sentences: List[StateIncarcerationSentence],
+) -> StateSupervisionPeriodSupervisionType:
+    if not supervision_period.termination_date:
+        raise ValueError(f'Expected a terminated supervision period for period '
+                         f'[{supervision_period.supervision_period_id}]')
 
     return get_month_supervision_type_default(
         supervision_period.termination_date, supervision_sentences, incarceration_sentences, supervision_period)
@@ -326,9 +522,15 @@ def filter_violation_responses_before_revocation(violation_responses: List[State
         List[StateSupervisionViolationResponse]:
     """State-specific filtering of the violation responses that should be included in pre-revocation analysis."""
     if violation_responses:
-        state_code = violation_responses[0].state_code
-        if state_code == 'US_MO':
-            return us_mo_filter_violation_responses(violation_responses, include_follow_up_responses)
+        state_config = get_state_calculation_config(violation_responses[0].state_code)
+        return state_config.filter_violation_responses_before_revocation(violation_responses,
+                                                                         include_follow_up_responses)
+    return violation_responses
+
+
+def _default_filter_violation_responses_before_revocation(
+        violation_responses: List[StateSupervisionViolationResponse],
+        _include_follow_up_responses: bool) -> List[StateSupervisionViolationResponse]:
     return violation_responses
 
 
@@ -336,8 +538,13 @@ def filter_supervision_periods_for_revocation_identification(supervision_periods
         List[StateSupervisionPeriod]:
     """State-specific filtering of supervision periods that should be included in pre-revocation analysis."""
     if supervision_periods:
-        if supervision_periods[0].state_code == 'US_ID':
-            return us_id_filter_supervision_periods_for_revocation_identification(supervision_periods)
+        state_config = get_state_calculation_config(supervision_periods[0].state_code)
+        return state_config.filter_supervision_periods_for_revocation_identification(supervision_periods)
+    return supervision_periods
+
+
+def _default_filter_supervision_periods_for_revocation_identification(
+        supervision_periods: List[StateSupervisionPeriod]) -> List[StateSupervisionPeriod]:
     return supervision_periods
 
 
@@ -346,11 +553,55 @@ def incarceration_period_is_from_revocation(
         preceding_incarceration_period: Optional[StateIncarcerationPeriod]) \
         -> bool:
     """Determines if the sequence of incarceration periods represents a revocation."""
-    if incarceration_period.state_code == 'US_ID':
-        return us_id_is_revocation_admission(incarceration_period, preceding_incarceration_period)
+    return get_state_calculation_config(incarceration_period.state_code).incarceration_period_is_from_revocation(
+        incarceration_period, preceding_incarceration_period)
+
+
+def _default_incarceration_period_is_from_revocation(
+        incarceration_period: StateIncarcerationPeriod,
+        _preceding_incarceration_period: Optional[StateIncarcerationPeriod]) -> bool:
     return is_revocation_admission(incarceration_period.admission_reason)
 
 
+def revoked_supervision_periods_if_revocation_occurred(
+        incarceration_period: StateIncarcerationPeriod,
+        supervision_periods: List[StateSupervisionPeriod],
+        preceding_incarceration_period: Optional[StateIncarcerationPeriod]) -> \
+        Tuple[bool, List[StateSupervisionPeriod]]:
+    """If the incarceration period was a result of a supervision revocation, finds the supervision periods that were
+    revoked, abiding by state-specific logic.
+
+    Returns False, [] if the incarceration period was not a result of a revocation. Returns True and the list of
+    supervision periods that were revoked if the incarceration period was a result of a revocation.
+    """
+    state_config = get_state_calculation_config(incarceration_period.state_code)
+    return state_config.revoked_supervision_periods_if_revocation_occurred(
+        incarceration_period, supervision_periods, preceding_incarceration_period)
+
+
+def _us_id_revoked_supervision_periods_if_revocation_occurred(
+        incarceration_period: StateIncarcerationPeriod,
+        supervision_periods: List[StateSupervisionPeriod],
+        preceding_incarceration_period: Optional[StateIncarcerationPeriod]) -> \
+        Tuple[bool, List[StateSupervisionPeriod]]:
+    admission_is_revocation, revoked_period = us_id_revoked_supervision_period_if_revocation_occurred(
+        incarceration_period, supervision_periods, preceding_incarceration_period)
+
+    return admission_is_revocation, ([revoked_period] if revoked_period else [])
+
+
+def _default_revoked_supervision_periods_if_revocation_occurred(
+        incarceration_period: StateIncarcerationPeriod,
+        supervision_periods: List[StateSupervisionPeriod],
+        _preceding_incarceration_period: Optional[StateIncarcerationPeriod]) -> \
+        Tuple[bool, List[StateSupervisionPeriod]]:
+    admission_is_revocation = is_revocation_admission(incarceration_period.admission_reason)
+    revoked_periods = get_relevant_supervision_periods_before_admission_date(incarceration_period.admission_date,
+                                                                             supervision_periods)
+
+    return admission_is_revocation, revoked_periods
+
+
 def produce_supervision_time_bucket_for_period(supervision_period: StateSupervisionPeriod):
     """Whether or not any SupervisionTimeBuckets should be created using the supervision_period. In some cases, we do
     not want to drop periods entirely because we need them for context in some of the calculations, but we do not want
@@ -358,7 +609,8 @@ def produce_supervision_time_bucket_for_period(supervision_period: StateSupervis
     if ((supervision_period.supervision_period_supervision_type == StateSupervisionPeriodSupervisionType.INVESTIGATION
          # TODO(2891): Remove this check when we remove supervision_type from StateSupervisionPeriods
          or supervision_period.supervision_type == StateSupervisionType.PRE_CONFINEMENT)
-            and not investigation_periods_in_supervision_population(supervision_period.state_code)):
+            and not get_state_calculation_config(
+                supervision_period.state_code).investigation_periods_in_supervision_population):
         return False
     return True
 
@@ -373,24 +625,45 @@ def get_case_compliance_on_date(supervision_period: StateSupervisionPeriod,
     """Returns the SupervisionCaseCompliance object containing information about whether the given supervision case is
     in compliance with state-specific standards on the compliance_evaluation_date. If the state of the
     supervision_period does not have state-specific compliance calculations, returns None."""
-    if supervision_period.state_code == 'US_ID':
-        return us_id_case_compliance_on_date(supervision_period,
-                                             case_type,
-                                             start_of_supervision,
-                                             compliance_evaluation_date,
-                                             assessments,
-                                             supervision_contacts)
+    return get_state_calculation_config(supervision_period.state_code).get_case_compliance_on_date(
+        supervision_period, case_type, start_of_supervision, compliance_evaluation_date, assessments,
+        supervision_contacts)
+
 
+def _default_case_compliance_on_date(_supervision_period: StateSupervisionPeriod,
+                                     _case_type: StateSupervisionCaseType,
+                                     _start_of_supervision: date,
+                                     _compliance_evaluation_date: date,
+                                     _assessments: List[StateAssessment],
+                                     _supervision_contacts: List[StateSupervisionContact]) -> \
+        Optional[SupervisionCaseCompliance]:
     return None
 
 
 # TODO(3829): Determine if we want a supervision district / supervision site distinction in our schema and/or metrics.
 def get_supervision_district_from_supervision_period(supervision_period: StateSupervisionPeriod) -> Optional[str]:
     """Given |supervision_period| returns the relevant supervision site abiding by state-specific logic."""
+    return get_state_calculation_config(
+        supervision_period.state_code).get_supervision_district_from_supervision_period(supervision_period)
 
-    # In some states we have squashed the notion of district and site into one field, so all filled in supervision sites
-    # are in the format "{supervision district}|{location/office within district}". This separates out the district
-    # info.
-    if supervision_period.state_code in ('US_ID', 'US_PA') and supervision_period.supervision_site:
+
+def _supervision_district_from_combined_supervision_site(supervision_period: StateSupervisionPeriod) -> Optional[str]:
+    if supervision_period.supervision_site:
         return supervision_period.supervision_site.split('|')[0]
     return supervision_period.supervision_site
+
+
+def _default_supervision_district_from_supervision_period(supervision_period: StateSupervisionPeriod) -> \
+        Optional[str]:
+    return supervision_period.supervision_site
+
+
+def _default_normalize_violations_on_response(response: StateSupervisionViolationResponse) -> \
+        StateSupervisionViolationResponse:
+    return response
+
+
+def _default_ranked_violation_type_and_subtype_counts(
+        _violations: List[StateSupervisionViolation],
+        _violation_type_severity_order: List[StateSupervisionViolationType]) -> Dict[str, int]:
+    return {}
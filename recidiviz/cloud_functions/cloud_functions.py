@@ -138,16 +138,23 @@ def dataflow_monitor():
         location: The region where the job is being run
         topic: The Pub/Sub topic to publish a message to if the job is
             successful
+        incremental_pipeline: (Optional) The calculation pipeline of the job,
+            if the job is an incremental run whose output must be merged into
+            the metric tables once it completes
     """
     job_id = get_str_param_value('job_id', request.args)
     location = get_str_param_value('location', request.args)
     topic = get_str_param_value('topic', request.args)
+    incremental_pipeline = get_str_param_value('incremental_pipeline',
+                                               request.args)
 
     logging.info("Attempting to monitor the job with id: %s. Will "
                  "publish to %s on success.", job_id, topic)
 
-    CalculateCloudTaskManager().create_dataflow_monitor_task(job_id,
-                                                             location,
-                                                             topic)
+    CalculateCloudTaskManager().create_dataflow_monitor_task(
+        job_id,
+        location,
+        topic,
+        incremental_pipeline=incremental_pipeline)
 
     return '', HTTPStatus.OK
@@ -125,9 +125,45 @@ STAFF_POSITIVE_FROM_ACTIVE_AND_RECOVERED_NOTE = \
     (f'{STAFF_TESTED_POSITIVE_COLUMN} calculated as sum of {STAFF_ACTIVE_CASES_COLUMN} and '
      f'{STAFF_RECOVERED_CASES_COLUMN}')
 
+# Numeric columns, which are merged across sources by taking the max value
+NUMERIC_COLUMNS = [
+    POP_TESTED_COLUMN,
+    POP_TESTED_POSITIVE_COLUMN,
+    POP_TESTED_NEGATIVE_COLUMN,
+    POP_PENDING_COLUMN,
+    POP_DEATHS_COLUMN,
+    POP_ACTIVE_CASES_COLUMN,
+    POP_RECOVERED_CASES_COLUMN,
+    STAFF_TESTED_COLUMN,
+    STAFF_TESTED_POSITIVE_COLUMN,
+    STAFF_TESTED_NEGATIVE_COLUMN,
+    STAFF_PENDING_COLUMN,
+    STAFF_DEATHS_COLUMN,
+    STAFF_ACTIVE_CASES_COLUMN,
+    STAFF_RECOVERED_CASES_COLUMN
+]
+
 
 def aggregate(prison_csv_reader, ucla_workbook, recidiviz_csv_reader):
-    """Aggregates all COVID data source files into a single output file
+    """Aggregates all COVID data source files into a single output CSV string
+
+    Args:
+        prison_csv_reader: prison file as a CSV DictReader
+        ucla_workbook: UCLA file as an XLRD Book
+        recidiviz_csv_reader: Recidiviz file as a CSV DictReader
+    """
+    string_buffer = StringIO()
+    write_csv(
+        aggregate_rows(prison_csv_reader, ucla_workbook, recidiviz_csv_reader),
+        string_buffer)
+    return string_buffer.getvalue()
+
+
+def aggregate_rows(prison_csv_reader, ucla_workbook, recidiviz_csv_reader):
+    """Aggregates all COVID data source files and returns a generator of output
+    rows (header first), which can be streamed to a file with write_csv. All
+    sources are parsed and combined before this returns, so any errors in the
+    source data are raised here rather than while the rows are being written.
 
     Args:
         prison_csv_reader: prison file as a CSV DictReader
@@ -160,8 +196,13 @@ def aggregate(prison_csv_reader, ucla_workbook, recidiviz_csv_reader):
         })
 
     amended_data = _amend_data(aggregated_data)
-    formatted_output = _format_output(amended_data)
-    return _to_csv_string(formatted_output)
+    return _format_output(amended_data)
+
+
+def write_csv(rows, output_file):
+    """Streams the output rows of aggregate_rows to a writable text file"""
+    csv_writer = csv.writer(output_file)
+    csv_writer.writerows(rows)
 
 
 def _parse_prison_csv(prison_csv_reader):
@@ -255,14 +296,20 @@ def _parse_ucla_workbook(ucla_workbook):
             if value in column_indices:
                 column_indices[value] = index
 
-        # Start from 1 to skip header row
-        for index in range(1, sheet.nrows):
-            row = \
-                [_get_excel_cell_string_value(
-                    cell, ucla_workbook.datemode).strip()
-                 for cell in sheet.row(index)]
+        # Only the columns we extract are converted to strings, one column at
+        # a time, starting from 1 to skip the header row
+        column_values = {
+            label: [_get_excel_cell_string_value(
+                cell, ucla_workbook.datemode).strip()
+                    for cell in sheet.col_slice(index, start_rowx=1)]
+            for label, index in column_indices.items() if index is not None
+        }
+
+        for index in range(sheet.nrows - 1):
+            row = {label: values[index]
+                   for label, values in column_values.items()}
 
-            date = row[column_indices['Date']]
+            date = row['Date']
             # Rows with missing dates should be ignored, since they can't be
             # used
             if date in MISSING_DATE_VALUES:
@@ -421,67 +468,36 @@ def _combine_by_facility(sources):
     """Creates an aggregated data set by taking the supserset of all facilities
     present in all sources and combining the available data for each facility
     """
-    all_keys = set()
-    for source in sources.values():
-        for key in source:
-            all_keys.add(key)
+    # Index every source row by key in a single pass, so each key's rows from
+    # all sources can be merged without looking the key up in every source
+    # again for every column
+    rows_by_key = {}
+    for source_name, source in sources.items():
+        for key, row in source.items():
+            rows_by_key.setdefault(key, []).append((source_name, row))
 
     aggregated_data = {}
 
-    for key in all_keys:
-        # The key fields and facility info fields will be the same for any
-        # sources in which the key is present, so the first non-null value can
-        # be used
-        date = _get_first_non_null(key, DATE_COLUMN, sources)
-        facility_type = _get_first_non_null(key, FACILITY_TYPE_COLUMN, sources)
-        state = _get_first_non_null(key, STATE_COLUMN, sources)
-        facility_name = _get_first_non_null(key, FACILITY_NAME_COLUMN, sources)
-
-        source = _combine_non_null_text(key, SOURCE_COLUMN, sources)
-        notes = _combine_non_null_text(key, NOTES_COLUMN, sources)
-        aggregation_notes = _combine_non_null_text(
-            key, AGGREGATION_NOTES_COLUMN, sources)
-
-        # Create initial row data, so numeric and compilation values will have
-        # a place to go
+    for key, source_rows in rows_by_key.items():
+        # Create initial row data from the merge policy for each non-numeric
+        # column, so numeric and compilation values will have a place to go
         combined_row = {
-            DATE_COLUMN: date,
-            FACILITY_TYPE_COLUMN: facility_type,
-            STATE_COLUMN: state,
-            FACILITY_NAME_COLUMN: facility_name,
-            SOURCE_COLUMN: source,
-            NOTES_COLUMN: notes,
-            AGGREGATION_NOTES_COLUMN: aggregation_notes
+            column: merge_policy(source_rows, column)
+            for column, merge_policy in TEXT_COLUMN_MERGE_POLICIES.items()
         }
 
-        # Easier to handle the numeric fields in a loop, since we also have to
-        # keep track of the source for all of them
-        numeric_columns = [
-            POP_TESTED_COLUMN,
-            POP_TESTED_POSITIVE_COLUMN,
-            POP_TESTED_NEGATIVE_COLUMN,
-            POP_PENDING_COLUMN,
-            POP_DEATHS_COLUMN,
-            POP_ACTIVE_CASES_COLUMN,
-            POP_RECOVERED_CASES_COLUMN,
-            STAFF_TESTED_COLUMN,
-            STAFF_TESTED_POSITIVE_COLUMN,
-            STAFF_TESTED_NEGATIVE_COLUMN,
-            STAFF_PENDING_COLUMN,
-            STAFF_DEATHS_COLUMN,
-            STAFF_ACTIVE_CASES_COLUMN,
-            STAFF_RECOVERED_CASES_COLUMN
-        ]
         numeric_value_sources = set()
         numeric_value_present = False
-        for column in numeric_columns:
+        # Easier to handle the numeric fields in a loop, since we also have to
+        # keep track of the source for all of them
+        for column in NUMERIC_COLUMNS:
             # For all numeric fields, the assumption is that the largest value
             # was obtained last on the given date and so should be the most
             # up-to-date value.
             #
             # Note that this step also converts all numeric fields from string
             # to int values.
-            value, value_source = _get_max(key, column, sources)
+            value, value_source = _get_max(source_rows, column)
             # Always include value even if it's null, to ensure all required
             # columns are present
             combined_row[column] = value
@@ -641,11 +657,9 @@ def _amend_data(data):
 
 
 def _format_output(data):
-    """Sorts rows and columns and adds header"""
-    output = []
-
-    header_row = list(OUTPUT_COLUMN_ORDER)
-    output.append(header_row)
+    """Sorts rows and columns and adds header, yielding each output row in turn
+    """
+    yield list(OUTPUT_COLUMN_ORDER)
 
     # Because of the choice of output date format and key structure, sorting by
     # key will conveniently sort by date, state, and facility, in that order.
@@ -655,18 +669,7 @@ def _format_output(data):
 
     for key in sorted_keys:
         row = data[key]
-        sorted_row = [row[column] for column in OUTPUT_COLUMN_ORDER]
-        output.append(sorted_row)
-
-    return output
-
-
-def _to_csv_string(rows):
-    """Converts list of lists to a CSV string"""
-    string_buffer = StringIO()
-    csv_writer = csv.writer(string_buffer)
-    csv_writer.writerows(rows)
-    return string_buffer.getvalue()
+        yield [row[column] for column in OUTPUT_COLUMN_ORDER]
 
 
 def _row_key(date, state, facility_name):
@@ -676,25 +679,26 @@ def _row_key(date, state, facility_name):
     return '{}:{}:{}'.format(date, state, facility_name)
 
 
-def _get_first_non_null(key, column, sources):
-    """Returns first occurence of a non-null value in the provided column for a
-    row with the provided key in any source
+def _get_first_non_null(source_rows, column):
+    """Returns first occurence of a non-null value in the provided column of the
+    provided (source name, row) pairs for a single key
     """
-    for source in sources.values():
-        if key in source and column in source[key] and source[key][column]:
-            return source[key][column]
+    for _, row in source_rows:
+        if row.get(column):
+            return row[column]
     return None
 
 
-def _get_max(key, column, sources):
+def _get_max(source_rows, column):
     """Returns max value and name of max value source over all occurences of a
-    value in the provided column for a row with the provided key in all sources
+    value in the provided column of the provided (source name, row) pairs for a
+    single key
     """
     current_max = None
     current_max_source = None
-    for source_name, source in sources.items():
-        if key in source and column in source[key] and source[key][column]:
-            value = _int_or_none(source[key][column])
+    for source_name, row in source_rows:
+        if row.get(column):
+            value = _int_or_none(row[column])
             # Explicit None check since 0 is a valid value
             if value is not None and (not current_max or value > current_max):
                 current_max = value
@@ -702,15 +706,26 @@ def _get_max(key, column, sources):
     return current_max, current_max_source
 
 
-def _combine_non_null_text(key, column, sources):
+def _combine_non_null_text(source_rows, column):
     """Returns comma-joined string of all non-null occurences of a value in the
-    provided column for a row with the provided key in all sources
+    provided column of the provided (source name, row) pairs for a single key
     """
-    values = []
-    for source in sources.values():
-        if key in source and column in source[key] and source[key][column]:
-            values.append(source[key][column])
-    return ', '.join(values)
+    return ', '.join(row[column] for _, row in source_rows if row.get(column))
+
+
+# Merge policy for each non-numeric column. The key fields and facility info
+# fields will be the same for any sources in which the key is present, so the
+# first non-null value can be used. Free text fields are combined from all
+# sources.
+TEXT_COLUMN_MERGE_POLICIES = {
+    DATE_COLUMN: _get_first_non_null,
+    FACILITY_TYPE_COLUMN: _get_first_non_null,
+    STATE_COLUMN: _get_first_non_null,
+    FACILITY_NAME_COLUMN: _get_first_non_null,
+    SOURCE_COLUMN: _combine_non_null_text,
+    NOTES_COLUMN: _combine_non_null_text,
+    AGGREGATION_NOTES_COLUMN: _combine_non_null_text
+}
 
 
 def _get_excel_cell_string_value(cell, workbook_date_mode):
@@ -750,7 +765,7 @@ def _get_cell_value_if_present(column_label, column_indices, row):
     # row, the label will be mapped to None.
     if not column_indices[column_label]:
         return None
-    return row[column_indices[column_label]]
+    return row[column_label]
 
 
 def _int_or_none(string):
@@ -74,7 +74,7 @@ def ingest_and_aggregate_latest_data():
     recidiviz_csv_reader = csv.DictReader(
         recidiviz_file_content.splitlines(), delimiter=',')
 
-    aggregated_csv = covid_aggregator.aggregate(
+    aggregated_rows = covid_aggregator.aggregate_rows(
         prison_csv_reader, ucla_workbook, recidiviz_csv_reader)
 
     # Clear out any existing files in the output bucket by moving them to the
@@ -89,7 +89,7 @@ def ingest_and_aggregate_latest_data():
         output_bucket, OUTPUT_FILE_NAME.format(
             datetime.datetime.now().strftime(OUTPUT_FILE_TIMESTAMP_FORMAT)))
     with file_system.open(output_file_path, 'wt') as output_file:
-        output_file.write(aggregated_csv)
+        covid_aggregator.write_csv(aggregated_rows, output_file)
 
 
 def _get_content_of_latest_file_from_folder(file_system, directory, mode):
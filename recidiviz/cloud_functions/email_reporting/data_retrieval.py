@@ -47,10 +47,12 @@ def start(state_code: str, report_type: str) -> str:
 
     recipient_data = retrieve_data(state_code, report_type, batch_id)
 
+    report_contexts = []
     for recipient in recipient_data:
         recipient[utils.KEY_BATCH_ID] = batch_id
-        report_context = get_report_context(state_code, report_type, recipient)
-        email_generation.generate(report_context)
+        report_contexts.append(get_report_context(state_code, report_type, recipient))
+
+    email_generation.generate_batch(report_contexts)
 
     return batch_id
 
@@ -92,8 +94,20 @@ def retrieve_data(state_code: str, report_type: str, batch_id: str) -> List:
         logging.error("Unable to archive the data file to %s/%s", archive_bucket, archive_filename)
         raise
 
-    json_list = file_contents_string.splitlines()
+    json_list = [json_str for json_str in file_contents_string.splitlines() if json_str.strip()]
+
+    try:
+        # Parse every line in a single pass, only falling back to parsing line by line to find and skip bad lines
+        recipient_data: List[dict] = json.loads(f"[{','.join(json_list)}]")
+    except json.JSONDecodeError:
+        recipient_data = _parse_json_lines(json_list, data_filename)
+
+    logging.info("Retrieved %s recipients from data file %s", len(recipient_data), data_filename)
+    return recipient_data
 
+
+def _parse_json_lines(json_list: List[str], data_filename: str) -> List[dict]:
+    """Parses each line as a separate JSON object, logging and skipping any lines that are not valid JSON."""
     recipient_data: List[dict] = []
     for json_str in json_list:
         try:
@@ -104,5 +118,4 @@ def retrieve_data(state_code: str, report_type: str, batch_id: str) -> List:
         else:
             recipient_data.append(item)
 
-    logging.info("Retrieved %s recipients from data file %s", len(recipient_data), data_filename)
     return recipient_data
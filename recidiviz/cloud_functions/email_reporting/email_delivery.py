@@ -27,7 +27,11 @@ and conform to the following:
 """
 
 import logging
-from typing import Dict, Tuple
+import os
+import threading
+import time
+from concurrent import futures
+from typing import Tuple, Iterator, Set, Optional
 
 from google.cloud import storage
 from sendgrid import SendGridAPIClient
@@ -37,16 +41,71 @@ import email_reporting_utils as utils
 
 EMAIL_SUBJECT = "Your monthly Recidiviz report"
 
+# The number of emails that are downloaded and sent concurrently
+DEFAULT_MAX_DELIVERY_WORKERS = 8
 
-def deliver(batch_id: str, test_address: str = None) -> Tuple[int, int]:
+# The maximum sustained number of emails sent per second, and how many emails can be sent in a burst above that rate
+DEFAULT_MAX_EMAILS_PER_SECOND = 10.0
+DEFAULT_EMAIL_BURST_SIZE = 10
+
+
+class RateLimiter:
+    """A thread-safe token bucket which limits the rate at which emails are sent.
+
+    The bucket holds up to |burst_size| tokens and is refilled at |rate_per_second| tokens per second. Each send takes
+    one token, waiting for the bucket to refill if it is empty.
+    """
+
+    def __init__(self, rate_per_second: float, burst_size: int):
+        if rate_per_second <= 0 or burst_size < 1:
+            raise ValueError(f"Invalid rate limit: rate_per_second = {rate_per_second}, burst_size = {burst_size}")
+
+        self.rate_per_second = rate_per_second
+        self.burst_size = burst_size
+        self._tokens = float(burst_size)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Blocks until a token is available and takes it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst_size, self._tokens + (now - self._last_refill) * self.rate_per_second)
+                self._last_refill = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait_seconds = (1 - self._tokens) / self.rate_per_second
+
+            time.sleep(wait_seconds)
+
+
+def deliver(batch_id: str,
+            test_address: str = None,
+            storage_client: Optional[storage.Client] = None,
+            mail_client: Optional[SendGridAPIClient] = None,
+            rate_limiter: Optional[RateLimiter] = None) -> Tuple[int, int]:
     """Delivers emails for the given batch.
 
     Delivers emails to either the desired recipients for the batch or to a test address. Emails delivered to the test
     address are identical to a production send except that the customer email address is appended to the subject.
 
+    The HTML files for the batch are streamed from Storage and sent by a pool of workers, subject to a rate limit on
+    the number of emails sent per second. Each successful delivery to a recipient is recorded in Storage, so that if
+    delivery of the batch is run again, emails that were already delivered are not sent a second time. Deliveries to a
+    test address are not recorded. An email that was sent but whose delivery could not be recorded still counts as a
+    success.
+
     Args:
         batch_id: The identifier for the batch
         test_address: If provided, all emails will be sent to this email address
+        storage_client: The client used to read the batch from Storage. Defaults to a new storage.Client.
+        mail_client: The client used to send emails. Defaults to a SendGridAPIClient.
+        rate_limiter: Limits how quickly emails are sent. Defaults to one configured by the optional
+            MAX_EMAILS_PER_SECOND and EMAIL_BURST_SIZE environment variables.
 
     Returns:
         A tuple with counts of successful deliveries and failures (successes, failures)
@@ -61,18 +120,27 @@ def deliver(batch_id: str, test_address: str = None) -> Tuple[int, int]:
         logging.info("Delivering emails for batch %s", batch_id)
 
     try:
-        sendgrid_api_key = utils.get_env_var('SENDGRID_API_KEY')
         from_email_address = utils.get_env_var('FROM_EMAIL_ADDRESS')
         from_email_name = utils.get_env_var('FROM_EMAIL_NAME')
+        if mail_client is None:
+            mail_client = SendGridAPIClient(utils.get_env_var('SENDGRID_API_KEY'))
     except KeyError:
         logging.error("Unable to get a required environment variable. Exiting.")
         raise
 
-    files = retrieve_html_files(batch_id)
-    success_count = 0
-    fail_count = 0
+    if storage_client is None:
+        storage_client = storage.Client()
+    if rate_limiter is None:
+        rate_limiter = RateLimiter(float(os.environ.get('MAX_EMAILS_PER_SECOND', DEFAULT_MAX_EMAILS_PER_SECOND)),
+                                   int(os.environ.get('EMAIL_BURST_SIZE', DEFAULT_EMAIL_BURST_SIZE)))
 
-    for email_address in files:
+    html_bucket = utils.get_html_bucket_name()
+    already_delivered = set() if test_address else retrieve_delivered_email_addresses(storage_client, batch_id)
+    if already_delivered:
+        logging.info("Skipping %s emails already delivered for batch %s", len(already_delivered), batch_id)
+
+    def _deliver_blob(blob: storage.Blob) -> None:
+        email_address = email_from_blob_name(blob.name)
         if test_address:
             subject = f"[{email_address}] {EMAIL_SUBJECT}"
             to_address = test_address
@@ -81,46 +149,80 @@ def deliver(batch_id: str, test_address: str = None) -> Tuple[int, int]:
             to_address = email_address
 
         try:
-            send_email(to_address, subject, files[email_address], sendgrid_api_key, from_email_address, from_email_name)
+            body = blob.download_as_string().decode("utf-8")
+        except Exception:
+            logging.error("Unable to load html file %s from bucket %s", blob.name, html_bucket)
+            raise
+
+        try:
+            rate_limiter.acquire()
+            send_email(mail_client, to_address, subject, body, from_email_address, from_email_name)
         except Exception as e:
             logging.error("Error sending the file created for %s to %s", email_address, to_address)
             logging.error(e)
-            fail_count = fail_count + 1
-        else:
-            logging.info("Email for %s sent to %s", email_address, to_address)
-            success_count = success_count + 1
+            raise
+
+        logging.info("Email for %s sent to %s", email_address, to_address)
+        if not test_address:
+            try:
+                record_delivery(storage_client, batch_id, email_address)
+            except Exception as e:
+                # The email has been sent, so it is not reported as a failure that would prompt a rerun of the
+                # batch and a duplicate email.
+                logging.error("Unable to record delivery of the email for %s", email_address)
+                logging.error(e)
+
+    success_count = 0
+    fail_count = 0
+    blob_count = 0
+    with futures.ThreadPoolExecutor(max_workers=DEFAULT_MAX_DELIVERY_WORKERS) as executor:
+        delivery_futures = []
+        for blob in list_html_blobs(storage_client, batch_id):
+            blob_count += 1
+            if email_from_blob_name(blob.name) in already_delivered:
+                continue
+            delivery_futures.append(executor.submit(_deliver_blob, blob))
+
+        for future in futures.as_completed(delivery_futures):
+            if future.exception() is not None:
+                fail_count = fail_count + 1
+            else:
+                success_count = success_count + 1
+
+    if blob_count == 0:
+        msg = f"No html files found for batch {batch_id} in the bucket {html_bucket}"
+        logging.error(msg)
+        raise IndexError(msg)
 
     logging.info("Sent %s emails. %s emails failed to send", success_count, fail_count)
     return success_count, fail_count
 
 
-def send_email(email_address: str,
+def send_email(mail_client: SendGridAPIClient,
+               email_address: str,
                subject: str,
                body: str,
-               sendgrid_api_key: str,
                from_email_address: str,
                from_email_name: str) -> None:
     """Send an email via SendGrid.
 
     Args:
+        mail_client: The client to send the email with
         email_address: The address to deliver to
         subject: Text for the subject line
         body: The body of the email
-        sendgrid_api_key: The SendGrid API key needed to send emails
         from_email_address: The address that the delivered emails should be from
         from_email_name: The name of the person sending emails
 
     Raises:
         All errors so that calling functions can handle appropriately for their use case.
     """
-    sg = SendGridAPIClient(sendgrid_api_key)
-
     message = Mail(to_emails=email_address,
                    from_email=Email(from_email_address, from_email_name),
                    subject=subject,
                    html_content=body)
 
-    response = sg.send(message)
+    response = mail_client.send(message)
     logging.info("Sent email. Status code = %s", response.status_code)
     logging.info("Email response body = %s", response.body)
 
@@ -136,44 +238,41 @@ def email_from_blob_name(blob_name: str) -> str:
     return email_address
 
 
-def retrieve_html_files(batch_id: str) -> Dict[str, str]:
-    """Loads the HTML files for this batch from Storage.
-
-    This function is guaranteed to either return a dictionary with 1 or more results or throw an exception if there is
-    a problem loading any of the files.
+def list_html_blobs(storage_client: storage.Client, batch_id: str) -> Iterator[storage.Blob]:
+    """Lists the HTML files for this batch in Storage, one page of results at a time.
 
     Args:
+        storage_client: The client used to list the files
         batch_id: The identifier for this batch
 
     Returns:
-        A dict whose keys are the email addresses of recipients and values are strings of the email body to send.
+        An iterator over the blobs of the HTML files, each of which contains the email body for one recipient.
 
     Raises:
-        Passes through exceptions from Storage and raises its own if there are no results in this batch.
+        Passes through exceptions from Storage.
     """
-    storage_client = storage.Client()
-
     html_bucket = utils.get_html_bucket_name()
     try:
-        blobs = storage_client.list_blobs(html_bucket, prefix=batch_id)
+        blobs = storage_client.list_blobs(html_bucket, prefix=f'{batch_id}/')
     except Exception:
         logging.error("Unable to list files in html folder. Bucket = %s, folder = %s", html_bucket, batch_id)
         raise
 
-    files = {}
+    delivered_prefix = utils.get_delivered_folder(batch_id)
     for blob in blobs:
-        try:
-            body = utils.load_string_from_storage(html_bucket, blob.name)
-        except Exception:
-            logging.error("Unable to load html file %s from bucket %s", blob.name, html_bucket)
-            raise
-        else:
-            email_address = email_from_blob_name(blob.name)
-            files[email_address] = body
+        if blob.name.endswith(".html") and not blob.name.startswith(delivered_prefix):
+            yield blob
 
-    if len(files) == 0:
-        msg = f"No html files found for batch {batch_id} in the bucket {html_bucket}"
-        logging.error(msg)
-        raise IndexError(msg)
 
-    return files
+def retrieve_delivered_email_addresses(storage_client: storage.Client, batch_id: str) -> Set[str]:
+    """Returns the email addresses that emails for this batch have already been delivered to."""
+    html_bucket = utils.get_html_bucket_name()
+    blobs = storage_client.list_blobs(html_bucket, prefix=utils.get_delivered_folder(batch_id))
+    return {email_from_blob_name(blob.name) for blob in blobs}
+
+
+def record_delivery(storage_client: storage.Client, batch_id: str, email_address: str) -> None:
+    """Records in Storage that the email for this batch has been delivered to the given recipient."""
+    html_bucket = utils.get_html_bucket_name()
+    blob = storage_client.bucket(html_bucket).blob(utils.get_delivered_filename(batch_id, email_address))
+    blob.upload_from_string('', content_type='text/plain')
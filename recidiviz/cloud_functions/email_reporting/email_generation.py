@@ -22,14 +22,25 @@ Generates the HTML for email reports and stores it for later delivery.
 
 import json
 import logging
-
+from collections import defaultdict
+from concurrent import futures
 from string import Template
+from typing import Dict, List, Optional, Tuple
 
-from google.cloud import pubsub_v1
+from google.cloud import pubsub_v1, storage
 
 import email_reporting_utils as utils
 from report_context import ReportContext
 
+# The number of generated emails uploaded to Cloud Storage concurrently in batch generation
+MAX_UPLOAD_WORKERS = 16
+
+# The number of recipients sent to a worker process at a time for rendering in batch generation
+RENDER_CHUNK_SIZE = 50
+
+# The compiled template used by the rendering worker processes in batch generation
+_worker_template: Optional[Template] = None
+
 
 def generate(report_context: ReportContext) -> None:
     """Generates an email for the identified recipient.
@@ -45,18 +56,80 @@ def generate(report_context: ReportContext) -> None:
     if report_context.has_chart():
         start_chart_generation(report_context)
 
+    template = load_template(report_context.state_code, report_context.get_report_type())
+    final_email = render_email(template, prepared_data)
+    upload_email(prepared_data, final_email)
+
+
+def generate_batch(report_contexts: List[ReportContext], storage_client: Optional[storage.Client] = None) -> None:
+    """Generates emails for all of the given recipients.
+
+    The HTML template and report properties are loaded from Cloud Storage once for each state and report type. The
+    emails are rendered across a pool of worker processes and the results are uploaded to Cloud Storage concurrently.
+
+    Args:
+        report_contexts: The contexts for each recipient
+        storage_client: The client used to load templates and upload emails. Defaults to a new storage.Client.
+    """
+    contexts_by_report: Dict[Tuple[str, str], List[ReportContext]] = defaultdict(list)
+    for report_context in report_contexts:
+        contexts_by_report[(report_context.state_code, report_context.get_report_type())].append(report_context)
+
+    if storage_client is None:
+        storage_client = storage.Client()
+    publisher: Optional[pubsub_v1.PublisherClient] = None
+
+    for (state_code, report_type), contexts in contexts_by_report.items():
+        logging.info("Generating %s emails for %s and %s", len(contexts), state_code, report_type)
+        template = load_template(state_code, report_type, storage_client)
+
+        all_prepared_data = []
+        properties: Optional[dict] = None
+        for report_context in contexts:
+            # All recipients of the same report share its properties, so they only need to be loaded once
+            if properties is not None:
+                report_context.set_properties(properties)
+
+            prepared_data = report_context.get_prepared_data()
+            check_for_required_keys(prepared_data)
+            properties = report_context.properties
+
+            if report_context.has_chart():
+                if publisher is None:
+                    publisher = pubsub_v1.PublisherClient()
+                start_chart_generation(report_context, publisher)
+
+            all_prepared_data.append(prepared_data)
+
+        with futures.ProcessPoolExecutor(initializer=_set_worker_template, initargs=(template.template,)) as executor:
+            final_emails = list(executor.map(_render_email_with_worker_template, all_prepared_data,
+                                             chunksize=RENDER_CHUNK_SIZE))
+
+        with futures.ThreadPoolExecutor(max_workers=MAX_UPLOAD_WORKERS) as executor:
+            upload_futures = [executor.submit(upload_email, prepared_data, final_email, storage_client)
+                              for prepared_data, final_email in zip(all_prepared_data, final_emails)]
+            for future in futures.as_completed(upload_futures):
+                future.result()
+
+
+def load_template(state_code: str, report_type: str, storage_client: Optional[storage.Client] = None) -> Template:
+    """Loads the HTML template for the given state and report type from Cloud Storage."""
     data_bucket = utils.get_data_storage_bucket_name()
     template_filename = ''
     try:
-        template_filename = utils.get_template_filename(report_context.state_code, report_context.get_report_type())
-        html_template = utils.load_string_from_storage(data_bucket, template_filename)
+        template_filename = utils.get_template_filename(state_code, report_type)
+        html_template = utils.load_string_from_storage(data_bucket, template_filename, storage_client)
     except Exception:
         logging.error("Unable to load email template at %s/%s", data_bucket, template_filename)
         raise
 
+    return Template(html_template)
+
+
+def render_email(template: Template, prepared_data: dict) -> str:
+    """Applies the prepared recipient data to the HTML template."""
     try:
-        template = Template(html_template)
-        final_email = template.substitute(prepared_data)
+        return template.substitute(prepared_data)
     except KeyError as err:
         logging.error("Attribute required for HTML template missing from recipient data: "
                       "batch id = %s, email address = %s, attribute = %s",
@@ -66,12 +139,26 @@ def generate(report_context: ReportContext) -> None:
         logging.error("Unexpected error during templating. Recipient data = %s", prepared_data)
         raise
 
+
+def _set_worker_template(html_template: str) -> None:
+    global _worker_template
+    _worker_template = Template(html_template)
+
+
+def _render_email_with_worker_template(prepared_data: dict) -> str:
+    if _worker_template is None:
+        raise ValueError("Rendering worker was not initialized with a template")
+    return render_email(_worker_template, prepared_data)
+
+
+def upload_email(prepared_data: dict, final_email: str, storage_client: Optional[storage.Client] = None) -> None:
+    """Stores the generated email for the recipient in Cloud Storage, to be retrieved later for delivery."""
     html_bucket = utils.get_html_bucket_name()
     html_filename = ''
     try:
         html_filename = utils.get_html_filename(prepared_data[utils.KEY_BATCH_ID],
                                                 prepared_data[utils.KEY_EMAIL_ADDRESS])
-        utils.upload_string_to_storage(html_bucket, html_filename, final_email, "text/html")
+        utils.upload_string_to_storage(html_bucket, html_filename, final_email, "text/html", storage_client)
     except Exception:
         logging.error("Error while attempting upload of %s/%s", html_bucket, html_filename)
         raise
@@ -91,7 +178,8 @@ def check_for_required_keys(recipient_data: dict) -> None:
                            f"Recipient data = {json.dumps(recipient_data)}")
 
 
-def start_chart_generation(report_context: ReportContext) -> None:
+def start_chart_generation(report_context: ReportContext,
+                           publisher: Optional[pubsub_v1.PublisherClient] = None) -> None:
     """Starts chart generation for a recipient.
 
     Uses Pub/Sub to send a message to the chart function. The message contains all of the recipient's data since the
@@ -99,8 +187,10 @@ def start_chart_generation(report_context: ReportContext) -> None:
 
     Args:
         report_context: The report context containing the data and chart type
+        publisher: Optional client to reuse across calls. A new client is created if not provided.
     """
-    publisher = pubsub_v1.PublisherClient()
+    if publisher is None:
+        publisher = pubsub_v1.PublisherClient()
 
     prepared_data = report_context.get_prepared_data()
     payload = json.dumps(prepared_data)  # no error checking here since we already validated the JSON previously
@@ -47,11 +47,15 @@ class PoMonthlyReportContext(ReportContext):
         return False
 
     def prepare_for_generation(self) -> dict:
-        """Executes PO Monthly Report data preparation."""
-        self.properties = json.loads(utils.load_string_from_storage(
-            utils.get_data_storage_bucket_name(),
-            utils.get_properties_filename(self.state_code, self.get_report_type())
-        ))
+        """Executes PO Monthly Report data preparation. The report properties are only loaded from storage if they
+        were not provided with set_properties."""
+        if self._shared_properties is not None:
+            self.properties = self._shared_properties
+        else:
+            self.properties = json.loads(utils.load_string_from_storage(
+                utils.get_data_storage_bucket_name(),
+                utils.get_properties_filename(self.state_code, self.get_report_type())
+            ))
 
         self.prepared_data = copy.deepcopy(self.recipient_data)
 
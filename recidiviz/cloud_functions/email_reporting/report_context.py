@@ -18,6 +18,7 @@
 """Abstract base class that encapsulates report-specific context."""
 
 from abc import ABC, abstractmethod
+from typing import Optional
 
 
 class ReportContext(ABC):
@@ -30,6 +31,13 @@ class ReportContext(ABC):
         self.prepared_data: dict = {}
 
         self.properties: dict = {}
+        # Properties shared by all recipients of the report, if they were provided with set_properties
+        self._shared_properties: Optional[dict] = None
+
+    def set_properties(self, properties: dict) -> None:
+        """Provides the properties shared by all recipients of this report, e.g. once they have been loaded for
+        another recipient in the same batch, so that they are not loaded again when preparing this recipient's data."""
+        self._shared_properties = properties
 
     @abstractmethod
     def get_report_type(self) -> str:
@@ -183,6 +183,11 @@ def run_calculation_pipelines(_event, _context):
     # Monitor the successfully triggered Dataflow job
     url = _DATAFLOW_MONITOR_URL.format(project_id, job_id, location, on_dataflow_job_completion_topic)
 
+    # Templates built with --incremental_lookback_days must have their output merged into the metric tables
+    incremental_pipeline = os.environ.get('INCREMENTAL_PIPELINE')
+    if incremental_pipeline:
+        url = url + f'&incremental_pipeline={incremental_pipeline}'
+
     monitor_response = make_iap_request(url, IAP_CLIENT_ID[project_id])
     logging.info("The monitoring Dataflow response is %s", monitor_response)
 
@@ -52,7 +52,7 @@ def add_column_to_df(df: pd.DataFrame, county_names: pd.Series,
     |df| row to the county_name that should be used to join against fips.csv.
     """
     old_index = df.index
-    df.index = county_names.apply(_sanitize_county_name)
+    df.index = _sanitize_county_names(county_names)
 
     df = fuzzy_join(df, get_fips_for(state), _FUZZY_MATCH_CUTOFF)
 
@@ -71,11 +71,11 @@ def get_fips_for(state: us.states) -> pd.DataFrame:
         raise FipsMergingError(
             "Failed to find FIPS codes for state: {}".format(state))
 
-    fips['county_name'] = fips['county_name'].apply(_sanitize_county_name)
+    fips['county_name'] = _sanitize_county_names(fips['county_name'])
     fips = fips.set_index('county_name')
     return fips[['fips']]
 
 
-def _sanitize_county_name(county_name: str) -> str:
+def _sanitize_county_names(county_names: pd.Series) -> pd.Series:
     """To ease fuzzy matching, ensure county_names fit a common shape."""
-    return county_name.lower().replace(' county', '')
+    return county_names.str.lower().str.replace(' county', '', regex=False)
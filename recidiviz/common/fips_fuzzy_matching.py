@@ -27,7 +27,14 @@ from recidiviz.common.errors import FipsMergingError
 def fuzzy_join(df1: pd.DataFrame, df2: pd.DataFrame,
                cutoff: float) -> pd.DataFrame:
     """Merges df1 to df2 by choosing the closest index (fuzzy) to join on."""
-    df1.index = df1.index.map(lambda x: best_match(x, df2.index, cutoff))
+    # Names that exactly match a known name are their own closest match, so
+    # only the remaining names need to be fuzzy matched, each of them once.
+    names = df1.index.unique()
+    closest_matches = {
+        name: name if is_exact_match else best_match(name, df2.index, cutoff)
+        for name, is_exact_match in zip(names, names.isin(df2.index))
+    }
+    df1.index = df1.index.map(closest_matches)
     return df1.join(df2)
 
 
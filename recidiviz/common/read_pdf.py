@@ -15,9 +15,21 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # ============================================================================
 """Used to make calls from the default service to the read_pdf service in order
-to run tabula to parse PDFs. """
+to run tabula to parse PDFs.
+
+Tabula output is cached in-process, keyed by the content of the PDF and the
+tabula options, so that a report that is read several times with the same
+options is only extracted once. Since the key is the file content rather than
+its name, a report that is re-published under the same name is read again.
+"""
+import collections
+import copy
+import hashlib
+import json
 import os
 import pickle
+import threading
+from typing import Any, Tuple
 
 import tabula
 
@@ -33,8 +45,52 @@ _CLIENT_ID = {
 }
 
 
+# Maximum number of tabula results kept in the in-process cache
+MAX_CACHED_PDF_READS = 32
+
+_cache: 'collections.OrderedDict[Tuple[str, str], Any]' = \
+    collections.OrderedDict()
+_cache_lock = threading.Lock()
+
+
 def read_pdf(
         location: str, filename: str, **kwargs):
+    """Returns the result of calling tabula.read_pdf with |kwargs| on the PDF at
+    the local path |filename|, which is also stored in GCS in |location|.
+
+    Each call returns its own copy of the result, so callers are free to
+    modify it.
+    """
+    cache_key = (_file_md5(filename), json.dumps(kwargs, sort_keys=True))
+    with _cache_lock:
+        if cache_key in _cache:
+            _cache.move_to_end(cache_key)
+            return copy.deepcopy(_cache[cache_key])
+
+    result = _read_pdf_uncached(location, filename, **kwargs)
+
+    with _cache_lock:
+        _cache[cache_key] = copy.deepcopy(result)
+        while len(_cache) > MAX_CACHED_PDF_READS:
+            _cache.popitem(last=False)
+    return result
+
+
+def clear_cache() -> None:
+    """Drops all cached tabula results. Used in tests."""
+    with _cache_lock:
+        _cache.clear()
+
+
+def _file_md5(filename: str) -> str:
+    md5 = hashlib.md5()
+    with open(filename, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+def _read_pdf_uncached(location: str, filename: str, **kwargs):
     if environment.in_test():
         return tabula.read_pdf(filename, **kwargs)
 
@@ -20,11 +20,11 @@
 import abc
 import datetime
 import logging
-from typing import Generic, Optional
+from typing import Generic, Optional, List
 
 from recidiviz import IngestInfo
 from recidiviz.ingest.direct.direct_ingest_cloud_task_manager import \
-    DirectIngestCloudTaskManagerImpl
+    DirectIngestCloudTaskManagerImpl, ProcessIngestJobCloudTaskQueueInfo
 from recidiviz.common.ingest_metadata import IngestMetadata, SystemLevel
 from recidiviz.ingest.direct.controllers.direct_ingest_types import \
     IngestArgsType, ContentsHandleType
@@ -84,6 +84,8 @@ class BaseDirectIngestController(Ingestor,
                 "region [%s]",
                 process_job_queue_info.task_names[0],
                 self.region.region_code)
+            self._schedule_concurrent_ingest_jobs(process_job_queue_info,
+                                                  just_scheduled_args=None)
             return
 
         next_job_args = self._get_next_job_args()
@@ -97,6 +99,8 @@ class BaseDirectIngestController(Ingestor,
             logging.info(
                 "Already have task queued for next job [%s] - returning.",
                 self._job_tag(next_job_args))
+            self._schedule_concurrent_ingest_jobs(process_job_queue_info,
+                                                  just_scheduled_args=None)
             return
 
         # TODO(3020): Add similar logic between the raw data BQ import and ingest view export tasks
@@ -131,6 +135,27 @@ class BaseDirectIngestController(Ingestor,
                 region=self.region,
                 ingest_args=next_job_args)
             self._on_job_scheduled(next_job_args)
+            self._schedule_concurrent_ingest_jobs(
+                process_job_queue_info, just_scheduled_args=next_job_args)
+
+    def _schedule_concurrent_ingest_jobs(
+            self,
+            process_job_queue_info: ProcessIngestJobCloudTaskQueueInfo,
+            just_scheduled_args: Optional[IngestArgsType]):
+        """Creates cloud tasks for any additional jobs that may run alongside
+        the jobs already in the process job queue (plus
+        |just_scheduled_args|, if it was scheduled after the queue info was
+        fetched).
+        """
+        for args in self._get_concurrent_job_args(process_job_queue_info,
+                                                  just_scheduled_args):
+            logging.info(
+                "Creating cloud task to run concurrent job [%s]",
+                self._job_tag(args))
+            self.cloud_task_manager.create_direct_ingest_process_job_task(
+                region=self.region,
+                ingest_args=args)
+            self._on_job_scheduled(args)
 
     def _schedule_any_pre_ingest_tasks(self) -> bool:
         """Schedules any tasks related to SQL preprocessing of new files in preparation for ingest of those files into
@@ -162,6 +187,18 @@ class BaseDirectIngestController(Ingestor,
         """Should be overridden to return args for the next ingest job, or
         None if there is nothing to process."""
 
+    def _get_concurrent_job_args(
+            self,
+            _process_job_queue_info: ProcessIngestJobCloudTaskQueueInfo,
+            _just_scheduled_args: Optional[IngestArgsType]
+    ) -> List[IngestArgsType]:
+        """Should be overridden by controllers that can safely run more than
+        one ingest job at a time to return args for jobs that can start now, in
+        addition to the jobs already queued. By default, ingest jobs for a
+        region run strictly one at a time.
+        """
+        return []
+
     @abc.abstractmethod
     def _on_job_scheduled(self, ingest_args: IngestArgsType):
         """Called from the scheduler queue when an individual direct ingest job
@@ -20,11 +20,13 @@ GCSFileSystem.
 
 import abc
 import inspect
+import logging
 import os
+from itertools import islice
 from typing import List, Optional, Callable
 
 import gcsfs
-import pandas as pd
+from more_itertools import chunked, ilen
 
 from recidiviz import IngestInfo
 from recidiviz.cloud_functions.cloud_function_utils import GCSFS_NO_CACHING
@@ -32,35 +34,17 @@ from recidiviz.common.ingest_metadata import SystemLevel
 
 from recidiviz.ingest.direct.controllers.gcsfs_direct_ingest_controller import \
     GcsfsDirectIngestController
-from recidiviz.ingest.direct.controllers.direct_ingest_gcs_file_system import GcsfsFileContentsHandle, \
-    DirectIngestGCSFileSystem
+from recidiviz.ingest.direct.controllers.direct_ingest_gcs_file_system import GcsfsFileContentsHandle
 from recidiviz.ingest.direct.controllers.gcsfs_direct_ingest_utils import \
     GcsfsIngestArgs, filename_parts_from_path, GcsfsDirectIngestFileType
 from recidiviz.ingest.direct.controllers.gcsfs_path import GcsfsFilePath, GcsfsDirectoryPath
-from recidiviz.ingest.direct.controllers.gcsfs_csv_reader import GcsfsCsvReader
-from recidiviz.ingest.direct.controllers.gcsfs_csv_reader_delegates import ReadOneGcsfsCsvReaderDelegate, \
-    SplittingGcsfsCsvReaderDelegate
+from recidiviz.ingest.direct.controllers.gcsfs_csv_reader import GcsfsCsvReader, COMMON_RAW_FILE_ENCODINGS
 from recidiviz.ingest.direct.errors import DirectIngestError, \
     DirectIngestErrorType
 from recidiviz.ingest.extractor.csv_data_extractor import CsvDataExtractor
 from recidiviz.utils import metadata
 
 
-class DirectIngestFileSplittingGcsfsCsvReaderDelegate(SplittingGcsfsCsvReaderDelegate):
-    def __init__(self, path: GcsfsFilePath, fs: DirectIngestGCSFileSystem, output_directory_path: GcsfsDirectoryPath):
-        super().__init__(path, fs, include_header=True)
-        self.output_directory_path = output_directory_path
-
-    def transform_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
-        return df
-
-    def get_output_path(self, chunk_num: int):
-        name, _extension = os.path.splitext(self.path.file_name)
-
-        return GcsfsFilePath.from_directory_and_file_name(self.output_directory_path,
-                                                          f'temp_direct_ingest_{name}_{chunk_num}.csv')
-
-
 class CsvGcsfsDirectIngestController(GcsfsDirectIngestController):
     """Direct ingest controller for regions that read CSV files from the
     GCSFileSystem.
@@ -89,31 +73,61 @@ class CsvGcsfsDirectIngestController(GcsfsDirectIngestController):
             self,
             line_limit: int,
             path: GcsfsFilePath) -> bool:
-        delegate = ReadOneGcsfsCsvReaderDelegate()
+        with self.csv_reader.record_iterator(path) as records:
+            # Count the header plus up to one row more than the acceptable size, without reading any further.
+            num_records = ilen(islice(records, line_limit + 2))
 
-        # Read a chunk up to one line bigger than the acceptable size
-        self.csv_reader.streaming_read(path, delegate=delegate, chunk_size=(line_limit + 1))
-
-        if delegate.df is None:
-            # If the file is empty, it's fine.
-            return True
-
-        # If length of the only chunk is less than or equal to the acceptable
-        # size, file meets line limit.
-        return len(delegate.df) <= line_limit
+        # If the file is empty or the number of rows is less than or equal to the acceptable size, file meets line
+        # limit.
+        return num_records - 1 <= line_limit
 
     def _split_file(self, path: GcsfsFilePath) -> List[GcsfsFilePath]:
+        """Splits the file at |path| into files of at most |ingest_file_split_line_limit| rows each, reading it in a
+        single pass. Each split is uploaded straight to its final path in the ingest directory with the original header
+        and the original bytes of its rows, so no temporary files need to be moved into place afterwards.
+        """
         parts = filename_parts_from_path(path)
 
         if self.region.is_raw_vs_ingest_file_name_detection_enabled() and \
                 parts.file_type == GcsfsDirectIngestFileType.RAW_DATA:
             raise ValueError(f'Splitting raw files unsupported. Attempting to split [{path.abs_path()}]')
 
-        delegate = DirectIngestFileSplittingGcsfsCsvReaderDelegate(path, self.fs, self.temp_output_directory_path)
-        self.csv_reader.streaming_read(path, delegate=delegate, chunk_size=self.ingest_file_split_line_limit)
-        output_paths = [path for path, _ in delegate.output_paths_with_columns]
+        output_dir = GcsfsDirectoryPath.from_file_path(path)
+        encodings_to_try = list(COMMON_RAW_FILE_ENCODINGS)
+        upload_paths: List[GcsfsFilePath] = []
+        try:
+            with self.csv_reader.record_iterator(path) as records:
+                header = next(records, None)
+                if header is None:
+                    return upload_paths
+
+                for split_num, rows in enumerate(chunked(records, self.ingest_file_split_line_limit)):
+                    upload_path = self._create_split_file_path(path, output_dir, split_num=split_num)
+                    logging.info("Writing split [%s] with [%s] rows to direct ingest directory at path [%s].",
+                                 split_num, len(rows), upload_path.abs_path())
+
+                    contents = self._decode_split_contents(header + b''.join(rows), encodings_to_try)
+                    self.fs.upload_from_string(upload_path, contents, 'text/csv')
+                    upload_paths.append(upload_path)
+        except Exception as e:
+            logging.error('Threw error while writing split files - attempting to clean up before rethrowing. [%s]', e)
+            for p in upload_paths:
+                self.fs.delete(p)
+            raise e
+
+        return upload_paths
 
-        return output_paths
+    @staticmethod
+    def _decode_split_contents(contents: bytes, encodings_to_try: List[str]) -> str:
+        """Decodes the raw bytes of one split with the first encoding in |encodings_to_try| that works. Encodings that
+        fail are dropped from |encodings_to_try| so that later splits of the same file are decoded consistently.
+        """
+        while encodings_to_try:
+            try:
+                return contents.decode(encodings_to_try[0])
+            except UnicodeDecodeError:
+                encodings_to_try.pop(0)
+        raise ValueError(f'Unable to decode split contents for any of these encodings: {COMMON_RAW_FILE_ENCODINGS}')
 
     def _yaml_filepath(self, file_tag):
         return os.path.join(os.path.dirname(inspect.getfile(self.__class__)),
@@ -182,9 +196,8 @@ class CsvGcsfsDirectIngestController(GcsfsDirectIngestController):
         """Returns true if the CSV file is emtpy, i.e. it contains no non-header
          rows.
          """
-        delegate = ReadOneGcsfsCsvReaderDelegate()
-        self.csv_reader.streaming_read(args.file_path, delegate=delegate, chunk_size=1, skiprows=1)
-        return delegate.df is None
+        with self.csv_reader.record_iterator(args.file_path) as records:
+            return ilen(islice(records, 2)) < 2
 
     def _get_row_pre_processors_for_file(self, _file_tag) -> List[Callable]:
         """Subclasses should override to return row_pre_processors for a given
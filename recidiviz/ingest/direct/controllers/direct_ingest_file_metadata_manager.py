@@ -40,6 +40,14 @@ class DirectIngestFileMetadataManager:
         """Writes a new row to the ingest view metadata table for a file generated by splitting one of the exported
         ingest view files."""
 
+    @abc.abstractmethod
+    def register_ingest_file_splits(self,
+                                    original_file_metadata: DirectIngestIngestFileMetadata,
+                                    paths: List[GcsfsFilePath]) -> List[DirectIngestIngestFileMetadata]:
+        """Writes a new row to the ingest view metadata table for each file generated by splitting one of the exported
+        ingest view files. Split files have already been written by the time they are registered, so each row is
+        marked as exported."""
+
     @abc.abstractmethod
     def has_file_been_discovered(self, path: GcsfsFilePath) -> bool:
         """Checks whether the file at this path has already been marked as discovered."""
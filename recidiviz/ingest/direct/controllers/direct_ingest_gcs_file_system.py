@@ -24,12 +24,13 @@ import logging
 import os
 import tempfile
 import uuid
-from typing import List, Optional, Union, Iterator, Callable
+from typing import List, Optional, Union, Iterator, Callable, Tuple, Dict, Set
 
 
 from google.api_core import retry, exceptions
 from google.cloud import storage
 from google.cloud.exceptions import NotFound
+from more_itertools import chunked
 
 from recidiviz.ingest.direct.controllers.direct_ingest_types import IngestContentsHandle
 from recidiviz.ingest.direct.controllers.gcsfs_direct_ingest_utils import \
@@ -253,6 +254,13 @@ class DirectIngestGCSFileSystem:
         self.copy(src_path, dst_path)
         self.delete(src_path)
 
+    def mv_paths(self, src_dst_paths: List[Tuple[GcsfsFilePath, GcsfsFilePath]]) -> None:
+        """Moves each source path to its paired destination path. Implementations may batch these requests - by
+        default, files are moved one at a time.
+        """
+        for src_path, dst_path in src_dst_paths:
+            self.mv(src_path, dst_path)
+
     @abc.abstractmethod
     def copy(self,
              src_path: GcsfsFilePath,
@@ -390,6 +398,7 @@ class DirectIngestGCSFileSystem:
 
         processed_file_paths = self.get_processed_file_paths(directory_path, file_type_filter)
 
+        paths_to_move = []
         for file_path in processed_file_paths:
             date_str = filename_parts_from_path(file_path).date_str
             if date_str < date_str_bound or \
@@ -398,7 +407,13 @@ class DirectIngestGCSFileSystem:
                     "Found file [%s] from [%s] which abides by provided bound "
                     "[%s]. Moving to storage.",
                     file_path.abs_path(), date_str, date_str_bound)
-                self.mv_path_to_storage(file_path, storage_directory_path)
+                paths_to_move.append(file_path)
+
+        if not paths_to_move:
+            return
+
+        storage_paths = self._storage_paths(storage_directory_path, paths_to_move)
+        self.mv_paths(list(zip(paths_to_move, storage_paths)))
 
     def mv_path_to_storage(self,
                            path: GcsfsFilePath,
@@ -458,7 +473,65 @@ class DirectIngestGCSFileSystem:
                       path: GcsfsFilePath) -> GcsfsFilePath:
         """Returns the storage file path for the input |file_name|,
         |storage_bucket|, and |ingest_date_str|"""
+        storage_subdirectory = self._storage_subdirectory(storage_directory_path, path)
+        return self._first_free_storage_path(storage_subdirectory, path, self.exists)
+
+    def _storage_paths(self,
+                       storage_directory_path: GcsfsDirectoryPath,
+                       paths: List[GcsfsFilePath]) -> List[GcsfsFilePath]:
+        """Returns a storage file path for each of the input |paths|, in order, such that no returned path collides with
+        an existing file or with another returned path. Each storage subdirectory is listed only once, rather than
+        checking whether each candidate file name exists one at a time.
+        """
+        existing_paths_by_directory: Dict[str, Set[str]] = {}
+
+        storage_paths = []
+        for path in paths:
+            storage_subdirectory = self._storage_subdirectory(storage_directory_path, path)
+            if storage_subdirectory.abs_path() not in existing_paths_by_directory:
+                existing_paths_by_directory[storage_subdirectory.abs_path()] = {
+                    p.abs_path() for p in self._ls_with_blob_prefix(storage_subdirectory.bucket_name,
+                                                                    storage_subdirectory.relative_path)
+                }
+            existing_paths = existing_paths_by_directory[storage_subdirectory.abs_path()]
+
+            # The predicate is only called before this iteration ends
+            storage_path = self._first_free_storage_path(
+                storage_subdirectory, path,
+                lambda p: p.abs_path() in existing_paths)  # pylint: disable=cell-var-from-loop
+            existing_paths.add(storage_path.abs_path())
+            storage_paths.append(storage_path)
+
+        return storage_paths
+
+    def _first_free_storage_path(self,
+                                 storage_subdirectory: GcsfsDirectoryPath,
+                                 path: GcsfsFilePath,
+                                 path_exists: Callable[[GcsfsFilePath], bool]) -> GcsfsFilePath:
+        """Returns the first path in |storage_subdirectory| for the file at |path| for which |path_exists| is False,
+        appending a suffix to the file name if there is a collision."""
+        for file_num in range(self._RENAME_RETRIES):
+            name, ext = path.file_name.split('.')
+            actual_file_name = \
+                path.file_name if file_num == 0 else f'{name}-({file_num}).{ext}'
+
+            storage_path = GcsfsFilePath.from_directory_and_file_name(storage_subdirectory, actual_file_name)
+
+            if not path_exists(storage_path):
+                return storage_path
+
+            logging.error(
+                "Storage path [%s] already exists, attempting rename",
+                storage_path.abs_path())
+
+        raise ValueError(
+            f'Could not find valid storage path for file {path.file_name}.')
 
+    def _storage_subdirectory(self,
+                              storage_directory_path: GcsfsDirectoryPath,
+                              path: GcsfsFilePath) -> GcsfsDirectoryPath:
+        """Returns the directory within |storage_directory_path| that the file at |path| should be stored in, based on
+        the date and file type information embedded in the file name."""
         parts = filename_parts_from_path(path)
 
         if self.is_split_file(path):
@@ -477,29 +550,12 @@ class DirectIngestGCSFileSystem:
                 f'{parts.utc_upload_datetime.day:02}'
             )
 
-        for file_num in range(self._RENAME_RETRIES):
-            name, ext = path.file_name.split('.')
-            actual_file_name = \
-                path.file_name if file_num == 0 else f'{name}-({file_num}).{ext}'
-
-            storage_path_str = os.path.join(
-                storage_directory_path.bucket_name,
-                storage_directory_path.relative_path,
-                file_type_subidr,
-                date_subdir,
-                opt_storage_subdir,
-                actual_file_name)
-            storage_path = GcsfsFilePath.from_absolute_path(storage_path_str)
-
-            if not self.exists(storage_path):
-                return storage_path
-
-            logging.error(
-                "Storage path [%s] already exists, attempting rename",
-                storage_path.abs_path())
-
-        raise ValueError(
-            f'Could not find valid storage path for file {path.file_name}.')
+        return GcsfsDirectoryPath.from_absolute_path(os.path.join(
+            storage_directory_path.bucket_name,
+            storage_directory_path.relative_path,
+            file_type_subidr,
+            date_subdir,
+            opt_storage_subdir))
 
     @classmethod
     def generate_random_temp_path(cls) -> str:
@@ -521,6 +577,9 @@ class DirectIngestGCSFileSystemImpl(DirectIngestGCSFileSystem):
     GCSFileSystem.
     """
 
+    # Maximum number of requests to send in a single GCS batch request
+    _MAX_BATCH_SIZE = 100
+
     def __init__(self, client: storage.Client):
         self.storage_client = client
 
@@ -604,6 +663,35 @@ class DirectIngestGCSFileSystemImpl(DirectIngestGCSFileSystem):
 
         src_bucket.copy_blob(src_blob, dst_bucket, dst_blob_name)
 
+    def mv_paths(self, src_dst_paths: List[Tuple[GcsfsFilePath, GcsfsFilePath]]) -> None:
+        """Moves files using GCS batch requests. For each batch, all copies must succeed before any of the source files
+        are deleted, so a failure never leaves a file missing from both locations."""
+        for batch_src_dst_paths in chunked(src_dst_paths, self._MAX_BATCH_SIZE):
+            logging.info("Moving batch of [%s] files.", len(batch_src_dst_paths))
+            self._copy_in_batch(batch_src_dst_paths)
+            self._delete_in_batch([src_path for src_path, _ in batch_src_dst_paths])
+
+    @retry.Retry(predicate=retry_predicate)
+    def _copy_in_batch(self, src_dst_paths: List[Tuple[GcsfsFilePath, GcsfsFilePath]]) -> None:
+        # Note: Bucket objects built with bucket() (rather than get_bucket()) do not make a request to GCS.
+        with self.storage_client.batch():
+            for src_path, dst_path in src_dst_paths:
+                src_bucket = self.storage_client.bucket(src_path.bucket_name)
+                src_bucket.copy_blob(src_bucket.blob(src_path.blob_name),
+                                     self.storage_client.bucket(dst_path.bucket_name),
+                                     dst_path.blob_name)
+
+    def _delete_in_batch(self, paths: List[GcsfsFilePath]) -> None:
+        try:
+            with self.storage_client.batch():
+                for path in paths:
+                    self.storage_client.bucket(path.bucket_name).blob(path.blob_name).delete()
+        except exceptions.GoogleAPICallError as e:
+            # Fall back to deleting one at a time, which skips paths that no longer exist and retries transient errors.
+            logging.warning("Batch delete failed, deleting [%s] paths individually: [%s]", len(paths), e)
+            for path in paths:
+                self.delete(path)
+
     @retry.Retry(predicate=retry_predicate)
     def delete(self, path: GcsfsFilePath) -> None:
         if not isinstance(path, GcsfsFilePath):
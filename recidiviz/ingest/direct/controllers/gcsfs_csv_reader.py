@@ -16,7 +16,9 @@
 # =============================================================================
 """Streaming read functionality for Google Cloud Storage CSV files."""
 import abc
-from typing import Iterator, List, Optional
+import re
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, BinaryIO, Pattern
 
 import gcsfs
 import pandas as pd
@@ -29,6 +31,57 @@ COMMON_RAW_FILE_ENCODINGS = [
     'ISO-8859-1'  # Also known as 'latin-1', used in the census and lots of other government data
 ]
 
+# Matches the rest of a quoted field, up to and including its closing quote. Escaped quotes ("") are part of the field
+# contents, so a closing quote may not be directly followed by another quote.
+_QUOTED_FIELD_REMAINDER = re.compile(rb'(?:[^"]|"")*"(?!")')
+
+
+def _quoted_field_start_pattern(separator: str) -> Pattern[bytes]:
+    """Returns a pattern matching a quote that opens a quoted field, i.e. a quote at the start of a line or directly
+    following a |separator|."""
+    return re.compile(b'(?:^|(?<=' + re.escape(separator.encode()) + b'))"')
+
+
+def iter_csv_records(fp: BinaryIO, separator: str = ',') -> Iterator[bytes]:
+    """Yields the raw bytes of each record in the CSV file open at |fp|, including its line terminator. Newlines inside
+    quoted fields do not end a record, and blank lines are skipped, matching how pandas.read_csv() counts rows.
+
+    The scan works on undecoded bytes, which is safe for all COMMON_RAW_FILE_ENCODINGS since quotes, separators and
+    newlines never appear inside a multi-byte UTF-8 sequence.
+    """
+    quoted_field_start = _quoted_field_start_pattern(separator)
+
+    record_lines: List[bytes] = []
+    in_quoted_field = False
+    for line in fp:
+        pos = 0
+        while True:
+            if in_quoted_field:
+                match = _QUOTED_FIELD_REMAINDER.match(line, pos)
+                if not match:
+                    break
+                in_quoted_field = False
+                pos = match.end()
+            else:
+                match = quoted_field_start.search(line, pos)
+                if not match:
+                    break
+                in_quoted_field = True
+                pos = match.end()
+
+        if not record_lines and not in_quoted_field and not line.strip(b'\r\n'):
+            # Blank line between records
+            continue
+
+        record_lines.append(line)
+        if not in_quoted_field:
+            yield b''.join(record_lines)
+            record_lines = []
+
+    if record_lines:
+        # File ends inside an unterminated quoted field - treat the remainder as a single record
+        yield b''.join(record_lines)
+
 
 class GcsfsCsvReaderDelegate:
     """A delegate for handling various events that happen during a GcsfsCsvReader streaming_read() call."""
@@ -89,6 +142,20 @@ class GcsfsCsvReader:
         token = 'google_default' if not environment.in_gae() else 'cloud'
         return self.gcs_file_system.open(path.uri(), encoding=encoding, token=token)
 
+    def _binary_file_pointer_for_path(self, path: GcsfsFilePath):
+        """Returns a file pointer for reading the raw bytes at the given path."""
+        token = 'google_default' if not environment.in_gae() else 'cloud'
+        return self.gcs_file_system.open(path.uri(), mode='rb', token=token)
+
+    @contextmanager
+    def record_iterator(self, path: GcsfsFilePath, separator: str = ',') -> Iterator[Iterator[bytes]]:
+        """Opens the CSV at the provided path and yields an iterator over the raw bytes of each of its records (see
+        iter_csv_records()). Reading stops as soon as the caller stops consuming records, so callers that only need to
+        look at the start of a file do not download the whole thing.
+        """
+        with self._binary_file_pointer_for_path(path) as fp:
+            yield iter_csv_records(fp, separator=separator)
+
     def streaming_read(self,
                        path: GcsfsFilePath,
                        delegate: GcsfsCsvReaderDelegate,
@@ -44,6 +44,7 @@ from recidiviz.ingest.direct.controllers.gcsfs_path import \
     GcsfsFilePath, GcsfsDirectoryPath
 from recidiviz.ingest.direct.controllers.postgres_direct_ingest_file_metadata_manager import \
     PostgresDirectIngestFileMetadataManager
+from recidiviz.ingest.direct.direct_ingest_cloud_task_manager import ProcessIngestJobCloudTaskQueueInfo
 from recidiviz.ingest.direct.direct_ingest_controller_utils import check_is_region_launched_in_env
 from recidiviz.persistence.entity.operations.entities import DirectIngestIngestFileMetadata
 
@@ -56,6 +57,10 @@ class GcsfsDirectIngestController(
     _DEFAULT_MAX_PROCESS_JOB_WAIT_TIME_SEC = 300
     _INGEST_FILE_SPLIT_LINE_LIMIT = 2500
 
+    # Maximum number of ingest jobs for this region that may run at once. Jobs only run concurrently for files with
+    # different conflict keys (see _get_ingest_conflict_key()).
+    _MAX_CONCURRENT_INGEST_JOBS = 1
+
     def __init__(self,
                  region_name: str,
                  system_level: SystemLevel,
@@ -95,6 +100,7 @@ class GcsfsDirectIngestController(
                 ingest_job_file_type_filter)
 
         self.ingest_file_split_line_limit = self._INGEST_FILE_SPLIT_LINE_LIMIT
+        self.max_concurrent_ingest_jobs = self._MAX_CONCURRENT_INGEST_JOBS
 
         self.file_metadata_manager = PostgresDirectIngestFileMetadataManager(
             region_code=self.region.region_code)
@@ -387,6 +393,42 @@ class GcsfsDirectIngestController(
 
         return args
 
+    def _get_concurrent_job_args(
+            self,
+            process_job_queue_info: ProcessIngestJobCloudTaskQueueInfo,
+            just_scheduled_args: Optional[GcsfsIngestArgs]) -> List[GcsfsIngestArgs]:
+        """Returns args for ingest view files that can be ingested alongside the jobs that are already running.
+
+        Concurrent jobs are only scheduled for regions with ingest view exports enabled: those files are all produced by
+        our own exports and tracked by the metadata manager, so there is no need to wait for further uploads before
+        deciding on an order.
+        """
+        if self.max_concurrent_ingest_jobs <= 1 or not self.region.are_ingest_view_exports_enabled_in_env():
+            return []
+
+        def is_job_running(args: GcsfsIngestArgs) -> bool:
+            if just_scheduled_args and args.file_path == just_scheduled_args.file_path:
+                return True
+            return process_job_queue_info.is_task_queued(self.region, args)
+
+        candidate_args = self.file_prioritizer.get_next_job_args_to_run_concurrently(
+            max_running_jobs=self.max_concurrent_ingest_jobs,
+            is_job_running=is_job_running,
+            conflict_key_for_file_tag=self._get_ingest_conflict_key)
+
+        # Files that have not been discovered yet will be picked up by a subsequent call to handle_new_files.
+        return [args for args in candidate_args
+                if self.file_metadata_manager.has_file_been_discovered(args.file_path)]
+
+    def _get_ingest_conflict_key(self, _file_tag: str) -> str:
+        """Returns a key describing the entities that ingesting a file with the given tag may write to. Files with
+        different keys must never touch the same entity trees (e.g. they ingest disjoint root entity classes), so they
+        may be ingested concurrently. Files that share a key are always ingested one at a time, in order.
+
+        Subclasses should override to allow concurrent ingest - by default, all files for a region share a single key.
+        """
+        return self.region.region_code
+
     def _wait_time_sec_for_next_args(self, args: GcsfsIngestArgs) -> int:
         if self.file_prioritizer.are_next_args_expected(args):
             # Run job immediately
@@ -508,43 +550,20 @@ class GcsfsDirectIngestController(
         if self.region.are_ingest_view_exports_enabled_in_env():
             original_metadata = self.file_metadata_manager.get_file_metadata(path)
 
-        output_dir = GcsfsDirectoryPath.from_file_path(path)
-
-        split_contents_paths = self._split_file(path)
-        upload_paths = []
-        for i, split_contents_path in enumerate(split_contents_paths):
-            upload_path = self._create_split_file_path(path, output_dir, split_num=i)
+        upload_paths = self._split_file(path)
 
-            logging.info("Copying split [%s] to direct ingest directory at path [%s].", i, upload_path.abs_path())
-
-            upload_paths.append(upload_path)
-            try:
-                self.fs.mv(split_contents_path, upload_path)
-            except Exception as e:
-                logging.error(
-                    'Threw error while copying split files from temp bucket - attempting to clean up before rethrowing.'
-                    ' [%s]', e)
-                for p in upload_paths:
-                    self.fs.delete(p)
-                raise e
-
-        # We wait to register files with metadata manager until all files have been successfully copied to avoid leaving
-        # the metadata manager in an inconsistent state.
+        # We wait to register files with metadata manager until all files have been successfully written to avoid
+        # leaving the metadata manager in an inconsistent state.
         if self.region.are_ingest_view_exports_enabled_in_env():
             if not isinstance(original_metadata, DirectIngestIngestFileMetadata):
                 raise ValueError('Attempting to split a non-ingest view type file')
 
             logging.info('Registering [%s] split files with the metadata manager.', len(upload_paths))
-
-            for upload_path in upload_paths:
-                ingest_file_metadata = self.file_metadata_manager.register_ingest_file_split(original_metadata,
-                                                                                             upload_path)
-                self.file_metadata_manager.mark_ingest_view_exported(ingest_file_metadata)
-
+            self.file_metadata_manager.register_ingest_file_splits(original_metadata, upload_paths)
             self.file_metadata_manager.mark_file_as_processed(path)
 
         logging.info("Done splitting file [%s] into [%s] paths, moving it to storage.",
-                     path.abs_path(), len(split_contents_paths))
+                     path.abs_path(), len(upload_paths))
 
         self.fs.mv_path_to_storage(path, self.storage_directory_path)
 
@@ -574,7 +593,9 @@ class GcsfsDirectIngestController(
     @abc.abstractmethod
     def _split_file(self, path: GcsfsFilePath) -> List[GcsfsFilePath]:
         """Should be implemented by subclasses to split a file accessible via the provided path into multiple
-        files and upload those files to GCS. Returns the list of upload paths."""
+        files and upload those files directly to their final location in the ingest directory (see
+        _create_split_file_path()). If any upload fails, implementations should delete the splits already uploaded
+        before rethrowing. Returns the list of upload paths."""
 
     def _do_cleanup(self, args: GcsfsIngestArgs):
         self.fs.mv_path_to_processed_path(args.file_path)
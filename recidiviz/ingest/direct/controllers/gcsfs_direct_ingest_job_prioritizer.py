@@ -19,7 +19,7 @@ for a given region, given the desired file ordering.
 """
 
 import datetime
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Callable
 
 from recidiviz.ingest.direct.controllers.gcsfs_direct_ingest_utils import \
     GcsfsIngestArgs, filename_parts_from_path, GcsfsDirectIngestFileType
@@ -66,6 +66,41 @@ class GcsfsDirectIngestJobPrioritizer:
             file_path=next_file_path,
         )
 
+    def get_next_job_args_to_run_concurrently(
+            self,
+            max_running_jobs: int,
+            is_job_running: Callable[[GcsfsIngestArgs], bool],
+            conflict_key_for_file_tag: Callable[[str], str]) -> List[GcsfsIngestArgs]:
+        """Returns args for jobs that can start right now alongside the jobs that are already running, such that no more
+        than |max_running_jobs| jobs run at once.
+
+        Files are considered in the same order as get_next_job_args(). A file may only start if no unprocessed file
+        that sorts before it has the same conflict key (see |conflict_key_for_file_tag|), so files that may write to
+        the same entities are still ingested one at a time, in order.
+
+        Args:
+            max_running_jobs: The maximum number of jobs that may be running at once, including running jobs.
+            is_job_running: Returns True if a job for the given args has already been scheduled and is not done.
+            conflict_key_for_file_tag: Returns a key for a file tag such that files with different keys may be
+                ingested concurrently.
+        """
+        blocked_conflict_keys: Set[str] = set()
+        num_running_jobs = 0
+        args_to_run: List[GcsfsIngestArgs] = []
+        for path in self._get_sorted_unprocessed_file_paths(date_str=None):
+            args = GcsfsIngestArgs(
+                ingest_time=datetime.datetime.utcnow(),
+                file_path=path,
+            )
+            conflict_key = conflict_key_for_file_tag(filename_parts_from_path(path).file_tag)
+            if is_job_running(args):
+                num_running_jobs += 1
+            elif conflict_key not in blocked_conflict_keys:
+                args_to_run.append(args)
+            blocked_conflict_keys.add(conflict_key)
+
+        return args_to_run[:max(0, max_running_jobs - num_running_jobs)]
+
     def are_next_args_expected(self, next_args: GcsfsIngestArgs):
         """Returns True if the provided args are the args we expect to run next,
         i.e. there are no other files with different file tags we expect to
@@ -100,6 +135,18 @@ class GcsfsDirectIngestJobPrioritizer:
         """Returns the path of the unprocessed file in the ingest cloud storage
         bucket that should be processed next.
         """
+        sorted_paths = self._get_sorted_unprocessed_file_paths(date_str)
+        if not sorted_paths:
+            return None
+
+        return sorted_paths[0]
+
+    def _get_sorted_unprocessed_file_paths(
+            self,
+            date_str: Optional[str]) -> List[GcsfsFilePath]:
+        """Returns the paths of all unprocessed files in the ingest cloud
+        storage bucket, in the order they should be processed.
+        """
         if date_str:
             unprocessed_paths = self.fs.get_unprocessed_file_paths_for_day(self.ingest_directory_path,
                                                                            date_str,
@@ -107,9 +154,6 @@ class GcsfsDirectIngestJobPrioritizer:
         else:
             unprocessed_paths = self.fs.get_unprocessed_file_paths(self.ingest_directory_path, self.file_type_filter)
 
-        if not unprocessed_paths:
-            return None
-
         keys_and_paths = []
         for unprocessed_path in unprocessed_paths:
             sort_key = self._sort_key_for_file_path(unprocessed_path,
@@ -117,11 +161,7 @@ class GcsfsDirectIngestJobPrioritizer:
             if sort_key:
                 keys_and_paths.append((sort_key, unprocessed_path))
 
-        if not keys_and_paths:
-            return None
-
-        sorted_keys_and_paths = sorted(keys_and_paths)
-        return sorted_keys_and_paths[0][1]
+        return [path for _, path in sorted(keys_and_paths)]
 
     def _get_expected_next_sort_key_prefix_for_day(self, date_str: str):
         """Returns a sort key that excludes the timestamp/filename_suffix term,
@@ -96,6 +96,40 @@ class PostgresDirectIngestFileMetadataManager(DirectIngestFileMetadataManager):
 
         return metadata_entity
 
+    def register_ingest_file_splits(self,
+                                    original_file_metadata: DirectIngestIngestFileMetadata,
+                                    paths: List[GcsfsFilePath]) -> List[DirectIngestIngestFileMetadata]:
+        session = SessionFactory.for_schema_base(OperationsBase)
+
+        try:
+            now = datetime.datetime.utcnow()
+            metadata_rows = [
+                schema.DirectIngestIngestFileMetadata(
+                    region_code=self.region_code,
+                    file_tag=original_file_metadata.file_tag,
+                    is_invalidated=False,
+                    is_file_split=True,
+                    job_creation_time=now,
+                    normalized_file_name=path.file_name,
+                    export_time=now,
+                    datetimes_contained_lower_bound_exclusive=
+                    original_file_metadata.datetimes_contained_lower_bound_exclusive,
+                    datetimes_contained_upper_bound_inclusive=
+                    original_file_metadata.datetimes_contained_upper_bound_inclusive
+                )
+                for path in paths
+            ]
+            session.add_all(metadata_rows)
+            session.commit()
+            metadata_entities = [self._ingest_file_schema_metadata_as_entity(metadata) for metadata in metadata_rows]
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+        return metadata_entities
+
     def has_file_been_discovered(self, path: GcsfsFilePath) -> bool:
         parts = filename_parts_from_path(path)
 
@@ -23,8 +23,10 @@ import collections
 import csv
 import logging
 from collections import defaultdict, OrderedDict
-from typing import Dict, Set, List, Callable, Optional, Iterable, Union
+from typing import Dict, Set, List, Callable, Optional, Iterable, Union, \
+    Tuple
 
+import attr
 import more_itertools
 
 from recidiviz.common.ingest_metadata import SystemLevel
@@ -57,6 +59,21 @@ class IngestFieldCoordinates:
                f'field_value: {self.field_value}]'
 
 
+@attr.s(frozen=True)
+class _ColumnExtractionPlan:
+    """Row-independent information about how values in a single mapped CSV
+    column are extracted. Plans are compiled once from the key mappings so that
+    per-row extraction does not need to re-parse them for every cell."""
+
+    # The <class_name>.<field_name> key the column's values are set on.
+    lookup_key: str = attr.ib()
+    class_name: str = attr.ib()
+    field_name: str = attr.ib()
+
+    # Whether this column sets values on a child of the primary object.
+    is_child: bool = attr.ib()
+
+
 _DUMMY_KEY_PREFIX = 'CSV_EXTRACTOR_DUMMY_KEY'
 
 
@@ -129,6 +146,50 @@ class CsvDataExtractor(DataExtractor):
             self.child_keys.keys()) | set(self.keys_to_ignore) | set(
                 self.ancestor_keys.keys()) | set(self.primary_key.keys())
 
+        # Columns whose values are not set on any object (e.g. ignored keys)
+        # have no plan.
+        self._column_plans: Dict[str, Optional[_ColumnExtractionPlan]] = \
+            self._compile_column_plans()
+        self._child_id_cols_by_class: Dict[str, List[str]] = \
+            self._compile_child_id_cols()
+        self._stripped_col_names: Dict[str, str] = {}
+
+    def _compile_column_plans(
+            self) -> Dict[str, Optional[_ColumnExtractionPlan]]:
+        """Returns the extraction plan for every column named in the key
+        mappings, or None for columns whose values are not set on any
+        object."""
+        column_plans: Dict[str, Optional[_ColumnExtractionPlan]] = {}
+        for col in self.all_keys:
+            lookup_key = self.keys.get(col)
+            if not lookup_key:
+                column_plans[col] = None
+                continue
+            class_name, field_name = lookup_key.split('.')
+            column_plans[col] = _ColumnExtractionPlan(
+                lookup_key=lookup_key,
+                class_name=class_name,
+                field_name=field_name,
+                is_child=col in self.child_keys)
+        return column_plans
+
+    def _compile_child_id_cols(self) -> Dict[str, List[str]]:
+        """Returns a mapping of child class name to the columns whose values
+        make up the dummy primary key for children of that class, ordered by
+        CSV column name."""
+        child_id_cols_by_class: Dict[str, List[str]] = defaultdict(list)
+        for col, field in sorted(self.child_keys.items()):
+            child_class_name, _ = field.split('.')
+            child_id_cols_by_class[child_class_name].append(col.strip())
+        return child_id_cols_by_class
+
+    def _strip_col_name(self, col: str) -> str:
+        stripped = self._stripped_col_names.get(col)
+        if stripped is None:
+            stripped = col.strip()
+            self._stripped_col_names[col] = stripped
+        return stripped
+
     def extract_and_populate_data(self,
                                   content: Union[str, Iterable[str]],
                                   ingest_info: IngestInfo = None) -> IngestInfo:
@@ -177,51 +238,52 @@ class CsvDataExtractor(DataExtractor):
 
         seen_map: Dict[int, Set[str]] = defaultdict(set)
         for row in rows:
-            row_with_stripped_cols = OrderedDict()
-            for key in row:
-                row_with_stripped_cols[key.strip()] = row[key]
-            row = row_with_stripped_cols
+            row = OrderedDict((self._strip_col_name(key), value)
+                              for key, value in row.items())
 
             self._pre_process_row(row)
             primary_coordinates = self._primary_coordinates(row)
             ancestor_chain: Dict[str, str] = self._ancestor_chain(row)
 
+            # Ancestor chains and creation args only depend on the class being
+            # set, so they are computed once per class in each row.
+            extraction_args_by_class: \
+                Dict[Tuple[str, bool], Tuple[Dict[str, str], Dict[str, str]]] \
+                = {}
+
             extracted_objects_for_row = []
             for k, v in row.items():
-                k = k.strip()
-                if k not in self.all_keys:
+                if k not in self._column_plans:
                     raise ValueError("Unmapped key: [%s]" % k)
+                column_plan = self._column_plans[k]
+
+                if column_plan is None:
+                    continue
 
-                if k in self.keys:
-                    cls, field = self.keys[k].split('.')
-                    if cls == primary_coordinates.class_name and field == primary_coordinates.field_name:
-                        # It's possible that the primary key field has been listed in key_mappings in the YAML to make
-                        # it so that section is not empty. However, if there is a primary coordinates override, we want
-                        # the value to match the overridden value so we don't skip this field if the row value is empty.
-                        v = primary_coordinates.field_value
+                if column_plan.class_name == primary_coordinates.class_name \
+                        and column_plan.field_name == \
+                        primary_coordinates.field_name:
+                    # It's possible that the primary key field has been listed in key_mappings in the YAML to make
+                    # it so that section is not empty. However, if there is a primary coordinates override, we want
+                    # the value to match the overridden value so we don't skip this field if the row value is empty.
+                    v = primary_coordinates.field_value
 
                 if not v and not self.set_with_empty_value:
                     continue
 
-                column_ancestor_chain = ancestor_chain.copy()
-                if k in self.child_keys:
-                    child_class_to_set, _ = self.child_keys[k].split('.')
-                    self._update_column_ancestor_chain_for_child_object(
-                        row,
-                        primary_coordinates,
-                        child_class_to_set,
-                        column_ancestor_chain)
-
-                create_args = self._get_creation_args(row,
-                                                      k,
-                                                      column_ancestor_chain)
-
-                extracted_objects_for_column = \
-                    self._set_value_if_key_exists(k, v,
-                                                  ingest_info,
-                                                  seen_map,
-                                                  column_ancestor_chain,
-                                                  **create_args)
+                class_key = (column_plan.class_name, column_plan.is_child)
+                if class_key not in extraction_args_by_class:
+                    extraction_args_by_class[class_key] = \
+                        self._extraction_args_for_class(
+                            row, column_plan, primary_coordinates,
+                            ancestor_chain)
+                column_ancestor_chain, create_args = \
+                    extraction_args_by_class[class_key]
+
+                extracted_objects_for_column = self._set_or_create_object(
+                    ingest_info, column_plan.lookup_key, [v], seen_map,
+                    column_ancestor_chain, self.enforced_ancestor_types,
+                    **create_args)
                 extracted_objects_for_row.extend(extracted_objects_for_column)
 
             self._post_process_row(row, extracted_objects_for_row)
@@ -230,6 +292,29 @@ class CsvDataExtractor(DataExtractor):
             for obj in obj_dict.values():
                 self._clear_dummy_id(obj)
 
+    def _extraction_args_for_class(
+            self,
+            row: Dict[str, str],
+            column_plan: _ColumnExtractionPlan,
+            primary_coordinates: IngestFieldCoordinates,
+            ancestor_chain: Dict[str, str]) \
+            -> Tuple[Dict[str, str], Dict[str, str]]:
+        """Returns the ancestor chain and creation args used to set values from
+        columns with the given |column_plan| in this |row|."""
+        column_ancestor_chain = ancestor_chain
+        if column_plan.is_child:
+            column_ancestor_chain = ancestor_chain.copy()
+            self._update_column_ancestor_chain_for_child_object(
+                row,
+                primary_coordinates,
+                column_plan.class_name,
+                column_ancestor_chain)
+
+        create_args = self._creation_args_for_class(
+            row, column_plan.class_name, primary_coordinates,
+            column_ancestor_chain)
+        return column_ancestor_chain, create_args
+
     def _update_column_ancestor_chain_for_child_object(
             self,
             row: Dict[str, str],
@@ -280,21 +365,6 @@ class CsvDataExtractor(DataExtractor):
         for post_hook in self.file_post_hooks:
             post_hook(ingest_info, self.ingest_object_cache)
 
-    def _set_value_if_key_exists(self,
-                                 lookup_key: str, value: str,
-                                 ingest_info: IngestInfo,
-                                 seen_map: Dict[int, Set[str]],
-                                 ancestor_chain: Dict[str, str] = None,
-                                 **create_args) -> List[IngestObject]:
-        """If the column key is one we want to set on the object, set it on the
-        appropriate object instance."""
-        if lookup_key in self.keys:
-            return self._set_or_create_object(
-                ingest_info, self.keys[lookup_key], [value], seen_map,
-                ancestor_chain, self.enforced_ancestor_types, **create_args)
-
-        return []
-
     def _instantiate_person(self, ingest_info: IngestInfo):
         if self.system_level == SystemLevel.COUNTY:
             ingest_info.create_person()
@@ -335,12 +405,8 @@ class CsvDataExtractor(DataExtractor):
 
         # Append all values in this row that are relevant to this child object,
         # ordered by CSV column name
-        cols_for_id = []
-        for col, field in self.child_keys.items():
-            this_col_class_name, _ = field.split('.')
-            if child_class_name == this_col_class_name:
-                cols_for_id.append(col)
-        child_primary_key_parts += [row[col.strip()] for col in sorted(cols_for_id)]
+        child_primary_key_parts += [
+            row[col] for col in self._child_id_cols_by_class[child_class_name]]
 
         return '|'.join(child_primary_key_parts)
 
@@ -367,13 +433,21 @@ class CsvDataExtractor(DataExtractor):
         row contains data for multiple entities.
         """
 
-        current_field = self.keys.get(lookup_key, None)
-        if not current_field:
+        column_plan = self._column_plans.get(lookup_key)
+        if column_plan is None:
             return {}
 
-        primary_coordinates = self._primary_coordinates(row)
+        return self._creation_args_for_class(row,
+                                             column_plan.class_name,
+                                             self._primary_coordinates(row),
+                                             column_ancestor_chain)
 
-        current_class_name, _current_field_name = current_field.split('.')
+    def _creation_args_for_class(
+            self,
+            row: Dict[str, str],
+            current_class_name: str,
+            primary_coordinates: IngestFieldCoordinates,
+            column_ancestor_chain: Dict[str, str]) -> Dict[str, str]:
         if current_class_name == primary_coordinates.class_name:
             return {
                 primary_coordinates.field_name: primary_coordinates.field_value
@@ -28,15 +28,22 @@ below a given key cell.
 The |search_for_keys| flag in extract_and_populate_data, which defaults to True,
 tells the extractor to search for HTML elements that look like keys but are not
 in table cells, and converts those elements to cells. See _key_element_to_cell
-for the HTML patterns we search over.
+for the HTML patterns we search over. The elements matching every key are found
+in a single walk over the page, using an index of the keys by their first
+character that is built once from the key mappings.
+
+For very large pages, extract_and_populate_data_from_stream parses the page
+incrementally from a file-like object and extracts from the parsed tree
+directly, rather than from a copy of an already parsed tree.
 """
 
 import copy
 import logging
+import re
 from collections import defaultdict
-from typing import Optional, Iterator, List, Dict, Set, Union
+from typing import Optional, Iterator, List, Dict, Set, Union, IO, AnyStr
 
-from lxml.html import HtmlElement, tostring
+from lxml.html import HtmlElement, HTMLParser, tostring
 
 from recidiviz.ingest.extractor.data_extractor import DataExtractor
 from recidiviz.ingest.models.ingest_info import IngestInfo
@@ -56,6 +63,18 @@ class HtmlDataExtractor(DataExtractor):
         self.all_keys = set(self.keys.keys()) | \
                         set(self.multi_keys.keys()) | set(self.keys_to_ignore)
 
+        # Keys that are searched for outside of table cells, indexed by their
+        # first character so each element on the page is only compared against
+        # the keys it could start with.
+        self.searched_keys_by_first_char: Dict[str, List[str]] = \
+            defaultdict(list)
+        for key in self.keys.keys():
+            if key not in self.css_keys:
+                self.searched_keys_by_first_char[key[:1]].append(key)
+
+        self.cells: List[HtmlElement] = []
+        self._normalized_cells: Dict[HtmlElement, str] = {}
+
     def _set_all_cells(
             self, content: HtmlElement, search_for_keys: bool) -> None:
         """Finds all leaf cells on a page and sets them.
@@ -63,11 +82,14 @@ class HtmlDataExtractor(DataExtractor):
         Args:
             content: the html_tree we are searching.
         """
+        self._normalized_cells = {}
+        matches_by_key = self._find_key_matches(content) \
+            if search_for_keys else {}
         for key in self.keys.keys():
             if key in self.css_keys:
                 self._css_key_to_cell(content, key)
             elif search_for_keys:
-                self._convert_key_to_cells(content, key)
+                self._convert_key_to_cells(matches_by_key.get(key, []), key)
 
         all_cells = content.xpath('//*[self::th or self::td]')
         self.cells = [cell for cell in all_cells if self._is_leaf_cell(cell)]
@@ -102,9 +124,45 @@ class HtmlDataExtractor(DataExtractor):
         Returns:
             A populated ingest data model for a scrape.
         """
-        content_copy = copy.deepcopy(content)
-        HtmlDataExtractor._process_html(content_copy)
-        self._set_all_cells(content_copy, search_for_keys)
+        return self._extract_and_populate_data_in_place(
+            copy.deepcopy(content), ingest_info, search_for_keys)
+
+    def extract_and_populate_data_from_stream(
+            self, stream: IO[AnyStr],
+            ingest_info: Optional[IngestInfo] = None,
+            search_for_keys: bool = True,
+            chunk_size: int = 1024 * 1024) -> IngestInfo:
+        """Same as extract_and_populate_data, but for an HTML page that has not
+        been parsed yet. The page is parsed incrementally from |stream|, so the
+        raw page never has to be held in memory as a single string, and since
+        the extractor owns the parsed tree it does not need to copy it before
+        converting elements to cells.
+
+        Args:
+            stream: A file-like object to read the HTML page from
+            ingest_info: An IngestInfo object to use, if None we create a new
+                one by default
+            search_for_keys: Flag to allow searching for keys outside of
+            table cells (<td> and <tr> elements).
+            chunk_size: The number of bytes or characters to parse at a time
+
+        Returns:
+            A populated ingest data model for a scrape.
+        """
+        parser = HTMLParser()
+        for chunk in iter(lambda: stream.read(chunk_size), stream.read(0)):
+            parser.feed(chunk)
+        content = parser.close()
+        return self._extract_and_populate_data_in_place(
+            content, ingest_info, search_for_keys)
+
+    def _extract_and_populate_data_in_place(
+            self, content: HtmlElement,
+            ingest_info: Optional[IngestInfo],
+            search_for_keys: bool) -> IngestInfo:
+        """Extracts data from |content|, which is modified along the way."""
+        HtmlDataExtractor._process_html(content)
+        self._set_all_cells(content, search_for_keys)
         if ingest_info is None:
             ingest_info = IngestInfo()
         seen_map: Dict[int, Set[str]] = defaultdict(set)
@@ -181,19 +239,43 @@ class HtmlDataExtractor(DataExtractor):
         for br in content.xpath('//br'):
             br.tail = '\n' + br.tail if br.tail else '\n'
 
-    def _convert_key_to_cells(self, content: HtmlElement, key: str) -> None:
-        """Searches for elements in |content| that match a |key| and converts
-        those elements, along with their adjacent text, as table cells.
+    def _find_key_matches(
+            self, content: HtmlElement) -> Dict[str, List[HtmlElement]]:
+        """Finds the elements below |content| whose text starts with each of the
+        keys searched for outside of table cells, in a single walk over
+        |content|.
+
+        This matches the same elements, in the same order, as evaluating
+        './/*[starts-with(normalize-space(translate(text(),"\xA0"," ")),key)]'
+        for each key.
+
+        Args:
+            content: (HtmlElement) to search
+        Returns:
+            A dict from key to the elements that match it, in document order.
+        """
+        matches_by_key: Dict[str, List[HtmlElement]] = defaultdict(list)
+        for element in content.iterdescendants():
+            # Skip comments and processing instructions
+            if not isinstance(element.tag, str):
+                continue
+            text = _normalize_space(_first_text(element))
+            for key in self.searched_keys_by_first_char.get(text[:1], []):
+                if text.startswith(key):
+                    matches_by_key[key].append(element)
+        return matches_by_key
+
+    def _convert_key_to_cells(
+            self, matches: List[HtmlElement], key: str) -> None:
+        """Converts the elements that match a |key|, along with their adjacent
+        text, to table cells.
 
         Args:
-            content: (HtmlElement) to be modified
-            key: (string) to search for
+            matches: (list of HtmlElement) matching |key|, to be modified
+            key: (string) the key that was searched for
         """
-        matches = content.xpath(
-            './/*[starts-with('
-            'normalize-space(translate(text(),"\xA0"," ")),"%s")]' % key)
-        # results from the xpath call are references, so modifying them changes
-        # |content|.
+        # |matches| are references into the page, so modifying them changes
+        # the page.
         for match in matches:
             # the xpath query above matches on links as well as regular html
             # elements. Therefore, we need to check text_content() as well as
@@ -418,7 +500,13 @@ class HtmlDataExtractor(DataExtractor):
         Args:
             cell: the html element for a table cell.
         """
-        return cell.text_content().strip().strip(':').strip()
+        # The page is not modified once all of its cells are set, so the
+        # normalized text of each element only needs to be computed once.
+        normalized = self._normalized_cells.get(cell)
+        if normalized is None:
+            normalized = cell.text_content().strip().strip(':').strip()
+            self._normalized_cells[cell] = normalized
+        return normalized
 
     def _element_contains_key_descendant(self, e: HtmlElement) -> bool:
         """Returns True if Element |e| or a descendant has a key as its text
@@ -449,6 +537,26 @@ class HtmlDataExtractor(DataExtractor):
         return True
 
 
+# Whitespace as defined by XPath's normalize-space
+_XPATH_WHITESPACE_REGEX = re.compile(r'[ \t\r\n]+')
+
+
+def _first_text(element: HtmlElement) -> str:
+    """Returns the first text node directly inside |element|, the equivalent of
+    text() in an XPath string function."""
+    if element.text:
+        return element.text
+    for child in element:
+        if child.tail:
+            return child.tail
+    return ''
+
+
+def _normalize_space(text: str) -> str:
+    """Equivalent of normalize-space(translate(text, "\xA0", " ")) in XPath."""
+    return _XPATH_WHITESPACE_REGEX.sub(' ', text.replace('\xa0', ' ')).strip(' ')
+
+
 def _remove_from_content(content, xpath: str) -> None:
     for elem in content.xpath(xpath):
         parent = elem.getparent()
@@ -51,6 +51,7 @@ from recidiviz.common.ingest_metadata import IngestMetadata
 from recidiviz.ingest.models.ingest_info import IngestInfo
 from recidiviz.ingest.models.scrape_key import ScrapeKey
 from recidiviz.ingest.scrape import constants, ingest_utils, sessions
+from recidiviz.ingest.scrape.page_fetcher import get_page_fetcher
 from recidiviz.ingest.scrape.errors import ScraperFetchError, \
     ScraperGetMoreTasksError, ScraperPopulateDataError
 from recidiviz.ingest.scrape.scraper import Scraper
@@ -107,11 +108,13 @@ class BaseScraper(Scraper):
         """
         logging.info("Fetching content with endpoint: [%s]", endpoint)
 
-        # Create cookie jar to pass to fetch
-        should_proxy = self.get_region().should_proxy
-        response = self.fetch_page(
+        # Requests for all of the region's tasks share one fetcher, which pools
+        # connections and limits how hard we hit the region's site.
+        region = self.get_region()
+        response = get_page_fetcher(region).fetch(
             endpoint, headers=headers, cookies=cookies, params=params,
-            post_data=post_data, json_data=json_data, should_proxy=should_proxy)
+            post_data=post_data, json_data=json_data,
+            should_proxy=region.should_proxy)
 
         # Extract any cookies from the response and convert back to dict.
         cookies.update(response.cookies.get_dict())
@@ -0,0 +1,212 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2020 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+
+"""Fetch layer shared by all of the scrape tasks for a single region.
+
+Each region gets one PageFetcher per process, which:
+
+    1.  sends every unproxied request over a single pooled requests.Session,
+        so connections to the region's site are reused across tasks;
+    2.  caps the number of requests the region has in flight at once, and
+        spaces out the starts of requests to the same host so that we stay
+        polite to the sites we scrape;
+    3.  makes GET requests conditional on the ETag / Last-Modified validators
+        of the last response for the same url, and serves the cached response
+        when the site reports that the page has not changed.
+"""
+
+import collections
+import copy
+import http.cookiejar
+import logging
+import threading
+import time
+from typing import Callable, Dict, Mapping, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from recidiviz.ingest.scrape.scraper import Scraper
+from recidiviz.utils.regions import Region
+
+DEFAULT_MAX_CONCURRENT_REQUESTS = 10
+DEFAULT_MIN_REQUEST_INTERVAL_SECONDS = 0.0
+
+# Maximum number of responses with validators kept around for conditional
+# requests, per region
+MAX_CACHED_RESPONSES = 1000
+
+_CacheKey = Tuple[str, Tuple[Tuple[str, str], ...], Tuple[Tuple[str, str], ...],
+                  Tuple[Tuple[str, str], ...]]
+
+
+class PageFetcher:
+    """Fetches pages for a single region over a pooled HTTP session, limiting
+    concurrency and request rate and caching responses for conditional
+    requests."""
+
+    def __init__(self, max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+                 min_request_interval_seconds: float = DEFAULT_MIN_REQUEST_INTERVAL_SECONDS,
+                 max_cached_responses: int = MAX_CACHED_RESPONSES,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=max_concurrent_requests)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        # Cookies are threaded through scrape tasks explicitly, so the shared
+        # session must never hold on to cookies from one task's response and
+        # send them with another task's request.
+        self._session.cookies.set_policy(
+            http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+
+        self._request_slots = threading.BoundedSemaphore(max_concurrent_requests)
+        self._min_request_interval_seconds = min_request_interval_seconds
+        self._max_cached_responses = max_cached_responses
+        self._clock = clock
+        self._sleep = sleep
+
+        self._lock = threading.Lock()
+        self._next_request_time_by_host: Dict[str, float] = {}
+        self._cached_responses: 'collections.OrderedDict[_CacheKey, requests.Response]' = \
+            collections.OrderedDict()
+
+    def fetch(self, url, headers=None, cookies=None, params=None,
+              post_data=None, json_data=None,
+              should_proxy=True) -> requests.Response:
+        """Fetches content from a URL, with the same arguments and behavior as
+        Scraper.fetch_page. If the url was fetched before and the site reports
+        it has not been modified since, the earlier response is returned.
+
+        Proxied requests are not sent over the pooled session: each of them
+        goes out through a freshly chosen proxy, and pooling connections per
+        proxy would keep a connection pool alive for every proxy ever used.
+        """
+        cache_key = None
+        cached_response = None
+        if post_data is None and json_data is None:
+            cache_key = self._cache_key(url, params, headers, cookies)
+            cached_response = self._get_cached_response(cache_key)
+            if cached_response is not None:
+                headers = dict(headers or {})
+                headers.update(self._conditional_headers(cached_response))
+
+        with self._request_slots:
+            self._wait_for_host(url)
+            response = Scraper.fetch_page(
+                url, headers=headers, cookies=cookies, params=params,
+                post_data=post_data, json_data=json_data,
+                should_proxy=should_proxy,
+                session=None if should_proxy else self._session)
+
+        if cache_key is None:
+            return response
+
+        if response.status_code == requests.codes.not_modified \
+                and cached_response is not None:
+            logging.info("Page not modified, using cached content for: [%s]",
+                         url)
+            # Hand back a copy of the cached response carrying any cookies set
+            # on this response, so they still flow on to the next tasks.
+            not_modified_response = copy.copy(cached_response)
+            not_modified_response.cookies = response.cookies
+            return not_modified_response
+
+        if self._conditional_headers(response):
+            self._cache_response(cache_key, response)
+        return response
+
+    def _wait_for_host(self, url: str) -> None:
+        """Blocks until at least min_request_interval_seconds have passed
+        since the start of the last request to the host of the given url."""
+        if not self._min_request_interval_seconds:
+            return
+
+        host = urlparse(url).netloc
+        with self._lock:
+            now = self._clock()
+            request_time = max(
+                now, self._next_request_time_by_host.get(host, now))
+            self._next_request_time_by_host[host] = \
+                request_time + self._min_request_interval_seconds
+        if request_time > now:
+            self._sleep(request_time - now)
+
+    def _get_cached_response(
+            self, cache_key: _CacheKey) -> Optional[requests.Response]:
+        with self._lock:
+            response = self._cached_responses.get(cache_key)
+            if response is not None:
+                self._cached_responses.move_to_end(cache_key)
+            return response
+
+    def _cache_response(self, cache_key: _CacheKey,
+                        response: requests.Response) -> None:
+        with self._lock:
+            self._cached_responses[cache_key] = response
+            self._cached_responses.move_to_end(cache_key)
+            while len(self._cached_responses) > self._max_cached_responses:
+                self._cached_responses.popitem(last=False)
+
+    @staticmethod
+    def _cache_key(url: str, params: Optional[Dict], headers: Optional[Dict],
+                   cookies: Optional[Mapping]) -> _CacheKey:
+        """Returns the key under which the response to a GET request with the
+        given arguments is cached. Headers and cookies are part of the key
+        since they can change the page the site responds with."""
+        def _sorted_items(values: Optional[Mapping]) -> Tuple[Tuple[str, str], ...]:
+            return tuple(sorted(
+                (str(key), str(value)) for key, value in (values or {}).items()))
+
+        return url, _sorted_items(params), _sorted_items(headers), \
+            _sorted_items(cookies)
+
+    @staticmethod
+    def _conditional_headers(response: requests.Response) -> Dict[str, str]:
+        """Returns the conditional request headers for the validators present
+        on the given response, if any."""
+        conditional_headers = {}
+        if 'ETag' in response.headers:
+            conditional_headers['If-None-Match'] = response.headers['ETag']
+        if 'Last-Modified' in response.headers:
+            conditional_headers['If-Modified-Since'] = \
+                response.headers['Last-Modified']
+        return conditional_headers
+
+
+_fetchers: Dict[str, PageFetcher] = {}
+_fetchers_lock = threading.Lock()
+
+
+def get_page_fetcher(region: Region) -> PageFetcher:
+    """Returns the PageFetcher shared by all scrape tasks for the given region
+    in this process, creating it from the region's settings if needed."""
+    with _fetchers_lock:
+        if region.region_code not in _fetchers:
+            _fetchers[region.region_code] = PageFetcher(
+                max_concurrent_requests=region.max_concurrent_requests
+                or DEFAULT_MAX_CONCURRENT_REQUESTS,
+                min_request_interval_seconds=region.min_request_interval_seconds
+                or DEFAULT_MIN_REQUEST_INTERVAL_SECONDS)
+        return _fetchers[region.region_code]
+
+
+def clear_page_fetchers() -> None:
+    """Drops all of the cached PageFetchers. Used in tests."""
+    with _fetchers_lock:
+        _fetchers.clear()
@@ -257,7 +257,8 @@ class Scraper(Ingestor, metaclass=abc.ABCMeta):
 
     @staticmethod
     def fetch_page(url, headers=None, cookies=None, params=None,
-                   post_data=None, json_data=None, should_proxy=True):
+                   post_data=None, json_data=None, should_proxy=True,
+                   session=None):
         """Fetch content from a URL. If data is None (the default), we perform
         a GET for the page. If the data is set, it must be a dict of parameters
         to use as POST data in a POST request to the url.
@@ -273,6 +274,9 @@ class Scraper(Ingestor, metaclass=abc.ABCMeta):
             extra_headers: dict of parameters to add to the headers of this
                            request
             should_proxy: (bool) whether or not to use a proxy.
+            session: (requests.Session) optional session to send the request
+                     over, so its pooled connections can be reused. If not
+                     set, a new connection is made for this request.
 
         Returns:
             The content.
@@ -286,13 +290,14 @@ class Scraper(Ingestor, metaclass=abc.ABCMeta):
         if 'User-Agent' not in headers:
             headers.update(scraper_utils.get_headers())
 
+        http = session if session is not None else requests
         try:
             if post_data is None and json_data is None:
-                page = requests.get(
+                page = http.get(
                     url, proxies=proxies, headers=headers, cookies=cookies,
                     params=params, verify=False)
             elif params is None:
-                page = requests.post(
+                page = http.post(
                     url, proxies=proxies, headers=headers, cookies=cookies,
                     data=post_data, json=json_data, verify=False)
             else:
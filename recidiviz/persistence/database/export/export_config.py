@@ -58,9 +58,11 @@ COUNTY_COLUMNS_TO_EXCLUDE = {
 
 ######### STATE EXPORT VALUES #########
 
-# History tables that should be included in the export
+# History tables that should be included in the export. The history tables of all person-level entities are exported
+# so that incremental calculation pipeline runs can identify the people whose entities have changed.
 STATE_HISTORY_TABLES_TO_INCLUDE_IN_EXPORT = [
-    'state_person_history'
+    table.name for table in schema_utils.get_state_table_classes()
+    if 'history' in table.name and 'person_id' in table.columns
 ]
 
 # Excluding history tables
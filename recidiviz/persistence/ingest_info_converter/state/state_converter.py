@@ -16,7 +16,12 @@
 # ============================================================================
 
 """Converts ingested IngestInfo data to the persistence layer entities."""
+from typing import Dict, Any, Optional, Callable, Type
 
+import attr
+
+from recidiviz.common.attr_mixins import BuildableAttr
+from recidiviz.common.ingest_metadata import IngestMetadata
 from recidiviz.ingest.models.ingest_info_pb2 import StateSentenceGroup, \
     StatePerson, StateSupervisionSentence, StateIncarcerationSentence, \
     StateCharge, StateIncarcerationPeriod, StateSupervisionPeriod, \
@@ -24,8 +29,9 @@ from recidiviz.ingest.models.ingest_info_pb2 import StateSentenceGroup, \
     StateIncarcerationIncident, StateAssessment, StateCourtCase, \
     StateSupervisionViolationResponse, StateProgramAssignment, StateEarlyDischarge, StateSupervisionContact
 from recidiviz.persistence.entity.state import entities
+from recidiviz.persistence.entity.base_entity import Entity
 from recidiviz.persistence.ingest_info_converter.base_converter import \
-    BaseConverter
+    BaseConverter, IngestInfoConversionResult
 from recidiviz.persistence.ingest_info_converter.state.entity_helpers import \
     state_person, state_alias, state_person_race, state_person_ethnicity, \
     state_assessment, state_person_external_id, state_sentence_group, \
@@ -39,7 +45,50 @@ from recidiviz.persistence.ingest_info_converter.state.entity_helpers import \
     state_supervision_violated_condition_entry, \
     state_supervision_violation_response_decision_entry, \
     state_supervision_case_type_entry, state_early_discharge, state_supervision_contact
-from recidiviz.persistence.ingest_info_converter.utils.converter_utils import fn
+from recidiviz.persistence.ingest_info_converter.utils.converter_utils import \
+    fn, batch_parsing_cache
+
+
+@attr.s(frozen=True)
+class _PreconvertedFields:
+    """The flat (non-child) field values converted from a single ingest_info proto, or the error raised while
+    converting them."""
+    fields: Dict[str, Any] = attr.ib(factory=dict)
+    error: Optional[Exception] = attr.ib(default=None)
+
+
+def _preconvert_all(protos_by_id: Dict[str, Any],
+                    entity_cls: Type[BuildableAttr],
+                    copy_fields_fn: Callable[[Any, Any, IngestMetadata], None],
+                    metadata: IngestMetadata) -> Dict[str, _PreconvertedFields]:
+    """Converts the flat fields of every proto of a single type at once, using the provided |copy_fields_fn|.
+
+    Errors are not raised here, but are recorded so that they are raised if and when the proto is assembled into a
+    person's entity tree, exactly as they would have been had that proto been converted on its own.
+    """
+    preconverted = {}
+    for proto_id, proto in protos_by_id.items():
+        builder = entity_cls.builder()
+        try:
+            copy_fields_fn(builder, proto, metadata)
+        except Exception as e:
+            preconverted[proto_id] = _PreconvertedFields(error=e)
+            continue
+        preconverted[proto_id] = _PreconvertedFields(fields=dict(builder.fields))
+    return preconverted
+
+
+def _copy_fields_from_convert_fn(convert_fn: Callable[[Any, IngestMetadata], Entity]) \
+        -> Callable[[Any, Any, IngestMetadata], None]:
+    """Adapts a |convert_fn| for an entity without children into a function that copies the converted fields onto
+    a builder."""
+    def _copy_fields_to_builder(builder, proto, metadata: IngestMetadata) -> None:
+        converted = convert_fn(proto, metadata)
+        for field in attr.fields(converted.__class__):
+            value = getattr(converted, field.name)
+            if not isinstance(value, list):
+                setattr(builder, field.name, value)
+    return _copy_fields_to_builder
 
 
 class StateConverter(BaseConverter[entities.StatePerson]):
@@ -129,6 +178,83 @@ class StateConverter(BaseConverter[entities.StatePerson]):
             svrdte for svrdte in ingest_info.state_supervision_violation_response_decision_entries
         }
 
+        self.preconverted: Dict[Type[BuildableAttr], Dict[str, _PreconvertedFields]] = {}
+
+    def run_convert(self) -> IngestInfoConversionResult:
+        """Converts all people in the IngestInfo. The flat fields of every object type are converted all at once,
+        with each distinct date and enum value parsed only once per batch, before the entity trees for each person
+        are assembled."""
+        with batch_parsing_cache():
+            self._preconvert_all_types()
+            return super().run_convert()
+
+    def _preconvert_all_types(self) -> None:
+        """Converts the flat fields of all non-person objects in the IngestInfo, one object type at a time."""
+        to_preconvert = [
+            (entities.StatePersonAlias, self.aliases, _copy_fields_from_convert_fn(state_alias.convert)),
+            (entities.StatePersonRace, self.person_races, _copy_fields_from_convert_fn(state_person_race.convert)),
+            (entities.StatePersonEthnicity, self.person_ethnicities,
+             _copy_fields_from_convert_fn(state_person_ethnicity.convert)),
+            (entities.StatePersonExternalId, self.person_external_ids,
+             _copy_fields_from_convert_fn(state_person_external_id.convert)),
+            (entities.StateAgent, self.agents, _copy_fields_from_convert_fn(state_agent.convert)),
+            (entities.StateBond, self.bonds, _copy_fields_from_convert_fn(state_bond.convert)),
+            (entities.StateSupervisionCaseTypeEntry, self.supervision_case_type_entries,
+             _copy_fields_from_convert_fn(state_supervision_case_type_entry.convert)),
+            (entities.StateSupervisionViolationTypeEntry, self.violation_type_entries,
+             _copy_fields_from_convert_fn(state_supervision_violation_type_entry.convert)),
+            (entities.StateSupervisionViolatedConditionEntry, self.violated_condition_entries,
+             _copy_fields_from_convert_fn(state_supervision_violated_condition_entry.convert)),
+            (entities.StateSupervisionViolationResponseDecisionEntry, self.violation_response_decision_entries,
+             _copy_fields_from_convert_fn(state_supervision_violation_response_decision_entry.convert)),
+            (entities.StateIncarcerationIncidentOutcome, self.incarceration_incident_outcomes,
+             _copy_fields_from_convert_fn(state_incarceration_incident_outcome.convert)),
+            (entities.StateAssessment, self.assessments, state_assessment.copy_fields_to_builder),
+            (entities.StateProgramAssignment, self.program_assignments,
+             state_program_assignment.copy_fields_to_builder),
+            (entities.StateSentenceGroup, self.sentence_groups, state_sentence_group.copy_fields_to_builder),
+            (entities.StateSupervisionSentence, self.supervision_sentences,
+             state_supervision_sentence.copy_fields_to_builder),
+            (entities.StateIncarcerationSentence, self.incarceration_sentences,
+             state_incarceration_sentence.copy_fields_to_builder),
+            (entities.StateEarlyDischarge, self.early_discharges, state_early_discharge.copy_fields_to_builder),
+            (entities.StateFine, self.fines, state_fine.copy_fields_to_builder),
+            (entities.StateCharge, self.charges, state_charge.copy_fields_to_builder),
+            (entities.StateCourtCase, self.court_cases, state_court_case.copy_fields_to_builder),
+            (entities.StateIncarcerationPeriod, self.incarceration_periods,
+             state_incarceration_period.copy_fields_to_builder),
+            (entities.StateSupervisionPeriod, self.supervision_periods,
+             state_supervision_period.copy_fields_to_builder),
+            (entities.StateSupervisionViolation, self.supervision_violations,
+             state_supervision_violation.copy_fields_to_builder),
+            (entities.StateSupervisionViolationResponse, self.violation_responses,
+             state_supervision_violation_response.copy_fields_to_builder),
+            (entities.StateIncarcerationIncident, self.incarceration_incidents,
+             state_incarceration_incident.copy_fields_to_builder),
+            (entities.StateSupervisionContact, self.supervision_contacts,
+             state_supervision_contact.copy_fields_to_builder),
+            (entities.StateParoleDecision, self.parole_decisions, state_parole_decision.copy_fields_to_builder),
+        ]
+
+        for entity_cls, protos_by_id, copy_fields_fn in to_preconvert:
+            self.preconverted[entity_cls] = _preconvert_all(protos_by_id, entity_cls, copy_fields_fn, self.metadata)
+
+    def _builder_with_preconverted_fields(self, entity_cls: Type[BuildableAttr], proto_id: str):
+        """Returns a new builder for |entity_cls| with the preconverted flat fields of the proto with the given id."""
+        preconverted = self.preconverted[entity_cls][proto_id]
+        if preconverted.error:
+            raise preconverted.error
+
+        builder = entity_cls.builder()
+        for field_name, value in preconverted.fields.items():
+            setattr(builder, field_name, value)
+        return builder
+
+    def _convert_preconverted(self, entity_cls: Type[BuildableAttr], proto_id: str):
+        """Builds a new |entity_cls| entity without children from the preconverted fields of the proto with the given
+        id."""
+        return self._builder_with_preconverted_fields(entity_cls, proto_id).build()
+
     def _is_complete(self) -> bool:
         if self.ingest_info.state_people:
             return False
@@ -148,22 +274,19 @@ class StateConverter(BaseConverter[entities.StatePerson]):
         state_person.copy_fields_to_builder(
             state_person_builder, ingest_person, self.metadata)
 
-        converted_aliases = [state_alias.convert(self.aliases[alias_id],
-                                                 self.metadata)
+        converted_aliases = [self._convert_preconverted(entities.StatePersonAlias, alias_id)
                              for alias_id
                              in ingest_person.state_alias_ids]
         state_person_builder.aliases = converted_aliases
 
         converted_races = [
-            state_person_race.convert(self.person_races[race_id],
-                                      self.metadata)
+            self._convert_preconverted(entities.StatePersonRace, race_id)
             for race_id in ingest_person.state_person_race_ids
         ]
         state_person_builder.races = converted_races
 
         converted_ethnicities = [
-            state_person_ethnicity.convert(
-                self.person_ethnicities[ethnicity_id], self.metadata)
+            self._convert_preconverted(entities.StatePersonEthnicity, ethnicity_id)
             for ethnicity_id in ingest_person.state_person_ethnicity_ids
         ]
         state_person_builder.ethnicities = converted_ethnicities
@@ -182,8 +305,7 @@ class StateConverter(BaseConverter[entities.StatePerson]):
         state_person_builder.program_assignments = converted_program_assignments
 
         converted_external_ids = [
-            state_person_external_id.convert(
-                self.person_external_ids[external_id], self.metadata)
+            self._convert_preconverted(entities.StatePersonExternalId, external_id)
             for external_id in ingest_person.state_person_external_ids_ids
         ]
         state_person_builder.external_ids = converted_external_ids
@@ -197,9 +319,8 @@ class StateConverter(BaseConverter[entities.StatePerson]):
         state_person_builder.sentence_groups = converted_sentence_groups
 
         if ingest_person.supervising_officer_id:
-            converted_supervising_officer = state_agent.convert(
-                self.agents[ingest_person.supervising_officer_id],
-                self.metadata)
+            converted_supervising_officer = self._convert_preconverted(
+                entities.StateAgent, ingest_person.supervising_officer_id)
             state_person_builder.supervising_officer = \
                 converted_supervising_officer
 
@@ -210,11 +331,8 @@ class StateConverter(BaseConverter[entities.StatePerson]):
             -> entities.StateSentenceGroup:
         """Converts an ingest_info proto StateSentenceGroup to a
         persistence entity."""
-        sentence_group_builder = entities.StateSentenceGroup.builder()
-
-        state_sentence_group.copy_fields_to_builder(sentence_group_builder,
-                                                    ingest_sentence_group,
-                                                    self.metadata)
+        sentence_group_builder = self._builder_with_preconverted_fields(
+            entities.StateSentenceGroup, ingest_sentence_group.state_sentence_group_id)
 
         converted_supervision_sentences = [
             self._convert_supervision_sentence(
@@ -247,13 +365,8 @@ class StateConverter(BaseConverter[entities.StatePerson]):
             -> entities.StateSupervisionSentence:
         """Converts an ingest_info proto StateSupervisionSentence to a
         persistence entity."""
-        supervision_sentence_builder = \
-            entities.StateSupervisionSentence.builder()
-
-        state_supervision_sentence.copy_fields_to_builder(
-            supervision_sentence_builder,
-            ingest_supervision_sentence,
-            self.metadata)
+        supervision_sentence_builder = self._builder_with_preconverted_fields(
+            entities.StateSupervisionSentence, ingest_supervision_sentence.state_supervision_sentence_id)
 
         self._copy_children_to_sentence(supervision_sentence_builder, ingest_supervision_sentence)
 
@@ -264,13 +377,8 @@ class StateConverter(BaseConverter[entities.StatePerson]):
             -> entities.StateIncarcerationSentence:
         """Converts an ingest_info proto StateIncarcerationSentence to a
         persistence entity."""
-        incarceration_sentence_builder = \
-            entities.StateIncarcerationSentence.builder()
-
-        state_incarceration_sentence.copy_fields_to_builder(
-            incarceration_sentence_builder,
-            ingest_incarceration_sentence,
-            self.metadata)
+        incarceration_sentence_builder = self._builder_with_preconverted_fields(
+            entities.StateIncarcerationSentence, ingest_incarceration_sentence.state_incarceration_sentence_id)
 
         self._copy_children_to_sentence(incarceration_sentence_builder, ingest_incarceration_sentence)
 
@@ -279,18 +387,14 @@ class StateConverter(BaseConverter[entities.StatePerson]):
     def _convert_early_discharge(
             self, ingest_early_discharge: StateEarlyDischarge) -> entities.StateIncarcerationSentence:
         """Converts an ingest_info proto StateEarlyDischarge to a persistence entity."""
-        early_discharge_builder = entities.StateEarlyDischarge.builder()
-
-        state_early_discharge.copy_fields_to_builder(early_discharge_builder, ingest_early_discharge, self.metadata)
+        early_discharge_builder = self._builder_with_preconverted_fields(
+            entities.StateEarlyDischarge, ingest_early_discharge.state_early_discharge_id)
 
         return early_discharge_builder.build()
 
     def _convert_fine(self, ingest_fine: StateFine) -> entities.StateFine:
         """Converts an ingest_info proto StateFine to a persistence entity."""
-        state_fine_builder = entities.StateFine.builder()
-
-        state_fine.copy_fields_to_builder(
-            state_fine_builder, ingest_fine, self.metadata)
+        state_fine_builder = self._builder_with_preconverted_fields(entities.StateFine, ingest_fine.state_fine_id)
 
         self._copy_children_to_sentence(
             state_fine_builder, ingest_fine, copy_periods=False, copy_early_discharges=False)
@@ -338,13 +442,10 @@ class StateConverter(BaseConverter[entities.StatePerson]):
     def _convert_charge(self, ingest_charge: StateCharge) \
             -> entities.StateCharge:
         """Converts an ingest_info proto StateCharge to a persistence entity."""
-        charge_builder = entities.StateCharge.builder()
-
-        state_charge.copy_fields_to_builder(
-            charge_builder, ingest_charge, self.metadata)
+        charge_builder = self._builder_with_preconverted_fields(entities.StateCharge, ingest_charge.state_charge_id)
 
         charge_builder.bond = \
-            fn(lambda i: state_bond.convert(self.bonds[i], self.metadata),
+            fn(lambda i: self._convert_preconverted(entities.StateBond, i),
                'state_bond_id',
                ingest_charge)
 
@@ -356,14 +457,11 @@ class StateConverter(BaseConverter[entities.StatePerson]):
         return charge_builder.build()
 
     def _convert_court_case(self, ingest_court_case: StateCourtCase):
-        court_case_builder = entities.StateCourtCase.builder()
-
-        state_court_case.copy_fields_to_builder(court_case_builder,
-                                                ingest_court_case,
-                                                self.metadata)
+        court_case_builder = self._builder_with_preconverted_fields(
+            entities.StateCourtCase, ingest_court_case.state_court_case_id)
 
         court_case_builder.judge = \
-            fn(lambda i: state_agent.convert(self.agents[i], self.metadata),
+            fn(lambda i: self._convert_preconverted(entities.StateAgent, i),
                'judge_id',
                ingest_court_case)
 
@@ -374,13 +472,8 @@ class StateConverter(BaseConverter[entities.StatePerson]):
             -> entities.StateIncarcerationPeriod:
         """Converts an ingest_info proto StateIncarcerationPeriod to a
         persistence entity."""
-        incarceration_period_builder = \
-            entities.StateIncarcerationPeriod.builder()
-
-        state_incarceration_period.copy_fields_to_builder(
-            incarceration_period_builder,
-            ingest_incarceration_period,
-            self.metadata)
+        incarceration_period_builder = self._builder_with_preconverted_fields(
+            entities.StateIncarcerationPeriod, ingest_incarceration_period.state_incarceration_period_id)
 
         converted_incidents = [
             self._convert_incarceration_incident(
@@ -431,16 +524,11 @@ class StateConverter(BaseConverter[entities.StatePerson]):
             -> entities.StateSupervisionPeriod:
         """Converts an ingest_info proto StateSupervisionPeriod to a
         persistence entity."""
-        supervision_period_builder = \
-            entities.StateSupervisionPeriod.builder()
-
-        state_supervision_period.copy_fields_to_builder(
-            supervision_period_builder,
-            ingest_supervision_period,
-            self.metadata)
+        supervision_period_builder = self._builder_with_preconverted_fields(
+            entities.StateSupervisionPeriod, ingest_supervision_period.state_supervision_period_id)
 
         supervision_period_builder.supervising_officer = \
-            fn(lambda i: state_agent.convert(self.agents[i], self.metadata),
+            fn(lambda i: self._convert_preconverted(entities.StateAgent, i),
                'supervising_officer_id',
                ingest_supervision_period)
 
@@ -468,8 +556,7 @@ class StateConverter(BaseConverter[entities.StatePerson]):
         supervision_period_builder.program_assignments = \
             converted_program_assignments
         converted_case_types = [
-            state_supervision_case_type_entry.convert(
-                self.supervision_case_type_entries[case_type_id], self.metadata)
+            self._convert_preconverted(entities.StateSupervisionCaseTypeEntry, case_type_id)
             for case_type_id in
             ingest_supervision_period.state_supervision_case_type_entry_ids]
         supervision_period_builder.case_type_entries = converted_case_types
@@ -488,13 +575,8 @@ class StateConverter(BaseConverter[entities.StatePerson]):
             -> entities.StateSupervisionViolation:
         """Converts an ingest_info proto StateSupervisionViolation to a
         persistence entity."""
-        supervision_violation_builder = \
-            entities.StateSupervisionViolation.builder()
-
-        state_supervision_violation.copy_fields_to_builder(
-            supervision_violation_builder,
-            ingest_supervision_violation,
-            self.metadata)
+        supervision_violation_builder = self._builder_with_preconverted_fields(
+            entities.StateSupervisionViolation, ingest_supervision_violation.state_supervision_violation_id)
 
         converted_violation_responses = [
             self._convert_supervision_violation_response(
@@ -507,8 +589,7 @@ class StateConverter(BaseConverter[entities.StatePerson]):
             converted_violation_responses
 
         converted_violation_type_entries = [
-            state_supervision_violation_type_entry.convert(
-                self.violation_type_entries[type_entry_id], self.metadata)
+            self._convert_preconverted(entities.StateSupervisionViolationTypeEntry, type_entry_id)
             for type_entry_id in
             ingest_supervision_violation.state_supervision_violation_type_entry_ids
         ]
@@ -516,9 +597,7 @@ class StateConverter(BaseConverter[entities.StatePerson]):
             = converted_violation_type_entries
 
         converted_violated_condition_entries = [
-            state_supervision_violated_condition_entry.convert(
-                self.violated_condition_entries[condition_entry_id],
-                self.metadata)
+            self._convert_preconverted(entities.StateSupervisionViolatedConditionEntry, condition_entry_id)
             for condition_entry_id in
             ingest_supervision_violation.state_supervision_violated_condition_entry_ids
         ]
@@ -535,16 +614,12 @@ class StateConverter(BaseConverter[entities.StatePerson]):
         """Converts an ingest_info proto StateSupervisionViolationResponse to a
         persistence entity."""
 
-        supervision_violation_response_builder = \
-            entities.StateSupervisionViolationResponse.builder()
-
-        state_supervision_violation_response.copy_fields_to_builder(
-            supervision_violation_response_builder,
-            ingest_supervision_violation_response,
-            self.metadata)
+        supervision_violation_response_builder = self._builder_with_preconverted_fields(
+            entities.StateSupervisionViolationResponse,
+            ingest_supervision_violation_response.state_supervision_violation_response_id)
 
         converted_agents = [
-            state_agent.convert(self.agents[agent_id], self.metadata)
+            self._convert_preconverted(entities.StateAgent, agent_id)
             for agent_id
             in ingest_supervision_violation_response.decision_agent_ids
         ]
@@ -552,10 +627,7 @@ class StateConverter(BaseConverter[entities.StatePerson]):
             converted_agents
 
         converted_decisions = [
-            state_supervision_violation_response_decision_entry.convert(
-                self.violation_response_decision_entries[
-                    condition_entry_id],
-                self.metadata)
+            self._convert_preconverted(entities.StateSupervisionViolationResponseDecisionEntry, condition_entry_id)
             for condition_entry_id in
             ingest_supervision_violation_response.
             state_supervision_violation_response_decision_entry_ids
@@ -569,14 +641,11 @@ class StateConverter(BaseConverter[entities.StatePerson]):
             -> entities.StateAssessment:
         """Converts an ingest_info proto StateAssessment to a
         persistence entity."""
-        assessment_builder = entities.StateAssessment.builder()
-
-        state_assessment.copy_fields_to_builder(assessment_builder,
-                                                ingest_assessment,
-                                                self.metadata)
+        assessment_builder = self._builder_with_preconverted_fields(
+            entities.StateAssessment, ingest_assessment.state_assessment_id)
 
         assessment_builder.conducting_agent = \
-            fn(lambda i: state_agent.convert(self.agents[i], self.metadata),
+            fn(lambda i: self._convert_preconverted(entities.StateAgent, i),
                'conducting_agent_id',
                ingest_assessment)
 
@@ -587,12 +656,11 @@ class StateConverter(BaseConverter[entities.StatePerson]):
         """Converts an ingest_info proto StateProgramAssignment to a
         persistence entity"""
 
-        program_assignment_builder = entities.StateProgramAssignment.builder()
-        state_program_assignment.copy_fields_to_builder(
-            program_assignment_builder, ingest_assignment, self.metadata)
+        program_assignment_builder = self._builder_with_preconverted_fields(
+            entities.StateProgramAssignment, ingest_assignment.state_program_assignment_id)
 
         program_assignment_builder.referring_agent = \
-            fn(lambda i: state_agent.convert(self.agents[i], self.metadata),
+            fn(lambda i: self._convert_preconverted(entities.StateAgent, i),
                'referring_agent_id',
                ingest_assignment)
 
@@ -603,21 +671,16 @@ class StateConverter(BaseConverter[entities.StatePerson]):
             -> entities.StateIncarcerationIncident:
         """Converts an ingest_info proto StateIncarcerationIncident to a
         persistence entity."""
-        incident_builder = entities.StateIncarcerationIncident.builder()
-
-        state_incarceration_incident.copy_fields_to_builder(incident_builder,
-                                                            ingest_incident,
-                                                            self.metadata)
+        incident_builder = self._builder_with_preconverted_fields(
+            entities.StateIncarcerationIncident, ingest_incident.state_incarceration_incident_id)
 
         incident_builder.responding_officer = \
-            fn(lambda i: state_agent.convert(self.agents[i], self.metadata),
+            fn(lambda i: self._convert_preconverted(entities.StateAgent, i),
                'responding_officer_id',
                ingest_incident)
 
         converted_outcomes = [
-            state_incarceration_incident_outcome.convert(
-                self.incarceration_incident_outcomes[outcome_id],
-                self.metadata)
+            self._convert_preconverted(entities.StateIncarcerationIncidentOutcome, outcome_id)
             for outcome_id in
             ingest_incident.state_incarceration_incident_outcome_ids
         ]
@@ -627,12 +690,11 @@ class StateConverter(BaseConverter[entities.StatePerson]):
 
     def _convert_supervision_contact(self, ingest_contact: StateSupervisionContact) -> entities.StateSupervisionContact:
         """Converts an ingest_info proto StateSupervisionContact to a persistence entity."""
-        contact_builder = entities.StateSupervisionContact.builder()
-
-        state_supervision_contact.copy_fields_to_builder(contact_builder, ingest_contact, self.metadata)
+        contact_builder = self._builder_with_preconverted_fields(
+            entities.StateSupervisionContact, ingest_contact.state_supervision_contact_id)
 
         contact_builder.contacted_agent = fn(
-            lambda i: state_agent.convert(self.agents[i], self.metadata), 'contacted_agent_id', ingest_contact)
+            lambda i: self._convert_preconverted(entities.StateAgent, i), 'contacted_agent_id', ingest_contact)
 
         return contact_builder.build()
 
@@ -641,14 +703,11 @@ class StateConverter(BaseConverter[entities.StatePerson]):
             -> entities.StateParoleDecision:
         """Converts an ingest_info proto StateParoleDecision to a
         persistence entity."""
-        parole_decision_builder = entities.StateParoleDecision.builder()
-
-        state_parole_decision.copy_fields_to_builder(parole_decision_builder,
-                                                     ingest_parole_decision,
-                                                     self.metadata)
+        parole_decision_builder = self._builder_with_preconverted_fields(
+            entities.StateParoleDecision, ingest_parole_decision.state_parole_decision_id)
 
         converted_agents = [
-            state_agent.convert(self.agents[agent_id], self.metadata)
+            self._convert_preconverted(entities.StateAgent, agent_id)
             for agent_id in ingest_parole_decision.decision_agent_ids
         ]
         parole_decision_builder.decision_agents = converted_agents
@@ -20,11 +20,14 @@ TODO(1861): Fill out unit tests instead of relying on implicit testing elsewhere
 """
 import datetime
 import locale
-from typing import Optional, Tuple
+import threading
+from contextlib import contextmanager
+from typing import Optional, Tuple, Iterator, Dict, Any
 
 from recidiviz.common import common_utils
 from recidiviz.common.constants.bond import (BOND_STATUS_MAP, BOND_TYPE_MAP,
                                              BondStatus, BondType)
+from recidiviz.common.constants.entity_enum import EntityEnumMeta
 from recidiviz.common.constants.person_characteristics import ResidencyStatus, \
     RESIDENCY_STATUS_SUBSTRING_MAP
 from recidiviz.common.ingest_metadata import IngestMetadata
@@ -33,6 +36,39 @@ from recidiviz.common.str_field_utils import parse_dollars, normalize, \
 
 locale.setlocale(locale.LC_ALL, 'en_US.UTF-8')
 
+_parsed_values = threading.local()
+
+
+@contextmanager
+def batch_parsing_cache() -> Iterator[None]:
+    """Within this context, date and enum values parsed through |fn| are
+    memoized by raw string value, so that each distinct value in a conversion
+    batch is only parsed once. Failed parses are not memoized and will raise
+    again on every occurrence.
+    """
+    previous = getattr(_parsed_values, 'cache', None)
+    _parsed_values.cache = {}
+    try:
+        yield
+    finally:
+        _parsed_values.cache = previous
+
+
+def _is_cacheable_parser(func) -> bool:
+    return func is parse_date or getattr(func, '__func__', None) is EntityEnumMeta.parse
+
+
+def _call_with_batch_cache(func, raw_value, *additional_func_args):
+    cache: Optional[Dict[Any, Any]] = getattr(_parsed_values, 'cache', None)
+    if cache is None or not _is_cacheable_parser(func):
+        return func(raw_value, *additional_func_args)
+
+    # Enum overrides are not hashable, but are constant for the duration of a batch.
+    key = (func, raw_value, tuple(id(arg) for arg in additional_func_args))
+    if key not in cache:
+        cache[key] = func(raw_value, *additional_func_args)
+    return cache[key]
+
 
 def fn(func, field_name, proto, *additional_func_args, default=None):
     """Return the result of applying the given function to the field on the
@@ -41,7 +77,8 @@ def fn(func, field_name, proto, *additional_func_args, default=None):
     """
     value = None
     if proto.HasField(field_name):
-        value = func(getattr(proto, field_name), *additional_func_args)
+        value = _call_with_batch_cache(
+            func, getattr(proto, field_name), *additional_func_args)
     return value if value is not None else default
 
 
@@ -16,10 +16,14 @@
 # =============================================================================
 
 """Entrypoint to read_pdf application."""
+import base64
+import hashlib
+import json
 import logging
 import os
 import pickle
 import tempfile
+from typing import Optional
 
 import gcsfs
 import tabula
@@ -31,6 +35,11 @@ from recidiviz.utils.auth import authenticate_request
 
 app = Flask(__name__)
 
+# Pickled tabula output is cached in GCS, keyed by the md5 hash of the PDF and
+# the tabula options, so a report is only ever extracted once per set of
+# options, even as it moves between buckets or is re-parsed during a backfill.
+CACHE_PATH = '{}-processed-state-aggregates/read_pdf_cache'
+
 
 @app.route('/read_pdf', methods=['POST'])
 @authenticate_request
@@ -50,7 +59,7 @@ def read_pdf():
         names with values that are possibly nested dictionaries, as in the
         'pandas_options' kwarg.
 
-    The HTTP response is the pandas dataframe as a csv.
+    The HTTP response is the pickled output of tabula.read_pdf.
     """
     if 'location' not in request.args or 'filename' not in request.args:
         raise ValueError("'location' and 'filename' must be provided.")
@@ -65,14 +74,43 @@ def read_pdf():
     logging.info("The files in the directory are:")
     logging.info(fs.ls(location))
 
+    tabula_kwargs = request.json or {}
+    cache_path = _cache_path(fs, project_id, path, tabula_kwargs)
+    if cache_path and fs.exists(cache_path):
+        logging.info("Returning cached output from [%s]", cache_path)
+        return fs.cat(cache_path)
+
     # Providing a stream buffer to tabula reader does not work because it
     # tries to load the file into the local filesystem, since appengine is a
     # read only filesystem (except for the tmpdir) we download the file into
     # the local tmpdir and pass that in.
     tmpdir_path = os.path.join(tempfile.gettempdir(), filename)
     fs.get(path, tmpdir_path)
-    output = tabula.read_pdf(tmpdir_path, **(request.json or {}))
-    return pickle.dumps(output)
+    output = pickle.dumps(tabula.read_pdf(tmpdir_path, **tabula_kwargs))
+
+    if cache_path:
+        try:
+            with fs.open(cache_path, 'wb') as cache_file:
+                cache_file.write(output)
+        except Exception:
+            # Failing to cache shouldn't fail the request
+            logging.exception("Failed to cache output at [%s]", cache_path)
+    return output
+
+
+def _cache_path(fs: gcsfs.GCSFileSystem, project_id: str, path: str,
+                tabula_kwargs: dict) -> Optional[str]:
+    """Returns the GCS path of the cached output for reading the PDF at |path|
+    with |tabula_kwargs|, or None if the PDF's md5 hash is not available."""
+    md5_hash = fs.info(path).get('md5Hash')
+    if not md5_hash:
+        return None
+    kwargs_hash = hashlib.sha1(
+        json.dumps(tabula_kwargs, sort_keys=True).encode('utf-8')).hexdigest()
+    # GCS reports the md5 hash base64 encoded, which isn't safe in a path
+    file_key = base64.b64decode(md5_hash).hex()
+    return os.path.join(CACHE_PATH.format(project_id),
+                        '{}_{}.pickle'.format(file_key, kwargs_hash))
 
 
 @app.errorhandler(500)
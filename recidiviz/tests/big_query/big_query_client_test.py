@@ -16,6 +16,7 @@
 # =============================================================================
 """Tests for BigQueryClientImpl"""
 from concurrent import futures
+import threading
 import unittest
 from unittest import mock
 
@@ -24,7 +25,7 @@ from google.cloud import bigquery, exceptions
 from google.cloud.bigquery import SchemaField
 from mock import call
 
-from recidiviz.big_query.big_query_client import BigQueryClientImpl
+from recidiviz.big_query.big_query_client import BigQueryClientImpl, MATERIALIZATION_FINGERPRINT_LABEL
 from recidiviz.big_query.big_query_view import BigQueryView
 from recidiviz.big_query.export.export_query_config import ExportQueryConfig
 
@@ -186,6 +187,63 @@ class BigQueryClientImplTest(unittest.TestCase):
         self.mock_client.delete_table.assert_called_with(
             bigquery.DatasetReference(self.mock_project_id, self.mock_view.dataset_id).table(self.mock_table_id))
 
+    def _export_query_config(self, table_name: str) -> ExportQueryConfig:
+        return ExportQueryConfig.from_view_query(
+            view=self.mock_view,
+            view_filter_clause='WHERE x = y',
+            intermediate_table_name=table_name,
+            output_uri=f'gs://{self.mock_project_id}-bucket/{table_name}.json',
+            output_format=bigquery.DestinationFormat.NEWLINE_DELIMITED_JSON)
+
+    def test_export_query_results_to_cloud_storage_failure_isolated(self):
+        """A failing export does not prevent the other exports from being extracted, and its error is raised once
+        all exports have finished."""
+        failed_query_job = futures.Future()
+        failed_query_job.set_exception(exceptions.InternalServerError('Query failed'))
+        query_job = futures.Future()
+        query_job.set_result([])
+        extract_job = futures.Future()
+        extract_job.set_result(None)
+
+        def _query(query, location, job_config):
+            _ = query, location
+            return failed_query_job if job_config.destination.table_id == 'failing_table' else query_job
+
+        self.mock_client.query.side_effect = _query
+        self.mock_client.extract_table.return_value = extract_job
+
+        with self.assertRaises(exceptions.InternalServerError):
+            self.bq_client.export_query_results_to_cloud_storage([
+                self._export_query_config('failing_table'),
+                self._export_query_config('succeeding_table'),
+            ])
+
+        # The failing export is retried before it is failed
+        self.assertEqual(self.bq_client.EXPORT_QUERY_RESULTS_MAX_ATTEMPTS + 1, self.mock_client.query.call_count)
+        self.mock_client.extract_table.assert_called_once()
+        self.assertEqual('gs://fake-recidiviz-project-bucket/succeeding_table.json',
+                         self.mock_client.extract_table.call_args[0][1])
+        self.mock_client.delete_table.assert_has_calls([
+            call(bigquery.DatasetReference(self.mock_project_id, self.mock_view.dataset_id).table('failing_table')),
+            call(bigquery.DatasetReference(self.mock_project_id, self.mock_view.dataset_id).table('succeeding_table')),
+        ], any_order=True)
+
+    def test_export_query_results_to_cloud_storage_retry(self):
+        """An export whose query fails is retried."""
+        failed_query_job = futures.Future()
+        failed_query_job.set_exception(exceptions.InternalServerError('Query failed'))
+        query_job = futures.Future()
+        query_job.set_result([])
+        extract_job = futures.Future()
+        extract_job.set_result(None)
+        self.mock_client.query.side_effect = [failed_query_job, query_job]
+        self.mock_client.extract_table.return_value = extract_job
+
+        self.bq_client.export_query_results_to_cloud_storage([self._export_query_config(self.mock_table_id)])
+
+        self.assertEqual(2, self.mock_client.query.call_count)
+        self.mock_client.extract_table.assert_called_once()
+
     def test_create_table_from_query(self):
         """Tests that the create_table_from_query function calls the function to create a table from a query."""
         self.bq_client.create_table_from_query_async(self.mock_dataset_id, self.mock_table_id,
@@ -239,6 +297,121 @@ class BigQueryClientImplTest(unittest.TestCase):
         self.bq_client.materialize_view_to_table(self.mock_view)
         self.mock_client.query.assert_called()
 
+    def _set_up_materialization(self, materialized_table_labels, view_query=None):
+        """Sets up the mock client so that the mock view reads from a single source table, and the view's materialized
+        table carries the given labels."""
+        source_table_ref = bigquery.DatasetReference(self.mock_project_id, 'source_dataset').table('source_table')
+        source_table = bigquery.Table.from_api_repr({
+            'tableReference': source_table_ref.to_api_repr(),
+            'lastModifiedTime': '1600000000000',
+        })
+
+        materialized_table = bigquery.Table(bigquery.DatasetReference(self.mock_project_id, 'dataset').table(
+            self.mock_view.materialized_view_table_id))
+        materialized_table.labels = materialized_table_labels
+
+        dry_run_job = mock.MagicMock()
+        dry_run_job.referenced_tables = [source_table_ref]
+        create_job = mock.MagicMock()
+
+        def _query(query, location, job_config):
+            _ = query, location
+            return dry_run_job if job_config.dry_run else create_job
+
+        def _get_table(table_ref):
+            table_id = table_ref.table_id if isinstance(table_ref, bigquery.TableReference) else table_ref
+            if table_id.endswith('source_table'):
+                return source_table
+            if table_id.endswith('upstream_view'):
+                upstream_view = bigquery.Table(table_ref)
+                upstream_view.view_query = view_query
+                return upstream_view
+            return materialized_table
+
+        self.mock_client.query.side_effect = _query
+        self.mock_client.get_table.side_effect = _get_table
+        return create_job
+
+    def test_materialize_view_to_table_records_fingerprint(self):
+        create_job = self._set_up_materialization(materialized_table_labels={})
+
+        self.bq_client.materialize_view_to_table(self.mock_view)
+
+        create_job.result.assert_called_once()
+        self.mock_client.update_table.assert_called_once()
+        updated_table, fields = self.mock_client.update_table.call_args[0]
+        self.assertEqual(['labels'], fields)
+        self.assertIn(MATERIALIZATION_FINGERPRINT_LABEL, updated_table.labels)
+
+    def test_materialize_view_to_table_unchanged_skipped(self):
+        self._set_up_materialization(materialized_table_labels={})
+        self.bq_client.materialize_view_to_table(self.mock_view)
+        fingerprinted_table, _ = self.mock_client.update_table.call_args[0]
+        fingerprint = fingerprinted_table.labels[MATERIALIZATION_FINGERPRINT_LABEL]
+
+        create_job = self._set_up_materialization(
+            materialized_table_labels={MATERIALIZATION_FINGERPRINT_LABEL: fingerprint})
+        self.mock_client.update_table.reset_mock()
+
+        self.bq_client.materialize_view_to_table(self.mock_view)
+
+        create_job.result.assert_not_called()
+        self.mock_client.update_table.assert_not_called()
+
+    def test_materialize_view_to_table_stale_fingerprint(self):
+        create_job = self._set_up_materialization(
+            materialized_table_labels={MATERIALIZATION_FINGERPRINT_LABEL: 'stale_fingerprint'})
+
+        self.bq_client.materialize_view_to_table(self.mock_view)
+
+        create_job.result.assert_called_once()
+        self.mock_client.update_table.assert_called_once()
+
+    def test_materialize_view_to_table_non_deterministic_upstream_view(self):
+        """A view that reads from a view using CURRENT_DATE is always rematerialized, and no fingerprint is
+        recorded."""
+        create_job = self._set_up_materialization(
+            materialized_table_labels={MATERIALIZATION_FINGERPRINT_LABEL: 'any_fingerprint'},
+            view_query='SELECT CURRENT_DATE() AS today')
+        view = BigQueryView(
+            dataset_id='dataset',
+            view_id='test_view',
+            view_query_template='SELECT * FROM `{project_id}.upstream_dataset.upstream_view`',
+            should_materialize=True
+        )
+
+        self.bq_client.materialize_view_to_table(view)
+
+        create_job.result.assert_called_once()
+        self.mock_client.update_table.assert_not_called()
+
+    def test_materialize_view_to_table_nested_view_query_changed(self):
+        """A view is rematerialized when only the query of a view it reads from has changed, even though none of the
+        source tables have been modified."""
+        view = BigQueryView(
+            dataset_id='dataset',
+            view_id='test_view',
+            view_query_template='SELECT * FROM `{project_id}.upstream_dataset.upstream_view`',
+            should_materialize=True
+        )
+        self._set_up_materialization(materialized_table_labels={},
+                                     view_query='SELECT * FROM `project.source_dataset.source_table`')
+        self.bq_client.materialize_view_to_table(view)
+        fingerprinted_table, _ = self.mock_client.update_table.call_args[0]
+        fingerprint = fingerprinted_table.labels[MATERIALIZATION_FINGERPRINT_LABEL]
+
+        create_job = self._set_up_materialization(
+            materialized_table_labels={MATERIALIZATION_FINGERPRINT_LABEL: fingerprint},
+            view_query='SELECT * FROM `project.source_dataset.source_table` WHERE id > 0')
+        self.mock_client.update_table.reset_mock()
+
+        self.bq_client.materialize_view_to_table(view)
+
+        create_job.result.assert_called_once()
+        self.mock_client.update_table.assert_called_once()
+        updated_table, _ = self.mock_client.update_table.call_args[0]
+        self.assertNotEqual(fingerprint, updated_table.labels[MATERIALIZATION_FINGERPRINT_LABEL])
+
     def test_materialize_view_to_table_no_materialized_view_table_id(self):
         """Tests that the materialize_view_to_table function does not call the function to create a table from a
         query if there is no set materialized_view_table_id on the view."""
@@ -350,8 +523,7 @@ class BigQueryClientImplTest(unittest.TestCase):
             {'supervision_type': 0, 'revocations': 1, 'district': 2},
         )
 
-        # First call returns a single row, second call returns nothing
-        mock_query_job.result.side_effect = [[first_row], []]
+        mock_query_job.result.return_value.pages = iter([[first_row]])
 
         processed_results = []
 
@@ -361,10 +533,7 @@ class BigQueryClientImplTest(unittest.TestCase):
         self.bq_client.paged_read_and_process(mock_query_job, 1, _process_fn)
 
         self.assertEqual([dict(first_row)], processed_results)
-        mock_query_job.result.assert_has_calls([
-            call(max_results=1, start_index=0),
-            call(max_results=1, start_index=1),
-        ])
+        mock_query_job.result.assert_called_once_with(page_size=1)
 
     @mock.patch('google.cloud.bigquery.QueryJob')
     def test_paged_read_single_page_multiple_rows(self, mock_query_job):
@@ -377,8 +546,7 @@ class BigQueryClientImplTest(unittest.TestCase):
             {'supervision_type': 0, 'revocations': 1, 'district': 2},
         )
 
-        # First call returns a single row, second call returns nothing
-        mock_query_job.result.side_effect = [[first_row, second_row], []]
+        mock_query_job.result.return_value.pages = iter([[first_row, second_row]])
 
         processed_results = []
 
@@ -388,10 +556,7 @@ class BigQueryClientImplTest(unittest.TestCase):
         self.bq_client.paged_read_and_process(mock_query_job, 10, _process_fn)
 
         self.assertEqual([dict(first_row), dict(second_row)], processed_results)
-        mock_query_job.result.assert_has_calls([
-            call(max_results=10, start_index=0),
-            call(max_results=10, start_index=2),
-        ])
+        mock_query_job.result.assert_called_once_with(page_size=10)
 
     @mock.patch('google.cloud.bigquery.QueryJob')
     def test_paged_read_multiple_pages(self, mock_query_job):
@@ -413,12 +578,10 @@ class BigQueryClientImplTest(unittest.TestCase):
             {'supervision_type': 0, 'revocations': 1, 'district': 2},
         )
 
-        # First two calls returns results, third call returns nothing
-        mock_query_job.result.side_effect = [
+        mock_query_job.result.return_value.pages = iter([
             [p1_r1, p1_r2],
             [p2_r1, p2_r2],
-            []
-        ]
+        ])
 
         processed_results = []
 
@@ -428,8 +591,42 @@ class BigQueryClientImplTest(unittest.TestCase):
         self.bq_client.paged_read_and_process(mock_query_job, 2, _process_fn)
 
         self.assertEqual([dict(p1_r1), dict(p1_r2), dict(p2_r1), dict(p2_r2)], processed_results)
-        mock_query_job.result.assert_has_calls([
-            call(max_results=2, start_index=0),
-            call(max_results=2, start_index=2),
-            call(max_results=2, start_index=4),
-        ])
+        mock_query_job.result.assert_called_once_with(page_size=2)
+
+    @mock.patch('google.cloud.bigquery.QueryJob')
+    def test_paged_read_prefetches_next_page(self, mock_query_job):
+        p1_r1 = bigquery.table.Row(
+            ['parole', 15, '10N'],
+            {'supervision_type': 0, 'revocations': 1, 'district': 2},
+        )
+        p2_r1 = bigquery.table.Row(
+            ['parole', 8, '10F'],
+            {'supervision_type': 0, 'revocations': 1, 'district': 2},
+        )
+
+        second_page_requested = threading.Event()
+
+        def _pages():
+            yield [p1_r1]
+            second_page_requested.set()
+            yield [p2_r1]
+
+        mock_query_job.result.return_value.pages = _pages()
+
+        processed_results = []
+
+        def _process_fn(row: bigquery.table.Row) -> None:
+            if row == p1_r1:
+                # The second page is fetched while the first page is still being processed
+                self.assertTrue(second_page_requested.wait(timeout=5))
+            processed_results.append(dict(row))
+
+        self.bq_client.paged_read_and_process(mock_query_job, 1, _process_fn)
+
+        self.assertEqual([dict(p1_r1), dict(p2_r1)], processed_results)
+
+    @mock.patch('google.cloud.bigquery.QueryJob')
+    def test_paged_read_no_results(self, mock_query_job):
+        mock_query_job.result.return_value.pages = iter([])
+
+        self.assertEqual([], list(self.bq_client.paged_read(mock_query_job, 10)))
@@ -23,6 +23,7 @@ from flask import Flask
 from google.cloud import bigquery
 
 from recidiviz.calculator import calculation_data_storage_manager
+from recidiviz.calculator.calculation_data_storage_config import dataflow_metric_tables_for_pipeline
 from recidiviz.calculator.calculation_data_storage_manager import calculation_data_storage_manager_blueprint
 
 
@@ -97,6 +98,76 @@ class CalculationDataStorageManagerTest(unittest.TestCase):
 
         self.mock_client.create_table_with_schema.assert_called()
 
+    def test_update_dataflow_metric_tables_schemas_incremental_dataset(self):
+        """Test that update_dataflow_metric_tables_schemas also creates the dataset that stages the output of
+        incremental jobs."""
+        calculation_data_storage_manager.update_dataflow_metric_tables_schemas()
+
+        self.mock_client.dataset_ref_for_id.assert_any_call('dataflow_metrics')
+        self.mock_client.dataset_ref_for_id.assert_any_call('dataflow_metrics_incremental')
+
+    def test_merge_incremental_dataflow_metrics(self):
+        """Test that merge_incremental_dataflow_metrics replaces the metrics of the changed people in each of the
+        pipeline's tables, and clears the staged output of the job, in a single transaction."""
+        self.mock_client.project_id = self.project_id
+
+        calculation_data_storage_manager.merge_incremental_dataflow_metrics('job-123', 'recidivism')
+
+        self.mock_client.run_query_async.assert_called_once()
+        merge_script = self.mock_client.run_query_async.call_args[0][0]
+
+        self.assertIn('BEGIN TRANSACTION;', merge_script)
+        self.assertTrue(merge_script.strip().endswith('COMMIT TRANSACTION;'))
+
+        for table_id in ['recidivism_count_metrics', 'recidivism_rate_metrics']:
+            self.assertIn(f'DELETE FROM `{self.project_id}.dataflow_metrics.{table_id}`', merge_script)
+            self.assertIn(f'INSERT INTO `{self.project_id}.dataflow_metrics.{table_id}`', merge_script)
+            self.assertIn(f"DELETE FROM `{self.project_id}.dataflow_metrics_incremental.{table_id}` "
+                          f"WHERE job_id = 'job-123'", merge_script)
+
+        self.assertNotIn('supervision_population_metrics', merge_script)
+        self.assertIn(f'DELETE FROM `{self.project_id}.dataflow_metrics_incremental.incremental_changed_persons`',
+                      merge_script)
+
+    def test_merge_incremental_dataflow_metrics_supervision(self):
+        """Test that merge_incremental_dataflow_metrics refuses to merge the output of the supervision pipeline, which
+        writes metrics without a person_id that cannot be replaced for the changed people."""
+        with self.assertRaises(ValueError) as e:
+            calculation_data_storage_manager.merge_incremental_dataflow_metrics('job-123', 'supervision')
+
+        self.assertIn('supervision_revocation_violation_type_analysis_metrics', str(e.exception))
+        self.mock_client.run_query_async.assert_not_called()
+
+    def test_merge_incremental_dataflow_metrics_combined(self):
+        """Test that merge_incremental_dataflow_metrics refuses to merge the output of the combined pipeline, which
+        also writes the supervision metrics without a person_id."""
+        with self.assertRaises(ValueError) as e:
+            calculation_data_storage_manager.merge_incremental_dataflow_metrics('job-123', 'combined')
+
+        self.assertIn('supervision_revocation_violation_type_analysis_metrics', str(e.exception))
+        self.mock_client.run_query_async.assert_not_called()
+
+    def test_merge_incremental_dataflow_metrics_all_person_level_tables(self):
+        """Test that every table merged for the pipelines that support incremental runs has a person_id column."""
+        self.mock_client.project_id = self.project_id
+
+        for pipeline in ['incarceration', 'program', 'recidivism']:
+            self.mock_client.run_query_async.reset_mock()
+
+            calculation_data_storage_manager.merge_incremental_dataflow_metrics('job-123', pipeline)
+
+            merge_script = self.mock_client.run_query_async.call_args[0][0]
+            for table_id in dataflow_metric_tables_for_pipeline(pipeline):
+                self.assertIn(f'INSERT INTO `{self.project_id}.dataflow_metrics.{table_id}`', merge_script)
+            self.assertEqual(len(dataflow_metric_tables_for_pipeline(pipeline)),
+                             merge_script.count('WHERE person_id IN ('))
+
+    def test_merge_incremental_dataflow_metrics_invalid_pipeline(self):
+        with self.assertRaises(ValueError):
+            calculation_data_storage_manager.merge_incremental_dataflow_metrics('job-123', 'not_a_pipeline')
+
+        self.mock_client.run_query_async.assert_not_called()
+
     @patch('recidiviz.calculator.calculation_data_storage_manager.move_old_dataflow_metrics_to_cold_storage')
     def test_prune_old_dataflow_data(self, mock_move_metrics):
         """Tests that the move_old_dataflow_metrics_to_cold_storage function is called when the /prune_old_dataflow_data
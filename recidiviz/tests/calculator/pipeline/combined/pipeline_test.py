@@ -0,0 +1,388 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2020 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for combined/pipeline.py."""
+import json
+import unittest
+from collections import Counter, defaultdict
+from datetime import date
+from typing import Any, Dict, List
+
+import apache_beam as beam
+from apache_beam.options.pipeline_options import PipelineOptions
+from apache_beam.testing.test_pipeline import TestPipeline
+from apache_beam.testing.util import assert_that, equal_to
+from mock import patch
+from more_itertools import one
+
+from recidiviz.calculator.pipeline.combined import pipeline
+from recidiviz.calculator.pipeline.incarceration import pipeline as incarceration_pipeline
+from recidiviz.calculator.pipeline.program import pipeline as program_pipeline
+from recidiviz.calculator.pipeline.recidivism import pipeline as recidivism_pipeline
+from recidiviz.calculator.pipeline.supervision import pipeline as supervision_pipeline
+from recidiviz.calculator.pipeline.utils.incarceration_period_utils import PreProcessedIncarcerationPeriods
+from recidiviz.common.constants.state.state_incarceration import StateIncarcerationType
+from recidiviz.common.constants.state.state_incarceration_period import StateIncarcerationPeriodStatus, \
+    StateIncarcerationPeriodAdmissionReason, StateIncarcerationPeriodReleaseReason
+from recidiviz.common.constants.state.state_program_assignment import StateProgramAssignmentParticipationStatus
+from recidiviz.common.constants.state.state_supervision import StateSupervisionType
+from recidiviz.persistence.database.schema.state import schema
+from recidiviz.persistence.database.schema_utils import get_state_table_classes
+from recidiviz.persistence.entity.state import entities
+from recidiviz.persistence.entity.state.entities import Gender, Race, ResidencyStatus
+from recidiviz.tests.calculator.calculator_test_utils import normalized_database_base_dict, \
+    normalized_database_base_dict_list
+from recidiviz.tests.calculator.pipeline.fake_bigquery import FakeReadFromBigQueryFactory
+
+_PROJECT = 'recidiviz-123'
+_DATASET = f'{_PROJECT}.state'
+
+# Rows written by FakeWriteToBigQuery as sorted-key JSON, keyed by output table
+_WRITTEN_ROWS: Dict[str, List[str]] = defaultdict(list)
+
+# Fields that identify the job that produced a metric rather than the metric itself
+_JOB_FIELDS = ('job_id', 'created_on')
+
+
+def _record_written_row(row: Dict[str, Any], table: str) -> None:
+    _WRITTEN_ROWS[table].append(json.dumps({key: value for key, value in row.items() if key not in _JOB_FIELDS},
+                                           sort_keys=True, default=str))
+
+
+class FakeReadReferenceView(beam.PTransform):
+    """Stands in for beam.io.Read of a reference view query, reading no rows."""
+
+    def __init__(self, source):
+        super().__init__()
+        self._source = source
+
+    def expand(self, input_or_inputs):
+        return input_or_inputs | 'Loading reference view rows' >> beam.Create([])
+
+
+class FakeWriteToBigQuery(beam.PTransform):
+    """Stands in for beam.io.WriteToBigQuery, recording the written rows in _WRITTEN_ROWS."""
+
+    Method = beam.io.WriteToBigQuery.Method
+
+    def __init__(self, table: str, dataset: str, **_kwargs):
+        super().__init__()
+        self._table = f'{dataset}.{table}'
+
+    def expand(self, input_or_inputs):
+        return input_or_inputs | 'Recording written rows' >> beam.Map(_record_written_row, self._table)
+
+
+class TestCalculationsForMetricTypes(unittest.TestCase):
+    """Tests the calculations_for_metric_types function."""
+
+    def test_calculations_for_metric_types_all(self):
+        self.assertEqual([pipeline.INCARCERATION, pipeline.RECIDIVISM, pipeline.SUPERVISION, pipeline.PROGRAM],
+                         pipeline.calculations_for_metric_types({'ALL'}))
+
+    def test_calculations_for_metric_types_subset(self):
+        self.assertEqual([pipeline.RECIDIVISM, pipeline.PROGRAM],
+                         pipeline.calculations_for_metric_types({'PROGRAM_REFERRAL', 'REINCARCERATION_RATE'}))
+
+
+class TestGetArgParser(unittest.TestCase):
+    """Tests the get_arg_parser function."""
+
+    def test_get_arg_parser_metric_types_from_multiple_calculations(self):
+        known_args, _ = pipeline.get_arg_parser().parse_known_args(
+            ['--metric_types', 'INCARCERATION_POPULATION', 'SUPERVISION_POPULATION', 'REINCARCERATION_COUNT',
+             '--project', 'project'])
+
+        self.assertEqual(['INCARCERATION_POPULATION', 'SUPERVISION_POPULATION', 'REINCARCERATION_COUNT'],
+                         known_args.metric_types)
+
+    def test_get_arg_parser_invalid_metric_type(self):
+        with self.assertRaises(SystemExit):
+            pipeline.get_arg_parser().parse_known_args(['--metric_types', 'NOT_A_METRIC'])
+
+
+class TestSplitPersonEntitiesByCalculation(unittest.TestCase):
+    """Tests the SplitPersonEntitiesByCalculation DoFn."""
+
+    def setUp(self):
+        self.person = entities.StatePerson.new_with_defaults(person_id=123, birthdate=date(1970, 1, 1))
+
+        self.incarceration_period = entities.StateIncarcerationPeriod.new_with_defaults(
+            incarceration_period_id=1111,
+            state_code='US_ND',
+            status=StateIncarcerationPeriodStatus.NOT_IN_CUSTODY,
+            admission_date=date(2008, 11, 20),
+            release_date=date(2010, 12, 4))
+
+        self.assessment = entities.StateAssessment.new_with_defaults(state_code='US_ND', assessment_score=10)
+
+        self.person_entities = {
+            'person': [self.person],
+            'incarceration_periods': [self.incarceration_period],
+            'assessments': [self.assessment],
+            'program_assignments': [],
+        }
+
+    def test_split_person_entities_projects_keys(self):
+        outputs = list(pipeline.SplitPersonEntitiesByCalculation().process(
+            (123, self.person_entities), [pipeline.RECIDIVISM, pipeline.PROGRAM]))
+
+        self.assertEqual([pipeline.RECIDIVISM, pipeline.PROGRAM], [output.tag for output in outputs])
+
+        recidivism_person_id, recidivism_entities = outputs[0].value
+        self.assertEqual(123, recidivism_person_id)
+        self.assertEqual({'person': [self.person],
+                          'incarceration_periods': [self.incarceration_period],
+                          'pre_processed_incarceration_periods': [
+                              PreProcessedIncarcerationPeriods('US_ND', [self.incarceration_period])]},
+                         recidivism_entities)
+
+        _, program_entities = outputs[1].value
+        self.assertEqual({'person': [self.person],
+                          'program_assignments': [],
+                          'assessments': [self.assessment],
+                          'supervision_periods': []},
+                         program_entities)
+
+    def test_split_person_entities_shares_pre_processed_incarceration_periods(self):
+        outputs = list(pipeline.SplitPersonEntitiesByCalculation().process(
+            (123, self.person_entities), [pipeline.RECIDIVISM, pipeline.SUPERVISION]))
+
+        _, recidivism_entities = outputs[0].value
+        _, supervision_entities = outputs[1].value
+
+        pre_processed_incarceration_periods = one(recidivism_entities['pre_processed_incarceration_periods'])
+        self.assertIs(pre_processed_incarceration_periods,
+                      one(supervision_entities['pre_processed_incarceration_periods']))
+        self.assertEqual([self.incarceration_period], pre_processed_incarceration_periods.sorted_periods)
+        self.assertIs(self.incarceration_period, recidivism_entities['incarceration_periods'][0])
+        self.assertIs(self.incarceration_period, supervision_entities['incarceration_periods'][0])
+
+    def test_split_person_entities_no_incarceration_periods(self):
+        self.person_entities['incarceration_periods'] = []
+
+        outputs = list(pipeline.SplitPersonEntitiesByCalculation().process(
+            (123, self.person_entities), [pipeline.RECIDIVISM]))
+
+        _, recidivism_entities = outputs[0].value
+        self.assertEqual({'person': [self.person], 'incarceration_periods': []}, recidivism_entities)
+
+    def test_split_person_entities_copies_mutated_entities(self):
+        sentence_group = entities.StateSentenceGroup.new_with_defaults(sentence_group_id=111, state_code='US_ND')
+        violation_response = entities.StateSupervisionViolationResponse.new_with_defaults(
+            supervision_violation_response_id=222, state_code='US_ND')
+        self.person_entities['sentence_groups'] = [sentence_group]
+        self.person_entities['violation_responses'] = [violation_response]
+
+        outputs = list(pipeline.SplitPersonEntitiesByCalculation().process(
+            (123, self.person_entities), [pipeline.INCARCERATION, pipeline.SUPERVISION, pipeline.PROGRAM]))
+
+        _, incarceration_entities = outputs[0].value
+        _, supervision_entities = outputs[1].value
+        _, program_entities = outputs[2].value
+
+        self.assertEqual([sentence_group], incarceration_entities['sentence_groups'])
+        self.assertIsNot(sentence_group, incarceration_entities['sentence_groups'][0])
+        self.assertEqual([violation_response], supervision_entities['violation_responses'])
+        self.assertIsNot(violation_response, supervision_entities['violation_responses'][0])
+
+        # Entities that no identifier modifies are shared between the calculations
+        self.assertIs(self.assessment, supervision_entities['assessments'][0])
+        self.assertIs(self.assessment, program_entities['assessments'][0])
+        self.assertIs(self.person, incarceration_entities['person'][0])
+
+    def test_split_person_entities_in_pipeline(self):
+        test_pipeline = TestPipeline()
+
+        output = (test_pipeline
+                  | beam.Create([(123, self.person_entities)])
+                  | 'Split person entities' >>
+                  beam.ParDo(pipeline.SplitPersonEntitiesByCalculation(),
+                             [pipeline.RECIDIVISM]).with_outputs(pipeline.RECIDIVISM))
+
+        assert_that(output[pipeline.RECIDIVISM],
+                    equal_to([(123, {'person': [self.person],
+                                     'incarceration_periods': [self.incarceration_period],
+                                     'pre_processed_incarceration_periods': [
+                                         PreProcessedIncarcerationPeriods('US_ND', [self.incarceration_period])]})]))
+
+        test_pipeline.run()
+
+
+class TestCombinedPipeline(unittest.TestCase):
+    """Tests the entire combined pipeline against the single-calculation pipelines."""
+
+    def setUp(self) -> None:
+        self.fake_bq_source_factory = FakeReadFromBigQueryFactory()
+        _WRITTEN_ROWS.clear()
+
+    def tearDown(self) -> None:
+        _WRITTEN_ROWS.clear()
+
+    @staticmethod
+    def build_data_dict(fake_person_id: int, state_code: str = 'US_XX'):
+        """Builds a data_dict for a person with entities used by each of the calculations."""
+        data_dict: Dict[str, List[Dict[str, Any]]] = {table.name: [] for table in get_state_table_classes()}
+
+        fake_person = schema.StatePerson(
+            person_id=fake_person_id, gender=Gender.MALE,
+            birthdate=date(1970, 1, 1),
+            residency_status=ResidencyStatus.PERMANENT)
+
+        race = schema.StatePersonRace(
+            person_race_id=111,
+            state_code=state_code,
+            race=Race.BLACK,
+            person_id=fake_person_id)
+
+        sentence_group = schema.StateSentenceGroup(
+            sentence_group_id=111,
+            state_code=state_code,
+            person_id=fake_person_id)
+
+        initial_incarceration = schema.StateIncarcerationPeriod(
+            incarceration_period_id=1111,
+            incarceration_type=StateIncarcerationType.STATE_PRISON,
+            status=StateIncarcerationPeriodStatus.NOT_IN_CUSTODY,
+            state_code=state_code,
+            county_code='124',
+            facility='San Quentin',
+            admission_reason=StateIncarcerationPeriodAdmissionReason.NEW_ADMISSION,
+            admission_date=date(2008, 11, 20),
+            release_date=date(2010, 12, 4),
+            release_reason=StateIncarcerationPeriodReleaseReason.SENTENCE_SERVED,
+            person_id=fake_person_id)
+
+        reincarceration = schema.StateIncarcerationPeriod(
+            incarceration_period_id=2222,
+            incarceration_type=StateIncarcerationType.STATE_PRISON,
+            status=StateIncarcerationPeriodStatus.IN_CUSTODY,
+            state_code=state_code,
+            county_code='124',
+            facility='San Quentin',
+            admission_reason=StateIncarcerationPeriodAdmissionReason.NEW_ADMISSION,
+            admission_date=date(2017, 1, 4),
+            person_id=fake_person_id)
+
+        incarceration_sentence = schema.StateIncarcerationSentence(
+            incarceration_sentence_id=1111,
+            state_code=state_code,
+            sentence_group_id=sentence_group.sentence_group_id,
+            person_id=fake_person_id)
+
+        supervision_sentence = schema.StateSupervisionSentence(
+            supervision_sentence_id=123,
+            state_code=state_code,
+            sentence_group_id=sentence_group.sentence_group_id,
+            person_id=fake_person_id)
+
+        supervision_period = schema.StateSupervisionPeriod(
+            supervision_period_id=1234,
+            state_code=state_code,
+            county_code='124',
+            start_date=date(2015, 3, 14),
+            termination_date=date(2016, 12, 29),
+            supervision_type=StateSupervisionType.PROBATION,
+            person_id=fake_person_id)
+
+        assessment = schema.StateAssessment(
+            assessment_id=298374,
+            state_code=state_code,
+            assessment_date=date(2015, 3, 19),
+            assessment_type='LSIR',
+            person_id=fake_person_id)
+
+        program_assignment = schema.StateProgramAssignment(
+            program_assignment_id=123,
+            state_code=state_code,
+            referral_date=date(2015, 5, 10),
+            participation_status=StateProgramAssignmentParticipationStatus.IN_PROGRESS,
+            person_id=fake_person_id)
+
+        data_dict.update({
+            schema.StatePerson.__tablename__: [normalized_database_base_dict(fake_person)],
+            schema.StatePersonRace.__tablename__: normalized_database_base_dict_list([race]),
+            schema.StateSentenceGroup.__tablename__: [normalized_database_base_dict(sentence_group)],
+            schema.StateIncarcerationSentence.__tablename__: [normalized_database_base_dict(incarceration_sentence)],
+            schema.StateSupervisionSentence.__tablename__: [normalized_database_base_dict(supervision_sentence)],
+            schema.StateIncarcerationPeriod.__tablename__:
+                normalized_database_base_dict_list([initial_incarceration, reincarceration]),
+            schema.StateSupervisionPeriod.__tablename__: [normalized_database_base_dict(supervision_period)],
+            schema.StateAssessment.__tablename__: [normalized_database_base_dict(assessment)],
+            schema.StateProgramAssignment.__tablename__: [normalized_database_base_dict(program_assignment)],
+            schema.state_incarceration_sentence_incarceration_period_association_table.name: [
+                {'incarceration_period_id': period.incarceration_period_id,
+                 'incarceration_sentence_id': incarceration_sentence.incarceration_sentence_id}
+                for period in (initial_incarceration, reincarceration)
+            ],
+            schema.state_supervision_sentence_supervision_period_association_table.name: [
+                {'supervision_period_id': supervision_period.supervision_period_id,
+                 'supervision_sentence_id': supervision_sentence.supervision_sentence_id}
+            ],
+        })
+
+        return data_dict
+
+    @staticmethod
+    def run_and_collect_written_rows(run_pipeline) -> Dict[str, List[str]]:
+        """Runs the given pipeline with the reference view reads and BigQuery writes faked out, and returns the rows
+        it wrote, keyed by output table."""
+        _WRITTEN_ROWS.clear()
+
+        with patch('apache_beam.io.BigQuerySource', lambda query, use_standard_sql: query), \
+                patch('apache_beam.io.Read', FakeReadReferenceView), \
+                patch('apache_beam.io.WriteToBigQuery', FakeWriteToBigQuery):
+            run_pipeline(PipelineOptions(['--project', _PROJECT]))
+
+        written_rows = dict(_WRITTEN_ROWS)
+        _WRITTEN_ROWS.clear()
+        return written_rows
+
+    def test_combined_pipeline_writes_union_of_calculation_metrics(self):
+        data_dict = self.build_data_dict(fake_person_id=12345)
+
+        single_calculation_runs = [
+            lambda options: incarceration_pipeline.run(
+                options, 'state', 'reference_views', 'dataflow_metrics', -1, ['ALL'], None, None, None),
+            lambda options: recidivism_pipeline.run(
+                options, 'state', 'reference_views', 'dataflow_metrics', ['ALL'], None, None),
+            lambda options: supervision_pipeline.run(
+                options, 'state', 'reference_views', 'dataflow_metrics', -1, ['ALL'], None, None, None),
+            lambda options: program_pipeline.run(
+                options, 'state', 'reference_views', 'dataflow_metrics', -1, ['ALL'], None, None, None),
+        ]
+
+        with patch('recidiviz.calculator.pipeline.utils.extractor_utils.ReadFromBigQuery',
+                   self.fake_bq_source_factory.create_fake_bq_source_constructor(_DATASET, data_dict)):
+            expected_rows: Dict[str, List[str]] = defaultdict(list)
+            for run_single_calculation in single_calculation_runs:
+                for table, rows in self.run_and_collect_written_rows(run_single_calculation).items():
+                    expected_rows[table].extend(rows)
+
+            combined_rows = self.run_and_collect_written_rows(
+                lambda options: pipeline.run(
+                    options, 'state', 'reference_views', 'dataflow_metrics', -1, ['ALL'], None, None, None))
+
+        self.assertTrue(expected_rows)
+        for calculation_metric_type in pipeline.CALCULATION_METRIC_TYPES.values():
+            self.assertTrue(any(rows and json.loads(rows[0])['metric_type'] in {metric_type.value
+                                                                     for metric_type in calculation_metric_type}
+                                for rows in expected_rows.values()),
+                            f'Expected fixture to produce {calculation_metric_type.__name__} metrics')
+
+        self.assertEqual(set(expected_rows), set(combined_rows))
+        for table, rows in expected_rows.items():
+            self.assertEqual(Counter(rows), Counter(combined_rows[table]), table)
@@ -24,7 +24,7 @@ from freezegun import freeze_time
 
 from recidiviz.calculator.pipeline.incarceration.incarceration_event import \
     IncarcerationEvent, IncarcerationAdmissionEvent,\
-    IncarcerationReleaseEvent, IncarcerationStayEvent
+    IncarcerationReleaseEvent, IncarcerationStayEvent, IncarcerationStaySpanEvent
 from recidiviz.calculator.pipeline.incarceration import calculator
 from recidiviz.calculator.pipeline.incarceration.metrics import IncarcerationMetricType, IncarcerationAdmissionMetric, \
     IncarcerationPopulationMetric, IncarcerationReleaseMetric
@@ -919,6 +919,82 @@ class TestMapIncarcerationCombinations(unittest.TestCase):
         for combo, _ in incarceration_combinations:
             assert combo.get('year') == 2007
 
+    def test_map_incarceration_combinations_stay_span(self):
+        person = StatePerson.new_with_defaults(person_id=12345,
+                                               birthdate=date(1984, 8, 31),
+                                               gender=Gender.FEMALE)
+
+        stay_span_event = IncarcerationStaySpanEvent(
+            state_code='CA',
+            event_date=date(1990, 3, 12),
+            end_date_exclusive=date(2000, 4, 2),
+            facility='SAN QUENTIN',
+            county_of_residence=_COUNTY_OF_RESIDENCE,
+        )
+
+        incarceration_combinations = calculator.map_incarceration_combinations(
+            person=person,
+            incarceration_events=[stay_span_event],
+            metric_inclusions=ALL_METRICS_INCLUSIONS_DICT,
+            calculation_end_month='2000-03',
+            calculation_month_count=2
+        )
+
+        # Only the stays in the calculation months are counted
+        expected_stay_events = [
+            IncarcerationStayEvent(
+                state_code='CA',
+                event_date=date(2000, 2, day),
+                facility='SAN QUENTIN',
+                county_of_residence=_COUNTY_OF_RESIDENCE,
+            ) for day in range(1, 30)
+        ] + [
+            IncarcerationStayEvent(
+                state_code='CA',
+                event_date=date(2000, 3, day),
+                facility='SAN QUENTIN',
+                county_of_residence=_COUNTY_OF_RESIDENCE,
+            ) for day in range(1, 32)
+        ]
+
+        expected_combinations = calculator.map_incarceration_combinations(
+            person=person,
+            incarceration_events=expected_stay_events,
+            metric_inclusions=ALL_METRICS_INCLUSIONS_DICT,
+            calculation_end_month='2000-03',
+            calculation_month_count=2
+        )
+
+        self.assertEqual(expected_metric_combos_count(expected_stay_events), len(incarceration_combinations))
+        self.assertEqual(expected_combinations, incarceration_combinations)
+
+    def test_map_incarceration_combinations_stay_span_population_not_included(self):
+        person = StatePerson.new_with_defaults(person_id=12345,
+                                               birthdate=date(1984, 8, 31),
+                                               gender=Gender.FEMALE)
+
+        stay_span_event = IncarcerationStaySpanEvent(
+            state_code='CA',
+            event_date=date(1990, 3, 12),
+            end_date_exclusive=date(2000, 4, 2),
+            facility='SAN QUENTIN',
+            county_of_residence=_COUNTY_OF_RESIDENCE,
+        )
+
+        incarceration_combinations = calculator.map_incarceration_combinations(
+            person=person,
+            incarceration_events=[stay_span_event],
+            metric_inclusions={
+                IncarcerationMetricType.INCARCERATION_ADMISSION: True,
+                IncarcerationMetricType.INCARCERATION_POPULATION: False,
+                IncarcerationMetricType.INCARCERATION_RELEASE: True
+            },
+            calculation_end_month='2000-03',
+            calculation_month_count=-1
+        )
+
+        self.assertEqual([], incarceration_combinations)
+
     def test_map_incarceration_combinations_includes_statute_output(self):
         person = StatePerson.new_with_defaults(person_id=12345,
                                                birthdate=date(1984, 8, 31),
@@ -31,7 +31,7 @@ from freezegun import freeze_time
 from recidiviz.calculator.pipeline.incarceration import identifier
 from recidiviz.calculator.pipeline.incarceration.incarceration_event import \
     IncarcerationAdmissionEvent, IncarcerationReleaseEvent, \
-    IncarcerationStayEvent, IncarcerationEvent
+    IncarcerationStayEvent, IncarcerationEvent, IncarcerationStaySpanEvent
 from recidiviz.calculator.pipeline.utils.state_utils.us_mo.us_mo_sentence_classification import SupervisionTypeSpan
 from recidiviz.common.constants.state.state_incarceration import \
     StateIncarcerationType
@@ -93,8 +93,8 @@ class TestFindIncarcerationEvents(unittest.TestCase):
 
         sentence_groups = [sentence_group]
 
-        incarceration_events = identifier.find_incarceration_events(
-            sentence_groups, _DEFAULT_INCARCERATION_PERIOD_JUDICIAL_DISTRICT_ASSOCIATION, _COUNTY_OF_RESIDENCE)
+        incarceration_events = expanded_stay_events(identifier.find_incarceration_events(
+            sentence_groups, _DEFAULT_INCARCERATION_PERIOD_JUDICIAL_DISTRICT_ASSOCIATION, _COUNTY_OF_RESIDENCE))
 
         expected_events: List[IncarcerationEvent] = expected_incarceration_stay_events(
             incarceration_period,
@@ -174,8 +174,8 @@ class TestFindIncarcerationEvents(unittest.TestCase):
 
         sentence_groups = [sentence_group]
 
-        incarceration_events = identifier.find_incarceration_events(
-            sentence_groups, _DEFAULT_INCARCERATION_PERIOD_JUDICIAL_DISTRICT_ASSOCIATION, _COUNTY_OF_RESIDENCE)
+        incarceration_events = expanded_stay_events(identifier.find_incarceration_events(
+            sentence_groups, _DEFAULT_INCARCERATION_PERIOD_JUDICIAL_DISTRICT_ASSOCIATION, _COUNTY_OF_RESIDENCE))
 
         expected_events: List[IncarcerationEvent] = expected_incarceration_stay_events(
             incarceration_period_1,
@@ -249,8 +249,8 @@ class TestFindIncarcerationEvents(unittest.TestCase):
 
         sentence_groups = [sentence_group]
 
-        incarceration_events = identifier.find_incarceration_events(
-            sentence_groups, _DEFAULT_INCARCERATION_PERIOD_JUDICIAL_DISTRICT_ASSOCIATION, _COUNTY_OF_RESIDENCE)
+        incarceration_events = expanded_stay_events(identifier.find_incarceration_events(
+            sentence_groups, _DEFAULT_INCARCERATION_PERIOD_JUDICIAL_DISTRICT_ASSOCIATION, _COUNTY_OF_RESIDENCE))
 
         expected_events: List[IncarcerationEvent] = expected_incarceration_stay_events(
             incarceration_period,
@@ -306,8 +306,8 @@ class TestFindIncarcerationEvents(unittest.TestCase):
 
         sentence_groups = [sentence_group]
 
-        incarceration_events = identifier.find_incarceration_events(
-            sentence_groups, _DEFAULT_INCARCERATION_PERIOD_JUDICIAL_DISTRICT_ASSOCIATION, _COUNTY_OF_RESIDENCE)
+        incarceration_events = expanded_stay_events(identifier.find_incarceration_events(
+            sentence_groups, _DEFAULT_INCARCERATION_PERIOD_JUDICIAL_DISTRICT_ASSOCIATION, _COUNTY_OF_RESIDENCE))
 
         self.assertCountEqual([], incarceration_events)
 
@@ -361,8 +361,8 @@ class TestFindIncarcerationEvents(unittest.TestCase):
 
         sentence_groups = [sentence_group]
 
-        incarceration_events = identifier.find_incarceration_events(
-            sentence_groups, _DEFAULT_INCARCERATION_PERIOD_JUDICIAL_DISTRICT_ASSOCIATION, _COUNTY_OF_RESIDENCE)
+        incarceration_events = expanded_stay_events(identifier.find_incarceration_events(
+            sentence_groups, _DEFAULT_INCARCERATION_PERIOD_JUDICIAL_DISTRICT_ASSOCIATION, _COUNTY_OF_RESIDENCE))
 
         self.assertCountEqual([
             IncarcerationStayEvent(
@@ -500,8 +500,8 @@ class TestFindIncarcerationEvents(unittest.TestCase):
 
         sentence_groups = [sentence_group]
 
-        incarceration_events = identifier.find_incarceration_events(
-            sentence_groups, _DEFAULT_INCARCERATION_PERIOD_JUDICIAL_DISTRICT_ASSOCIATION, _COUNTY_OF_RESIDENCE)
+        incarceration_events = expanded_stay_events(identifier.find_incarceration_events(
+            sentence_groups, _DEFAULT_INCARCERATION_PERIOD_JUDICIAL_DISTRICT_ASSOCIATION, _COUNTY_OF_RESIDENCE))
 
         self.maxDiff = None
         self.assertCountEqual([
@@ -566,13 +566,13 @@ class TestFindEndOfMonthStatePrisonStays(unittest.TestCase):
         original_admission_reasons_by_period_id = \
             identifier._original_admission_reasons_by_period_id([incarceration_period])
 
-        return identifier.find_incarceration_stays(
+        return expanded_stay_events(identifier.find_incarceration_stays(
             incarceration_sentences,
             supervision_sentences,
             incarceration_period,
             original_admission_reasons_by_period_id,
             default_incarceration_period_judicial_district_association,
-            county_of_residence)
+            county_of_residence))
 
     def test_find_incarceration_stays_type_us_mo(self):
         incarceration_period = StateIncarcerationPeriod.new_with_defaults(
@@ -626,13 +626,13 @@ class TestFindEndOfMonthStatePrisonStays(unittest.TestCase):
             identifier._original_admission_reasons_by_period_id([incarceration_period])
 
         incarceration_sentences = []
-        incarceration_events = identifier.find_incarceration_stays(
+        incarceration_events = expanded_stay_events(identifier.find_incarceration_stays(
             incarceration_sentences,
             [supervision_sentence],
             incarceration_period,
             original_admission_reasons_by_period_id,
             incarceration_period_judicial_district_association,
-            _COUNTY_OF_RESIDENCE)
+            _COUNTY_OF_RESIDENCE))
 
         expected_incarceration_events = expected_incarceration_stay_events(incarceration_period)
 
@@ -1029,13 +1029,13 @@ class TestFindEndOfMonthStatePrisonStays(unittest.TestCase):
             identifier._original_admission_reasons_by_period_id([incarceration_period_1, incarceration_period_2])
 
         incarceration_sentences = []
-        incarceration_events = identifier.find_incarceration_stays(
+        incarceration_events = expanded_stay_events(identifier.find_incarceration_stays(
             incarceration_sentences,
             [],
             incarceration_period_2,
             original_admission_reasons_by_period_id,
             incarceration_period_judicial_district_association,
-            _COUNTY_OF_RESIDENCE)
+            _COUNTY_OF_RESIDENCE))
 
         expected_incarceration_events = expected_incarceration_stay_events(
             incarceration_period_2,
@@ -1091,13 +1091,13 @@ class TestFindEndOfMonthStatePrisonStays(unittest.TestCase):
             identifier._original_admission_reasons_by_period_id([incarceration_period_1, incarceration_period_2])
 
         incarceration_sentences = []
-        incarceration_events = identifier.find_incarceration_stays(
+        incarceration_events = expanded_stay_events(identifier.find_incarceration_stays(
             incarceration_sentences,
             [],
             incarceration_period_2,
             original_admission_reasons_by_period_id,
             incarceration_period_judicial_district_association,
-            _COUNTY_OF_RESIDENCE)
+            _COUNTY_OF_RESIDENCE))
 
         expected_incarceration_events = expected_incarceration_stay_events(
             incarceration_period_2
@@ -1105,6 +1105,101 @@ class TestFindEndOfMonthStatePrisonStays(unittest.TestCase):
 
         self.assertEqual(expected_incarceration_events, incarceration_events)
 
+    def test_find_incarceration_stays_spans_split_on_most_serious_charge_change(self):
+        incarceration_period = StateIncarcerationPeriod.new_with_defaults(
+            incarceration_period_id=1111,
+            incarceration_type=StateIncarcerationType.STATE_PRISON,
+            status=StateIncarcerationPeriodStatus.NOT_IN_CUSTODY,
+            state_code='US_XX',
+            facility='PRISON3',
+            admission_date=date(2000, 1, 20),
+            admission_reason=StateIncarcerationPeriodAdmissionReason.NEW_ADMISSION,
+            release_date=date(2010, 3, 1),
+            release_reason=StateIncarcerationPeriodReleaseReason.SENTENCE_SERVED)
+
+        incarceration_sentence_1 = StateIncarcerationSentence.new_with_defaults(
+            incarceration_sentence_id=9797,
+            start_date=date(1999, 12, 1),
+            incarceration_periods=[incarceration_period],
+            charges=[StateCharge.new_with_defaults(ncic_code='5511', statute='1111')]
+        )
+
+        # The most serious charge changes the day after this sentence starts
+        incarceration_sentence_2 = StateIncarcerationSentence.new_with_defaults(
+            incarceration_sentence_id=9898,
+            start_date=date(2005, 6, 10),
+            charges=[StateCharge.new_with_defaults(ncic_code='1010', statute='2222')]
+        )
+
+        # This sentence does not change the most serious charge
+        incarceration_sentence_3 = StateIncarcerationSentence.new_with_defaults(
+            incarceration_sentence_id=9999,
+            start_date=date(2007, 2, 3),
+            charges=[StateCharge.new_with_defaults(ncic_code='5599', statute='3333')]
+        )
+
+        incarceration_period.incarceration_sentences = [incarceration_sentence_1]
+
+        sentence_group = StateSentenceGroup.new_with_defaults(
+            sentence_group_id=6666,
+            incarceration_sentences=[incarceration_sentence_1, incarceration_sentence_2, incarceration_sentence_3])
+
+        for incarceration_sentence in sentence_group.incarceration_sentences:
+            incarceration_sentence.sentence_group = sentence_group
+
+        stay_span_events = identifier.find_incarceration_stays(
+            [],
+            [],
+            incarceration_period,
+            identifier._original_admission_reasons_by_period_id([incarceration_period]),
+            {},
+            _COUNTY_OF_RESIDENCE)
+
+        expected_span_events = [
+            IncarcerationStaySpanEvent(
+                state_code='US_XX',
+                event_date=date(2000, 1, 20),
+                end_date_exclusive=date(2005, 6, 11),
+                facility='PRISON3',
+                county_of_residence=_COUNTY_OF_RESIDENCE,
+                most_serious_offense_ncic_code='5511',
+                most_serious_offense_statute='1111',
+                admission_reason=StateIncarcerationPeriodAdmissionReason.NEW_ADMISSION),
+            IncarcerationStaySpanEvent(
+                state_code='US_XX',
+                event_date=date(2005, 6, 11),
+                end_date_exclusive=date(2010, 3, 1),
+                facility='PRISON3',
+                county_of_residence=_COUNTY_OF_RESIDENCE,
+                most_serious_offense_ncic_code='1010',
+                most_serious_offense_statute='2222',
+                admission_reason=StateIncarcerationPeriodAdmissionReason.NEW_ADMISSION),
+        ]
+
+        self.assertEqual(expected_span_events, stay_span_events)
+
+    def test_incarceration_stay_span_event_stay_events_with_bounds(self):
+        stay_span_event = IncarcerationStaySpanEvent(
+            state_code='US_XX',
+            event_date=date(2000, 1, 20),
+            end_date_exclusive=date(2010, 3, 1),
+            facility='PRISON3',
+            most_serious_offense_ncic_code='5511')
+
+        stay_events = stay_span_event.stay_events(lower_bound_inclusive=date(2010, 2, 1),
+                                                  upper_bound_inclusive=date(2010, 12, 31))
+
+        expected_stay_events = [
+            IncarcerationStayEvent(
+                state_code='US_XX',
+                event_date=date(2010, 2, 1) + relativedelta(days=x),
+                facility='PRISON3',
+                most_serious_offense_ncic_code='5511')
+            for x in range(28)
+        ]
+
+        self.assertEqual(expected_stay_events, stay_events)
+
 
 class TestDeDuplicatedAdmissions(unittest.TestCase):
     """Tests the de_duplicated_admissions function."""
@@ -2449,3 +2544,16 @@ def expected_incarceration_stay_events(incarceration_period: StateIncarcerationP
             expected_incarceration_events.append(event)
 
     return expected_incarceration_events
+
+
+def expanded_stay_events(incarceration_events: List[IncarcerationEvent]) -> List[IncarcerationEvent]:
+    """Replaces any IncarcerationStaySpanEvents with the IncarcerationStayEvents for each day in the span."""
+    expanded_events: List[IncarcerationEvent] = []
+
+    for incarceration_event in incarceration_events:
+        if isinstance(incarceration_event, IncarcerationStaySpanEvent):
+            expanded_events.extend(incarceration_event.stay_events())
+        else:
+            expanded_events.append(incarceration_event)
+
+    return expanded_events
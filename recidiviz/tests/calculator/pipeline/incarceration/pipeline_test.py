@@ -35,7 +35,7 @@ from mock import patch
 from recidiviz.calculator.pipeline.incarceration import pipeline, calculator
 from recidiviz.calculator.pipeline.incarceration.incarceration_event import \
     IncarcerationAdmissionEvent, IncarcerationReleaseEvent, \
-    IncarcerationStayEvent, IncarcerationEvent
+    IncarcerationStaySpanEvent, IncarcerationEvent
 from recidiviz.calculator.pipeline.incarceration.metrics import \
     IncarcerationMetric, IncarcerationMetricType, IncarcerationAdmissionMetric, IncarcerationPopulationMetric, \
     IncarcerationReleaseMetric
@@ -627,12 +627,13 @@ class TestClassifyIncarcerationEvents(unittest.TestCase):
             {'person_id': fake_person_id, 'incarceration_period_id': 123, 'judicial_district_code': 'NW'}
 
         incarceration_events = [
-            IncarcerationStayEvent(
+            IncarcerationStaySpanEvent(
                 admission_reason=incarceration_period.admission_reason,
                 admission_reason_raw_text=incarceration_period.admission_reason_raw_text,
                 supervision_type_at_admission=StateSupervisionPeriodSupervisionType.PROBATION,
                 state_code=incarceration_period.state_code,
                 event_date=incarceration_period.admission_date,
+                end_date_exclusive=incarceration_period.release_date,
                 facility=incarceration_period.facility,
                 county_of_residence=_COUNTY_OF_RESIDENCE,
                 most_serious_offense_ncic_code='5699',
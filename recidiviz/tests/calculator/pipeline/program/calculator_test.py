@@ -26,7 +26,7 @@ from recidiviz.calculator.pipeline.program import calculator
 from recidiviz.calculator.pipeline.program.metrics import ProgramMetricType, ProgramReferralMetric, \
     ProgramParticipationMetric
 from recidiviz.calculator.pipeline.program.program_event import \
-    ProgramReferralEvent, ProgramEvent, ProgramParticipationEvent
+    ProgramReferralEvent, ProgramEvent, ProgramParticipationEvent, ProgramParticipationSpanEvent
 from recidiviz.calculator.pipeline.utils import calculator_utils
 from recidiviz.calculator.pipeline.utils.calculator_utils import last_day_of_month
 from recidiviz.calculator.pipeline.utils.metric_utils import \
@@ -579,6 +579,46 @@ class TestMapProgramCombinations(unittest.TestCase):
         assert all(value == 1 for _combination, value in program_combinations)
 
 
+    def test_map_program_combinations_participation_span(self):
+        person = StatePerson.new_with_defaults(person_id=12345,
+                                               birthdate=date(1984, 8, 31),
+                                               gender=Gender.FEMALE)
+
+        participation_span_event = ProgramParticipationSpanEvent(
+            state_code='US_ND',
+            event_date=date(2001, 5, 3),
+            end_date_exclusive=date(2012, 12, 4),
+            program_id='XXX',
+            program_location_id='LOCATION',
+            supervision_type=StateSupervisionType.PAROLE
+        )
+
+        program_combinations = calculator.map_program_combinations(
+            person, [participation_span_event], ALL_METRICS_INCLUSIONS_DICT,
+            calculation_end_month='2012-12',
+            calculation_month_count=1
+        )
+
+        # Only the participation in the calculation months is counted
+        expected_participation_events = [
+            ProgramParticipationEvent(
+                state_code='US_ND',
+                event_date=date(2012, 12, day),
+                program_id='XXX',
+                program_location_id='LOCATION',
+                supervision_type=StateSupervisionType.PAROLE
+            ) for day in range(1, 4)
+        ]
+
+        expected_combinations = calculator.map_program_combinations(
+            person, expected_participation_events, ALL_METRICS_INCLUSIONS_DICT,
+            calculation_end_month='2012-12',
+            calculation_month_count=1
+        )
+
+        self.assertEqual(expected_metric_combos_count(expected_participation_events), len(program_combinations))
+        self.assertEqual(expected_combinations, program_combinations)
+
 class TestCharacteristicsDict(unittest.TestCase):
     """Tests the characteristics_dict function."""
 
@@ -20,13 +20,14 @@
 from datetime import date
 
 import unittest
+from typing import List
 
 from dateutil.relativedelta import relativedelta
 from freezegun import freeze_time
 
 from recidiviz.calculator.pipeline.program import identifier
 from recidiviz.calculator.pipeline.program.program_event import \
-    ProgramReferralEvent, ProgramParticipationEvent
+    ProgramReferralEvent, ProgramParticipationEvent, ProgramParticipationSpanEvent, ProgramEvent
 from recidiviz.common.constants.state.state_assessment import \
     StateAssessmentType
 from recidiviz.common.constants.state.state_program_assignment import StateProgramAssignmentParticipationStatus
@@ -80,12 +81,12 @@ class TestFindProgramEvents(unittest.TestCase):
         assessments = [assessment]
         supervision_periods = [supervision_period]
 
-        program_events = identifier.find_program_events(
+        program_events = expanded_participation_events(identifier.find_program_events(
             program_assignments,
             assessments,
             supervision_periods,
             DEFAULT_SUPERVISION_PERIOD_AGENT_ASSOCIATIONS
-        )
+        ))
 
         expected_events = [
             ProgramReferralEvent(
@@ -115,9 +116,9 @@ class TestFindProgramEvents(unittest.TestCase):
         self.assertListEqual(program_events, expected_events)
 
     def test_find_program_events_no_program_assignments(self):
-        program_events = identifier.find_program_events(
+        program_events = expanded_participation_events(identifier.find_program_events(
             [], [], [], DEFAULT_SUPERVISION_PERIOD_AGENT_ASSOCIATIONS
-        )
+        ))
 
         self.assertEqual([], program_events)
 
@@ -422,9 +423,9 @@ class TestFindProgramParticipationEvents(unittest.TestCase):
 
         supervision_periods = [supervision_period]
 
-        participation_events = identifier.find_program_participation_events(
-            program_assignment, supervision_periods
-        )
+        participation_events = expanded_participation_events(identifier.find_program_participation_events(
+            program_assignment, identifier.build_supervision_period_intervals(supervision_periods)
+        ))
 
         expected_events = [ProgramParticipationEvent(
             state_code=program_assignment.state_code,
@@ -463,9 +464,9 @@ class TestFindProgramParticipationEvents(unittest.TestCase):
 
         supervision_periods = [supervision_period]
 
-        participation_events = identifier.find_program_participation_events(
-            program_assignment, supervision_periods
-        )
+        participation_events = expanded_participation_events(identifier.find_program_participation_events(
+            program_assignment, identifier.build_supervision_period_intervals(supervision_periods)
+        ))
 
         expected_events = [ProgramParticipationEvent(
             state_code=program_assignment.state_code,
@@ -501,9 +502,9 @@ class TestFindProgramParticipationEvents(unittest.TestCase):
 
         supervision_periods = []
 
-        participation_events = identifier.find_program_participation_events(
-            program_assignment, supervision_periods
-        )
+        participation_events = expanded_participation_events(identifier.find_program_participation_events(
+            program_assignment, identifier.build_supervision_period_intervals(supervision_periods)
+        ))
 
         self.assertEqual([], participation_events)
 
@@ -520,11 +521,122 @@ class TestFindProgramParticipationEvents(unittest.TestCase):
 
         supervision_periods = []
 
+        participation_events = expanded_participation_events(identifier.find_program_participation_events(
+            program_assignment, identifier.build_supervision_period_intervals(supervision_periods)
+        ))
+
+        self.assertEqual([], participation_events)
+
+    def test_find_program_participation_events_overlapping_supervision_periods(self):
+        program_assignment = StateProgramAssignment.new_with_defaults(
+            state_code='US_CA',
+            program_id='PG3',
+            participation_status=StateProgramAssignmentParticipationStatus.DISCHARGED,
+            program_location_id='LOCATION',
+            start_date=date(2009, 1, 1),
+            discharge_date=date(2012, 1, 1)
+        )
+
+        supervision_period_1 = StateSupervisionPeriod.new_with_defaults(
+            supervision_period_id=111,
+            status=StateSupervisionPeriodStatus.TERMINATED,
+            state_code='UT',
+            start_date=date(2008, 3, 5),
+            termination_date=date(2010, 5, 19),
+            supervision_type=StateSupervisionType.PAROLE
+        )
+
+        supervision_period_2 = StateSupervisionPeriod.new_with_defaults(
+            supervision_period_id=222,
+            status=StateSupervisionPeriodStatus.TERMINATED,
+            state_code='UT',
+            start_date=date(2010, 1, 1),
+            termination_date=date(2011, 3, 1),
+            supervision_type=StateSupervisionType.PROBATION
+        )
+
+        supervision_periods = [supervision_period_1, supervision_period_2]
+
         participation_events = identifier.find_program_participation_events(
-            program_assignment, supervision_periods
+            program_assignment, identifier.build_supervision_period_intervals(supervision_periods)
         )
 
-        self.assertEqual([], participation_events)
+        def _span(start_date: date, end_date: date, supervision_type) -> ProgramParticipationSpanEvent:
+            return ProgramParticipationSpanEvent(
+                state_code=program_assignment.state_code,
+                program_id=program_assignment.program_id,
+                event_date=start_date,
+                end_date_exclusive=end_date,
+                program_location_id=program_assignment.program_location_id,
+                supervision_type=supervision_type
+            )
+
+        expected_events = [
+            _span(date(2009, 1, 1), date(2010, 1, 1), StateSupervisionType.PAROLE),
+            _span(date(2010, 1, 1), date(2010, 5, 19), StateSupervisionType.PAROLE),
+            _span(date(2010, 1, 1), date(2010, 5, 19), StateSupervisionType.PROBATION),
+            _span(date(2010, 5, 19), date(2011, 3, 1), StateSupervisionType.PROBATION),
+            _span(date(2011, 3, 1), date(2012, 1, 1), None),
+        ]
+
+        self.assertListEqual(expected_events, participation_events)
+
+        # Each day has one event per overlapping supervision period
+        expanded_events = expanded_participation_events(participation_events)
+        for participation_date in (date(2009, 1, 1), date(2010, 1, 1), date(2010, 5, 18), date(2011, 2, 28)):
+            supervision_periods_on_date = identifier.find_supervision_periods_overlapping_with_date(
+                participation_date, supervision_periods)
+            self.assertCountEqual(
+                [sp.supervision_type for sp in supervision_periods_on_date],
+                [event.supervision_type for event in expanded_events if event.event_date == participation_date])
+
+
+class TestBuildSupervisionPeriodIntervals(unittest.TestCase):
+    """Tests the build_supervision_period_intervals function."""
+
+    def test_build_supervision_period_intervals(self):
+        supervision_period_1 = StateSupervisionPeriod.new_with_defaults(
+            supervision_period_id=111,
+            status=StateSupervisionPeriodStatus.TERMINATED,
+            state_code='UT',
+            start_date=date(2008, 3, 5),
+            termination_date=date(2010, 5, 19),
+            supervision_type=StateSupervisionType.PAROLE
+        )
+
+        supervision_period_2 = StateSupervisionPeriod.new_with_defaults(
+            supervision_period_id=222,
+            status=StateSupervisionPeriodStatus.UNDER_SUPERVISION,
+            state_code='UT',
+            start_date=date(2011, 1, 1),
+            supervision_type=StateSupervisionType.PROBATION
+        )
+
+        supervision_period_3 = StateSupervisionPeriod.new_with_defaults(
+            supervision_period_id=333,
+            status=StateSupervisionPeriodStatus.TERMINATED,
+            state_code='UT',
+            start_date=date(2007, 1, 1),
+            termination_date=date(2009, 1, 1),
+            supervision_type=StateSupervisionType.PROBATION
+        )
+
+        intervals = identifier.build_supervision_period_intervals(
+            [supervision_period_1, supervision_period_2, supervision_period_3])
+
+        expected_intervals = [
+            identifier.SupervisionPeriodInterval(date(2007, 1, 1), date(2008, 3, 5), [supervision_period_3]),
+            identifier.SupervisionPeriodInterval(date(2008, 3, 5), date(2009, 1, 1),
+                                                 [supervision_period_1, supervision_period_3]),
+            identifier.SupervisionPeriodInterval(date(2009, 1, 1), date(2010, 5, 19), [supervision_period_1]),
+            identifier.SupervisionPeriodInterval(date(2010, 5, 19), date(2011, 1, 1), []),
+            identifier.SupervisionPeriodInterval(date(2011, 1, 1), None, [supervision_period_2]),
+        ]
+
+        self.assertEqual(expected_intervals, intervals)
+
+    def test_build_supervision_period_intervals_no_periods(self):
+        self.assertEqual([], identifier.build_supervision_period_intervals([]))
 
 
 class TestFindSupervisionPeriodsOverlappingWithDate(unittest.TestCase):
@@ -745,3 +857,16 @@ class TestReferralsForSupervisionPeriods(unittest.TestCase):
                 supervision_type=supervision_period_2.supervision_type
             )
         ], program_referrals)
+
+
+def expanded_participation_events(program_events: List[ProgramEvent]) -> List[ProgramEvent]:
+    """Replaces any ProgramParticipationSpanEvents with the ProgramParticipationEvents for each day in the span."""
+    expanded_events: List[ProgramEvent] = []
+
+    for program_event in program_events:
+        if isinstance(program_event, ProgramParticipationSpanEvent):
+            expanded_events.extend(program_event.participation_events())
+        else:
+            expanded_events.append(program_event)
+
+    return expanded_events
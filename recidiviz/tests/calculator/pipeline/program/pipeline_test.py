@@ -28,7 +28,7 @@ from apache_beam.testing.test_pipeline import TestPipeline
 from apache_beam.options.pipeline_options import PipelineOptions
 
 import datetime
-from datetime import date
+from datetime import date, timedelta
 
 from freezegun import freeze_time
 from mock import patch
@@ -37,7 +37,7 @@ from recidiviz.calculator.pipeline.program import pipeline
 from recidiviz.calculator.pipeline.program.metrics import ProgramMetric, \
     ProgramMetricType
 from recidiviz.calculator.pipeline.program.program_event import \
-    ProgramReferralEvent, ProgramParticipationEvent
+    ProgramReferralEvent, ProgramParticipationEvent, ProgramParticipationSpanEvent
 from recidiviz.calculator.pipeline.utils import extractor_utils
 from recidiviz.calculator.pipeline.utils.metric_utils import MetricMethodologyType
 from recidiviz.common.constants.state.state_assessment import \
@@ -473,11 +473,12 @@ class TestClassifyProgramAssignments(unittest.TestCase):
             supervision_type=supervision_period.supervision_type,
             supervising_officer_external_id='OFFICER0009',
             supervising_district_external_id='10'
-        ), ProgramParticipationEvent(
+        ), ProgramParticipationSpanEvent(
             state_code=program_assignment.state_code,
             program_id=program_assignment.program_id,
             program_location_id=program_assignment.program_location_id,
             event_date=date.today(),
+            end_date_exclusive=date.today() + timedelta(days=1),
             supervision_type=supervision_period.supervision_type
         )]
 
@@ -20,7 +20,7 @@
 """Tests for recidivism/calculator.py."""
 import unittest
 from datetime import date
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from dateutil.relativedelta import relativedelta
 from freezegun import freeze_time
@@ -78,8 +78,24 @@ class TestReincarcerations(unittest.TestCase):
         self.assertEqual({}, reincarcerations)
 
 
-class TestReincarcerationsInWindow(unittest.TestCase):
-    """Tests the reincarcerations_in_window() function in the calculator."""
+class TestRecidivismTimelineReincarcerationsInWindow(unittest.TestCase):
+    """Tests the RecidivismTimeline.reincarcerations_in_window() function in the calculator."""
+
+    @staticmethod
+    def _timeline(reincarceration_returns: Dict[date, Tuple[ReincarcerationReturnType,
+                                                            Optional[StateSupervisionPeriodSupervisionType]]]) \
+            -> calculator.RecidivismTimeline:
+        """Returns a RecidivismTimeline for a person who was released a year before each of the given
+        reincarceration dates and returned with the given return and supervision types."""
+        release_events: Dict[int, List[ReleaseEvent]] = {}
+        for reincarceration_date, (return_type, from_supervision_type) in reincarceration_returns.items():
+            release_date = reincarceration_date - relativedelta(years=1)
+            release_events.setdefault(release_date.year, []).append(RecidivismReleaseEvent(
+                'CA', release_date - relativedelta(years=2), release_date, 'Sing Sing',
+                _COUNTY_OF_RESIDENCE, reincarceration_date, 'Sing Sing',
+                return_type, from_supervision_type=from_supervision_type))
+
+        return calculator.RecidivismTimeline(release_events)
 
     def test_reincarcerations_in_window(self):
         # Too early
@@ -91,20 +107,17 @@ class TestReincarcerationsInWindow(unittest.TestCase):
         # Too late
         release_2022 = date(2022, 5, 13)
 
-        reincarceration = {'return_type': ReincarcerationReturnType.NEW_ADMISSION,
-                           'from_supervision_type': None}
+        reincarceration = (ReincarcerationReturnType.NEW_ADMISSION, None)
 
-        all_reincarcerations = {release_2012: reincarceration,
-                                release_2016: reincarceration,
-                                release_2020: reincarceration,
-                                release_2021: reincarceration,
-                                release_2022: reincarceration}
+        timeline = self._timeline({release_2012: reincarceration,
+                                   release_2016: reincarceration,
+                                   release_2020: reincarceration,
+                                   release_2021: reincarceration,
+                                   release_2022: reincarceration})
 
         start_date = date(2016, 5, 13)
 
-        reincarcerations = calculator.reincarcerations_in_window(
-            start_date, start_date +
-            relativedelta(years=6), all_reincarcerations)
+        reincarcerations = timeline.reincarcerations_in_window(start_date, start_date + relativedelta(years=6))
         self.assertEqual(3, len(reincarcerations))
 
     def test_reincarcerations_in_window_all_early(self):
@@ -115,20 +128,17 @@ class TestReincarcerationsInWindow(unittest.TestCase):
         release_2021 = date(2021, 5, 13)
         release_2022 = date(2022, 5, 13)
 
-        reincarceration = {'return_type': ReincarcerationReturnType.NEW_ADMISSION,
-                           'from_supervision_type': None}
+        reincarceration = (ReincarcerationReturnType.NEW_ADMISSION, None)
 
-        all_reincarcerations = {release_2012: reincarceration,
-                                release_2016: reincarceration,
-                                release_2020: reincarceration,
-                                release_2021: reincarceration,
-                                release_2022: reincarceration}
+        timeline = self._timeline({release_2012: reincarceration,
+                                   release_2016: reincarceration,
+                                   release_2020: reincarceration,
+                                   release_2021: reincarceration,
+                                   release_2022: reincarceration})
 
         start_date = date(2026, 5, 13)
 
-        reincarcerations = calculator.reincarcerations_in_window(
-            start_date, start_date +
-            relativedelta(years=6), all_reincarcerations)
+        reincarcerations = timeline.reincarcerations_in_window(start_date, start_date + relativedelta(years=6))
 
         self.assertEqual([], reincarcerations)
 
@@ -140,23 +150,30 @@ class TestReincarcerationsInWindow(unittest.TestCase):
         release_2021 = date(2021, 5, 13)
         release_2022 = date(2022, 5, 13)
 
-        reincarceration = {'return_type': ReincarcerationReturnType.NEW_ADMISSION,
-                           'from_supervision_type': None}
+        reincarceration = (ReincarcerationReturnType.NEW_ADMISSION, None)
 
-        all_reincarcerations = {release_2012: reincarceration,
-                                release_2016: reincarceration,
-                                release_2020: reincarceration,
-                                release_2021: reincarceration,
-                                release_2022: reincarceration}
+        timeline = self._timeline({release_2012: reincarceration,
+                                   release_2016: reincarceration,
+                                   release_2020: reincarceration,
+                                   release_2021: reincarceration,
+                                   release_2022: reincarceration})
 
         start_date = date(2006, 5, 13)
 
-        reincarcerations = calculator.reincarcerations_in_window(
-            start_date, start_date +
-            relativedelta(years=5), all_reincarcerations)
+        reincarcerations = timeline.reincarcerations_in_window(start_date, start_date + relativedelta(years=5))
 
         self.assertEqual([], reincarcerations)
 
+    def test_reincarcerations_in_window_start_inclusive_end_exclusive(self):
+        reincarceration = (ReincarcerationReturnType.NEW_ADMISSION, None)
+
+        timeline = self._timeline({date(2016, 5, 13): reincarceration,
+                                   date(2022, 5, 13): reincarceration})
+
+        reincarcerations = timeline.reincarcerations_in_window(date(2016, 5, 13), date(2022, 5, 13))
+
+        self.assertEqual([date(2015, 5, 13)], [reincarceration['release_date'] for reincarceration in reincarcerations])
+
     def test_reincarcerations_in_window_with_revocation_returns(self):
         # Too early
         release_2012 = date(2012, 4, 30)
@@ -167,27 +184,20 @@ class TestReincarcerationsInWindow(unittest.TestCase):
         # Too late
         release_2022 = date(2022, 5, 13)
 
-        revocation_reincarceration = {
-            'return_type':
-                ReincarcerationReturnType.REVOCATION,
-            'from_supervision_type':
-                StateSupervisionPeriodSupervisionType.PAROLE}
+        revocation_reincarceration = (ReincarcerationReturnType.REVOCATION,
+                                      StateSupervisionPeriodSupervisionType.PAROLE)
 
-        new_admission_reincarceration = {
-            'return_type': ReincarcerationReturnType.NEW_ADMISSION,
-            'from_supervision_type': None}
+        new_admission_reincarceration = (ReincarcerationReturnType.NEW_ADMISSION, None)
 
-        all_reincarcerations = {release_2012: new_admission_reincarceration,
-                                release_2016: revocation_reincarceration,
-                                release_2020: revocation_reincarceration,
-                                release_2021: new_admission_reincarceration,
-                                release_2022: new_admission_reincarceration}
+        timeline = self._timeline({release_2012: new_admission_reincarceration,
+                                   release_2016: revocation_reincarceration,
+                                   release_2020: revocation_reincarceration,
+                                   release_2021: new_admission_reincarceration,
+                                   release_2022: new_admission_reincarceration})
 
         start_date = date(2016, 5, 13)
 
-        reincarcerations = calculator.reincarcerations_in_window(
-            start_date, start_date +
-            relativedelta(years=6), all_reincarcerations)
+        reincarcerations = timeline.reincarcerations_in_window(start_date, start_date + relativedelta(years=6))
 
         self.assertEqual(3, len(reincarcerations))
         self.assertEqual(ReincarcerationReturnType.REVOCATION, reincarcerations[0].get('return_type'))
@@ -198,6 +208,68 @@ class TestReincarcerationsInWindow(unittest.TestCase):
         self.assertIsNone(reincarcerations[2].get('from_supervision_type'))
 
 
+class TestRecidivismTimeline(unittest.TestCase):
+    """Tests the RecidivismTimeline class in the calculator."""
+
+    def setUp(self):
+        self.first_event = RecidivismReleaseEvent(
+            'CA', date(2008, 11, 20), date(2010, 12, 4), 'Sing Sing',
+            _COUNTY_OF_RESIDENCE, date(2011, 4, 5), 'Sing Sing',
+            ReincarcerationReturnType.NEW_ADMISSION)
+        self.second_event = RecidivismReleaseEvent(
+            'CA', date(2011, 4, 5), date(2014, 4, 14), 'Sing Sing',
+            _COUNTY_OF_RESIDENCE, date(2017, 1, 4), 'Sing Sing',
+            ReincarcerationReturnType.REVOCATION,
+            from_supervision_type=StateSupervisionPeriodSupervisionType.PAROLE)
+        self.third_event = NonRecidivismReleaseEvent(
+            'CA', date(2017, 1, 4), date(2017, 10, 20), 'Sing Sing',
+            _COUNTY_OF_RESIDENCE)
+        self.earlier_event_in_cohort = RecidivismReleaseEvent(
+            'CA', date(2016, 1, 4), date(2014, 2, 1), 'Sing Sing',
+            _COUNTY_OF_RESIDENCE, date(2014, 3, 2), 'Sing Sing',
+            ReincarcerationReturnType.NEW_ADMISSION)
+
+        # The reincarcerations and the releases within a cohort are intentionally out of order
+        self.release_events: Dict[int, List[ReleaseEvent]] = {
+            2017: [self.third_event],
+            2014: [self.second_event, self.earlier_event_in_cohort],
+            2010: [self.first_event]
+        }
+
+    def test_reincarcerations_in_window(self):
+        timeline = calculator.RecidivismTimeline(self.release_events)
+
+        reincarcerations = timeline.reincarcerations_in_window(date(2011, 4, 5), date(2017, 1, 4))
+
+        self.assertEqual([date(2011, 4, 5), date(2014, 3, 2), date(2017, 1, 4)], timeline.reincarceration_dates)
+        self.assertEqual([self.first_event.release_date, self.earlier_event_in_cohort.release_date],
+                         [reincarceration['release_date'] for reincarceration in reincarcerations])
+
+    def test_is_first_release_in_cohort(self):
+        timeline = calculator.RecidivismTimeline(self.release_events)
+
+        self.assertTrue(timeline.is_first_release_in_cohort(self.first_event))
+        self.assertTrue(timeline.is_first_release_in_cohort(self.earlier_event_in_cohort))
+        self.assertFalse(timeline.is_first_release_in_cohort(self.second_event))
+        self.assertTrue(timeline.is_first_release_in_cohort(self.third_event))
+
+        # The release events given to the timeline are not re-ordered
+        self.assertEqual([self.second_event, self.earlier_event_in_cohort], self.release_events[2014])
+
+    def test_is_first_release_in_cohort_missing_cohort(self):
+        timeline = calculator.RecidivismTimeline({2010: [self.first_event]})
+
+        with self.assertRaises(ValueError):
+            timeline.is_first_release_in_cohort(self.second_event)
+
+    def test_earliest_follow_up_period(self):
+        timeline = calculator.RecidivismTimeline(self.release_events)
+
+        self.assertEqual(1, timeline.earliest_follow_up_period(self.first_event))
+        self.assertEqual(3, timeline.earliest_follow_up_period(self.second_event))
+        self.assertIsNone(timeline.earliest_follow_up_period(self.third_event))
+
+
 class TestEarliestRecidivatedFollowUpPeriod(unittest.TestCase):
     """Tests the earliest_recidivated_follow_up_period() function in the calculator."""
 
@@ -24,11 +24,14 @@ import unittest
 from datetime import date
 from typing import Dict, List
 
+from mock import patch
+
 from recidiviz.calculator.pipeline.recidivism import identifier
 from recidiviz.calculator.pipeline.recidivism.release_event import \
     RecidivismReleaseEvent, NonRecidivismReleaseEvent, ReincarcerationReturnType
 from recidiviz.calculator.pipeline.recidivism.metrics import \
     StateSupervisionPeriodSupervisionType
+from recidiviz.calculator.pipeline.utils.incarceration_period_utils import PreProcessedIncarcerationPeriods
 from recidiviz.common.constants.state.state_incarceration import StateIncarcerationType
 from recidiviz.common.constants.state.state_incarceration_period import \
     StateIncarcerationPeriodStatus
@@ -248,6 +251,55 @@ class TestClassifyReleaseEvents(unittest.TestCase):
             release_events_by_cohort[2014]
         )
 
+    def test_find_release_events_by_cohort_year_pre_processed_periods(self):
+        """Tests the find_release_events_by_cohort_year function when the person's incarceration periods have already
+        been pre-processed, which should not be done again."""
+        initial_incarceration_period = \
+            StateIncarcerationPeriod.new_with_defaults(
+                incarceration_period_id=1111,
+                incarceration_type=StateIncarcerationType.STATE_PRISON,
+                status=StateIncarcerationPeriodStatus.NOT_IN_CUSTODY,
+                state_code='TX',
+                admission_date=date(2008, 11, 20),
+                admission_reason=AdmissionReason.NEW_ADMISSION,
+                release_date=date(2010, 12, 4),
+                release_reason=ReleaseReason.SENTENCE_SERVED)
+
+        reincarceration_period = \
+            StateIncarcerationPeriod.new_with_defaults(
+                incarceration_period_id=2222,
+                incarceration_type=StateIncarcerationType.STATE_PRISON,
+                status=StateIncarcerationPeriodStatus.IN_CUSTODY,
+                state_code='TX',
+                admission_date=date(2011, 4, 5),
+                admission_reason=AdmissionReason.NEW_ADMISSION)
+
+        incarceration_periods = [initial_incarceration_period, reincarceration_period]
+
+        pre_processed_incarceration_periods = PreProcessedIncarcerationPeriods('TX', incarceration_periods)
+
+        with patch('recidiviz.calculator.pipeline.recidivism.identifier.PreProcessedIncarcerationPeriods') \
+                as mock_pre_processed_incarceration_periods:
+            release_events_by_cohort = \
+                identifier.find_release_events_by_cohort_year(
+                    incarceration_periods,
+                    _COUNTY_OF_RESIDENCE,
+                    pre_processed_incarceration_periods)
+
+            mock_pre_processed_incarceration_periods.assert_not_called()
+
+        self.assertEqual({
+            2010: [RecidivismReleaseEvent(
+                state_code='TX',
+                original_admission_date=initial_incarceration_period.admission_date,
+                release_date=initial_incarceration_period.release_date,
+                release_facility=None,
+                reincarceration_date=reincarceration_period.admission_date,
+                reincarceration_facility=None,
+                county_of_residence=_COUNTY_OF_RESIDENCE,
+                return_type=ReincarcerationReturnType.NEW_ADMISSION)]
+        }, release_events_by_cohort)
+
     def test_find_release_events_by_cohort_year_no_incarcerations_at_all(self):
         """Tests the find_release_events_by_cohort_year function when the person
         has no StateIncarcerationPeriods."""
@@ -26,12 +26,16 @@ from typing import Optional, List, Dict
 import attr
 from dateutil.relativedelta import relativedelta
 from freezegun import freeze_time
+from mock import patch
 
 import recidiviz.calculator
 from recidiviz.calculator.pipeline.supervision import identifier
 from recidiviz.calculator.pipeline.supervision.supervision_case_compliance import SupervisionCaseCompliance
 from recidiviz.calculator.pipeline.utils.calculator_utils import last_day_of_month
 from recidiviz.calculator.pipeline.utils.incarceration_period_index import IncarcerationPeriodIndex
+from recidiviz.calculator.pipeline.utils.incarceration_period_utils import PreProcessedIncarcerationPeriods
+from recidiviz.calculator.pipeline.utils.state_utils.state_calculation_config_manager import \
+    get_state_calculation_config
 from recidiviz.calculator.pipeline.supervision.metrics import SupervisionMetricType
 from recidiviz.calculator.pipeline.supervision.supervision_time_bucket import \
     NonRevocationReturnSupervisionTimeBucket, \
@@ -211,6 +215,69 @@ class TestClassifySupervisionTimeBuckets(unittest.TestCase):
 
         self.assertCountEqual(supervision_time_buckets, expected_buckets)
 
+    def test_find_supervision_time_buckets_pre_processed_incarceration_periods(self):
+        """Tests the find_supervision_time_buckets function when the person's incarceration periods have already been
+        pre-processed, which should not be done again and should produce the same buckets."""
+
+        def _build_periods():
+            supervision_period = StateSupervisionPeriod.new_with_defaults(
+                supervision_period_id=111,
+                external_id='sp1',
+                status=StateSupervisionPeriodStatus.TERMINATED,
+                state_code='US_ND',
+                start_date=date(2018, 3, 5),
+                termination_date=date(2018, 5, 19),
+                termination_reason=StateSupervisionPeriodTerminationReason.REVOCATION,
+                supervision_type=StateSupervisionType.PROBATION
+            )
+
+            incarceration_period = StateIncarcerationPeriod.new_with_defaults(
+                incarceration_period_id=111,
+                external_id='ip1',
+                status=StateIncarcerationPeriodStatus.NOT_IN_CUSTODY,
+                state_code='US_ND',
+                incarceration_type=StateIncarcerationType.STATE_PRISON,
+                admission_date=date(2018, 5, 19),
+                admission_reason=StateIncarcerationPeriodAdmissionReason.PROBATION_REVOCATION,
+                release_date=date(2018, 12, 3),
+                release_reason=ReleaseReason.SENTENCE_SERVED
+            )
+
+            return [supervision_period], [incarceration_period]
+
+        def _find_supervision_time_buckets(supervision_periods, incarceration_periods,
+                                           pre_processed_incarceration_periods=None):
+            return identifier.find_supervision_time_buckets(
+                [],
+                [],
+                supervision_periods,
+                incarceration_periods,
+                [],
+                [],
+                [],
+                DEFAULT_SSVR_AGENT_ASSOCIATIONS,
+                DEFAULT_SUPERVISION_PERIOD_AGENT_ASSOCIATIONS,
+                DEFAULT_SUPERVISION_PERIOD_JUDICIAL_DISTRICT_ASSOCIATIONS,
+                pre_processed_incarceration_periods
+            )
+
+        supervision_periods, incarceration_periods = _build_periods()
+        expected_buckets = _find_supervision_time_buckets(supervision_periods, incarceration_periods)
+
+        supervision_periods, incarceration_periods = _build_periods()
+        pre_processed_incarceration_periods = PreProcessedIncarcerationPeriods('US_ND', incarceration_periods)
+
+        with patch('recidiviz.calculator.pipeline.supervision.identifier.PreProcessedIncarcerationPeriods') \
+                as mock_pre_processed_incarceration_periods:
+            supervision_time_buckets = _find_supervision_time_buckets(
+                supervision_periods, incarceration_periods, pre_processed_incarceration_periods)
+
+            mock_pre_processed_incarceration_periods.assert_not_called()
+
+        self.assertTrue(any(isinstance(bucket, RevocationReturnSupervisionTimeBucket)
+                            for bucket in supervision_time_buckets))
+        self.assertCountEqual(expected_buckets, supervision_time_buckets)
+
     def test_find_supervision_time_buckets_overlaps_year(self):
         """Tests the find_supervision_time_buckets function for a single
         supervision period with no incarceration periods, where the supervision
@@ -6621,7 +6688,9 @@ class TestGetViolationAndResponseHistory(unittest.TestCase):
         revocation_date = date(2009, 2, 13)
 
         violation_history = identifier.get_violation_and_response_history(
-            supervision_violation_response.state_code, revocation_date, [supervision_violation_response])
+            get_state_calculation_config(supervision_violation_response.state_code),
+            revocation_date,
+            [supervision_violation_response])
 
         self.assertEqual(StateSupervisionViolationType.FELONY,
                          violation_history.most_severe_violation_type)
@@ -6687,7 +6756,7 @@ class TestGetViolationAndResponseHistory(unittest.TestCase):
         revocation_date = date(2009, 2, 13)
 
         violation_history = identifier.get_violation_and_response_history(
-            supervision_violation_response_1.state_code,
+            get_state_calculation_config(supervision_violation_response_1.state_code),
             revocation_date,
             [supervision_violation_response_1, supervision_violation_response_2])
 
@@ -6767,7 +6836,7 @@ class TestGetViolationAndResponseHistory(unittest.TestCase):
         revocation_date = date(2009, 2, 13)
 
         violation_history = identifier.get_violation_and_response_history(
-            supervision_violation_response.state_code,
+            get_state_calculation_config(supervision_violation_response.state_code),
             revocation_date,
             [supervision_violation_response_old, supervision_violation_response])
 
@@ -6841,7 +6910,7 @@ class TestGetViolationAndResponseHistory(unittest.TestCase):
         revocation_date = date(2009, 12, 31)
 
         violation_history = identifier.get_violation_and_response_history(
-            supervision_violation_response.state_code,
+            get_state_calculation_config(supervision_violation_response.state_code),
             revocation_date,
             [supervision_violation_response_old, supervision_violation_response])
 
@@ -6893,7 +6962,8 @@ class TestGetViolationAndResponseHistory(unittest.TestCase):
         revocation_date = date(2009, 2, 13)
 
         violation_history = \
-            identifier.get_violation_and_response_history('US_MO', revocation_date, [supervision_violation_response])
+            identifier.get_violation_and_response_history(
+                get_state_calculation_config('US_MO'), revocation_date, [supervision_violation_response])
 
         self.assertEqual(StateSupervisionViolationType.TECHNICAL,
                          violation_history.most_severe_violation_type)
@@ -6931,7 +7001,9 @@ class TestGetViolationAndResponseHistory(unittest.TestCase):
         revocation_date = date(2009, 2, 13)
 
         violation_history = identifier.get_violation_and_response_history(
-            supervision_violation_response.state_code, revocation_date, [supervision_violation_response])
+            get_state_calculation_config(supervision_violation_response.state_code),
+            revocation_date,
+            [supervision_violation_response])
 
         self.assertIsNone(violation_history.most_severe_violation_type)
         self.assertIsNone(violation_history.most_severe_violation_type_subtype)
@@ -6991,7 +7063,9 @@ class TestGetViolationAndResponseHistory(unittest.TestCase):
 
         violation_history = \
             identifier.get_violation_and_response_history(
-                'US_MO', revocation_date, [supervision_violation_response, supervision_violation_response_supplemental])
+                get_state_calculation_config('US_MO'),
+                revocation_date,
+                [supervision_violation_response, supervision_violation_response_supplemental])
 
         self.assertEqual(StateSupervisionViolationType.TECHNICAL, violation_history.most_severe_violation_type)
         self.assertIsNone(violation_history.most_severe_violation_type_subtype)
@@ -7004,7 +7078,8 @@ class TestGetViolationAndResponseHistory(unittest.TestCase):
     def test_get_violation_and_response_history_no_responses(self):
         revocation_date = date(2009, 2, 13)
 
-        violation_history = identifier.get_violation_and_response_history('US_XX', revocation_date, [])
+        violation_history = identifier.get_violation_and_response_history(
+            get_state_calculation_config('US_XX'), revocation_date, [])
 
         self.assertIsNone(violation_history.most_severe_violation_type)
         self.assertIsNone(violation_history.most_severe_violation_type_subtype)
@@ -7049,7 +7124,9 @@ class TestGetViolationAndResponseHistory(unittest.TestCase):
         revocation_date = date(2009, 2, 13)
 
         violation_history = identifier.get_violation_and_response_history(
-            supervision_violation_response.state_code, revocation_date, [supervision_violation_response])
+            get_state_calculation_config(supervision_violation_response.state_code),
+            revocation_date,
+            [supervision_violation_response])
 
         self.assertEqual(StateSupervisionViolationType.MISDEMEANOR,
                          violation_history.most_severe_violation_type)
@@ -7103,7 +7180,9 @@ class TestGetViolationAndResponseHistory(unittest.TestCase):
         revocation_date = date(2009, 2, 13)
 
         violation_history = identifier.get_violation_and_response_history(
-            supervision_violation_response.state_code, revocation_date, [supervision_violation_response])
+            get_state_calculation_config(supervision_violation_response.state_code),
+            revocation_date,
+            [supervision_violation_response])
 
         self.assertIsNone(violation_history.most_severe_violation_type)
         self.assertIsNone(violation_history.most_severe_violation_type_subtype)
@@ -7141,7 +7220,7 @@ class TestGetViolationAndResponseHistory(unittest.TestCase):
         revocation_date = date(2009, 2, 13)
 
         violation_history = identifier.get_violation_and_response_history(
-            'US_MO', revocation_date, [supervision_violation_response])
+            get_state_calculation_config('US_MO'), revocation_date, [supervision_violation_response])
 
         self.assertEqual(StateSupervisionViolationType.TECHNICAL, violation_history.most_severe_violation_type)
         self.assertIsNone(violation_history.most_severe_violation_type_subtype)
@@ -7193,7 +7272,7 @@ class TestGetViolationAndResponseHistory(unittest.TestCase):
         revocation_date = date(2009, 2, 13)
 
         violation_history = identifier.get_violation_and_response_history(
-            'US_MO', revocation_date, [supervision_violation_response])
+            get_state_calculation_config('US_MO'), revocation_date, [supervision_violation_response])
 
         self.assertEqual(StateSupervisionViolationType.TECHNICAL,
                          violation_history.most_severe_violation_type)
@@ -7289,7 +7368,9 @@ class TestGetViolationAndResponseHistory(unittest.TestCase):
         revocation_date = date(2009, 2, 13)
 
         violation_history = identifier.get_violation_and_response_history(
-            'US_MO', revocation_date, [supervision_violation_response_law, supervision_violation_response_absc])
+            get_state_calculation_config('US_MO'),
+            revocation_date,
+            [supervision_violation_response_law, supervision_violation_response_absc])
 
         self.assertEqual(StateSupervisionViolationType.TECHNICAL,
                          violation_history.most_severe_violation_type)
@@ -7342,7 +7423,7 @@ class TestGetViolationAndResponseHistory(unittest.TestCase):
         revocation_date = date(2009, 2, 13)
 
         violation_history = identifier.get_violation_and_response_history(
-            'US_MO', revocation_date, [supervision_violation_response])
+            get_state_calculation_config('US_MO'), revocation_date, [supervision_violation_response])
 
         self.assertEqual(StateSupervisionViolationType.TECHNICAL,
                          violation_history.most_severe_violation_type)
@@ -7402,7 +7483,7 @@ class TestGetViolationAndResponseHistory(unittest.TestCase):
         revocation_date = date(2009, 2, 13)
 
         violation_history = identifier.get_violation_and_response_history(
-            'US_MO', revocation_date, [supervision_violation_response])
+            get_state_calculation_config('US_MO'), revocation_date, [supervision_violation_response])
 
         self.assertEqual(StateSupervisionViolationType.TECHNICAL,
                          violation_history.most_severe_violation_type)
@@ -16,14 +16,30 @@
 # =============================================================================
 """Tests for utils/beam_utils.py."""
 
+import datetime
+import pickle
 import unittest
+from enum import EnumMeta
+from typing import Any, Dict, Type
 
+import attr
 import apache_beam as beam
 from apache_beam.testing.test_pipeline import TestPipeline
 from apache_beam.testing.util import assert_that, equal_to
 
+from recidiviz.calculator.calculation_data_storage_config import DATAFLOW_METRICS_TO_TABLES
+from recidiviz.calculator.pipeline.incarceration import pipeline as incarceration_pipeline
+from recidiviz.calculator.pipeline.incarceration.incarceration_event import IncarcerationEvent, \
+    IncarcerationAdmissionEvent
+from recidiviz.calculator.pipeline.incarceration.metrics import IncarcerationMetric, IncarcerationPopulationMetric
+from recidiviz.calculator.pipeline.program.program_event import ProgramEvent
+from recidiviz.calculator.pipeline.recidivism.release_event import ReleaseEvent
+from recidiviz.calculator.pipeline.supervision.supervision_time_bucket import SupervisionTimeBucket
 from recidiviz.calculator.pipeline.utils import beam_utils
-from recidiviz.calculator.pipeline.utils.beam_utils import AverageFnResult
+from recidiviz.calculator.pipeline.utils.beam_utils import AverageFnResult, RecidivizAttrCoder
+from recidiviz.calculator.pipeline.utils.metric_utils import RecidivizMetric, MetricMethodologyType
+from recidiviz.common.attr_utils import is_enum, get_enum_cls, is_list, is_str, is_int, is_float, is_bool, is_date
+from recidiviz.common.constants.person_characteristics import Race
 
 
 class TestBeamUtils(unittest.TestCase):
@@ -115,3 +131,139 @@ class TestBeamUtils(unittest.TestCase):
         assert_that(output, equal_to([]))
 
         test_pipeline.run()
+
+
+def _populated_attr_object(cls: Type, seed: int):
+    """Returns an instance of the given attr class with a non-null value set on each field, based on the field type."""
+    values: Dict[str, Any] = {}
+    for i, field in enumerate(attr.fields(cls)):
+        if is_list(field):
+            # Optional[List[...]]
+            list_type = field.type.__args__[0]
+            element_type = list_type.__args__[0]
+            values[field.name] = list(element_type)[:2] if isinstance(element_type, EnumMeta) else [['a', 'b'], ['c']]
+        elif is_enum(field):
+            enum_cls = get_enum_cls(field)
+            assert enum_cls is not None
+            enum_members = list(enum_cls)
+            values[field.name] = enum_members[(seed + i) % len(enum_members)]
+        elif is_str(field):
+            values[field.name] = f'{field.name}_{seed}'
+        elif is_bool(field):
+            values[field.name] = bool((seed + i) % 2)
+        elif is_int(field):
+            values[field.name] = seed * 1000 - i
+        elif is_float(field):
+            values[field.name] = seed / (i + 1)
+        elif is_date(field):
+            values[field.name] = datetime.date(2000, 1, 1) + datetime.timedelta(days=seed + i)
+        else:
+            nested_cls = next(t for t in field.type.__args__ if attr.has(t))
+            values[field.name] = _populated_attr_object(nested_cls, seed)
+
+    obj = object.__new__(cls)
+    obj.__dict__.update(values)
+    return obj
+
+
+class TestRecidivizAttrCoder(unittest.TestCase):
+    """Tests for the RecidivizAttrCoder."""
+
+    def assertRoundTrip(self, coder: RecidivizAttrCoder, value):
+        decoded = coder.decode(coder.encode(value))
+
+        self.assertEqual(value, decoded)
+        self.assertEqual(type(value), type(decoded))
+        self.assertEqual(value.__dict__ if hasattr(value, '__dict__') else value,
+                         decoded.__dict__ if hasattr(decoded, '__dict__') else decoded)
+
+    def testRoundTrip_AllMetrics(self):
+        coder = RecidivizAttrCoder(RecidivizMetric)
+
+        for metric_class in DATAFLOW_METRICS_TO_TABLES:
+            for seed in range(3):
+                self.assertRoundTrip(coder, _populated_attr_object(metric_class, seed))
+
+    def testRoundTrip_AllEvents(self):
+        for event_base_class in [IncarcerationEvent, ProgramEvent, ReleaseEvent, SupervisionTimeBucket]:
+            coder = RecidivizAttrCoder(event_base_class)
+
+            for event_class in beam_utils._attr_subclasses(event_base_class):  # pylint: disable=protected-access
+                for seed in range(3):
+                    self.assertRoundTrip(coder, _populated_attr_object(event_class, seed))
+
+    def testRoundTrip_NullFields(self):
+        coder = RecidivizAttrCoder(IncarcerationMetric)
+
+        metric = IncarcerationPopulationMetric(job_id='job', state_code='US_XX', year=2000, month=1,
+                                               metric_period_months=1)
+
+        self.assertRoundTrip(coder, metric)
+
+    def testRoundTrip_MismatchedFieldTypes(self):
+        """Tests that values that don't match the types of their fields are preserved."""
+        coder = RecidivizAttrCoder(IncarcerationMetric)
+
+        metric = IncarcerationPopulationMetric(job_id='job', state_code='US_XX', year='2000', month=1.5,
+                                               metric_period_months=2 ** 70,
+                                               created_on=datetime.datetime(2000, 1, 1, 12, 30),
+                                               methodology='PERSON', race=[Race.WHITE, 'X'], person_id=True)
+
+        self.assertRoundTrip(coder, metric)
+
+    def testRoundTrip_NotAttrSubclass(self):
+        coder = RecidivizAttrCoder(IncarcerationEvent)
+
+        self.assertRoundTrip(coder, {'not': 'an event'})
+        self.assertRoundTrip(coder, IncarcerationPopulationMetric(job_id='job', state_code='US_XX', year=2000,
+                                                                  month=1, metric_period_months=1))
+
+    def testRoundTrip_ExtraAttributes(self):
+        coder = RecidivizAttrCoder(IncarcerationEvent)
+
+        event = IncarcerationAdmissionEvent(state_code='US_XX', event_date=datetime.date(2000, 1, 1),
+                                            facility='FACILITY')
+        object.__setattr__(event, 'extra_attribute', 'extra')
+
+        decoded = coder.decode(coder.encode(event))
+
+        self.assertEqual(event, decoded)
+        self.assertEqual('extra', decoded.extra_attribute)
+
+    def testRoundTrip_Nested(self):
+        coder = RecidivizAttrCoder(IncarcerationMetric)
+        metrics = [_populated_attr_object(IncarcerationPopulationMetric, seed) for seed in range(3)]
+        nested_coder = beam.coders.TupleCoder([beam.coders.VarIntCoder(), beam.coders.IterableCoder(coder)])
+
+        self.assertEqual((1, metrics), nested_coder.decode(nested_coder.encode((1, metrics))))
+
+    def testPickledCoder(self):
+        coder = RecidivizAttrCoder(IncarcerationMetric)
+        metric = _populated_attr_object(IncarcerationPopulationMetric, 1)
+        encoded = coder.encode(metric)
+
+        unpickled_coder = pickle.loads(pickle.dumps(coder))
+
+        self.assertEqual(coder, unpickled_coder)
+        self.assertEqual(metric, unpickled_coder.decode(encoded))
+        self.assertEqual(encoded, unpickled_coder.encode(metric))
+
+    def testEncodedSize(self):
+        coder = RecidivizAttrCoder(IncarcerationMetric)
+        metric = IncarcerationPopulationMetric(job_id='2020-01-01_12_00_00', state_code='US_XX', year=2000, month=1,
+                                               metric_period_months=1, methodology=MetricMethodologyType.PERSON,
+                                               created_on=datetime.date(2020, 1, 1), person_id=12345)
+
+        self.assertLess(len(coder.encode(metric)) * 5, len(beam.coders.FastPrimitivesCoder().encode(metric)))
+
+    def testRegisteredCoder(self):
+        # Registered when the incarceration pipeline is imported
+        self.assertIsNotNone(incarceration_pipeline)
+
+        for typehint in [IncarcerationMetric, IncarcerationPopulationMetric, IncarcerationEvent,
+                         IncarcerationAdmissionEvent]:
+            self.assertEqual(RecidivizAttrCoder(typehint), beam.coders.registry.get_coder(typehint))
+
+        list_coder = beam.coders.registry.get_coder(beam.typehints.List[IncarcerationEvent])
+        self.assertIn(RecidivizAttrCoder(IncarcerationEvent),
+                      list_coder._get_component_coders())  # pylint: disable=protected-access
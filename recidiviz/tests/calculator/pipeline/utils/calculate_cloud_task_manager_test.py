@@ -96,3 +96,102 @@ class TestCalculateCloudTaskManager(unittest.TestCase):
             task_id)
         mock_client.return_value.create_task.assert_called_with(
             queue_path, task)
+
+    @patch(f'{CLOUD_TASK_MANAGER_PACKAGE_NAME}.uuid')
+    @patch('google.cloud.tasks_v2.CloudTasksClient')
+    @freeze_time('2019-04-14')
+    def test_create_dataflow_monitor_task_incremental(self, mock_client, mock_uuid):
+        # Arrange
+        delay_sec = 300
+        now_utc_timestamp = int(datetime.datetime.now().timestamp())
+
+        uuid = 'random-uuid'
+        mock_uuid.uuid4.return_value = uuid
+
+        job_id = '12345'
+        location = 'fake_location'
+        topic = 'fake.topic'
+        pipeline = 'supervision'
+        project_id = 'recidiviz-456'
+        body = {
+            'project_id': project_id,
+            'job_id': job_id,
+            'location': location,
+            'topic': topic,
+            'incremental_pipeline': pipeline,
+        }
+
+        queue_path = f'queue_path/{project_id}/{QUEUES_REGION}'
+
+        task_id = '12345-2019-04-14-random-uuid'
+        task_path = f'{queue_path}/{task_id}'
+        task = tasks_v2.types.task_pb2.Task(
+            name=task_path,
+            schedule_time=timestamp_pb2.Timestamp(
+                seconds=(now_utc_timestamp + delay_sec)),
+            app_engine_http_request={
+                'http_method': 'POST',
+                'relative_uri': '/dataflow_monitor/monitor',
+                'body': json.dumps(body).encode()
+            }
+        )
+
+        mock_client.return_value.task_path.return_value = task_path
+        mock_client.return_value.queue_path.return_value = queue_path
+
+        # Act
+        CalculateCloudTaskManager(project_id=project_id). \
+            create_dataflow_monitor_task(job_id, location, topic,
+                                         incremental_pipeline=pipeline)
+
+        # Assert
+        mock_client.return_value.create_task.assert_called_with(
+            queue_path, task)
+
+    @patch(f'{CLOUD_TASK_MANAGER_PACKAGE_NAME}.uuid')
+    @patch('google.cloud.tasks_v2.CloudTasksClient')
+    @freeze_time('2019-04-14')
+    def test_create_incremental_metrics_merge_task(self, mock_client, mock_uuid):
+        # Arrange
+        uuid = 'random-uuid'
+        mock_uuid.uuid4.return_value = uuid
+
+        job_id = '12345'
+        topic = 'fake.topic'
+        pipeline = 'supervision'
+        project_id = 'recidiviz-456'
+        body = {
+            'project_id': project_id,
+            'job_id': job_id,
+            'pipeline': pipeline,
+            'topic': topic,
+        }
+
+        queue_path = f'queue_path/{project_id}/{QUEUES_REGION}'
+
+        task_id = '12345-merge-2019-04-14-random-uuid'
+        task_path = f'{queue_path}/{task_id}'
+        task = tasks_v2.types.task_pb2.Task(
+            name=task_path,
+            app_engine_http_request={
+                'http_method': 'POST',
+                'relative_uri': '/dataflow_monitor/merge_incremental_metrics',
+                'body': json.dumps(body).encode()
+            }
+        )
+
+        mock_client.return_value.task_path.return_value = task_path
+        mock_client.return_value.queue_path.return_value = queue_path
+
+        # Act
+        CalculateCloudTaskManager(project_id=project_id). \
+            create_incremental_metrics_merge_task(job_id, pipeline, topic)
+
+        # Assert
+        mock_client.return_value.task_path.assert_called_with(
+            project_id,
+            QUEUES_REGION,
+            JOB_MONITOR_QUEUE_V2,
+            task_id)
+        mock_client.return_value.create_task.assert_called_with(
+            queue_path, task)
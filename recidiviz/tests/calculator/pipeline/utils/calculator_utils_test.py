@@ -21,9 +21,13 @@ from datetime import datetime
 
 import pytest
 
+from recidiviz.calculator.pipeline.incarceration.incarceration_event import IncarcerationAdmissionEvent
+from recidiviz.calculator.pipeline.incarceration.metrics import IncarcerationAdmissionMetric, IncarcerationReleaseMetric
 from recidiviz.calculator.pipeline.utils import calculator_utils
 from recidiviz.calculator.pipeline.utils.calculator_utils import person_characteristics
 from recidiviz.common.constants.person_characteristics import Gender
+from recidiviz.common.constants.state.external_id_types import US_MO_DOC
+from recidiviz.common.constants.state.state_incarceration_period import StateIncarcerationPeriodAdmissionReason
 from recidiviz.common.constants.state.state_supervision_violation import StateSupervisionViolationType
 from recidiviz.common.constants.state.state_supervision_violation_response import \
     StateSupervisionViolationResponseDecision
@@ -519,6 +523,96 @@ class TestAddPersonCharacteristics(unittest.TestCase):
         self.assertEqual(updated_characteristics, expected_output)
 
 
+class TestPersonCharacteristicsCache(unittest.TestCase):
+    """Tests the PersonCharacteristicsCache and its use in characteristics_dict_builder."""
+    def setUp(self) -> None:
+        self.person = StatePerson.new_with_defaults(
+            state_code='US_MO',
+            person_id=12345,
+            birthdate=date(1984, 8, 31),
+            gender=Gender.FEMALE,
+            races=[
+                StatePersonRace.new_with_defaults(
+                    race=Race.ASIAN
+                )
+            ],
+            external_ids=[
+                StatePersonExternalId.new_with_defaults(
+                    external_id='DOC1341',
+                    id_type=US_MO_DOC,
+                    state_code='US_MO'
+                )
+            ])
+
+    def test_characteristics_for_metric(self):
+        cache = calculator_utils.PersonCharacteristicsCache(person=self.person, pipeline='incarceration')
+
+        characteristics = cache.characteristics_for_metric(IncarcerationAdmissionMetric, date(2010, 9, 1))
+
+        expected_output = {
+            'age_bucket': '25-29',
+            'race': [Race.ASIAN],
+            'gender': Gender.FEMALE,
+            'person_id': self.person.person_id,
+            'person_external_id': 'DOC1341'
+        }
+
+        self.assertEqual(expected_output, characteristics)
+
+    def test_characteristics_for_metric_age_bucket_by_event_date(self):
+        cache = calculator_utils.PersonCharacteristicsCache(person=self.person, pipeline='incarceration')
+
+        self.assertEqual('<25', cache.characteristics_for_metric(
+            IncarcerationAdmissionMetric, date(2008, 9, 1))['age_bucket'])
+        self.assertEqual('25-29', cache.characteristics_for_metric(
+            IncarcerationAdmissionMetric, date(2010, 9, 1))['age_bucket'])
+
+    def test_characteristics_for_metric_returns_new_dict(self):
+        cache = calculator_utils.PersonCharacteristicsCache(person=self.person, pipeline='incarceration')
+
+        characteristics = cache.characteristics_for_metric(IncarcerationAdmissionMetric, date(2010, 9, 1))
+        characteristics['metric_type'] = 'ADMISSION'
+
+        self.assertNotIn(
+            'metric_type', cache.characteristics_for_metric(IncarcerationAdmissionMetric, date(2010, 9, 1)))
+
+    def test_characteristics_dict_builder_with_cache(self):
+        cache = calculator_utils.PersonCharacteristicsCache(person=self.person, pipeline='incarceration')
+
+        event = IncarcerationAdmissionEvent(
+            state_code='US_MO',
+            event_date=date(2010, 9, 1),
+            facility='FACILITY X',
+            admission_reason=StateIncarcerationPeriodAdmissionReason.NEW_ADMISSION
+        )
+
+        for _ in range(2):
+            with_cache = calculator_utils.characteristics_dict_builder(
+                pipeline='incarceration', event=event, metric_class=IncarcerationAdmissionMetric,
+                person=self.person, event_date=event.event_date, include_person_attributes=True,
+                person_characteristics_cache=cache)
+
+            without_cache = calculator_utils.characteristics_dict_builder(
+                pipeline='incarceration', event=event, metric_class=IncarcerationAdmissionMetric,
+                person=self.person, event_date=event.event_date, include_person_attributes=True)
+
+            self.assertEqual(without_cache, with_cache)
+            self.assertEqual('FACILITY X', with_cache['facility'])
+            self.assertEqual(StateIncarcerationPeriodAdmissionReason.NEW_ADMISSION, with_cache['admission_reason'])
+
+    def test_characteristics_dict_builder_missing_event_field(self):
+        event = IncarcerationAdmissionEvent(
+            state_code='US_MO',
+            event_date=date(2010, 9, 1)
+        )
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                calculator_utils.characteristics_dict_builder(
+                    pipeline='incarceration', event=event, metric_class=IncarcerationReleaseMetric,
+                    person=self.person, event_date=event.event_date, include_person_attributes=True)
+
+
 class TestIncludeInMonthlyMetrics(unittest.TestCase):
     """Tests the include_in_monthly_metrics function."""
     def test_include_in_monthly_metrics(self):
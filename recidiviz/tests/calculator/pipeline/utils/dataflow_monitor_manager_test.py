@@ -102,9 +102,11 @@ class DataflowMonitorManagerTest(unittest.TestCase):
         assert response.status_code == HTTPStatus.OK
 
         mock_cloud_task_manager.return_value. \
-            create_dataflow_monitor_task.assert_called_with(job_id,
-                                                            location,
-                                                            topic)
+            create_dataflow_monitor_task.assert_called_with(
+                job_id,
+                location,
+                topic,
+                incremental_pipeline=None)
         mock_pubsub_helper.publish_message_to_topic.assert_not_called()
 
     @mock.patch('recidiviz.utils.metadata.project_id')
@@ -139,7 +141,8 @@ class DataflowMonitorManagerTest(unittest.TestCase):
         mock_cloud_task_manager.return_value.create_dataflow_monitor_task. \
             assert_called_with(job_id,
                                location,
-                               topic)
+                               topic,
+                               incremental_pipeline=None)
         mock_pubsub_helper.publish_message_to_topic.assert_not_called()
 
     @mock.patch('recidiviz.utils.metadata.project_id')
@@ -174,7 +177,8 @@ class DataflowMonitorManagerTest(unittest.TestCase):
         mock_cloud_task_manager.return_value.create_dataflow_monitor_task. \
             assert_called_with(job_id,
                                location,
-                               topic)
+                               topic,
+                               incremental_pipeline=None)
         mock_pubsub_helper.publish_message_to_topic.assert_not_called()
 
     @mock.patch('recidiviz.utils.metadata.project_id')
@@ -209,7 +213,8 @@ class DataflowMonitorManagerTest(unittest.TestCase):
         mock_cloud_task_manager.return_value.create_dataflow_monitor_task. \
             assert_called_with(job_id,
                                location,
-                               topic)
+                               topic,
+                               incremental_pipeline=None)
         mock_pubsub_helper.publish_message_to_topic.assert_not_called()
 
     @mock.patch('recidiviz.utils.metadata.project_id')
@@ -244,3 +249,110 @@ class DataflowMonitorManagerTest(unittest.TestCase):
         mock_cloud_task_manager.return_value.create_dataflow_monitor_task.\
             assert_not_called()
         mock_pubsub_helper.publish_message_to_topic.assert_not_called()
+
+    @mock.patch('recidiviz.utils.metadata.project_id')
+    @mock.patch(f'{MONITOR_MANAGER_PACKAGE_NAME}.pubsub_helper')
+    @mock.patch(f'{MONITOR_MANAGER_PACKAGE_NAME}.CalculateCloudTaskManager')
+    @mock.patch(f'{MONITOR_MANAGER_PACKAGE_NAME}.get_dataflow_job_with_id')
+    def test_handle_dataflow_monitor_task_incremental_success(self, mock_get_job,
+                                                              mock_cloud_task_manager,
+                                                              mock_pubsub_helper,
+                                                              mock_project_id):
+        """Tests that a task to merge the output of an incremental Dataflow
+        job is created, and that no message is published, when the
+        incremental job has successfully completed."""
+        mock_get_job.return_value = {
+            'currentState': 'JOB_STATE_DONE'
+        }
+
+        project_id = 'test-project'
+        mock_project_id.return_value = project_id
+        job_id = "12345"
+        location = "fake_location"
+        topic = 'fake_topic'
+        pipeline = 'supervision'
+        route = '/monitor'
+        data = {"job_id": job_id, "location": location, "topic": topic,
+                "incremental_pipeline": pipeline}
+
+        response = self.mock_flask_client.post(
+            route,
+            data=json.dumps(data),
+            content_type='application/json',
+            headers={'X-Appengine-Inbound-Appid': 'test-project'})
+        assert response.status_code == HTTPStatus.OK
+
+        mock_cloud_task_manager.return_value.\
+            create_incremental_metrics_merge_task.assert_called_with(job_id,
+                                                                     pipeline,
+                                                                     topic)
+        mock_cloud_task_manager.return_value.create_dataflow_monitor_task. \
+            assert_not_called()
+        mock_pubsub_helper.publish_message_to_topic.assert_not_called()
+
+    @mock.patch('recidiviz.utils.metadata.project_id')
+    @mock.patch(f'{MONITOR_MANAGER_PACKAGE_NAME}.pubsub_helper')
+    @mock.patch(f'{MONITOR_MANAGER_PACKAGE_NAME}.CalculateCloudTaskManager')
+    @mock.patch(f'{MONITOR_MANAGER_PACKAGE_NAME}.get_dataflow_job_with_id')
+    def test_handle_dataflow_monitor_task_incremental_running(self, mock_get_job,
+                                                              mock_cloud_task_manager,
+                                                              mock_pubsub_helper,
+                                                              mock_project_id):
+        """Tests that the new Dataflow monitor task created for a running
+        incremental job keeps track of the job's pipeline."""
+        mock_get_job.return_value = {
+            'currentState': 'JOB_STATE_RUNNING'
+        }
+
+        project_id = 'test-project'
+        mock_project_id.return_value = project_id
+        job_id = "12345"
+        location = "fake_location"
+        topic = 'fake_topic'
+        pipeline = 'supervision'
+        route = '/monitor'
+        data = {"job_id": job_id, "location": location, "topic": topic,
+                "incremental_pipeline": pipeline}
+
+        response = self.mock_flask_client.post(
+            route,
+            data=json.dumps(data),
+            content_type='application/json',
+            headers={'X-Appengine-Inbound-Appid': 'test-project'})
+        assert response.status_code == HTTPStatus.OK
+
+        mock_cloud_task_manager.return_value.create_dataflow_monitor_task. \
+            assert_called_with(job_id,
+                               location,
+                               topic,
+                               incremental_pipeline=pipeline)
+        mock_cloud_task_manager.return_value.\
+            create_incremental_metrics_merge_task.assert_not_called()
+        mock_pubsub_helper.publish_message_to_topic.assert_not_called()
+
+    @mock.patch('recidiviz.utils.metadata.project_id')
+    @mock.patch(f'{MONITOR_MANAGER_PACKAGE_NAME}.pubsub_helper')
+    @mock.patch(f'{MONITOR_MANAGER_PACKAGE_NAME}.merge_incremental_dataflow_metrics')
+    def test_handle_merge_incremental_metrics_task(self, mock_merge,
+                                                   mock_pubsub_helper,
+                                                   mock_project_id):
+        """Tests that the output of an incremental job is merged before a
+        message is published to the Pub/Sub topic."""
+        mock_project_id.return_value = 'test-project'
+        job_id = "12345"
+        topic = 'fake-topic'
+        pipeline = 'supervision'
+        message = 'Dataflow job {} complete'.format(job_id)
+        route = '/merge_incremental_metrics'
+        data = {"job_id": job_id, "pipeline": pipeline, "topic": topic}
+
+        response = self.mock_flask_client.post(
+            route,
+            data=json.dumps(data),
+            content_type='application/json',
+            headers={'X-Appengine-Inbound-Appid': 'test-project'})
+        assert response.status_code == HTTPStatus.OK
+
+        mock_merge.assert_called_with(job_id, pipeline)
+        mock_pubsub_helper.publish_message_to_topic.assert_called_with(
+            message, 'fake.topic')
@@ -18,7 +18,11 @@
 import unittest
 from datetime import date
 
-from recidiviz.calculator.pipeline.program.program_event import ProgramReferralEvent
+from recidiviz.calculator.pipeline.incarceration.incarceration_event import IncarcerationStaySpanEvent, \
+    IncarcerationStayEvent
+from recidiviz.calculator.pipeline.program.program_event import ProgramReferralEvent, \
+    ProgramParticipationSpanEvent, ProgramParticipationEvent
+from recidiviz.calculator.pipeline.utils.event_utils import expand_span_to_day_events
 from recidiviz.common.constants.state.state_assessment import StateAssessmentType, StateAssessmentLevel
 
 
@@ -67,3 +71,50 @@ class TestAssessmentEventMixin(unittest.TestCase):
         )
 
         self.assertIsNone(event.assessment_score_bucket)
+
+
+class TestExpandSpanToDayEvents(unittest.TestCase):
+    """Tests the expand_span_to_day_events function."""
+    def setUp(self) -> None:
+        self.span_event = ProgramParticipationSpanEvent(
+            state_code='US_XX',
+            event_date=date(2020, 1, 30),
+            end_date_exclusive=date(2020, 2, 2),
+            program_id='xxx',
+            program_location_id='yyy'
+        )
+
+    def test_expand_span_to_day_events(self):
+        day_events = expand_span_to_day_events(self.span_event, ProgramParticipationEvent)
+
+        self.assertEqual([
+            ProgramParticipationEvent(state_code='US_XX', event_date=event_date, program_id='xxx',
+                                      program_location_id='yyy')
+            for event_date in [date(2020, 1, 30), date(2020, 1, 31), date(2020, 2, 1)]
+        ], day_events)
+
+    def test_expand_span_to_day_events_bounded(self):
+        day_events = expand_span_to_day_events(self.span_event, ProgramParticipationEvent,
+                                               lower_bound_inclusive=date(2020, 1, 31),
+                                               upper_bound_inclusive=date(2020, 1, 31))
+
+        self.assertEqual([date(2020, 1, 31)], [event.event_date for event in day_events])
+
+    def test_expand_span_to_day_events_bounds_outside_span(self):
+        day_events = expand_span_to_day_events(self.span_event, ProgramParticipationEvent,
+                                               lower_bound_inclusive=date(2020, 2, 2))
+
+        self.assertEqual([], day_events)
+
+    def test_span_events_expand_with_shared_helper(self):
+        stay_span_event = IncarcerationStaySpanEvent(
+            state_code='US_XX',
+            event_date=date(2020, 1, 30),
+            end_date_exclusive=date(2020, 2, 1),
+            facility='PRISON'
+        )
+
+        self.assertEqual(expand_span_to_day_events(stay_span_event, IncarcerationStayEvent),
+                         stay_span_event.stay_events())
+        self.assertEqual(expand_span_to_day_events(self.span_event, ProgramParticipationEvent, date(2020, 1, 31)),
+                         self.span_event.participation_events(date(2020, 1, 31)))
@@ -33,8 +33,9 @@ from freezegun import freeze_time
 
 from recidiviz.calculator.pipeline.utils import execution_utils
 from recidiviz.calculator.pipeline.utils.execution_utils import person_and_kwargs_for_identifier, \
-    select_all_by_person_query, select_all_query
-from recidiviz.persistence.entity.state.entities import StatePerson, StateAssessment
+    select_all_by_person_query, select_all_query, changed_person_ids_query, incremental_run_person_id_filter_query
+from recidiviz.calculator.pipeline.utils.incarceration_period_utils import PreProcessedIncarcerationPeriods
+from recidiviz.persistence.entity.state.entities import StatePerson, StateAssessment, StateIncarcerationPeriod
 
 
 class TestGetJobID(unittest.TestCase):
@@ -185,6 +186,34 @@ class TestPersonAndKwargsForIdentifier(unittest.TestCase):
         self.assertEqual(person, person_input)
         self.assertEqual(expected_kwargs, kwargs)
 
+    def test_person_and_kwargs_for_identifier_pre_processed_incarceration_periods(self):
+        person_input = StatePerson.new_with_defaults(
+            person_id=123
+        )
+
+        incarceration_period = StateIncarcerationPeriod.new_with_defaults(
+            state_code='US_XX',
+            admission_date=datetime.date(2008, 11, 20)
+        )
+
+        pre_processed_incarceration_periods = PreProcessedIncarcerationPeriods('US_XX', [incarceration_period])
+
+        arg_to_entities_map = {
+            'person': iter([person_input]),
+            'incarceration_periods': iter([incarceration_period]),
+            'pre_processed_incarceration_periods': iter([pre_processed_incarceration_periods])
+        }
+
+        person, kwargs = person_and_kwargs_for_identifier(arg_to_entities_map)
+
+        expected_kwargs = {
+            'incarceration_periods': [incarceration_period],
+            'pre_processed_incarceration_periods': pre_processed_incarceration_periods
+        }
+
+        self.assertEqual(person, person_input)
+        self.assertEqual(expected_kwargs, kwargs)
+
     def test_person_and_kwargs_for_identifier_two_people_same_id(self):
         person_input_1 = StatePerson.new_with_defaults(
             person_id=123
@@ -289,3 +318,86 @@ class TestSelectAllQuery(unittest.TestCase):
                                                           state_code_filter='US_XX',
                                                           unifying_id_field='field_name',
                                                           unifying_id_field_filter_set={1234, 56}))
+
+    def test_select_all_with_ids_filter_query(self):
+        filter_query = 'SELECT person_id FROM `project-id.my_dataset.changed`'
+        expected_query = \
+            'SELECT * FROM `project-id.my_dataset.TABLE_WHERE_DATA_IS` ' \
+            'WHERE person_id IN (SELECT person_id FROM (SELECT person_id FROM `project-id.my_dataset.changed`)) ' \
+            'AND state_code IN (\'US_XX\')'
+
+        self.assertEqual(expected_query,
+                         select_all_by_person_query(self.dataset,
+                                                    self.table_id,
+                                                    state_code_filter='US_XX',
+                                                    person_id_filter_set=None,
+                                                    person_id_filter_query=filter_query))
+
+    def test_select_all_with_ids_filter_set_and_query(self):
+        filter_query = 'SELECT field_name FROM `project-id.my_dataset.changed`'
+        expected_query = \
+            'SELECT * FROM `project-id.my_dataset.TABLE_WHERE_DATA_IS` ' \
+            'WHERE field_name IN (1234) ' \
+            'AND field_name IN (SELECT field_name FROM (SELECT field_name FROM `project-id.my_dataset.changed`))'
+
+        self.assertEqual(expected_query, select_all_query(self.dataset, self.table_id,
+                                                          state_code_filter=None,
+                                                          unifying_id_field='field_name',
+                                                          unifying_id_field_filter_set={1234},
+                                                          unifying_id_field_filter_query=filter_query))
+
+    def test_select_all_with_ids_filter_query_no_unifying_id_field(self):
+        with pytest.raises(ValueError):
+            select_all_query(self.dataset, self.table_id,
+                             state_code_filter=None,
+                             unifying_id_field=None,
+                             unifying_id_field_filter_set=None,
+                             unifying_id_field_filter_query='SELECT field_name FROM `project-id.my_dataset.changed`')
+
+
+class TestIncrementalRunPersonIdFilterQuery(unittest.TestCase):
+    """Tests for the changed_person_ids_query and incremental_run_person_id_filter_query functions."""
+
+    def setUp(self) -> None:
+        self.dataset = 'project-id.state'
+
+    def test_changed_person_ids_query(self):
+        query = changed_person_ids_query(self.dataset, state_code_filter='US_XX', lookback_days=3)
+
+        self.assertTrue(query.startswith('SELECT DISTINCT person_id, state_code FROM ('))
+        self.assertIn('SELECT person_id, state_code FROM `project-id.state.state_person_history` '
+                      'WHERE (DATE(valid_from) >= DATE_SUB(CURRENT_DATE(), INTERVAL 3 DAY) '
+                      'OR DATE(valid_to) >= DATE_SUB(CURRENT_DATE(), INTERVAL 3 DAY)) '
+                      'AND state_code IN (\'US_XX\')', query)
+        self.assertIn('`project-id.state.state_incarceration_period_history`', query)
+        self.assertIn('`project-id.state.state_supervision_period_history`', query)
+
+    def test_changed_person_ids_query_no_state_code_filter(self):
+        query = changed_person_ids_query(self.dataset, state_code_filter=None, lookback_days=0)
+
+        self.assertIn('INTERVAL 0 DAY', query)
+        self.assertNotIn('state_code IN', query)
+
+    def test_changed_person_ids_query_negative_lookback(self):
+        with pytest.raises(ValueError):
+            changed_person_ids_query(self.dataset, state_code_filter=None, lookback_days=-1)
+
+    def test_incremental_run_person_id_filter_query(self):
+        self.assertEqual(changed_person_ids_query(self.dataset, 'US_XX', 3),
+                         incremental_run_person_id_filter_query('incarceration', self.dataset, 'US_XX', ['ALL'], 3))
+
+    def test_incremental_run_person_id_filter_query_not_incremental(self):
+        self.assertIsNone(incremental_run_person_id_filter_query(
+            'incarceration', self.dataset, 'US_XX', ['POPULATION'], None))
+
+    def test_incremental_run_person_id_filter_query_not_all_metrics(self):
+        with pytest.raises(ValueError):
+            incremental_run_person_id_filter_query('incarceration', self.dataset, 'US_XX', ['POPULATION'], 3)
+
+    def test_incremental_run_person_id_filter_query_pipeline_with_aggregate_metrics(self):
+        for pipeline in ['supervision', 'combined']:
+            with pytest.raises(ValueError):
+                incremental_run_person_id_filter_query(pipeline, self.dataset, 'US_XX', ['ALL'], 3)
+
+    def test_incremental_run_person_id_filter_query_pipeline_with_aggregate_metrics_not_incremental(self):
+        self.assertIsNone(incremental_run_person_id_filter_query('supervision', self.dataset, 'US_XX', ['ALL'], None))
@@ -280,11 +280,11 @@ class TestIdentifyMonthsFullyIncarcerated(unittest.TestCase):
         self.assertEqual(incarceration_period_index.months_fully_incarcerated, set())
 
 
-class TestIndexMonthToOverlappingIncarcerationPeriods(unittest.TestCase):
-    """Tests the month_to_overlapping_incarceration_periods initialization function."""
+class TestIndexIncarcerationCoverage(unittest.TestCase):
+    """Tests the incarceration_coverage initialization function."""
     def test_no_periods(self):
         index = IncarcerationPeriodIndex([])
-        self.assertEqual(index.month_to_overlapping_incarceration_periods, {})
+        self.assertEqual(index.incarceration_coverage, [])
 
     def test_one_period_start_end_middle_of_months(self):
         incarceration_period = \
@@ -300,18 +300,9 @@ class TestIndexMonthToOverlappingIncarcerationPeriods(unittest.TestCase):
 
         index = IncarcerationPeriodIndex([incarceration_period])
 
-        expected = {
-            2007: {
-                12: [incarceration_period]
-            },
-            2008: {
-                1: [incarceration_period],
-                2: [incarceration_period],
-                3: [incarceration_period]
-            },
-        }
+        expected = [TimeRange(date(2007, 12, 2), date(2008, 3, 28))]
 
-        self.assertEqual(index.month_to_overlapping_incarceration_periods, expected)
+        self.assertEqual(index.incarceration_coverage, expected)
 
     def test_one_period_start_end_exactly_on_month(self):
         incarceration_period = \
@@ -327,16 +318,9 @@ class TestIndexMonthToOverlappingIncarcerationPeriods(unittest.TestCase):
 
         index = IncarcerationPeriodIndex([incarceration_period])
 
-        expected = {
-            2007: {
-                12: [incarceration_period]
-            },
-            2008: {
-                1: [incarceration_period]
-            },
-        }
+        expected = [TimeRange(date(2007, 12, 1), date(2008, 2, 1))]
 
-        self.assertEqual(index.month_to_overlapping_incarceration_periods, expected)
+        self.assertEqual(index.incarceration_coverage, expected)
 
     @freeze_time('2008-04-01')
     def test_period_no_termination(self):
@@ -352,19 +336,9 @@ class TestIndexMonthToOverlappingIncarcerationPeriods(unittest.TestCase):
 
         index = IncarcerationPeriodIndex([incarceration_period])
 
-        expected = {
-            2007: {
-                12: [incarceration_period]
-            },
-            2008: {
-                1: [incarceration_period],
-                2: [incarceration_period],
-                3: [incarceration_period],
-                4: [incarceration_period],
-            },
-        }
+        expected = [TimeRange(date(2007, 12, 1), date(2008, 4, 2))]
 
-        self.assertEqual(index.month_to_overlapping_incarceration_periods, expected)
+        self.assertEqual(index.incarceration_coverage, expected)
 
     @freeze_time('2008-04-01')
     def test_period_no_release_date_not_in_custody(self):
@@ -406,19 +380,10 @@ class TestIndexMonthToOverlappingIncarcerationPeriods(unittest.TestCase):
 
         index = IncarcerationPeriodIndex([incarceration_period, incarceration_period_2])
 
-        expected = {
-            2007: {
-                12: [incarceration_period]
-            },
-            2008: {
-                1: [incarceration_period],
-                2: [incarceration_period, incarceration_period_2],
-                3: [incarceration_period_2],
-                4: [incarceration_period_2]
-            },
-        }
+        expected = [TimeRange(date(2007, 12, 1), date(2008, 2, 2)),
+                    TimeRange(date(2008, 2, 4), date(2008, 4, 5))]
 
-        self.assertEqual(index.month_to_overlapping_incarceration_periods, expected)
+        self.assertEqual(index.incarceration_coverage, expected)
 
     def test_period_starts_ends_same_month(self):
         incarceration_period = \
@@ -434,13 +399,48 @@ class TestIndexMonthToOverlappingIncarcerationPeriods(unittest.TestCase):
 
         index = IncarcerationPeriodIndex([incarceration_period])
 
-        expected = {
-            2008: {
-                2: [incarceration_period],
-            },
-        }
+        expected = [TimeRange(date(2008, 2, 4), date(2008, 2, 5))]
 
-        self.assertEqual(index.month_to_overlapping_incarceration_periods, expected)
+        self.assertEqual(index.incarceration_coverage, expected)
+
+    def test_overlapping_and_adjacent_periods_merged(self):
+        incarceration_period = \
+            StateIncarcerationPeriod.new_with_defaults(
+                incarceration_period_id=444,
+                external_id='ip4',
+                state_code='US_XX',
+                admission_date=date(2008, 1, 10),
+                admission_reason=AdmissionReason.NEW_ADMISSION,
+                release_date=date(2008, 2, 2),
+                release_reason=ReleaseReason.TRANSFER
+            )
+
+        incarceration_period_2 = \
+            StateIncarcerationPeriod.new_with_defaults(
+                incarceration_period_id=555,
+                external_id='ip5',
+                state_code='US_XX',
+                admission_date=date(2008, 2, 2),
+                admission_reason=AdmissionReason.TRANSFER,
+                release_date=date(2008, 4, 5),
+                release_reason=ReleaseReason.TRANSFER
+            )
+
+        incarceration_period_3 = \
+            StateIncarcerationPeriod.new_with_defaults(
+                incarceration_period_id=666,
+                external_id='ip6',
+                state_code='US_XX',
+                admission_date=date(2008, 3, 1),
+                admission_reason=AdmissionReason.TRANSFER,
+                release_date=date(2008, 3, 15),
+                release_reason=ReleaseReason.SENTENCE_SERVED
+            )
+
+        index = IncarcerationPeriodIndex([incarceration_period, incarceration_period_2, incarceration_period_3])
+
+        self.assertEqual(index.incarceration_coverage, [TimeRange(date(2008, 1, 10), date(2008, 4, 5))])
+        self.assertEqual(index.months_fully_incarcerated, {(2008, 2), (2008, 3)})
 
 
 class TestIsFullyIncarceratedForRange(unittest.TestCase):
@@ -837,3 +837,81 @@ class TestIsFullyIncarceratedForRange(unittest.TestCase):
             range_end_num_days_from_periods_end=5,
             is_fully_incarcerated=False
         )
+
+
+class TestHasRevocationAdmissionOnDate(unittest.TestCase):
+    """Tests the has_revocation_admission_on_date function."""
+
+    def setUp(self) -> None:
+        self.new_admission_period = \
+            StateIncarcerationPeriod.new_with_defaults(
+                incarceration_period_id=111,
+                external_id='ip1',
+                state_code='US_XX',
+                admission_date=date(2007, 2, 5),
+                admission_reason=AdmissionReason.NEW_ADMISSION,
+                release_date=date(2007, 6, 8),
+                release_reason=ReleaseReason.CONDITIONAL_RELEASE
+            )
+
+        self.revocation_period = \
+            StateIncarcerationPeriod.new_with_defaults(
+                incarceration_period_id=222,
+                external_id='ip2',
+                state_code='US_XX',
+                admission_date=date(2008, 2, 8),
+                admission_reason=AdmissionReason.PAROLE_REVOCATION,
+                release_date=date(2008, 3, 15),
+                release_reason=ReleaseReason.SENTENCE_SERVED
+            )
+
+    def test_has_revocation_admission_on_date(self):
+        index = IncarcerationPeriodIndex([self.revocation_period, self.new_admission_period])
+
+        self.assertEqual({date(2008, 2, 8)}, index.revocation_admission_dates)
+        self.assertTrue(index.has_revocation_admission_on_date(date(2008, 2, 8)))
+        self.assertFalse(index.has_revocation_admission_on_date(date(2007, 2, 5)))
+        self.assertFalse(index.has_revocation_admission_on_date(date(2008, 2, 9)))
+
+    def test_has_revocation_admission_on_date_no_periods(self):
+        index = IncarcerationPeriodIndex([])
+
+        self.assertFalse(index.has_revocation_admission_on_date(date(2008, 2, 8)))
+
+
+class TestIncarcerationAdmissionsBetweenDates(unittest.TestCase):
+    """Tests the incarceration_admissions_between_dates function."""
+
+    def setUp(self) -> None:
+        incarceration_period = \
+            StateIncarcerationPeriod.new_with_defaults(
+                incarceration_period_id=111,
+                external_id='ip1',
+                state_code='US_XX',
+                admission_date=date(2007, 2, 5),
+                admission_reason=AdmissionReason.NEW_ADMISSION,
+                release_date=date(2007, 6, 8),
+                release_reason=ReleaseReason.CONDITIONAL_RELEASE
+            )
+
+        incarceration_period_2 = \
+            StateIncarcerationPeriod.new_with_defaults(
+                incarceration_period_id=222,
+                external_id='ip2',
+                state_code='US_XX',
+                admission_date=date(2008, 2, 8),
+                admission_reason=AdmissionReason.PAROLE_REVOCATION,
+                release_date=date(2008, 3, 15),
+                release_reason=ReleaseReason.SENTENCE_SERVED
+            )
+
+        self.index = IncarcerationPeriodIndex([incarceration_period, incarceration_period_2])
+
+    def test_incarceration_admissions_between_dates(self):
+        self.assertTrue(self.index.incarceration_admissions_between_dates(date(2007, 2, 5), date(2007, 2, 6)))
+        self.assertTrue(self.index.incarceration_admissions_between_dates(date(2007, 3, 1), date(2009, 1, 1)))
+
+    def test_incarceration_admissions_between_dates_none_in_window(self):
+        self.assertFalse(self.index.incarceration_admissions_between_dates(date(2007, 2, 6), date(2008, 2, 8)))
+        self.assertFalse(self.index.incarceration_admissions_between_dates(date(2008, 2, 9), date(2010, 1, 1)))
+        self.assertFalse(self.index.incarceration_admissions_between_dates(date(2000, 1, 1), date(2007, 2, 5)))
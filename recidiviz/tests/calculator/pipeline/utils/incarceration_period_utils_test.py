@@ -27,7 +27,7 @@ from recidiviz.calculator.pipeline.utils.incarceration_period_utils import \
     drop_placeholder_periods, \
     prepare_incarceration_periods_for_calculations, \
     collapse_temporary_custody_and_revocation_periods, drop_periods_not_under_state_custodial_authority, \
-    _infer_missing_dates_and_statuses
+    _infer_missing_dates_and_statuses, PreProcessedIncarcerationPeriods
 from recidiviz.common.constants.state.state_incarceration import StateIncarcerationType
 from recidiviz.common.constants.state.state_incarceration_period import \
     StateIncarcerationPeriodStatus, StateIncarcerationFacilitySecurityLevel, StateSpecializedPurposeForIncarceration
@@ -1308,6 +1308,39 @@ class TestPrepareIncarcerationPeriodsForCalculations(unittest.TestCase):
             second_incarceration_period,
             third_incarceration_period])
 
+    def test_sort_incarceration_periods_release_only_period_on_admission_day(self):
+        """A period with only a release_date sorts after a period admitted on that day, even when the external_id of
+        the admitted period sorts after it."""
+        state_code = 'US_XX'
+        release_only_period = \
+            StateIncarcerationPeriod.new_with_defaults(
+                incarceration_period_id=1111,
+                external_id='ip0',
+                incarceration_type=StateIncarcerationType.STATE_PRISON,
+                status=StateIncarcerationPeriodStatus.NOT_IN_CUSTODY,
+                state_code=state_code,
+                release_date=date(2020, 1, 1),
+                release_reason=ReleaseReason.SENTENCE_SERVED)
+
+        admitted_period = \
+            StateIncarcerationPeriod.new_with_defaults(
+                incarceration_period_id=2222,
+                external_id='ip1',
+                incarceration_type=StateIncarcerationType.STATE_PRISON,
+                status=StateIncarcerationPeriodStatus.NOT_IN_CUSTODY,
+                state_code=state_code,
+                admission_date=date(2020, 1, 1),
+                admission_reason=AdmissionReason.NEW_ADMISSION,
+                release_date=date(2020, 1, 4),
+                release_reason=ReleaseReason.SENTENCE_SERVED)
+
+        incarceration_periods = [release_only_period, admitted_period]
+
+        # pylint: disable=protected-access
+        utils._sort_ips_by_set_dates_and_statuses(incarceration_periods)
+
+        self.assertEqual([admitted_period, release_only_period], incarceration_periods)
+
     def test_collapse_incarceration_periods(self):
         state_code = 'US_XX'
         initial_incarceration_period = \
@@ -1597,6 +1630,104 @@ class TestPrepareIncarcerationPeriodsForCalculations(unittest.TestCase):
         self.assertEqual(validated_incarceration_periods, [valid_incarceration_period])
 
 
+class TestPreProcessedIncarcerationPeriods(unittest.TestCase):
+    """Tests the PreProcessedIncarcerationPeriods class."""
+
+    def setUp(self):
+        self.state_code = 'US_XX'
+        self.initial_incarceration_period = \
+            StateIncarcerationPeriod.new_with_defaults(
+                incarceration_period_id=1111,
+                external_id='1',
+                incarceration_type=StateIncarcerationType.STATE_PRISON,
+                status=StateIncarcerationPeriodStatus.NOT_IN_CUSTODY,
+                state_code=self.state_code,
+                facility='PRISON A',
+                admission_date=date(2008, 11, 20),
+                admission_reason=AdmissionReason.NEW_ADMISSION,
+                release_date=date(2010, 12, 4),
+                release_reason=ReleaseReason.TRANSFER)
+
+        self.transfer_incarceration_period = \
+            StateIncarcerationPeriod.new_with_defaults(
+                incarceration_period_id=2222,
+                external_id='2',
+                incarceration_type=StateIncarcerationType.STATE_PRISON,
+                status=StateIncarcerationPeriodStatus.NOT_IN_CUSTODY,
+                state_code=self.state_code,
+                facility='PRISON B',
+                admission_date=date(2010, 12, 4),
+                admission_reason=AdmissionReason.TRANSFER,
+                release_date=date(2014, 4, 14),
+                release_reason=ReleaseReason.SENTENCE_SERVED)
+
+    def test_periods_for_calculations(self):
+        pre_processed_periods = PreProcessedIncarcerationPeriods(
+            self.state_code, [self.transfer_incarceration_period, self.initial_incarceration_period])
+
+        uncollapsed_periods = pre_processed_periods.periods_for_calculations(
+            collapse_transfers=False,
+            collapse_temporary_custody_periods_with_revocation=False,
+            collapse_transfers_with_different_pfi=False,
+            overwrite_facility_information_in_transfers=False)
+
+        self.assertEqual([self.initial_incarceration_period, self.transfer_incarceration_period],
+                         uncollapsed_periods)
+
+        collapsed_periods = pre_processed_periods.periods_for_calculations(
+            collapse_transfers=True,
+            collapse_temporary_custody_periods_with_revocation=False,
+            collapse_transfers_with_different_pfi=True,
+            overwrite_facility_information_in_transfers=False)
+
+        collapsed_periods_overwrite_facility = pre_processed_periods.periods_for_calculations(
+            collapse_transfers=True,
+            collapse_temporary_custody_periods_with_revocation=False,
+            collapse_transfers_with_different_pfi=True,
+            overwrite_facility_information_in_transfers=True)
+
+        self.assertEqual(1, len(collapsed_periods))
+        self.assertEqual('PRISON A', collapsed_periods[0].facility)
+        self.assertEqual(date(2014, 4, 14), collapsed_periods[0].release_date)
+
+        self.assertEqual(1, len(collapsed_periods_overwrite_facility))
+        self.assertEqual('PRISON B', collapsed_periods_overwrite_facility[0].facility)
+
+        # Collapsing does not modify the shared sorted periods
+        self.assertEqual('PRISON A', self.initial_incarceration_period.facility)
+        self.assertEqual(date(2010, 12, 4), self.initial_incarceration_period.release_date)
+
+    def test_periods_for_calculations_cached(self):
+        pre_processed_periods = PreProcessedIncarcerationPeriods(
+            self.state_code, [self.initial_incarceration_period, self.transfer_incarceration_period])
+
+        collapsed_periods = pre_processed_periods.periods_for_calculations(
+            collapse_transfers=True,
+            collapse_temporary_custody_periods_with_revocation=True,
+            collapse_transfers_with_different_pfi=True,
+            overwrite_facility_information_in_transfers=True)
+
+        # Modifying the returned list does not change the cached periods
+        collapsed_periods.clear()
+
+        cached_collapsed_periods = pre_processed_periods.periods_for_calculations(
+            collapse_transfers=True,
+            collapse_temporary_custody_periods_with_revocation=True,
+            collapse_transfers_with_different_pfi=True,
+            overwrite_facility_information_in_transfers=True)
+
+        self.assertEqual(1, len(cached_collapsed_periods))
+
+    def test_periods_for_calculations_no_periods(self):
+        pre_processed_periods = PreProcessedIncarcerationPeriods(self.state_code, [])
+
+        self.assertEqual([], pre_processed_periods.periods_for_calculations(
+            collapse_transfers=True,
+            collapse_temporary_custody_periods_with_revocation=True,
+            collapse_transfers_with_different_pfi=True,
+            overwrite_facility_information_in_transfers=True))
+
+
 class TestUsNdPrepareIncarcerationPeriodsForCalculations(unittest.TestCase):
     """Tests the prepare_incarceration_periods_for_calculations function for ND specific functions."""
 
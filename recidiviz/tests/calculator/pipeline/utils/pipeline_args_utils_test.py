@@ -28,7 +28,8 @@ class TestPipelineArgsUtils(unittest.TestCase):
     DEFAULT_INCARCERATION_PIPELINE_ARGS =   \
         Namespace(calculation_month_count=1, calculation_end_month=None,
                   data_input='state', output='dataflow_metrics', metric_types={'ALL'},
-                  person_filter_ids=None, reference_input='reference_views', state_code=None)
+                  person_filter_ids=None, incremental_lookback_days=None,
+                  reference_input='reference_views', state_code=None)
 
     DEFAULT_APACHE_BEAM_OPTIONS_DICT = {
         'runner': 'DataflowRunner',
@@ -101,7 +102,8 @@ class TestPipelineArgsUtils(unittest.TestCase):
         expected_incarceration_pipeline_args = \
             Namespace(calculation_month_count=6, calculation_end_month='2009-07',
                       data_input='county', output='dataflow_metrics_2', metric_types={'ALL'},
-                      person_filter_ids=None, reference_input='reference_views_2', state_code=None)
+                      person_filter_ids=None, incremental_lookback_days=None,
+                      reference_input='reference_views_2', state_code=None)
 
         self.assertEqual(incarceration_pipeline_args, expected_incarceration_pipeline_args)
 
@@ -146,6 +148,24 @@ class TestPipelineArgsUtils(unittest.TestCase):
         self.assertEqual(incarceration_pipeline_args, expected_incarceration_pipeline_args)
         self.assertEqual(pipeline_options.get_all_options(drop_default=True), self.DEFAULT_APACHE_BEAM_OPTIONS_DICT)
 
+    def test_incarceration_pipeline_specify_incremental_lookback_days(self):
+        # Arrange
+        argv = ['--job_name', 'incarceration-args-test',
+                '--project', 'recidiviz-staging',
+                '--incremental_lookback_days', '2',
+                '--setup_file', './setup.py']
+
+        # Act
+        incarceration_pipeline_args, apache_beam_args = incarceration_pipeline.get_arg_parser().parse_known_args(argv)
+        pipeline_options = get_apache_beam_pipeline_options_from_args(apache_beam_args)
+
+        # Assert
+        expected_incarceration_pipeline_args = Namespace(**self.DEFAULT_INCARCERATION_PIPELINE_ARGS.__dict__)
+        expected_incarceration_pipeline_args.incremental_lookback_days = 2
+
+        self.assertEqual(incarceration_pipeline_args, expected_incarceration_pipeline_args)
+        self.assertEqual(pipeline_options.get_all_options(drop_default=True), self.DEFAULT_APACHE_BEAM_OPTIONS_DICT)
+
 
     def test_incarceration_pipeline_args_additional_bad_arg(self):
         # Arrange
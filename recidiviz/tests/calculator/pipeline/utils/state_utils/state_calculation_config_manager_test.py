@@ -0,0 +1,134 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2020 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for the StateCalculationConfig in state_calculation_config_manager.py"""
+import unittest
+from datetime import date
+
+from recidiviz.calculator.pipeline.utils.state_utils import state_calculation_config_manager
+from recidiviz.calculator.pipeline.utils.state_utils.state_calculation_config_manager import \
+    get_state_calculation_config, get_supervision_district_from_supervision_period
+from recidiviz.calculator.pipeline.utils.state_utils.us_id.us_id_supervision_compliance import \
+    us_id_case_compliance_on_date
+from recidiviz.calculator.pipeline.utils.state_utils.us_mo import us_mo_violation_utils
+from recidiviz.common.constants.state.state_incarceration_period import StateIncarcerationPeriodAdmissionReason
+from recidiviz.common.constants.state.state_supervision_period import StateSupervisionPeriodSupervisionType
+from recidiviz.persistence.entity.state.entities import StateSupervisionPeriod, StateIncarcerationPeriod, \
+    StateSupervisionViolationResponse
+
+
+class TestGetStateCalculationConfig(unittest.TestCase):
+    """Tests the get_state_calculation_config function."""
+
+    def test_get_state_calculation_config_cached(self):
+        self.assertIs(get_state_calculation_config('US_MO'), get_state_calculation_config('US_MO'))
+        self.assertIsNot(get_state_calculation_config('US_MO'), get_state_calculation_config('US_ND'))
+
+    def test_get_state_calculation_config_flags(self):
+        for state_code in ('US_ID', 'US_MO', 'US_ND', 'US_PA', 'US_XX'):
+            config = get_state_calculation_config(state_code)
+
+            self.assertEqual(state_code, config.state_code)
+            self.assertEqual(state_calculation_config_manager.supervision_types_distinct_for_state(state_code),
+                             config.supervision_types_distinct)
+            self.assertEqual(
+                state_calculation_config_manager.default_to_supervision_period_officer_for_revocation_details_for_state(
+                    state_code),
+                config.default_to_supervision_period_officer_for_revocation_details)
+            self.assertEqual(state_calculation_config_manager.temporary_custody_periods_under_state_authority(
+                state_code), config.temporary_custody_periods_under_state_authority)
+            self.assertEqual(state_calculation_config_manager.non_prison_periods_under_state_authority(state_code),
+                             config.non_prison_periods_under_state_authority)
+            self.assertEqual(state_calculation_config_manager.investigation_periods_in_supervision_population(
+                state_code), config.investigation_periods_in_supervision_population)
+            self.assertEqual(state_calculation_config_manager.only_state_custodial_authority_in_supervision_population(
+                state_code), config.only_state_custodial_authority_in_supervision_population)
+            self.assertEqual(
+                state_calculation_config_manager.should_collapse_transfers_different_purpose_for_incarceration(
+                    state_code),
+                config.should_collapse_transfers_different_purpose_for_incarceration)
+            self.assertEqual(state_calculation_config_manager.include_decisions_on_follow_up_responses(state_code),
+                             config.include_decisions_on_follow_up_responses)
+            self.assertEqual(
+                state_calculation_config_manager.second_assessment_on_supervision_is_more_reliable(state_code),
+                config.second_assessment_on_supervision_is_more_reliable)
+
+    def test_get_state_calculation_config_strategies(self):
+        us_mo_config = get_state_calculation_config('US_MO')
+        us_id_config = get_state_calculation_config('US_ID')
+        us_nd_config = get_state_calculation_config('US_ND')
+
+        self.assertEqual(us_mo_violation_utils.normalize_violations_on_responses,
+                         us_mo_config.normalize_violations_on_response)
+        self.assertEqual(us_mo_violation_utils.get_ranked_violation_type_and_subtype_counts,
+                         us_mo_config.get_ranked_violation_type_and_subtype_counts)
+        self.assertEqual(us_id_case_compliance_on_date, us_id_config.get_case_compliance_on_date)
+
+        response = StateSupervisionViolationResponse.new_with_defaults(state_code='US_ND')
+
+        self.assertIs(response, us_nd_config.normalize_violations_on_response(response))
+        self.assertEqual({}, us_nd_config.get_ranked_violation_type_and_subtype_counts([], []))
+        self.assertIsNone(us_nd_config.get_case_compliance_on_date(None, None, None, None, [], []))
+
+
+class TestStateSpecificDispatch(unittest.TestCase):
+    """Tests that the state-specific dispatch functions delegate to the state's StateCalculationConfig."""
+
+    def test_get_supervision_district_from_supervision_period(self):
+        for state_code, expected_district in (('US_ID', 'DISTRICT 1'), ('US_PA', 'DISTRICT 1'),
+                                              ('US_ND', 'DISTRICT 1|OFFICE 2')):
+            supervision_period = StateSupervisionPeriod.new_with_defaults(
+                state_code=state_code,
+                supervision_site='DISTRICT 1|OFFICE 2'
+            )
+
+            self.assertEqual(expected_district, get_supervision_district_from_supervision_period(supervision_period))
+
+    def test_get_supervision_district_from_supervision_period_no_site(self):
+        supervision_period = StateSupervisionPeriod.new_with_defaults(state_code='US_ID')
+
+        self.assertIsNone(get_supervision_district_from_supervision_period(supervision_period))
+
+    def test_get_month_supervision_type_us_id(self):
+        supervision_period = StateSupervisionPeriod.new_with_defaults(
+            state_code='US_ID',
+            start_date=date(2018, 1, 1),
+            supervision_period_supervision_type=StateSupervisionPeriodSupervisionType.PAROLE
+        )
+
+        self.assertEqual(StateSupervisionPeriodSupervisionType.PAROLE,
+                         state_calculation_config_manager.get_month_supervision_type(
+                             date(2018, 3, 5), [], [], supervision_period))
+
+    def test_revoked_supervision_periods_if_revocation_occurred(self):
+        supervision_period = StateSupervisionPeriod.new_with_defaults(
+            state_code='US_ND',
+            start_date=date(2018, 1, 1),
+            termination_date=date(2018, 6, 1)
+        )
+
+        incarceration_period = StateIncarcerationPeriod.new_with_defaults(
+            state_code='US_ND',
+            admission_date=date(2018, 6, 1),
+            admission_reason=StateIncarcerationPeriodAdmissionReason.PROBATION_REVOCATION
+        )
+
+        admission_is_revocation, revoked_periods = \
+            state_calculation_config_manager.revoked_supervision_periods_if_revocation_occurred(
+                incarceration_period, [supervision_period], None)
+
+        self.assertTrue(admission_is_revocation)
+        self.assertEqual([supervision_period], revoked_periods)
@@ -0,0 +1,171 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2020 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for covid_aggregator.py, run over synthetic versions of each of the source files."""
+import csv
+import datetime
+import os
+import unittest
+from io import StringIO
+from typing import Any, List
+
+import xlrd
+from mock import Mock, patch
+
+from recidiviz.cloud_functions.covid import covid_aggregator
+
+_FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+_EMPTY = 0
+_TEXT = 1
+_NUMBER = 2
+_DATE = 3
+
+
+def _fixture_path(filename: str) -> str:
+    return os.path.join(_FIXTURES_DIR, filename)
+
+
+class _FakeCell:
+    """Stands in for an xlrd Cell."""
+
+    def __init__(self, ctype: int, value: Any):
+        self.ctype = ctype
+        self.value = value
+
+
+class _FakeSheet:
+    """Stands in for an xlrd Sheet with the given rows of cells."""
+
+    def __init__(self, name: str, rows: List[List[_FakeCell]]):
+        self.name = name
+        self._rows = rows
+        self.nrows = len(rows)
+
+    def row(self, rowx: int) -> List[_FakeCell]:
+        return self._rows[rowx]
+
+    def col_slice(self, colx: int, start_rowx: int = 0) -> List[_FakeCell]:
+        return [row[colx] for row in self._rows[start_rowx:]]
+
+
+class _FakeBook:
+    """Stands in for an xlrd Book with the given sheets."""
+
+    datemode = 0
+
+    def __init__(self, sheets: List[_FakeSheet]):
+        self._sheets = sheets
+
+    def sheets(self) -> List[_FakeSheet]:
+        return self._sheets
+
+
+def _text(value: str) -> _FakeCell:
+    return _FakeCell(_TEXT, value)
+
+
+def _number(value: float) -> _FakeCell:
+    return _FakeCell(_NUMBER, value)
+
+
+def _date(value: datetime.date) -> _FakeCell:
+    return _FakeCell(_DATE,
+                     xlrd.xldate.xldate_from_date_tuple((value.year, value.month, value.day), _FakeBook.datemode))
+
+
+def _empty() -> _FakeCell:
+    return _FakeCell(_EMPTY, '')
+
+
+def _ucla_workbook() -> _FakeBook:
+    """Returns a UCLA workbook with a summary sheet and two data sheets whose columns are in different orders, the
+    earlier of which is missing some of the columns. Number cells are read as floats, which the aggregator does not
+    parse as counts, so the counts that should be picked up are in text cells."""
+    summary_sheet = _FakeSheet('Summary', [[_text('Total facilities')], [_number(3)]])
+
+    first_data_sheet = _FakeSheet('5.20.20', [
+        [_text(label) for label in ('Date', 'State', 'Name', 'Residents confirmed', 'Resident Deaths', 'Website')],
+        [_date(datetime.date(2020, 5, 20)), _text('Ohio'), _text('Marion Correctional Institution'),
+         _text('2025'), _number(11.0), _text('https://example.com/ucla')],
+        [_date(datetime.date(2020, 5, 20)), _text('Ohio'), _text('Pickaway CI'),
+         _number(1490.0), _empty(), _text('https://example.com/ucla')],
+        [_date(datetime.date(2020, 5, 19)), _text('Delaware'), _text('Vaughn'),
+         _text('100'), _text('1'), _text('https://example.com/ucla')],
+        [_empty(), _text('Ohio'), _text('Marion CI'), _number(1.0), _number(1.0), _text('https://example.com/ucla')],
+    ])
+
+    second_data_sheet = _FakeSheet('05.21.20', [
+        [_text(label) for label in ('Website', 'Name', 'State', 'Date', 'Staff Confirmed', 'Residents confirmed',
+                                    'Staff Deaths', 'Resident Deaths', 'Staff Tested', 'Residents Tested',
+                                    'Add\'l Notes')],
+        [_text('https://example.com/ucla'), _text('Vaughn'), _text('Delaware'), _date(datetime.date(2020, 5, 21)),
+         _number(50.0), _number(118.0), _number(0.0), _number(3.0), _number(110.0), _empty(),
+         _text('Staff numbers include contractors')],
+        [_text('https://example.com/ucla'), _text('Fort Worth'), _text('Texas'), _date(datetime.date(2020, 5, 21)),
+         _text('30'), _text('600'), _empty(), _text('5'), _empty(), _text('1700'), _empty()],
+        [_text('https://example.com/ucla'), _text('Sussex CI'), _text('Delaware'), _date(datetime.date(2020, 5, 21)),
+         _number(1.0), _number(5.0), _number(0.0), _number(0.0), _empty(), _empty(), _empty()],
+    ])
+
+    return _FakeBook([summary_sheet, first_data_sheet, second_data_sheet])
+
+
+class TestCovidAggregator(unittest.TestCase):
+    """Tests that aggregating synthetic prison, UCLA and Recidiviz source files produces the expected CSV."""
+
+    def setUp(self) -> None:
+        with open(_fixture_path('facility_info_mapping.csv'), 'rb') as mapping_file:
+            facility_info_mapping_response = Mock(content=mapping_file.read())
+
+        self.requests_patcher = patch.object(
+            covid_aggregator.requests, 'get', return_value=facility_info_mapping_response)
+        self.mock_requests_get = self.requests_patcher.start()
+
+    def tearDown(self) -> None:
+        self.requests_patcher.stop()
+
+    def test_aggregate(self):
+        with open(_fixture_path('prison.csv'), newline='') as prison_file, \
+                open(_fixture_path('recidiviz.csv'), newline='') as recidiviz_file:
+            output = covid_aggregator.aggregate(
+                csv.DictReader(prison_file), _ucla_workbook(), csv.DictReader(recidiviz_file))
+
+        with open(_fixture_path('aggregated.csv'), newline='') as expected_file:
+            expected_rows = list(csv.reader(expected_file))
+
+        self.mock_requests_get.assert_called_once_with(covid_aggregator.FACILITY_INFO_MAPPING_URL)
+        self.assertEqual(expected_rows, list(csv.reader(StringIO(output))))
+
+    def test_aggregate_rows_streams_same_rows(self):
+        with open(_fixture_path('prison.csv'), newline='') as prison_file, \
+                open(_fixture_path('recidiviz.csv'), newline='') as recidiviz_file:
+            rows = covid_aggregator.aggregate_rows(
+                csv.DictReader(prison_file), _ucla_workbook(), csv.DictReader(recidiviz_file))
+
+            output = StringIO()
+            covid_aggregator.write_csv(rows, output)
+
+        with open(_fixture_path('aggregated.csv'), newline='') as expected_file:
+            self.assertEqual(list(csv.reader(expected_file)), list(csv.reader(StringIO(output.getvalue()))))
+
+    def test_aggregate_missing_source(self):
+        with self.assertRaises(RuntimeError):
+            covid_aggregator.aggregate([], _ucla_workbook(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
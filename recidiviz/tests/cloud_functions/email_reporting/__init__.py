@@ -0,0 +1,29 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2020 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for the email reporting cloud functions.
+
+The cloud function modules are deployed from their own directory and import each other as top-level modules, so that
+directory is added to the path here.
+"""
+import os
+import sys
+
+import recidiviz.cloud_functions
+
+_EMAIL_REPORTING_DIR = os.path.join(os.path.dirname(recidiviz.cloud_functions.__file__), 'email_reporting')
+if _EMAIL_REPORTING_DIR not in sys.path:
+    sys.path.append(_EMAIL_REPORTING_DIR)
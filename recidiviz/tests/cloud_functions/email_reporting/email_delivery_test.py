@@ -0,0 +1,148 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2020 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for email_delivery.py."""
+import os
+import threading
+import unittest
+from typing import List, Optional, Set, Tuple
+
+from mock import patch
+from sendgrid.helpers.mail import Mail
+
+import email_delivery  # pylint: disable=import-error,wrong-import-order
+from recidiviz.tests.cloud_functions.email_reporting.fake_storage_client import FakeStorageClient
+
+_BATCH_ID = '20201019120000'
+_HTML_BUCKET = 'test-project-report-html'
+
+
+class _FakeResponse:
+    status_code = 202
+    body = ''
+
+
+class _FakeMailClient:
+    """Records the emails it is asked to send, failing for the given recipients."""
+
+    def __init__(self, failing_addresses: Optional[Set[str]] = None):
+        self.failing_addresses = failing_addresses or set()
+        self.sent: List[Tuple[str, str, str]] = []
+        self._lock = threading.Lock()
+
+    def send(self, message: Mail) -> _FakeResponse:
+        to_address = message.personalizations[0].tos[0]['email']
+        if to_address in self.failing_addresses:
+            raise IOError(f'Failed to send to {to_address}')
+        with self._lock:
+            self.sent.append((to_address, message.subject.subject, message.contents[0].content))
+        return _FakeResponse()
+
+
+class _CountingRateLimiter:
+    """Counts how many times a token is taken, without ever waiting."""
+
+    def __init__(self) -> None:
+        self.acquire_count = 0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            self.acquire_count += 1
+
+
+@patch.dict(os.environ, {'GCP_PROJECT': 'test-project',
+                         'FROM_EMAIL_ADDRESS': 'reports@recidiviz.org',
+                         'FROM_EMAIL_NAME': 'Recidiviz'})
+class EmailDeliveryTest(unittest.TestCase):
+    """Tests for email_delivery.deliver."""
+
+    def setUp(self) -> None:
+        self.storage_client = FakeStorageClient({
+            (_HTML_BUCKET, f'{_BATCH_ID}/{address}.html'): f'<p>{address}</p>'
+            for address in ('a@state.gov', 'b@state.gov', 'c@state.gov')
+        })
+        self.mail_client = _FakeMailClient()
+        self.rate_limiter = _CountingRateLimiter()
+
+    def _deliver(self, test_address: Optional[str] = None) -> Tuple[int, int]:
+        return email_delivery.deliver(_BATCH_ID,
+                                      test_address=test_address,
+                                      storage_client=self.storage_client,
+                                      mail_client=self.mail_client,
+                                      rate_limiter=self.rate_limiter)
+
+    def test_deliver(self) -> None:
+        self.assertEqual((3, 0), self._deliver())
+
+        self.assertCountEqual([
+            ('a@state.gov', email_delivery.EMAIL_SUBJECT, '<p>a@state.gov</p>'),
+            ('b@state.gov', email_delivery.EMAIL_SUBJECT, '<p>b@state.gov</p>'),
+            ('c@state.gov', email_delivery.EMAIL_SUBJECT, '<p>c@state.gov</p>'),
+        ], self.mail_client.sent)
+        self.assertCountEqual([
+            (_HTML_BUCKET, f'{_BATCH_ID}/delivered/a@state.gov'),
+            (_HTML_BUCKET, f'{_BATCH_ID}/delivered/b@state.gov'),
+            (_HTML_BUCKET, f'{_BATCH_ID}/delivered/c@state.gov'),
+        ], self.storage_client.uploads)
+
+    def test_deliver_rate_limiter_acquired_once_per_send(self) -> None:
+        self.mail_client.failing_addresses = {'b@state.gov'}
+
+        self._deliver()
+
+        self.assertEqual(3, self.rate_limiter.acquire_count)
+
+    def test_deliver_counts_failures(self) -> None:
+        self.mail_client.failing_addresses = {'b@state.gov'}
+
+        self.assertEqual((2, 1), self._deliver())
+
+        self.assertNotIn((_HTML_BUCKET, f'{_BATCH_ID}/delivered/b@state.gov'), self.storage_client.uploads)
+
+    def test_deliver_resume_skips_delivered_recipients(self) -> None:
+        self.mail_client.failing_addresses = {'b@state.gov'}
+        self._deliver()
+
+        self.mail_client = _FakeMailClient()
+        self.assertEqual((1, 0), self._deliver())
+
+        self.assertEqual(['b@state.gov'], [to_address for to_address, _, _ in self.mail_client.sent])
+
+    def test_deliver_record_failure_counted_as_sent(self) -> None:
+        self.storage_client.failing_upload_prefixes = [f'{_BATCH_ID}/delivered/']
+
+        self.assertEqual((3, 0), self._deliver())
+
+        self.assertEqual(3, len(self.mail_client.sent))
+
+    def test_deliver_test_address_not_recorded(self) -> None:
+        self._deliver()
+        self.mail_client = _FakeMailClient()
+
+        self.assertEqual((3, 0), self._deliver(test_address='tester@recidiviz.org'))
+
+        self.assertCountEqual([
+            ('tester@recidiviz.org', f'[{address}] {email_delivery.EMAIL_SUBJECT}', f'<p>{address}</p>')
+            for address in ('a@state.gov', 'b@state.gov', 'c@state.gov')
+        ], self.mail_client.sent)
+        self.assertEqual(3, len(self.storage_client.uploads))
+
+    def test_deliver_no_html_files(self) -> None:
+        self.storage_client = FakeStorageClient()
+
+        with self.assertRaises(IndexError):
+            self._deliver()
@@ -0,0 +1,98 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2020 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for email_generation.py."""
+import os
+import unittest
+from collections import Counter
+
+from mock import patch
+
+import email_generation  # pylint: disable=import-error,wrong-import-order
+from report_context import ReportContext  # pylint: disable=import-error,wrong-import-order
+from recidiviz.tests.cloud_functions.email_reporting.fake_storage_client import FakeStorageClient
+
+_BATCH_ID = '20201019120000'
+_DATA_BUCKET = 'test-project-report-data'
+_HTML_BUCKET = 'test-project-report-html'
+
+
+class _FakeReportContext(ReportContext):
+    """Report context that counts how many times the report properties are loaded for each state."""
+
+    property_loads: Counter = Counter()
+
+    def get_report_type(self) -> str:
+        return 'fake_report'
+
+    def has_chart(self) -> bool:
+        return False
+
+    def prepare_for_generation(self) -> dict:
+        if self._shared_properties is not None:
+            self.properties = self._shared_properties
+        else:
+            _FakeReportContext.property_loads[self.state_code] += 1
+            self.properties = {'greeting': f'Hello from {self.state_code}'}
+
+        self.prepared_data = dict(self.recipient_data, greeting=self.properties['greeting'])
+        return self.prepared_data
+
+
+def _context(state_code: str, email_address: str) -> _FakeReportContext:
+    return _FakeReportContext(state_code, {
+        'email_address': email_address,
+        'state_code': state_code,
+        'batch_id': _BATCH_ID,
+    })
+
+
+@patch.dict(os.environ, {'GCP_PROJECT': 'test-project'})
+class GenerateBatchTest(unittest.TestCase):
+    """Tests for email_generation.generate_batch."""
+
+    def setUp(self) -> None:
+        _FakeReportContext.property_loads.clear()
+        self.storage_client = FakeStorageClient({
+            (_DATA_BUCKET, 'fake_report/US_XX/template.html'): '<p>$greeting, $email_address</p>',
+            (_DATA_BUCKET, 'fake_report/US_YY/template.html'): '<p>$greeting</p>',
+        })
+
+    def test_generate_batch(self) -> None:
+        report_contexts = [
+            _context('US_XX', 'a@xx.gov'),
+            _context('US_YY', 'b@yy.gov'),
+            _context('US_XX', 'c@xx.gov'),
+            _context('US_XX', 'd@xx.gov'),
+        ]
+
+        email_generation.generate_batch(report_contexts, self.storage_client)
+
+        self.assertCountEqual([
+            (_DATA_BUCKET, 'fake_report/US_XX/template.html'),
+            (_DATA_BUCKET, 'fake_report/US_YY/template.html'),
+        ], self.storage_client.downloads)
+        self.assertEqual(Counter({'US_XX': 1, 'US_YY': 1}), _FakeReportContext.property_loads)
+        self.assertCountEqual([
+            (_HTML_BUCKET, f'{_BATCH_ID}/a@xx.gov.html'),
+            (_HTML_BUCKET, f'{_BATCH_ID}/b@yy.gov.html'),
+            (_HTML_BUCKET, f'{_BATCH_ID}/c@xx.gov.html'),
+            (_HTML_BUCKET, f'{_BATCH_ID}/d@xx.gov.html'),
+        ], self.storage_client.uploads)
+        self.assertEqual(b'<p>Hello from US_XX, c@xx.gov</p>',
+                         self.storage_client.get_contents(_HTML_BUCKET, f'{_BATCH_ID}/c@xx.gov.html'))
+        self.assertEqual(b'<p>Hello from US_YY</p>',
+                         self.storage_client.get_contents(_HTML_BUCKET, f'{_BATCH_ID}/b@yy.gov.html'))
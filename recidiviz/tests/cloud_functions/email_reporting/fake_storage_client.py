@@ -0,0 +1,81 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2020 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""A fake for the parts of storage.Client used by the email reporting cloud functions."""
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+class FakeBlob:
+    """An in-memory stand-in for a storage.Blob."""
+
+    def __init__(self, client: 'FakeStorageClient', bucket_name: str, name: str):
+        self.client = client
+        self.bucket_name = bucket_name
+        self.name = name
+
+    def download_as_string(self) -> bytes:
+        return self.client.get_contents(self.bucket_name, self.name)
+
+    def upload_from_string(self, contents: str, content_type: str = 'text/plain') -> None:
+        _ = content_type
+        self.client.upload(self.bucket_name, self.name, contents)
+
+
+class FakeBucket:
+    """An in-memory stand-in for a storage.Bucket."""
+
+    def __init__(self, client: 'FakeStorageClient', name: str):
+        self.client = client
+        self.name = name
+
+    def blob(self, blob_name: str) -> FakeBlob:
+        return FakeBlob(self.client, self.name, blob_name)
+
+
+class FakeStorageClient:
+    """An in-memory stand-in for a storage.Client, which records every upload and download."""
+
+    def __init__(self, contents: Optional[Dict[Tuple[str, str], str]] = None):
+        self._lock = threading.Lock()
+        self._contents: Dict[Tuple[str, str], bytes] = {
+            path: value.encode('utf-8') for path, value in (contents or {}).items()}
+        self.uploads: List[Tuple[str, str]] = []
+        self.downloads: List[Tuple[str, str]] = []
+        self.failing_upload_prefixes: List[str] = []
+
+    def bucket(self, bucket_name: str) -> FakeBucket:
+        return FakeBucket(self, bucket_name)
+
+    def get_bucket(self, bucket_name: str) -> FakeBucket:
+        return FakeBucket(self, bucket_name)
+
+    def list_blobs(self, bucket_name: str, prefix: str = '') -> Iterator[FakeBlob]:
+        with self._lock:
+            names = sorted(name for bucket, name in self._contents if bucket == bucket_name and name.startswith(prefix))
+        return iter([FakeBlob(self, bucket_name, name) for name in names])
+
+    def get_contents(self, bucket_name: str, blob_name: str) -> bytes:
+        with self._lock:
+            self.downloads.append((bucket_name, blob_name))
+            return self._contents[(bucket_name, blob_name)]
+
+    def upload(self, bucket_name: str, blob_name: str, contents: str) -> None:
+        if any(blob_name.startswith(prefix) for prefix in self.failing_upload_prefixes):
+            raise IOError(f'Failed to upload {bucket_name}/{blob_name}')
+        with self._lock:
+            self.uploads.append((bucket_name, blob_name))
+            self._contents[(bucket_name, blob_name)] = contents.encode('utf-8')
@@ -0,0 +1,81 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2020 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for read_pdf.py"""
+import os
+import shutil
+import tempfile
+import unittest
+
+import pandas as pd
+from mock import patch
+
+from recidiviz.common import read_pdf
+
+
+@patch('tabula.read_pdf')
+class TestReadPdf(unittest.TestCase):
+    """Tests for the cache in front of tabula in read_pdf."""
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = self._write_pdf('report.pdf', b'%PDF report one')
+        read_pdf.clear_cache()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmpdir)
+        read_pdf.clear_cache()
+
+    def _write_pdf(self, name: str, content: bytes) -> str:
+        path = os.path.join(self.tmpdir, name)
+        with open(path, 'wb') as f:
+            f.write(content)
+        return path
+
+    def test_readPdf_sameContentAndOptions_extractsOnce(self, mock_tabula):
+        mock_tabula.return_value = pd.DataFrame({'a': [1, 2]})
+
+        first = read_pdf.read_pdf('bucket/state', self.filename, pages=[3])
+        second = read_pdf.read_pdf('bucket/other', self.filename, pages=[3])
+
+        mock_tabula.assert_called_once_with(self.filename, pages=[3])
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_readPdf_returnsIndependentCopies(self, mock_tabula):
+        mock_tabula.return_value = [pd.DataFrame({'a': [1, 2]})]
+
+        first = read_pdf.read_pdf('bucket/state', self.filename, pages='all')
+        first[0]['a'] = 0
+        second = read_pdf.read_pdf('bucket/state', self.filename, pages='all')
+
+        self.assertEqual([1, 2], second[0]['a'].tolist())
+
+    def test_readPdf_differentOptions_extractsAgain(self, mock_tabula):
+        mock_tabula.return_value = pd.DataFrame()
+
+        read_pdf.read_pdf('bucket/state', self.filename, pages=[3])
+        read_pdf.read_pdf('bucket/state', self.filename, pages=[4])
+
+        self.assertEqual(2, mock_tabula.call_count)
+
+    def test_readPdf_sameNameDifferentContent_extractsAgain(self, mock_tabula):
+        mock_tabula.return_value = pd.DataFrame()
+
+        read_pdf.read_pdf('bucket/state', self.filename, pages=[3])
+        self._write_pdf('report.pdf', b'%PDF report two')
+        read_pdf.read_pdf('bucket/state', self.filename, pages=[3])
+
+        self.assertEqual(2, mock_tabula.call_count)
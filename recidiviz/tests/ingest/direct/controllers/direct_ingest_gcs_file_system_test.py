@@ -22,7 +22,7 @@ from unittest import TestCase
 from google.api_core import exceptions
 from google.cloud import storage
 from google.cloud.storage import Bucket
-from mock import create_autospec
+from mock import create_autospec, patch, call, Mock
 
 from recidiviz.ingest.direct.controllers.direct_ingest_gcs_file_system import \
     to_normalized_unprocessed_file_path_from_normalized_path, to_normalized_processed_file_path_from_normalized_path, \
@@ -35,6 +35,8 @@ from recidiviz.tests.ingest.direct.fake_direct_ingest_gcs_file_system import Fak
 
 
 class TestDirectIngestGcsFileSystem(TestCase):
+    """Tests for the DirectIngestGCSFileSystemImpl, run against a mock storage client."""
+
     def setUp(self) -> None:
         self.mock_storage_client = create_autospec(storage.Client)
         self.fs = DirectIngestGCSFileSystemImpl(self.mock_storage_client)
@@ -58,6 +60,55 @@ class TestDirectIngestGcsFileSystem(TestCase):
         with self.assertRaises(ValueError):
             self.fs.exists(GcsfsBucketPath.from_absolute_path('gs://my-bucket'))
 
+    def test_mv_paths_copies_before_deleting(self):
+        src_dst_paths = [
+            (GcsfsFilePath(bucket_name='my-bucket', blob_name=f'file_{i}.csv'),
+             GcsfsFilePath(bucket_name='storage-bucket', blob_name=f'dir/file_{i}.csv'))
+            for i in range(150)
+        ]
+
+        with patch.object(DirectIngestGCSFileSystemImpl, '_copy_in_batch') as mock_copy, \
+                patch.object(DirectIngestGCSFileSystemImpl, '_delete_in_batch') as mock_delete:
+            manager = Mock()
+            manager.attach_mock(mock_copy, 'copy')
+            manager.attach_mock(mock_delete, 'delete')
+
+            self.fs.mv_paths(src_dst_paths)
+
+        self.assertEqual([
+            call.copy(src_dst_paths[:100]),
+            call.delete([src for src, _ in src_dst_paths[:100]]),
+            call.copy(src_dst_paths[100:]),
+            call.delete([src for src, _ in src_dst_paths[100:]]),
+        ], manager.mock_calls)
+
+    def test_delete_in_batch_falls_back_to_single_deletes(self):
+        self.mock_storage_client.batch.return_value.__exit__.side_effect = exceptions.NotFound('Exception')
+        paths = [GcsfsFilePath(bucket_name='my-bucket', blob_name='file_1.csv'),
+                 GcsfsFilePath(bucket_name='my-bucket', blob_name='file_2.csv')]
+
+        with patch.object(DirectIngestGCSFileSystemImpl, 'delete') as mock_delete:
+            # pylint: disable=protected-access
+            self.fs._delete_in_batch(paths)
+
+        mock_delete.assert_has_calls([call(paths[0]), call(paths[1])])
+
+
+    def test_mv_path_to_storage_checks_existence_without_listing(self):
+        path = GcsfsFilePath.from_absolute_path(
+            'gs://my-bucket/processed_2019-08-12T00:00:00:000000_raw_test_file_tag.csv')
+        storage_directory = GcsfsDirectoryPath.from_absolute_path('gs://storage-bucket/us_xx')
+
+        with patch.object(DirectIngestGCSFileSystemImpl, 'exists', side_effect=[True, False]) as mock_exists, \
+                patch.object(DirectIngestGCSFileSystemImpl, '_ls_with_blob_prefix') as mock_ls, \
+                patch.object(DirectIngestGCSFileSystemImpl, 'mv') as mock_mv:
+            self.fs.mv_path_to_storage(path, storage_directory)
+
+        mock_ls.assert_not_called()
+        self.assertEqual(2, mock_exists.call_count)
+        mock_mv.assert_called_once_with(path, GcsfsFilePath.from_absolute_path(
+            'gs://storage-bucket/us_xx/raw/2019/08/12/processed_2019-08-12T00:00:00:000000_raw_test_file_tag-(1).csv'))
+
 
 class TestFakeDirectIngestGcsFileSystem(TestCase):
     """Tests for the DirectIngestGCSFileSystem."""
@@ -266,6 +317,27 @@ class TestFakeDirectIngestGcsFileSystem(TestCase):
         self.assertTrue(found_first_file)
         self.assertTrue(found_second_file)
 
+    def test_storage_paths_for_batch_with_conflicts(self):
+        dt = datetime.datetime.now()
+        self.fully_process_file(dt,
+                                GcsfsFilePath(bucket_name='my_bucket',
+                                              blob_name='test_file.csv'))
+
+        # Two processed files with the same name as a file already in storage get distinct storage paths in a batch
+        file_name = to_normalized_processed_file_name('test_file.csv', GcsfsDirectIngestFileType.UNSPECIFIED, dt=dt)
+        paths = [GcsfsFilePath(bucket_name='my_bucket', blob_name=file_name),
+                 GcsfsFilePath(bucket_name='my_other_bucket', blob_name=file_name)]
+
+        # pylint: disable=protected-access
+        with patch.object(self.fs, '_ls_with_blob_prefix', wraps=self.fs._ls_with_blob_prefix) as mock_ls:
+            storage_paths = self.fs._storage_paths(self.STORAGE_DIR_PATH, paths)
+
+        # The storage subdirectory is only listed once for the whole batch
+        self.assertEqual(1, mock_ls.call_count)
+        self.assertEqual(2, len({p.abs_path() for p in storage_paths}))
+        self.assertTrue(storage_paths[0].abs_path().endswith('test_file-(1).csv'))
+        self.assertTrue(storage_paths[1].abs_path().endswith('test_file-(2).csv'))
+
 
 class TestPathNormalization(TestCase):
     """Class that tests path normalization functions created for both processed and unprocessed file paths"""
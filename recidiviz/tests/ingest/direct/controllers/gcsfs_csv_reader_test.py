@@ -16,14 +16,16 @@
 # =============================================================================
 """Tests for the GcsfsCsvReader."""
 
+import io
 import unittest
+from typing import Optional
 
 import gcsfs
 import pandas as pd
 from mock import create_autospec
 
 from recidiviz.ingest.direct.controllers.gcsfs_csv_reader import GcsfsCsvReader, GcsfsCsvReaderDelegate, \
-    COMMON_RAW_FILE_ENCODINGS
+    COMMON_RAW_FILE_ENCODINGS, iter_csv_records
 from recidiviz.ingest.direct.controllers.gcsfs_path import GcsfsFilePath
 from recidiviz.tests.ingest import fixtures
 
@@ -62,14 +64,15 @@ class TestGcsfsCsvReaderDelegate(GcsfsCsvReaderDelegate):
 def _fake_gcsfs_open(
         path_str: str,
         *,
-        encoding: str,
+        mode: str = 'r',
+        encoding: Optional[str] = None,
         # pylint: disable=unused-argument
         token: str):
     if not path_str.startswith('gs://'):
         raise ValueError(f'Expected gs:// path URI, got this instead: {path_str}')
 
     # Convert to local absolute path
-    return open('/' + path_str[len('gs://'):], encoding=encoding)
+    return open('/' + path_str[len('gs://'):], mode=mode, encoding=encoding)
 
 
 class GcsfsCsvReaderTest(unittest.TestCase):
@@ -199,3 +202,38 @@ class GcsfsCsvReaderTest(unittest.TestCase):
         self.assertEqual({'UTF-8'}, {encoding for encoding, df in delegate.dataframes})
         self.assertEqual(0, delegate.decode_errors)
         self.assertEqual(1, delegate.exceptions)
+
+    def test_record_iterator(self):
+        file_path = fixtures.as_filepath('encoded_latin_1.csv')
+        with self.reader.record_iterator(GcsfsFilePath.from_absolute_path(file_path)) as records:
+            self.assertEqual(5, len(list(records)))
+
+    def test_record_iterator_completely_empty_file(self):
+        empty_file_path = fixtures.as_filepath('tagA.csv')
+        with self.reader.record_iterator(GcsfsFilePath.from_absolute_path(empty_file_path)) as records:
+            self.assertEqual([], list(records))
+
+
+class IterCsvRecordsTest(unittest.TestCase):
+    """Tests for iter_csv_records."""
+
+    def test_iter_csv_records(self):
+        contents = b'a,b,c\r\n1,2,3\r\n4,5,6'
+        self.assertEqual([b'a,b,c\r\n', b'1,2,3\r\n', b'4,5,6'], list(iter_csv_records(io.BytesIO(contents))))
+
+    def test_iter_csv_records_quoted_newlines(self):
+        contents = b'a,b,c\n1,"multi\nline",3\n4,"ends with quote""\n""",6\n'
+        self.assertEqual([b'a,b,c\n', b'1,"multi\nline",3\n', b'4,"ends with quote""\n""",6\n'],
+                         list(iter_csv_records(io.BytesIO(contents))))
+
+    def test_iter_csv_records_quote_mid_field_is_literal(self):
+        contents = b'a,b\n5\'10",x\n6,y\n'
+        self.assertEqual([b'a,b\n', b'5\'10",x\n', b'6,y\n'], list(iter_csv_records(io.BytesIO(contents))))
+
+    def test_iter_csv_records_skips_blank_lines(self):
+        contents = b'a,b\n\n1,2\r\n\r\n3,4\n\n'
+        self.assertEqual([b'a,b\n', b'1,2\r\n', b'3,4\n'], list(iter_csv_records(io.BytesIO(contents))))
+
+    def test_iter_csv_records_custom_separator(self):
+        contents = b'a|b\n1|"x\ny"\n'
+        self.assertEqual([b'a|b\n', b'1|"x\ny"\n'], list(iter_csv_records(io.BytesIO(contents), separator='|')))
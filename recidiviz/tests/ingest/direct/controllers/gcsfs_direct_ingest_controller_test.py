@@ -126,6 +126,14 @@ class SingleTagStateTestGcsfsDirectIngestController(
         return ['tagC']
 
 
+class ConcurrentStateTestGcsfsDirectIngestController(StateTestGcsfsDirectIngestController):
+    """Test controller that may ingest files with different tags concurrently."""
+    _MAX_CONCURRENT_INGEST_JOBS = 2
+
+    def _get_ingest_conflict_key(self, file_tag: str) -> str:
+        return file_tag
+
+
 class CountyTestGcsfsDirectIngestController(
         BaseTestCsvGcsfsDirectIngestController):
     def __init__(self,
@@ -657,6 +665,65 @@ class TestGcsfsDirectIngestController(unittest.TestCase):
                                     expected_ingest_metadata_tags_with_is_processed=[('tagA', True)])
 
 
+    @patch("recidiviz.utils.regions.get_region", Mock(return_value=TEST_SQL_PRE_PROCESSING_LAUNCHED_REGION))
+    def test_concurrent_jobs_for_non_conflicting_files(self):
+        controller = build_gcsfs_controller_for_tests(
+            ConcurrentStateTestGcsfsDirectIngestController,
+            self.FIXTURE_PATH_PREFIX,
+            run_async=False)
+        self.assertIsInstance(
+            controller.cloud_task_manager,
+            FakeSynchronousDirectIngestCloudTaskManager,
+            "Expected FakeSynchronousDirectIngestCloudTaskManager")
+        task_manager = controller.cloud_task_manager
+
+        if not isinstance(controller.fs, FakeDirectIngestGCSFileSystem):
+            raise ValueError(f"Controller fs must have type "
+                             f"FakeDirectIngestGCSFileSystem. Found instead "
+                             f"type [{type(controller.fs)}]")
+
+        dt = datetime.datetime.now()
+        file_paths = []
+        for file_tag in ['tagA', 'tagB']:
+            file_path = path_for_fixture_file(controller, f'{file_tag}.csv',
+                                              file_type=GcsfsDirectIngestFileType.INGEST_VIEW,
+                                              should_normalize=True,
+                                              dt=dt)
+            metadata = controller.file_metadata_manager.register_ingest_file_export_job(GcsfsIngestViewExportArgs(
+                ingest_view_name=file_tag,
+                upper_bound_datetime_prev=None,
+                upper_bound_datetime_to_export=dt
+            ))
+            controller.file_metadata_manager.register_ingest_view_export_file_name(metadata, file_path)
+            controller.fs.test_add_path(file_path)
+            file_paths.append(file_path)
+
+        while task_manager.scheduler_tasks:
+            task_manager.test_run_next_scheduler_task()
+            task_manager.test_pop_finished_scheduler_task()
+
+        # Both files are queued at once, since they have different conflict keys.
+        self.assertEqual(
+            2,
+            task_manager.get_process_job_queue_info(controller.region).size())
+        self.assertCountEqual(file_paths, [args.file_path for _, args in task_manager.process_job_tasks])
+
+        while task_manager.process_job_tasks:
+            task_manager.test_run_next_process_job_task()
+            task_manager.test_pop_finished_process_job_task()
+
+        while task_manager.scheduler_tasks:
+            task_manager.test_run_next_scheduler_task()
+            task_manager.test_pop_finished_scheduler_task()
+
+        self.assertEqual(
+            0,
+            task_manager.get_process_job_queue_info(controller.region).size())
+        self.validate_file_metadata(controller,
+                                    expected_raw_metadata_tags_with_is_processed=[],
+                                    expected_ingest_metadata_tags_with_is_processed=[('tagA', True),
+                                                                                     ('tagB', True)])
+
     @patch("recidiviz.utils.regions.get_region", Mock(return_value=TEST_STATE_REGION))
     def test_do_not_schedule_more_than_one_delayed_scheduler_job(self):
         controller = build_gcsfs_controller_for_tests(
@@ -586,3 +586,72 @@ class TestGcsfsDirectIngestJobPrioritizerIngestViewFilter(unittest.TestCase):
         self.assertIsNone(self.prioritizer.get_next_job_args())
         self.assertFalse(
             self.prioritizer.are_more_jobs_expected_for_day(self._DAY_1.isoformat()))
+
+    def test_concurrent_jobs_disjoint_conflict_keys(self):
+        paths = [
+            self._normalized_path_for_filename(
+                'tagA.csv', GcsfsDirectIngestFileType.INGEST_VIEW, self._DAY_1_TIME_1),
+            self._normalized_path_for_filename(
+                'tagB.csv', GcsfsDirectIngestFileType.INGEST_VIEW, self._DAY_1_TIME_2),
+            self._normalized_path_for_filename(
+                'tagA.csv', GcsfsDirectIngestFileType.INGEST_VIEW, self._DAY_2_TIME_1),
+        ]
+        for path in paths:
+            self.fs.test_add_path(path)
+
+        running_paths = {paths[0]}
+        args_to_run = self.prioritizer.get_next_job_args_to_run_concurrently(
+            max_running_jobs=3,
+            is_job_running=lambda args: args.file_path in running_paths,
+            conflict_key_for_file_tag=lambda file_tag: file_tag)
+
+        # The day 2 tagA file must wait for the day 1 tagA file to finish
+        self.assertEqual([paths[1]], [args.file_path for args in args_to_run])
+
+        self.fs.mv_path_to_processed_path(paths[0])
+        running_paths = {paths[1]}
+        args_to_run = self.prioritizer.get_next_job_args_to_run_concurrently(
+            max_running_jobs=3,
+            is_job_running=lambda args: args.file_path in running_paths,
+            conflict_key_for_file_tag=lambda file_tag: file_tag)
+
+        self.assertEqual([paths[2]], [args.file_path for args in args_to_run])
+
+    def test_concurrent_jobs_shared_conflict_key(self):
+        paths = [
+            self._normalized_path_for_filename(
+                'tagA.csv', GcsfsDirectIngestFileType.INGEST_VIEW, self._DAY_1_TIME_1),
+            self._normalized_path_for_filename(
+                'tagB.csv', GcsfsDirectIngestFileType.INGEST_VIEW, self._DAY_1_TIME_2),
+        ]
+        for path in paths:
+            self.fs.test_add_path(path)
+
+        args_to_run = self.prioritizer.get_next_job_args_to_run_concurrently(
+            max_running_jobs=2,
+            is_job_running=lambda args: False,
+            conflict_key_for_file_tag=lambda file_tag: 'us_nd')
+
+        self.assertEqual([paths[0]], [args.file_path for args in args_to_run])
+
+    def test_concurrent_jobs_max_running_jobs(self):
+        paths = [
+            self._normalized_path_for_filename(
+                'tagA.csv', GcsfsDirectIngestFileType.INGEST_VIEW, self._DAY_1_TIME_1),
+            self._normalized_path_for_filename(
+                'tagB.csv', GcsfsDirectIngestFileType.INGEST_VIEW, self._DAY_1_TIME_2),
+        ]
+        for path in paths:
+            self.fs.test_add_path(path)
+
+        args_to_run = self.prioritizer.get_next_job_args_to_run_concurrently(
+            max_running_jobs=2,
+            is_job_running=lambda args: args.file_path == paths[0],
+            conflict_key_for_file_tag=lambda file_tag: file_tag)
+        self.assertEqual([paths[1]], [args.file_path for args in args_to_run])
+
+        args_to_run = self.prioritizer.get_next_job_args_to_run_concurrently(
+            max_running_jobs=1,
+            is_job_running=lambda args: args.file_path == paths[0],
+            conflict_key_for_file_tag=lambda file_tag: file_tag)
+        self.assertEqual([], args_to_run)
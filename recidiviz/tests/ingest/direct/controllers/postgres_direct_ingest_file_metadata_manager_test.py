@@ -486,6 +486,41 @@ class PostgresDirectIngestFileMetadataManagerTest(unittest.TestCase):
             metadata = metadata_manager.get_file_metadata(split_file_path)
             self.assertEqual(expected_metadata, metadata)
 
+    def test_register_ingest_file_splits(self):
+        original_file_metadata = DirectIngestIngestFileMetadata.new_with_defaults(
+            region_code=self.metadata_manager.region_code,
+            file_tag='file_tag',
+            datetimes_contained_lower_bound_exclusive=datetime.datetime(2015, 1, 2, 2, 2, 2, 2),
+            datetimes_contained_upper_bound_inclusive=datetime.datetime(2015, 1, 2, 3, 3, 3, 3),
+        )
+        split_file_paths = [self._make_unprocessed_path(f'bucket/split{i}.csv', GcsfsDirectIngestFileType.INGEST_VIEW)
+                            for i in range(2)]
+
+        with freeze_time('2015-01-02T03:05:05'):
+            split_file_metadatas = self.metadata_manager.register_ingest_file_splits(original_file_metadata,
+                                                                                     split_file_paths)
+
+        expected_metadatas = [
+            DirectIngestIngestFileMetadata.new_with_defaults(
+                region_code=self.metadata_manager.region_code,
+                file_tag='file_tag',
+                is_invalidated=False,
+                is_file_split=True,
+                job_creation_time=datetime.datetime(2015, 1, 2, 3, 5, 5),
+                datetimes_contained_lower_bound_exclusive=datetime.datetime(2015, 1, 2, 2, 2, 2, 2),
+                datetimes_contained_upper_bound_inclusive=datetime.datetime(2015, 1, 2, 3, 3, 3, 3),
+                normalized_file_name=split_file_path.file_name,
+                export_time=datetime.datetime(2015, 1, 2, 3, 5, 5),
+                discovery_time=None,
+                processed_time=None,
+            )
+            for split_file_path in split_file_paths
+        ]
+
+        self.assertEqual(expected_metadatas, split_file_metadatas)
+        self.assertEqual(expected_metadatas,
+                         [self.metadata_manager.get_file_metadata(path) for path in split_file_paths])
+
     def test_ingest_then_split_progression(self):
         args = GcsfsIngestViewExportArgs(
             ingest_view_name='file_tag',
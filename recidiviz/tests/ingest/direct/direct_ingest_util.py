@@ -64,6 +64,10 @@ class TestSafeGcsCsvReader(GcsfsCsvReader):
         path_str = self.fs.real_absolute_path_for_path(path)
         return open(path_str, encoding=encoding)
 
+    def _binary_file_pointer_for_path(self, path: GcsfsFilePath):
+        path_str = self.fs.real_absolute_path_for_path(path)
+        return open(path_str, 'rb')
+
 
 @attr.s
 class FakeDirectIngestRegionRawFileConfig(DirectIngestRegionRawFileConfig):
@@ -98,6 +98,9 @@ class FakeDirectIngestBigQueryClient(BigQueryClient):
             -> bigquery.QueryJob:
         raise ValueError('Must be implemented for use in tests.')
 
+    def paged_read(self, query_job: bigquery.QueryJob, page_size: int) -> Iterator[List[bigquery.table.Row]]:
+        raise ValueError('Must be implemented for use in tests.')
+
     def paged_read_and_process(self,
                                query_job: bigquery.QueryJob,
                                page_size: int,
@@ -19,6 +19,7 @@
 import os
 import shutil
 import threading
+from collections import defaultdict
 from typing import Set, Union, Dict, Optional, List
 
 from recidiviz.ingest.direct.controllers.direct_ingest_gcs_file_system import DirectIngestGCSFileSystem, \
@@ -35,6 +36,8 @@ class FakeDirectIngestGCSFileSystem(DirectIngestGCSFileSystem):
     def __init__(self):
         self.mutex = threading.Lock()
         self.all_paths: Set[Union[GcsfsFilePath, GcsfsDirectoryPath]] = set()
+        # Number of paths in |all_paths| with a given absolute path, for constant time existence checks
+        self._abs_path_counts: Dict[str, int] = defaultdict(int)
         self.uploaded_test_path_to_actual: Dict[str, str] = {}
         self.controller: Optional[GcsfsDirectIngestController] = None
 
@@ -53,7 +56,9 @@ class FakeDirectIngestGCSFileSystem(DirectIngestGCSFileSystem):
                   path: Union[GcsfsFilePath, GcsfsDirectoryPath],
                   fail_handle_file_call=False) -> None:
         with self.mutex:
-            self.all_paths.add(path)
+            if path not in self.all_paths:
+                self.all_paths.add(path)
+                self._abs_path_counts[path.abs_path()] += 1
 
         if not fail_handle_file_call and self.controller and \
                 path.abs_path().startswith(
@@ -63,7 +68,7 @@ class FakeDirectIngestGCSFileSystem(DirectIngestGCSFileSystem):
 
     def exists(self, path: Union[GcsfsBucketPath, GcsfsFilePath]) -> bool:
         with self.mutex:
-            return path.abs_path() in [p.abs_path() for p in self.all_paths]
+            return self._abs_path_counts.get(path.abs_path(), 0) > 0
 
     def real_absolute_path_for_path(self, path: GcsfsFilePath) -> str:
         if path.abs_path() in self.uploaded_test_path_to_actual:
@@ -133,14 +138,9 @@ class FakeDirectIngestGCSFileSystem(DirectIngestGCSFileSystem):
 
     def delete(self, path: GcsfsFilePath) -> None:
         with self.mutex:
-            path_to_remove = None
-            for p in self.all_paths:
-                if p == path:
-                    path_to_remove = p
-                    break
-
-            if path_to_remove is not None:
-                self.all_paths.remove(path_to_remove)
+            if path in self.all_paths:
+                self.all_paths.remove(path)
+                self._abs_path_counts[path.abs_path()] -= 1
 
     def _ls_with_blob_prefix(self,
                              bucket_name: str,
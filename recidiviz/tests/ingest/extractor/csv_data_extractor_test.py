@@ -23,6 +23,7 @@ from typing import Callable
 
 from recidiviz.ingest.extractor.csv_data_extractor import CsvDataExtractor, \
     IngestFieldCoordinates
+from recidiviz.ingest.models.ingest_info import IngestInfo
 from recidiviz.tests.ingest import fixtures
 
 
@@ -194,6 +195,29 @@ class CsvDataExtractorTest(unittest.TestCase):
         self.assertIsNotNone(ingest_info)
         self.assertFalse(ingest_info)
 
+    def test_parse_file_rows_set_different_child_classes(self):
+        """Tests that the column plans compiled once for the extractor set
+        each row's values on the right objects when rows set different child
+        classes."""
+        extractor = _instantiate_extractor('child_keys_csv.yaml')
+        content = fixtures.as_string('testdata/data_extractor/csv',
+                                     'child_keys.csv')
+
+        expected_info = IngestInfo()
+        person = expected_info.create_state_person(
+            state_person_id='1001', full_name='JON SNOW')
+        person.create_state_person_race(race='WHITE')
+        person = expected_info.create_state_person(
+            state_person_id='1002', full_name='ARYA STARK')
+        person.create_state_alias(full_name='NO ONE')
+        person = expected_info.create_state_person(
+            state_person_id='1003', full_name='SANSA STARK')
+        person.create_state_person_race(race='WHITE')
+        person.create_state_alias(full_name='ALAYNE')
+
+        self.assertEqual(expected_info,
+                         extractor.extract_and_populate_data(content))
+
 
 def _instantiate_extractor(yaml_filename: str,
                            primary_key_override: Callable = None) \
@@ -16,6 +16,7 @@
 # =============================================================================
 
 """Tests for ingest/extractor/html_data_extractor.py"""
+import io
 import os
 import unittest
 
@@ -38,6 +39,16 @@ class HtmlDataExtractorTest(unittest.TestCase):
             fixtures.as_string('testdata/data_extractor/html', html_filename))
         return extractor.extract_and_populate_data(contents)
 
+    def extract_from_stream(self, html_filename, yaml_filename):
+        yaml_path = os.path.join(os.path.dirname(__file__),
+                                 '../testdata/data_extractor/yaml',
+                                 yaml_filename)
+        extractor = HtmlDataExtractor(yaml_path)
+        stream = io.StringIO(
+            fixtures.as_string('testdata/data_extractor/html', html_filename))
+        return extractor.extract_and_populate_data_from_stream(
+            stream, chunk_size=256)
+
     def test_good_table(self):
         """Tests a well modelled table."""
         expected_info = IngestInfo()
@@ -419,3 +430,28 @@ class HtmlDataExtractorTest(unittest.TestCase):
         info = self.extract('three_levels_multi_key.html',
                             'three_levels_multi_key.yaml')
         self.assertEqual(expected_info, info)
+
+    def test_extract_from_stream_matches_parsed_content(self):
+        for html_filename, yaml_filename in [
+                ('text_label.html', 'text_label.yaml'),
+                ('single_page_roster.html', 'single_page_roster.yaml'),
+                ('three_levels_multi_key.html', 'three_levels_multi_key.yaml')]:
+            self.assertEqual(self.extract(html_filename, yaml_filename),
+                             self.extract_from_stream(html_filename,
+                                                      yaml_filename))
+
+    def test_search_for_keys_normalizes_whitespace(self):
+        yaml_path = os.path.join(os.path.dirname(__file__),
+                                 '../testdata/data_extractor/yaml',
+                                 'text_label.yaml')
+        extractor = HtmlDataExtractor(yaml_path)
+        contents = html.fromstring(
+            '<html><body><div><span>\n\xa0 Booking Number:</span> 123</div>'
+            '<div><span>Sex</span> M</div>'
+            '<div><span>Sexes</span> X</div></body></html>')
+
+        expected_info = IngestInfo()
+        expected_info.create_person(gender='M').create_booking(
+            booking_id='123')
+        self.assertEqual(expected_info,
+                         extractor.extract_and_populate_data(contents))
@@ -0,0 +1,230 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2020 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for the PageFetcher in page_fetcher.py, run against a local HTTP
+server standing in for a region's site."""
+
+import threading
+import time
+import unittest
+from concurrent import futures
+from typing import Dict, List, Tuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from mock import Mock, patch
+
+from recidiviz.ingest.scrape import page_fetcher
+from recidiviz.ingest.scrape.page_fetcher import PageFetcher, \
+    get_page_fetcher
+from recidiviz.ingest.scrape.scraper import FetchPageError
+
+_ETAG = '"roster-v1"'
+
+
+class _FakeSiteServer(ThreadingHTTPServer):
+    """Local HTTP server that records the requests made to it."""
+
+    def __init__(self) -> None:
+        super().__init__(('127.0.0.1', 0), _FakeSiteHandler)
+        self.lock = threading.Lock()
+        self.requests: List[Tuple[str, Dict[str, str], Tuple[str, int]]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.response_delay_seconds = 0.0
+
+
+class _FakeSiteHandler(BaseHTTPRequestHandler):
+    """Serves a roster page that supports conditional requests and records
+    the requests it receives on the server."""
+
+    protocol_version = 'HTTP/1.1'
+
+    server: _FakeSiteServer
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        server = self.server
+        with server.lock:
+            server.requests.append((self.path, dict(self.headers), self.client_address))
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            time.sleep(server.response_delay_seconds)
+            if self.path == '/missing':
+                self._respond(404, b'')
+            elif self.headers.get('If-None-Match') == _ETAG:
+                self._respond(304, None)
+            else:
+                self._respond(200, b'<html><body>roster</body></html>')
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def _respond(self, status, body):
+        self.send_response(status)
+        self.send_header('ETag', _ETAG)
+        self.send_header('Set-Cookie', 'session=abc')
+        if body is not None:
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+class TestPageFetcher(unittest.TestCase):
+    """Tests for PageFetcher."""
+
+    def setUp(self) -> None:
+        self.server = _FakeSiteServer()
+        self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.server_thread.start()
+        self.url = 'http://127.0.0.1:{}/roster'.format(self.server.server_address[1])
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        page_fetcher.clear_page_fetchers()
+
+    def test_fetch_reuses_pooled_connection(self):
+        fetcher = PageFetcher()
+
+        fetcher.fetch(self.url, should_proxy=False)
+        fetcher.fetch(self.url, params={'page': 2}, should_proxy=False)
+
+        client_addresses = {address for _, _, address in self.server.requests}
+        self.assertEqual(2, len(self.server.requests))
+        self.assertEqual(1, len(client_addresses))
+
+    def test_fetch_unmodified_page_returns_cached_response(self):
+        fetcher = PageFetcher()
+
+        first = fetcher.fetch(self.url, should_proxy=False)
+        second = fetcher.fetch(self.url, should_proxy=False)
+
+        self.assertEqual(200, first.status_code)
+        self.assertEqual(first.text, second.text)
+        self.assertEqual({'session': 'abc'}, second.cookies.get_dict())
+        _, first_headers, _ = self.server.requests[0]
+        _, second_headers, _ = self.server.requests[1]
+        self.assertNotIn('If-None-Match', first_headers)
+        self.assertEqual(_ETAG, second_headers['If-None-Match'])
+
+    def test_fetch_different_params_not_conditional(self):
+        fetcher = PageFetcher()
+
+        fetcher.fetch(self.url, params={'page': 1}, should_proxy=False)
+        response = fetcher.fetch(self.url, params={'page': 2}, should_proxy=False)
+
+        self.assertEqual(200, response.status_code)
+        _, second_headers, _ = self.server.requests[1]
+        self.assertNotIn('If-None-Match', second_headers)
+
+    def test_fetch_different_cookies_not_conditional(self):
+        fetcher = PageFetcher()
+
+        fetcher.fetch(self.url, cookies={'session': 'abc'}, should_proxy=False)
+        fetcher.fetch(self.url, cookies={'session': 'def'}, should_proxy=False)
+        fetcher.fetch(self.url, cookies={'session': 'abc'}, should_proxy=False)
+
+        _, second_headers, _ = self.server.requests[1]
+        _, third_headers, _ = self.server.requests[2]
+        self.assertNotIn('If-None-Match', second_headers)
+        self.assertEqual(_ETAG, third_headers['If-None-Match'])
+
+    def test_fetch_different_headers_not_conditional(self):
+        fetcher = PageFetcher()
+
+        fetcher.fetch(self.url, headers={'Accept-Language': 'en'}, should_proxy=False)
+        fetcher.fetch(self.url, headers={'Accept-Language': 'es'}, should_proxy=False)
+
+        _, second_headers, _ = self.server.requests[1]
+        self.assertNotIn('If-None-Match', second_headers)
+
+    def test_fetch_proxied_does_not_use_pooled_session(self):
+        proxy_url = 'http://{}:{}'.format(*self.server.server_address)
+        proxies = iter([{'http': proxy_url.replace('//', '//user-{}:pass@'.format(i))} for i in range(3)])
+        fetcher = PageFetcher()
+
+        with patch('recidiviz.ingest.scrape.scraper_utils.get_proxies', side_effect=lambda: next(proxies)):
+            for _ in range(3):
+                response = fetcher.fetch(self.url, should_proxy=True)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(3, len(self.server.requests))
+        self.assertEqual({}, fetcher._session.get_adapter(self.url).proxy_manager)  # pylint: disable=protected-access
+
+    def test_fetch_does_not_share_cookies_between_requests(self):
+        fetcher = PageFetcher()
+
+        fetcher.fetch(self.url, params={'page': 1}, should_proxy=False)
+        fetcher.fetch(self.url, params={'page': 2}, should_proxy=False)
+
+        _, second_headers, _ = self.server.requests[1]
+        self.assertNotIn('Cookie', second_headers)
+
+    def test_fetch_limits_concurrent_requests(self):
+        self.server.response_delay_seconds = 0.1
+        fetcher = PageFetcher(max_concurrent_requests=2)
+
+        with futures.ThreadPoolExecutor(max_workers=6) as executor:
+            responses = list(executor.map(
+                lambda i: fetcher.fetch(self.url, params={'page': i}, should_proxy=False), range(6)))
+
+        self.assertTrue(all(response.status_code == 200 for response in responses))
+        self.assertEqual(6, len(self.server.requests))
+        self.assertEqual(2, self.server.max_in_flight)
+
+    def test_fetch_spaces_out_requests_to_host(self):
+        sleeps: List[float] = []
+        fetcher = PageFetcher(min_request_interval_seconds=0.2,
+                              clock=lambda: 100.0, sleep=sleeps.append)
+
+        for i in range(3):
+            fetcher.fetch(self.url, params={'page': i}, should_proxy=False)
+
+        self.assertEqual(3, len(self.server.requests))
+        self.assertEqual([0.2, 0.4], [round(s, 6) for s in sleeps])
+
+    def test_fetch_does_not_wait_once_interval_has_passed(self):
+        sleeps: List[float] = []
+        times = iter([100.0, 100.5, 100.6])
+        fetcher = PageFetcher(min_request_interval_seconds=0.2,
+                              clock=lambda: next(times), sleep=sleeps.append)
+
+        for i in range(3):
+            fetcher.fetch(self.url, params={'page': i}, should_proxy=False)
+
+        self.assertEqual([0.1], [round(s, 6) for s in sleeps])
+
+    def test_fetch_error(self):
+        fetcher = PageFetcher()
+
+        with self.assertRaises(FetchPageError):
+            fetcher.fetch(self.url.replace('/roster', '/missing'), should_proxy=False)
+
+    def test_get_page_fetcher_per_region(self):
+        region_a = Mock(region_code='us_xx', max_concurrent_requests=None, min_request_interval_seconds=None)
+        region_b = Mock(region_code='us_yy', max_concurrent_requests=2, min_request_interval_seconds=1.0)
+
+        self.assertIs(get_page_fetcher(region_a), get_page_fetcher(region_a))
+        self.assertIsNot(get_page_fetcher(region_a), get_page_fetcher(region_b))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -20,6 +20,8 @@ import unittest
 
 from typing import List
 
+from more_itertools import one
+
 from recidiviz.common.constants.bond import BondStatus
 from recidiviz.common.constants.charge import ChargeStatus
 from recidiviz.common.constants.person_characteristics import Race, Ethnicity
@@ -720,3 +722,57 @@ class TestIngestInfoStateConverter(unittest.TestCase):
         # Act + Assert
         with self.assertRaises(ValueError):
             self._convert_and_throw_on_errors(ingest_info, metadata)
+
+    def testConvert_UnreferencedObjectCannotConvert_NoErrors(self):
+        # Arrange
+        metadata = IngestMetadata.new_with_defaults(system_level=SystemLevel.STATE)
+
+        ingest_info = IngestInfo()
+        ingest_info.state_people.add(state_person_id='PERSON_ID')
+        ingest_info.state_assessments.add(state_assessment_id='ASSESSMENT_ID', assessment_date='NOT_A_DATE')
+
+        # Act
+        result = self._convert_and_throw_on_errors(ingest_info, metadata)
+
+        # Assert
+        self.assertEqual([StatePerson.new_with_defaults()], result)
+
+    def testConvert_SharedChild_ConvertedSeparatelyForEachParent(self):
+        # Arrange
+        metadata = IngestMetadata.new_with_defaults(region='us_nd', system_level=SystemLevel.STATE)
+
+        ingest_info = IngestInfo()
+        ingest_info.state_agents.add(state_agent_id='AGENT_ID', full_name='AGENT WILLIAMS')
+        ingest_info.state_people.add(state_person_id='PERSON_ID',
+                                     supervising_officer_id='AGENT_ID',
+                                     state_assessment_ids=['ASSESSMENT_ID'])
+        ingest_info.state_assessments.add(state_assessment_id='ASSESSMENT_ID',
+                                          assessment_date='1/2/2111',
+                                          conducting_agent_id='AGENT_ID')
+
+        # Act
+        result = self._convert_and_throw_on_errors(ingest_info, metadata)
+
+        # Assert
+        def _expected_agent():
+            return StateAgent.new_with_defaults(
+                external_id='AGENT_ID',
+                state_code='US_ND',
+                agent_type=StateAgentType.PRESENT_WITHOUT_INFO,
+                full_name='{"full_name": "AGENT WILLIAMS"}'
+            )
+
+        expected_result = [StatePerson.new_with_defaults(
+            state_code='US_ND',
+            supervising_officer=_expected_agent(),
+            assessments=[StateAssessment.new_with_defaults(
+                external_id='ASSESSMENT_ID',
+                state_code='US_ND',
+                assessment_date=datetime.date(year=2111, month=1, day=2),
+                conducting_agent=_expected_agent()
+            )]
+        )]
+
+        self.assertEqual(expected_result, result)
+        person = one(result)
+        self.assertIsNot(person.supervising_officer, one(person.assessments).conducting_agent)
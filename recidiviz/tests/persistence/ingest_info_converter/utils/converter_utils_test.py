@@ -22,6 +22,8 @@ from unittest import TestCase
 import pytest
 from mock import patch
 
+from recidiviz.common.str_field_utils import parse_date
+from recidiviz.ingest.models.ingest_info_pb2 import StatePerson
 from recidiviz.persistence.ingest_info_converter.utils import converter_utils
 
 _NOW = datetime.datetime(2000, 1, 1)
@@ -43,3 +45,18 @@ class TestConverterUtils(TestCase):
     def test_parseBadAge(self):
         with pytest.raises(ValueError):
             converter_utils.calculate_birthdate_from_age('ABC')
+
+    @patch('recidiviz.persistence.ingest_info_converter.utils.converter_utils.parse_date', wraps=parse_date)
+    def test_batchParsingCache_parsesDistinctDatesOnce(self, mock_parse_date):
+        with converter_utils.batch_parsing_cache():
+            for _ in range(3):
+                assert converter_utils.fn(converter_utils.parse_date, 'birthdate', StatePerson(birthdate='1/2/2000')) \
+                       == datetime.date(year=2000, month=1, day=2)
+
+        assert mock_parse_date.call_count == 1
+
+    def test_batchParsingCache_failedParsesRaiseEveryTime(self):
+        with converter_utils.batch_parsing_cache():
+            for _ in range(2):
+                with pytest.raises(ValueError):
+                    converter_utils.fn(parse_date, 'birthdate', StatePerson(birthdate='NOT_A_DATE'))
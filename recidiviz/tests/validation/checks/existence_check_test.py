@@ -43,7 +43,7 @@ class TestExistenceValidationChecker(TestCase):
         self.metadata_patcher.stop()
 
     def test_existence_check_no_failures(self):
-        self.mock_client.run_query_async.return_value = []
+        self.mock_client.run_query_async.return_value = [{'invalid_rows': 0}]
 
         job = DataValidationJob(region_code='US_VA',
                                 validation=ExistenceDataValidationCheck(
@@ -58,7 +58,7 @@ class TestExistenceValidationChecker(TestCase):
                          DataValidationJobResult(validation_job=job, was_successful=True, failure_description=None))
 
     def test_existence_check_failures(self):
-        self.mock_client.run_query_async.return_value = ['some result row', 'some other result row']
+        self.mock_client.run_query_async.return_value = [{'invalid_rows': 2}]
 
         job = DataValidationJob(region_code='US_VA',
                                 validation=ExistenceDataValidationCheck(
@@ -75,7 +75,7 @@ class TestExistenceValidationChecker(TestCase):
                                                  failure_description='Found 2 invalid rows, though 0 were expected'))
 
     def test_existence_check_failures_below_threshold(self):
-        self.mock_client.run_query_async.return_value = ['some result row', 'some other result row']
+        self.mock_client.run_query_async.return_value = [{'invalid_rows': 2}]
 
         job = DataValidationJob(region_code='US_VA',
                                 validation=ExistenceDataValidationCheck(
@@ -89,3 +89,18 @@ class TestExistenceValidationChecker(TestCase):
 
         self.assertEqual(result,
                          DataValidationJobResult(validation_job=job, was_successful=True, failure_description=None))
+
+    def test_existence_check_query(self):
+        self.mock_client.run_query_async.return_value = [{'invalid_rows': 0}]
+
+        job = DataValidationJob(region_code='US_VA',
+                                validation=ExistenceDataValidationCheck(
+                                    validation_type=ValidationCheckType.EXISTENCE,
+                                    view=BigQueryView(dataset_id='my_dataset',
+                                                      view_id='test_view',
+                                                      view_query_template='select * from literally_anything')
+                                ))
+        ExistenceValidationChecker.run_check(job)
+
+        self.mock_client.run_query_async.assert_called_with(
+            f'SELECT COUNT(*) AS invalid_rows FROM ({job.query_str()})', [])
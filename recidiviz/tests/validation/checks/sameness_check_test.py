@@ -16,7 +16,6 @@
 # =============================================================================
 
 """Tests for validation/checks/sameness_check.py."""
-from typing import List, Dict
 from unittest import TestCase
 
 from mock import patch
@@ -40,19 +39,10 @@ class TestSamenessValidationChecker(TestCase):
             'recidiviz.validation.checks.sameness_check.BigQueryClientImpl')
         self.mock_client = self.client_patcher.start().return_value
 
-        self.good_string_row = {'a': 'same', 'b': 'same', 'c': 'same'}
-        self.bad_string_row = {'a': 'a_value', 'b': 'b_value', 'c': 'c_value'}
-
     def tearDown(self):
         self.client_patcher.stop()
         self.metadata_patcher.stop()
 
-    def return_string_values_with_num_bad_rows(self, num_bad_rows) -> List[Dict[str, str]]:
-        return_values = [self.good_string_row] * (100 - num_bad_rows)
-        return_values.extend([self.bad_string_row] * num_bad_rows)
-
-        return return_values
-
     def test_samneness_check_no_comparison_columns(self):
         with self.assertRaises(ValueError) as e:
             _ = SamenessDataValidationCheck(
@@ -100,7 +90,8 @@ class TestSamenessValidationChecker(TestCase):
         self.assertEqual(check_with_name_suffix.validation_name, 'test_view_b_c_only')
 
     def test_sameness_check_same_values_numbers(self):
-        self.mock_client.run_query_async.return_value = [{'a': 10, 'b': 10, 'c': 10}]
+        self.mock_client.run_query_async.return_value = [{'num_failed_rows': 0, 'num_rows_with_null_values': 0,
+                                                         'highest_error': 0.0}]
 
         job = DataValidationJob(region_code='US_VA',
                                 validation=SamenessDataValidationCheck(
@@ -117,7 +108,8 @@ class TestSamenessValidationChecker(TestCase):
                          DataValidationJobResult(validation_job=job, was_successful=True, failure_description=None))
 
     def test_sameness_check_different_values_numbers_no_allowed_error(self):
-        self.mock_client.run_query_async.return_value = [{'a': 98, 'b': 100, 'c': 99}]
+        self.mock_client.run_query_async.return_value = [{'num_failed_rows': 1, 'num_rows_with_null_values': 0,
+                                                         'highest_error': 0.02}]
 
         job = DataValidationJob(region_code='US_VA',
                                 validation=SamenessDataValidationCheck(
@@ -140,7 +132,8 @@ class TestSamenessValidationChecker(TestCase):
                          ))
 
     def test_sameness_check_numbers_different_values_within_margin(self):
-        self.mock_client.run_query_async.return_value = [{'a': 98, 'b': 100, 'c': 99}]
+        self.mock_client.run_query_async.return_value = [{'num_failed_rows': 0, 'num_rows_with_null_values': 0,
+                                                         'highest_error': 0.02}]
 
         job = DataValidationJob(region_code='US_VA',
                                 validation=SamenessDataValidationCheck(
@@ -158,7 +151,8 @@ class TestSamenessValidationChecker(TestCase):
                          DataValidationJobResult(validation_job=job, was_successful=True, failure_description=None))
 
     def test_sameness_check_numbers_different_values_above_margin(self):
-        self.mock_client.run_query_async.return_value = [{'a': 97, 'b': 100, 'c': 99}]
+        self.mock_client.run_query_async.return_value = [{'num_failed_rows': 1, 'num_rows_with_null_values': 0,
+                                                         'highest_error': 0.03}]
 
         job = DataValidationJob(region_code='US_VA',
                                 validation=SamenessDataValidationCheck(
@@ -182,7 +176,8 @@ class TestSamenessValidationChecker(TestCase):
                          ))
 
     def test_sameness_check_numbers_multiple_rows_above_margin(self):
-        self.mock_client.run_query_async.return_value = [{'a': 97, 'b': 100, 'c': 99}, {'a': 14, 'b': 21, 'c': 14}]
+        self.mock_client.run_query_async.return_value = [{'num_failed_rows': 2, 'num_rows_with_null_values': 0,
+                                                         'highest_error': 1 / 3}]
 
         job = DataValidationJob(region_code='US_VA',
                                 validation=SamenessDataValidationCheck(
@@ -205,8 +200,59 @@ class TestSamenessValidationChecker(TestCase):
                                                  'errors as high as 0.3333.',
                          ))
 
+    def test_sameness_check_numbers_null_values(self):
+        self.mock_client.run_query_async.return_value = [{'num_failed_rows': 1, 'num_rows_with_null_values': 1,
+                                                         'highest_error': 0.01}]
+
+        job = DataValidationJob(region_code='US_VA',
+                                validation=SamenessDataValidationCheck(
+                                    validation_type=ValidationCheckType.SAMENESS,
+                                    comparison_columns=['a', 'b', 'c'],
+                                    sameness_check_type=SamenessDataValidationCheckType.NUMBERS,
+                                    max_allowed_error=0.02,
+                                    view=BigQueryView(dataset_id='my_dataset',
+                                                      view_id='test_view',
+                                                      view_query_template='select * from literally_anything')
+                                ))
+        result = SamenessValidationChecker.run_check(job)
+
+        self.assertEqual(result,
+                         DataValidationJobResult(
+                             validation_job=job,
+                             was_successful=False,
+                             failure_description='1 row(s) had unacceptable margins of error. The acceptable margin '
+                                                 'of error is only 0.02. 1 of these row(s) had null values in the '
+                                                 'compared columns.',
+                         ))
+
+    def test_sameness_check_numbers_null_values_and_values_above_margin(self):
+        self.mock_client.run_query_async.return_value = [{'num_failed_rows': 3, 'num_rows_with_null_values': 1,
+                                                         'highest_error': 0.03}]
+
+        job = DataValidationJob(region_code='US_VA',
+                                validation=SamenessDataValidationCheck(
+                                    validation_type=ValidationCheckType.SAMENESS,
+                                    comparison_columns=['a', 'b', 'c'],
+                                    sameness_check_type=SamenessDataValidationCheckType.NUMBERS,
+                                    max_allowed_error=0.02,
+                                    view=BigQueryView(dataset_id='my_dataset',
+                                                      view_id='test_view',
+                                                      view_query_template='select * from literally_anything')
+                                ))
+        result = SamenessValidationChecker.run_check(job)
+
+        self.assertEqual(result,
+                         DataValidationJobResult(
+                             validation_job=job,
+                             was_successful=False,
+                             failure_description='3 row(s) had unacceptable margins of error. The acceptable margin '
+                                                 'of error is only 0.02, but the validation returned rows with '
+                                                 'errors as high as 0.03. 1 of these row(s) had null values in the '
+                                                 'compared columns.',
+                         ))
+
     def test_string_sameness_check_same_values(self):
-        self.mock_client.run_query_async.return_value = [{'a': '10', 'b': '10', 'c': '10'}]
+        self.mock_client.run_query_async.return_value = [{'num_rows': 1, 'num_errors': 0}]
 
         job = DataValidationJob(region_code='US_VA',
                                 validation=SamenessDataValidationCheck(
@@ -223,7 +269,7 @@ class TestSamenessValidationChecker(TestCase):
                          DataValidationJobResult(validation_job=job, was_successful=True, failure_description=None))
 
     def test_string_sameness_check_same_values_all_none(self):
-        self.mock_client.run_query_async.return_value = [{'a': None, 'b': None, 'c': None}]
+        self.mock_client.run_query_async.return_value = [{'num_rows': 1, 'num_errors': 0}]
 
         job = DataValidationJob(region_code='US_VA',
                                 validation=SamenessDataValidationCheck(
@@ -240,7 +286,7 @@ class TestSamenessValidationChecker(TestCase):
                          DataValidationJobResult(validation_job=job, was_successful=True, failure_description=None))
 
     def test_string_sameness_check_different_values_no_allowed_error(self):
-        self.mock_client.run_query_async.return_value = [{'a': 'a', 'b': 'b', 'c': 'c'}]
+        self.mock_client.run_query_async.return_value = [{'num_rows': 1, 'num_errors': 1}]
 
         job = DataValidationJob(region_code='US_VA',
                                 validation=SamenessDataValidationCheck(
@@ -263,7 +309,7 @@ class TestSamenessValidationChecker(TestCase):
                          ))
 
     def test_string_sameness_check_different_values_handle_empty_string(self):
-        self.mock_client.run_query_async.return_value = [{'a': 'same', 'b': 'same', 'c': None}]
+        self.mock_client.run_query_async.return_value = [{'num_rows': 1, 'num_errors': 1}]
 
         job = DataValidationJob(region_code='US_VA',
                                 validation=SamenessDataValidationCheck(
@@ -286,7 +332,7 @@ class TestSamenessValidationChecker(TestCase):
                          ))
 
     def test_string_sameness_check_different_values_handle_non_string_type(self):
-        self.mock_client.run_query_async.return_value = [{'a': 'same', 'b': 'same', 'c': 1245}]
+        self.mock_client.run_query_async.return_value = [{'num_rows': 1, 'num_errors': 1}]
 
         job = DataValidationJob(region_code='US_VA',
                                 validation=SamenessDataValidationCheck(
@@ -312,7 +358,7 @@ class TestSamenessValidationChecker(TestCase):
         num_bad_rows = 2
         max_allowed_error = (num_bad_rows / 100)
 
-        self.mock_client.run_query_async.return_value = self.return_string_values_with_num_bad_rows(num_bad_rows)
+        self.mock_client.run_query_async.return_value = [{'num_rows': 100, 'num_errors': num_bad_rows}]
 
         job = DataValidationJob(region_code='US_VA',
                                 validation=SamenessDataValidationCheck(
@@ -333,7 +379,7 @@ class TestSamenessValidationChecker(TestCase):
         num_bad_rows = 5
         max_allowed_error = ((num_bad_rows - 1) / 100)  # Below the number of bad rows
 
-        self.mock_client.run_query_async.return_value = self.return_string_values_with_num_bad_rows(num_bad_rows)
+        self.mock_client.run_query_async.return_value = [{'num_rows': 100, 'num_errors': num_bad_rows}]
         job = DataValidationJob(region_code='US_VA',
                                 validation=SamenessDataValidationCheck(
                                     validation_type=ValidationCheckType.SAMENESS,
@@ -356,3 +402,64 @@ class TestSamenessValidationChecker(TestCase):
                                                  f'The acceptable margin of error is only {max_allowed_error}, but the '
                                                  f'validation returned an error rate of {actual_expected_error}.',
                          ))
+
+    def test_sameness_check_numbers_query(self):
+        self.mock_client.run_query_async.return_value = [{'num_failed_rows': 0, 'num_rows_with_null_values': 0,
+                                                         'highest_error': None}]
+
+        job = DataValidationJob(region_code='US_VA',
+                                validation=SamenessDataValidationCheck(
+                                    validation_type=ValidationCheckType.SAMENESS,
+                                    comparison_columns=['a', 'b'],
+                                    sameness_check_type=SamenessDataValidationCheckType.NUMBERS,
+                                    max_allowed_error=0.02,
+                                    view=BigQueryView(dataset_id='my_dataset',
+                                                      view_id='test_view',
+                                                      view_query_template='select * from literally_anything')
+                                ))
+        result = SamenessValidationChecker.run_check(job)
+
+        self.assertEqual(result,
+                         DataValidationJobResult(validation_job=job, was_successful=True, failure_description=None))
+
+        query_str, _ = self.mock_client.run_query_async.call_args[0]
+        self.assertEqual(
+            'SELECT COUNTIF(`a` IS NULL OR `b` IS NULL OR '
+            '(CASE WHEN GREATEST(`a`, `b`) = 0 AND LEAST(`a`, `b`) = 0 THEN 0.0 '
+            'WHEN GREATEST(`a`, `b`) = 0 AND LEAST(`a`, `b`) < 0 '
+            'THEN (LEAST(`a`, `b`) - GREATEST(`a`, `b`)) / LEAST(`a`, `b`) '
+            'ELSE (GREATEST(`a`, `b`) - LEAST(`a`, `b`)) / GREATEST(`a`, `b`) END) > 0.02) AS num_failed_rows, '
+            'COUNTIF(`a` IS NULL OR `b` IS NULL) AS num_rows_with_null_values, '
+            'MAX((CASE WHEN GREATEST(`a`, `b`) = 0 AND LEAST(`a`, `b`) = 0 THEN 0.0 '
+            'WHEN GREATEST(`a`, `b`) = 0 AND LEAST(`a`, `b`) < 0 '
+            'THEN (LEAST(`a`, `b`) - GREATEST(`a`, `b`)) / LEAST(`a`, `b`) '
+            'ELSE (GREATEST(`a`, `b`) - LEAST(`a`, `b`)) / GREATEST(`a`, `b`) END)) AS highest_error '
+            f'FROM ({job.query_str()})',
+            query_str)
+
+    def test_string_sameness_check_query(self):
+        self.mock_client.run_query_async.return_value = [{'num_rows': 0, 'num_errors': 0}]
+
+        job = DataValidationJob(region_code='US_VA',
+                                validation=SamenessDataValidationCheck(
+                                    validation_type=ValidationCheckType.SAMENESS,
+                                    comparison_columns=['a', 'b', 'c'],
+                                    sameness_check_type=SamenessDataValidationCheckType.STRINGS,
+                                    view=BigQueryView(dataset_id='my_dataset',
+                                                      view_id='test_view',
+                                                      view_query_template='select * from literally_anything')
+                                ))
+        result = SamenessValidationChecker.run_check(job)
+
+        self.assertEqual(result,
+                         DataValidationJobResult(validation_job=job, was_successful=True, failure_description=None))
+
+        query_str, _ = self.mock_client.run_query_async.call_args[0]
+        self.assertEqual(
+            "SELECT COUNT(*) AS num_rows, "
+            "COUNTIF(NOT (IFNULL(CAST(`a` AS STRING), 'EMPTY_STRING_VALUE') = "
+            "IFNULL(CAST(`b` AS STRING), 'EMPTY_STRING_VALUE') AND "
+            "IFNULL(CAST(`a` AS STRING), 'EMPTY_STRING_VALUE') = "
+            "IFNULL(CAST(`c` AS STRING), 'EMPTY_STRING_VALUE'))) AS num_errors "
+            f"FROM ({job.query_str()})",
+            query_str)
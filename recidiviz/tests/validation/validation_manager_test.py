@@ -21,16 +21,18 @@ from typing import List
 from unittest import TestCase
 
 from flask import Flask
-from mock import patch, call
+from mock import patch, call, MagicMock
 
 from recidiviz.big_query.big_query_view import BigQueryView
 from recidiviz.big_query.view_update_manager import BigQueryViewNamespace
 from recidiviz.tests.utils.matchers import UnorderedCollection
 from recidiviz.utils.environment import GaeEnvironment
 from recidiviz.validation.checks.existence_check import ExistenceDataValidationCheck
+from recidiviz.validation.checks.sameness_check import SamenessDataValidationCheck
 from recidiviz.validation.configured_validations import get_all_validations, get_validation_region_configs, \
     get_validation_global_config
-from recidiviz.validation.validation_manager import validation_manager_blueprint, _fetch_validation_jobs_to_perform
+from recidiviz.validation.validation_manager import validation_manager_blueprint, _fetch_validation_jobs_to_perform, \
+    _batch_jobs_by_query, _run_job_batch
 from recidiviz.validation.validation_models import DataValidationJob, DataValidationJobResult
 from recidiviz.calculator.query.county import view_config as county_view_config
 from recidiviz.calculator.query.state import view_config as state_view_config
@@ -88,12 +90,13 @@ class TestHandleRequest(TestCase):
         self.metadata_patcher.stop()
 
     @patch("recidiviz.validation.validation_manager._emit_failures")
-    @patch("recidiviz.validation.validation_manager._run_job")
+    @patch("recidiviz.validation.validation_manager._run_job_batch")
     @patch("recidiviz.validation.validation_manager._fetch_validation_jobs_to_perform")
-    def test_handle_request_happy_path_no_failures(self, mock_fetch_validations, mock_run_job, mock_emit_failures):
+    def test_handle_request_happy_path_no_failures(
+            self, mock_fetch_validations, mock_run_job_batch, mock_emit_failures):
         mock_fetch_validations.return_value = self._TEST_VALIDATIONS
-        mock_run_job.return_value = DataValidationJobResult(
-            validation_job=self._TEST_VALIDATIONS[0], was_successful=True, failure_description=None)
+        mock_run_job_batch.return_value = ([DataValidationJobResult(
+            validation_job=self._TEST_VALIDATIONS[0], was_successful=True, failure_description=None)], [])
 
         headers = {'X-Appengine-Cron': 'test-cron'}
         response = self.client.get('/validate', headers=headers)
@@ -101,27 +104,27 @@ class TestHandleRequest(TestCase):
         self.assertEqual(200, response.status_code)
         self.assertEqual(_API_RESPONSE_IF_NO_FAILURES, response.get_data().decode())
 
-        self.assertEqual(4, mock_run_job.call_count)
+        self.assertEqual(4, mock_run_job_batch.call_count)
         for job in self._TEST_VALIDATIONS:
-            mock_run_job.assert_any_call(job)
+            mock_run_job_batch.assert_any_call([job])
 
         mock_emit_failures.assert_not_called()
 
     @patch("recidiviz.validation.validation_manager._emit_failures")
-    @patch("recidiviz.validation.validation_manager._run_job")
+    @patch("recidiviz.validation.validation_manager._run_job_batch")
     @patch("recidiviz.validation.validation_manager._fetch_validation_jobs_to_perform")
     def test_handle_request_with_job_failures_and_validation_failures(
-            self, mock_fetch_validations, mock_run_job, mock_emit_failures):
+            self, mock_fetch_validations, mock_run_job_batch, mock_emit_failures):
         mock_fetch_validations.return_value = self._TEST_VALIDATIONS
         first_failure = DataValidationJobResult(
             validation_job=self._TEST_VALIDATIONS[1], was_successful=False, failure_description='Oh no')
         second_failure = DataValidationJobResult(
             validation_job=self._TEST_VALIDATIONS[2], was_successful=False, failure_description='How awful')
-        mock_run_job.side_effect = [
-            DataValidationJobResult(
-                validation_job=self._TEST_VALIDATIONS[0], was_successful=True, failure_description=None),
-            first_failure,
-            second_failure,
+        mock_run_job_batch.side_effect = [
+            ([DataValidationJobResult(
+                validation_job=self._TEST_VALIDATIONS[0], was_successful=True, failure_description=None)], []),
+            ([first_failure], []),
+            ([second_failure], []),
             ValueError('Job failed to run!')
         ]
         headers = {'X-Appengine-Cron': 'test-cron'}
@@ -130,30 +133,31 @@ class TestHandleRequest(TestCase):
         self.assertEqual(200, response.status_code)
         self.assertNotEqual(_API_RESPONSE_IF_NO_FAILURES, response.get_data().decode())
 
-        self.assertEqual(4, mock_run_job.call_count)
+        self.assertEqual(4, mock_run_job_batch.call_count)
         for job in self._TEST_VALIDATIONS:
-            mock_run_job.assert_any_call(job)
+            mock_run_job_batch.assert_any_call([job])
 
         mock_emit_failures.assert_called_with(UnorderedCollection([self._TEST_VALIDATIONS[3]]),
                                               UnorderedCollection([first_failure, second_failure]))
 
     @patch("recidiviz.validation.validation_manager._emit_failures")
-    @patch("recidiviz.validation.validation_manager._run_job")
+    @patch("recidiviz.validation.validation_manager._run_job_batch")
     @patch("recidiviz.validation.validation_manager._fetch_validation_jobs_to_perform")
-    def test_handle_request_happy_path_some_failures(self, mock_fetch_validations, mock_run_job, mock_emit_failures):
+    def test_handle_request_happy_path_some_failures(
+            self, mock_fetch_validations, mock_run_job_batch, mock_emit_failures):
         mock_fetch_validations.return_value = self._TEST_VALIDATIONS
 
         first_failure = DataValidationJobResult(
             validation_job=self._TEST_VALIDATIONS[1], was_successful=False, failure_description='Oh no')
         second_failure = DataValidationJobResult(
             validation_job=self._TEST_VALIDATIONS[2], was_successful=False, failure_description='How awful')
-        mock_run_job.side_effect = [
-            DataValidationJobResult(
-                validation_job=self._TEST_VALIDATIONS[0], was_successful=True, failure_description=None),
-            first_failure,
-            second_failure,
-            DataValidationJobResult(
-                validation_job=self._TEST_VALIDATIONS[3], was_successful=True, failure_description=None),
+        mock_run_job_batch.side_effect = [
+            ([DataValidationJobResult(
+                validation_job=self._TEST_VALIDATIONS[0], was_successful=True, failure_description=None)], []),
+            ([first_failure], []),
+            ([second_failure], []),
+            ([DataValidationJobResult(
+                validation_job=self._TEST_VALIDATIONS[3], was_successful=True, failure_description=None)], []),
         ]
 
         headers = {'X-Appengine-Cron': 'test-cron'}
@@ -162,18 +166,18 @@ class TestHandleRequest(TestCase):
         self.assertEqual(200, response.status_code)
         self.assertNotEqual(_API_RESPONSE_IF_NO_FAILURES, response.get_data().decode())
 
-        self.assertEqual(4, mock_run_job.call_count)
+        self.assertEqual(4, mock_run_job_batch.call_count)
         for job in self._TEST_VALIDATIONS:
-            mock_run_job.assert_any_call(job)
+            mock_run_job_batch.assert_any_call([job])
 
         mock_emit_failures.assert_called_with([], UnorderedCollection([first_failure, second_failure]))
 
     @patch("recidiviz.validation.validation_manager._emit_failures")
-    @patch("recidiviz.validation.validation_manager._run_job")
+    @patch("recidiviz.validation.validation_manager._run_job_batch")
     @patch("recidiviz.validation.validation_manager._fetch_validation_jobs_to_perform")
     def test_handle_request_happy_path_nothing_configured(self,
                                                           mock_fetch_validations,
-                                                          mock_run_job,
+                                                          mock_run_job_batch,
                                                           mock_emit_failures):
         mock_fetch_validations.return_value = []
 
@@ -183,16 +187,16 @@ class TestHandleRequest(TestCase):
         self.assertEqual(200, response.status_code)
         self.assertEqual(_API_RESPONSE_IF_NO_FAILURES, response.get_data().decode())
 
-        mock_run_job.assert_not_called()
+        mock_run_job_batch.assert_not_called()
         mock_emit_failures.assert_not_called()
 
     @patch("recidiviz.big_query.view_update_manager.create_dataset_and_update_views_for_view_builders")
     @patch("recidiviz.validation.validation_manager._emit_failures")
-    @patch("recidiviz.validation.validation_manager._run_job")
+    @patch("recidiviz.validation.validation_manager._run_job_batch")
     @patch("recidiviz.validation.validation_manager._fetch_validation_jobs_to_perform")
     def test_handle_request_happy_path_should_update_views(self,
                                                            mock_fetch_validations,
-                                                           mock_run_job,
+                                                           mock_run_job_batch,
                                                            mock_emit_failures,
                                                            mock_update_views):
         mock_fetch_validations.return_value = []
@@ -203,7 +207,7 @@ class TestHandleRequest(TestCase):
         self.assertEqual(200, response.status_code)
         self.assertEqual(_API_RESPONSE_IF_NO_FAILURES, response.get_data().decode())
 
-        mock_run_job.assert_not_called()
+        mock_run_job_batch.assert_not_called()
         mock_emit_failures.assert_not_called()
 
         self.maxDiff = None
@@ -308,3 +312,96 @@ class TestFetchValidations(TestCase):
         validation_views_not_in_view_config = views_in_validations.difference(view_in_config)
 
         self.assertEqual(set(), validation_views_not_in_view_config)
+
+
+class TestRunJobBatch(TestCase):
+    """Tests the batching of validation jobs into single queries."""
+
+    def setUp(self) -> None:
+        self.metadata_patcher = patch('recidiviz.utils.metadata.project_id')
+        self.mock_project_id_fn = self.metadata_patcher.start()
+        self.mock_project_id_fn.return_value = 'recidiviz-456'
+
+        self.client_patcher = patch('recidiviz.validation.validation_manager.BigQueryClientImpl')
+        self.mock_client = self.client_patcher.start().return_value
+
+        self.view = BigQueryView(dataset_id='my_dataset',
+                                 view_id='test_1',
+                                 view_query_template='select * from literally_anything')
+        self.existence_job = DataValidationJob(region_code='US_UT',
+                                               validation=ExistenceDataValidationCheck(view=self.view))
+        self.sameness_job = DataValidationJob(region_code='US_UT',
+                                              validation=SamenessDataValidationCheck(
+                                                  view=self.view,
+                                                  comparison_columns=['a', 'b'],
+                                                  max_allowed_error=0.1))
+
+    def tearDown(self):
+        self.client_patcher.stop()
+        self.metadata_patcher.stop()
+
+    def test_batch_jobs_by_query(self):
+        other_region_job = DataValidationJob(region_code='US_VA',
+                                             validation=ExistenceDataValidationCheck(view=self.view))
+
+        self.assertCountEqual([[self.existence_job, self.sameness_job], [other_region_job]],
+                              _batch_jobs_by_query([self.existence_job, other_region_job, self.sameness_job]))
+
+    def test_run_job_batch_single_query(self):
+        query_job = MagicMock()
+        query_job.__iter__.return_value = [{
+            'job_0_invalid_rows': 3,
+            'job_1_num_failed_rows': 0,
+            'job_1_num_rows_with_null_values': 0,
+            'job_1_highest_error': 0.05,
+        }]
+        query_job.total_bytes_processed = 1024
+        self.mock_client.run_query_async.return_value = query_job
+
+        results, failed_to_run_jobs = _run_job_batch([self.existence_job, self.sameness_job])
+
+        self.mock_client.run_query_async.assert_called_once()
+        query_str, _ = self.mock_client.run_query_async.call_args[0]
+        self.assertIn('COUNT(*) AS job_0_invalid_rows', query_str)
+        self.assertIn('AS job_1_num_failed_rows', query_str)
+        self.assertIn(self.existence_job.query_str(), query_str)
+
+        self.assertEqual([
+            DataValidationJobResult(validation_job=self.existence_job,
+                                    was_successful=False,
+                                    failure_description='Found 3 invalid rows, though 0 were expected'),
+            DataValidationJobResult(validation_job=self.sameness_job,
+                                    was_successful=True,
+                                    failure_description=None),
+        ], results)
+        self.assertEqual([], failed_to_run_jobs)
+
+    def test_run_job_batch_query_fails_falls_back_to_individual_queries(self):
+        existence_query_job = MagicMock()
+        existence_query_job.__iter__.return_value = [{'invalid_rows': 0}]
+        existence_query_job.total_bytes_processed = 2048
+        self.mock_client.run_query_async.side_effect = [
+            ValueError('Unrecognized name: b'),
+            existence_query_job,
+            ValueError('Unrecognized name: b'),
+        ]
+
+        with patch('recidiviz.validation.validation_manager._record_bytes_processed') as mock_record_bytes_processed:
+            results, failed_to_run_jobs = _run_job_batch([self.existence_job, self.sameness_job])
+
+        self.assertEqual(3, self.mock_client.run_query_async.call_count)
+        mock_record_bytes_processed.assert_called_once_with([self.existence_job], 2048)
+        self.assertEqual([
+            DataValidationJobResult(validation_job=self.existence_job,
+                                    was_successful=True,
+                                    failure_description=None),
+        ], results)
+        self.assertEqual([self.sameness_job], failed_to_run_jobs)
+
+    def test_run_job_batch_single_job_query_fails(self):
+        self.mock_client.run_query_async.side_effect = ValueError('Unrecognized name: b')
+
+        with self.assertRaises(ValueError):
+            _run_job_batch([self.sameness_job])
+
+        self.mock_client.run_query_async.assert_called_once()
@@ -52,6 +52,12 @@ Examples:
     python -m recidiviz.tools.run_calculation_pipelines.py --pipeline incarceration --job_name incarceration-example \
     --region us-central1 --include_race False --save_as_template --calculation_month_count 36
 
+    python -m recidiviz.tools.run_calculation_pipelines.py --pipeline combined --job_name combined-example \
+    --metric_types INCARCERATION_POPULATION SUPERVISION_POPULATION
+
+The combined pipeline hydrates each person's entities once and produces the metrics of all of the other pipelines,
+writing them to the same output tables.
+
 You must also include any arguments required by the given pipeline.
 """
 from __future__ import absolute_import
@@ -60,6 +66,8 @@ import logging
 import sys
 import argparse
 
+from recidiviz.calculator.pipeline.combined import \
+    pipeline as combined_pipeline
 from recidiviz.calculator.pipeline.incarceration import \
     pipeline as incarceration_pipeline
 from recidiviz.calculator.pipeline.program import \
@@ -74,7 +82,8 @@ PIPELINE_MODULES = {
     'incarceration': incarceration_pipeline,
     'recidivism': recidivism_pipeline,
     'supervision': supervision_pipeline,
-    'program': program_pipeline
+    'program': program_pipeline,
+    'combined': combined_pipeline
 }
 
 
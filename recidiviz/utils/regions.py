@@ -81,6 +81,10 @@ class Region:
         names_file: (string) Optional filename of names file for this region
         is_stoppable: (string) Whether or not this region is stoppable via the
             cron job /scraper/stop.
+        max_concurrent_requests: (int) Optional maximum number of requests
+            this region's scraper may have in flight at once.
+        min_request_interval_seconds: (float) Optional minimum number of
+            seconds between the starts of two requests to the same host.
     """
 
     region_code: str = attr.ib()
@@ -99,6 +103,8 @@ class Region:
     should_proxy: Optional[bool] = attr.ib(default=False)
     is_stoppable: Optional[bool] = attr.ib(default=False)
     is_direct_ingest: Optional[bool] = attr.ib(default=False)
+    max_concurrent_requests: Optional[int] = attr.ib(default=None)
+    min_request_interval_seconds: Optional[float] = attr.ib(default=None)
 
     # TODO(3162): Once SQL preprocessing flow is enabled for all direct ingest regions, delete these configs
     raw_vs_ingest_file_name_differentiation_enabled_env = attr.ib(default=None)
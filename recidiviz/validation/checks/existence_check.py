@@ -18,6 +18,8 @@
 """Models an existence check, which identifies a validation issue by observing that there is any row returned
 in a given validation result set."""
 
+from typing import List, Any, Mapping
+
 import attr
 
 from recidiviz.big_query.big_query_client import BigQueryClientImpl
@@ -49,15 +51,19 @@ class ExistenceValidationChecker(ValidationChecker[ExistenceDataValidationCheck]
 
     @classmethod
     def run_check(cls, validation_job: DataValidationJob[ExistenceDataValidationCheck]) -> DataValidationJobResult:
-        was_successful = True
-        invalid_rows = 0
-        query_job = BigQueryClientImpl().run_query_async(validation_job.query_str(), [])
-
-        # We need to iterate over the collection to initialize the query result set
-        for _ in query_job:
-            invalid_rows += 1
-            if validation_job.validation.num_allowed_rows < invalid_rows:
-                was_successful = False
+        return cls._run_check_in_query(BigQueryClientImpl(), validation_job)
+
+    @classmethod
+    def aggregate_columns(cls, validation: ExistenceDataValidationCheck, column_prefix: str) -> List[str]:
+        return [f'COUNT(*) AS {column_prefix}invalid_rows']
+
+    @classmethod
+    def result_from_aggregate_row(cls,
+                                  validation_job: DataValidationJob[ExistenceDataValidationCheck],
+                                  row: Mapping[str, Any],
+                                  column_prefix: str) -> DataValidationJobResult:
+        invalid_rows = row[f'{column_prefix}invalid_rows']
+        was_successful = invalid_rows <= validation_job.validation.num_allowed_rows
 
         description = f'Found {invalid_rows} invalid rows, though 0 were expected' if not was_successful else None
         return DataValidationJobResult(validation_job=validation_job,
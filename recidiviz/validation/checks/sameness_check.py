@@ -18,7 +18,7 @@
 """Models a sameness check, which identifies a validation issue by observing that values in a configured set of
 columns are not the same."""
 from enum import Enum
-from typing import List, Set
+from typing import List, Any, Mapping
 
 import attr
 
@@ -78,84 +78,100 @@ class SamenessValidationChecker(ValidationChecker[SamenessDataValidationCheck]):
 
     @classmethod
     def run_check(cls, validation_job: DataValidationJob[SamenessDataValidationCheck]) -> DataValidationJobResult:
-        comparison_columns = validation_job.validation.comparison_columns
-        max_allowed_error = validation_job.validation.max_allowed_error
+        return cls._run_check_in_query(BigQueryClientImpl(), validation_job)
 
-        query_job = BigQueryClientImpl().run_query_async(validation_job.query_str(), [])
+    @classmethod
+    def aggregate_columns(cls, validation: SamenessDataValidationCheck, column_prefix: str) -> List[str]:
+        if validation.sameness_check_type == SamenessDataValidationCheckType.NUMBERS:
+            return cls._aggregate_columns_for_numbers(validation, column_prefix)
+        if validation.sameness_check_type == SamenessDataValidationCheckType.STRINGS:
+            return cls._aggregate_columns_for_strings(validation, column_prefix)
 
-        if validation_job.validation.sameness_check_type == SamenessDataValidationCheckType.NUMBERS:
-            return SamenessValidationChecker.run_check_for_numbers(
-                validation_job, comparison_columns, max_allowed_error, query_job)
-        if validation_job.validation.sameness_check_type == SamenessDataValidationCheckType.STRINGS:
-            return SamenessValidationChecker.run_check_for_strings(
-                validation_job, comparison_columns, max_allowed_error, query_job)
+        raise ValueError(f"Unexpected sameness_check_type of {validation.sameness_check_type}.")
 
-        raise ValueError(f"Unexpected sameness_check_type of {validation_job.validation.sameness_check_type}.")
+    @classmethod
+    def result_from_aggregate_row(cls,
+                                  validation_job: DataValidationJob[SamenessDataValidationCheck],
+                                  row: Mapping[str, Any],
+                                  column_prefix: str) -> DataValidationJobResult:
+        sameness_check_type = validation_job.validation.sameness_check_type
+        if sameness_check_type == SamenessDataValidationCheckType.NUMBERS:
+            return cls._result_for_numbers(validation_job, row, column_prefix)
+        if sameness_check_type == SamenessDataValidationCheckType.STRINGS:
+            return cls._result_for_strings(validation_job, row, column_prefix)
+
+        raise ValueError(f"Unexpected sameness_check_type of {sameness_check_type}.")
 
     @staticmethod
-    def run_check_for_numbers(validation_job, comparison_columns, max_allowed_error, query_job) -> \
-            DataValidationJobResult:
-        """Performs the validation check for sameness check types, where the values being compares are numbers (either
-        ints or floats)."""
-        was_successful = True
-        failed_rows = []
-
-        for row in query_job:
-            comparison_values = [row[column] for column in comparison_columns]
-            max_value = max(comparison_values)
-            min_value = min(comparison_values)
-
-            # If max and min are 0, then there's no issue
-            if max_value == 0 and min_value == 0:
-                break
-
-            # If comparing negative values to 0, swap min and max
-            if max_value == 0 and min_value < 0:
-                max_value, min_value = min_value, max_value
-
-            error = (max_value - min_value) / max_value
-            if error > max_allowed_error:
-                was_successful = False
-                failed_rows.append(error)
-
-        highest_error = round(max(failed_rows), 4) if failed_rows else None
-
-        description = f'{len(failed_rows)} row(s) had unacceptable margins of error. The acceptable ' \
-                      f'margin of error is only {max_allowed_error}, but the validation returned rows with errors ' \
-                      f'as high as {highest_error}.' \
-            if not was_successful else None
+    def _aggregate_columns_for_numbers(validation: SamenessDataValidationCheck, column_prefix: str) -> List[str]:
+        """Computes the relative error between the largest and smallest of the compared numbers (either ints or
+        floats) in each row, counting the rows whose error is above the allowed margin of error. Rows with a null value
+        in any of the compared columns have no error, and are counted as failures."""
+        columns = ', '.join(f'`{column}`' for column in validation.comparison_columns)
+        has_null_value = ' OR '.join(f'`{column}` IS NULL' for column in validation.comparison_columns)
+        max_value = f'GREATEST({columns})'
+        min_value = f'LEAST({columns})'
+
+        # If max and min are 0, then there's no issue. If comparing negative values to 0, the error is measured
+        # relative to the negative value.
+        error = f'(CASE WHEN {max_value} = 0 AND {min_value} = 0 THEN 0.0 ' \
+                f'WHEN {max_value} = 0 AND {min_value} < 0 THEN ({min_value} - {max_value}) / {min_value} ' \
+                f'ELSE ({max_value} - {min_value}) / {max_value} END)'
+
+        return [
+            f'COUNTIF({has_null_value} OR {error} > {validation.max_allowed_error}) AS {column_prefix}num_failed_rows',
+            f'COUNTIF({has_null_value}) AS {column_prefix}num_rows_with_null_values',
+            f'MAX({error}) AS {column_prefix}highest_error',
+        ]
+
+    @staticmethod
+    def _aggregate_columns_for_strings(validation: SamenessDataValidationCheck, column_prefix: str) -> List[str]:
+        """Counts the rows where the compared values are not all the same string. Null values are treated as the same
+        as each other, and non-string values are compared by their string representation."""
+        normalized_values = [f"IFNULL(CAST(`{column}` AS STRING), '{EMPTY_STRING_VALUE}')"
+                             for column in validation.comparison_columns]
+        all_values_match = ' AND '.join(f'{normalized_values[0]} = {value}' for value in normalized_values[1:])
+
+        return [
+            f'COUNT(*) AS {column_prefix}num_rows',
+            f'COUNTIF(NOT ({all_values_match})) AS {column_prefix}num_errors',
+        ]
+
+    @staticmethod
+    def _result_for_numbers(validation_job: DataValidationJob[SamenessDataValidationCheck],
+                            row: Mapping[str, Any],
+                            column_prefix: str) -> DataValidationJobResult:
+        max_allowed_error = validation_job.validation.max_allowed_error
+        num_failed_rows = row[f'{column_prefix}num_failed_rows']
+        num_rows_with_null_values = row[f'{column_prefix}num_rows_with_null_values']
+        was_successful = num_failed_rows == 0
+
+        description = None
+        if not was_successful:
+            description = f'{num_failed_rows} row(s) had unacceptable margins of error. The acceptable ' \
+                          f'margin of error is only {max_allowed_error}'
+
+            if num_failed_rows > num_rows_with_null_values:
+                highest_error = round(row[f'{column_prefix}highest_error'], 4)
+                description += f', but the validation returned rows with errors as high as {highest_error}.'
+            else:
+                description += '.'
+
+            if num_rows_with_null_values:
+                description += f' {num_rows_with_null_values} of these row(s) had null values in the compared ' \
+                               f'columns.'
+
         return DataValidationJobResult(validation_job=validation_job,
                                        was_successful=was_successful,
                                        failure_description=description)
 
     @staticmethod
-    def run_check_for_strings(validation_job, comparison_columns, max_allowed_error, query_job) -> \
-            DataValidationJobResult:
-        """Performs the validation check for sameness check types, where the values being compared are strings."""
-        num_errors = 0
-        num_rows = 0
-
-        for row in query_job:
-            num_rows += 1
-            unique_string_values: Set[str] = set()
-
-            for column in comparison_columns:
-                value = row[column]
-                if value is None:
-                    unique_string_values.add(EMPTY_STRING_VALUE)
-                elif isinstance(value, str):
-                    unique_string_values.add(value)
-                else:
-                    # The value is not a string.
-                    num_errors += 1
-                    continue
-
-            # If there is only one unique string value in the row, then there's no issue
-            if len(unique_string_values) == 1:
-                continue
-
-            # Increment the number of errors
-            num_errors += 1
+    def _result_for_strings(validation_job: DataValidationJob[SamenessDataValidationCheck],
+                            row: Mapping[str, Any],
+                            column_prefix: str) -> DataValidationJobResult:
+        max_allowed_error = validation_job.validation.max_allowed_error
+        num_rows = row[f'{column_prefix}num_rows']
+        num_errors = row[f'{column_prefix}num_errors']
 
         error_rate = (num_errors / num_rows) if num_rows > 0 else 0.0
         was_successful = error_rate <= max_allowed_error
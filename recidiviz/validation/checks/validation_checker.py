@@ -18,14 +18,51 @@
 """An interface for validation checkers."""
 
 import abc
-from typing import Generic
+from typing import Generic, List, Any, Mapping
 
+from recidiviz.big_query.big_query_client import BigQueryClient
 from recidiviz.validation.validation_models import DataValidationType, DataValidationJob, DataValidationJobResult
 
 
 class ValidationChecker(Generic[DataValidationType]):
-    """Defines the interface for performing a particular kind of check."""
+    """Defines the interface for performing a particular kind of check.
+
+    Checks are evaluated in BigQuery: each checker provides aggregate expressions over the rows of the validation view
+    for a single region, so that only a single row of summary values is returned for each check. This allows several
+    checks against the same view and region to be evaluated together in one query.
+    """
 
     @abc.abstractmethod
     def run_check(self, validation_job: DataValidationJob[DataValidationType]) -> DataValidationJobResult:
         pass
+
+    @classmethod
+    @abc.abstractmethod
+    def aggregate_columns(cls, validation: DataValidationType, column_prefix: str) -> List[str]:
+        """Returns the SQL select expressions that aggregate the rows of the validation view into the values needed to
+        evaluate the given check. Each expression is aliased with a column name that starts with |column_prefix|."""
+
+    @classmethod
+    @abc.abstractmethod
+    def result_from_aggregate_row(cls,
+                                  validation_job: DataValidationJob[DataValidationType],
+                                  row: Mapping[str, Any],
+                                  column_prefix: str) -> DataValidationJobResult:
+        """Evaluates the given job using the values produced by the expressions from aggregate_columns in |row|."""
+
+    @classmethod
+    def _run_check_in_query(cls,
+                            bq_client: BigQueryClient,
+                            validation_job: DataValidationJob[DataValidationType]) -> DataValidationJobResult:
+        """Runs the aggregate query for a single validation job and evaluates the result."""
+        query_str = aggregate_query_str(validation_job, cls.aggregate_columns(validation_job.validation, ''))
+        query_job = bq_client.run_query_async(query_str, [])
+        row = next(iter(query_job))
+
+        return cls.result_from_aggregate_row(validation_job, row, '')
+
+
+def aggregate_query_str(validation_job: DataValidationJob, aggregate_columns: List[str]) -> str:
+    """Returns a query that computes the given aggregate columns over the validation view rows for the job's region."""
+    return 'SELECT {columns} FROM ({query})'.format(columns=', '.join(aggregate_columns),
+                                                     query=validation_job.query_str())
@@ -16,22 +16,25 @@
 # =============================================================================
 
 """Contains the API for automated data validation."""
+from collections import defaultdict
 from concurrent import futures
 from http import HTTPStatus
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
 from opencensus.stats import aggregation, measure, view
 
 from flask import Blueprint, request
 
 from recidiviz.big_query import view_update_manager
+from recidiviz.big_query.big_query_client import BigQueryClientImpl
 from recidiviz.utils import monitoring
 from recidiviz.utils.auth import authenticate_request
 from recidiviz.utils.environment import GCP_PROJECT_STAGING
 from recidiviz.utils.metadata import local_project_id_override
 from recidiviz.utils.params import get_bool_param_value
 from recidiviz.validation.checks.check_resolver import checker_for_validation
+from recidiviz.validation.checks.validation_checker import aggregate_query_str, ValidationChecker
 
 from recidiviz.validation.configured_validations import get_all_validations, \
     get_validation_region_configs, get_validation_global_config
@@ -58,7 +61,17 @@ failed_validations_view = view.View("recidiviz/validation/num_failures",
                                     m_failed_validations,
                                     aggregation.SumAggregation())
 
-monitoring.register_views([failed_validations_view, failed_to_run_validations_view])
+m_validation_bytes_processed = measure.MeasureInt(
+    "validation/bytes_processed", "The number of bytes processed by the queries for validations", "By")
+
+validation_bytes_processed_view = view.View("recidiviz/validation/bytes_processed",
+                                            "The sum of bytes processed by validation queries",
+                                            [monitoring.TagKey.REGION,
+                                             monitoring.TagKey.VALIDATION_VIEW_ID],
+                                            m_validation_bytes_processed,
+                                            aggregation.SumAggregation())
+
+monitoring.register_views([failed_validations_view, failed_to_run_validations_view, validation_bytes_processed_view])
 
 
 validation_manager_blueprint = Blueprint('validation_manager', __name__)
@@ -82,24 +95,33 @@ def execute_validation(should_update_views: bool) -> List[DataValidationJobResul
 
     # Fetch collection of validation jobs to perform
     validation_jobs = _fetch_validation_jobs_to_perform()
-    logging.info('Performing a total of %s validation jobs...', len(validation_jobs))
+    job_batches = _batch_jobs_by_query(validation_jobs)
+    logging.info('Performing a total of %s validation jobs in %s queries...', len(validation_jobs), len(job_batches))
 
     # Perform all validations and track failures
     failed_to_run_validations: List[DataValidationJob] = []
     failed_validations: List[DataValidationJobResult] = []
     with futures.ThreadPoolExecutor() as executor:
-        future_to_jobs = {executor.submit(_run_job, job): job for job in validation_jobs}
+        future_to_job_batches = {executor.submit(_run_job_batch, job_batch): job_batch for job_batch in job_batches}
 
-        for future in futures.as_completed(future_to_jobs):
-            job = future_to_jobs[future]
+        for future in futures.as_completed(future_to_job_batches):
+            job_batch = future_to_job_batches[future]
             try:
-                result = future.result()
+                results, failed_to_run_jobs = future.result()
+            except Exception as e:
+                for job in job_batch:
+                    logging.error('Failed to execute asynchronous query for validation job [%s] due to error: %s',
+                                  job, e)
+                failed_to_run_validations.extend(job_batch)
+                continue
+
+            failed_to_run_validations.extend(failed_to_run_jobs)
+
+            for result in results:
                 if not result.was_successful:
                     failed_validations.append(result)
-                logging.info('Finished job [%s] for region [%s]', job.validation.validation_name, job.region_code)
-            except Exception as e:
-                logging.error('Failed to execute asynchronous query for validation job [%s] due to error: %s', job, e)
-                failed_to_run_validations.append(job)
+                logging.info('Finished job [%s] for region [%s]',
+                             result.validation_job.validation.validation_name, result.validation_job.region_code)
 
     if failed_validations or failed_to_run_validations:
         logging.error('Found a total of [%s] failures, with [%s] failing to run entirely. Emitting results...',
@@ -113,9 +135,85 @@ def execute_validation(should_update_views: bool) -> List[DataValidationJobResul
     return failed_validations
 
 
-def _run_job(job: DataValidationJob) -> DataValidationJobResult:
-    validation_checker = checker_for_validation(job)
-    return validation_checker.run_check(job)
+def _batch_jobs_by_query(validation_jobs: List[DataValidationJob]) -> List[List[DataValidationJob]]:
+    """Groups together the validation jobs that read the same rows of the same validation view, so that they can be
+    evaluated in a single query."""
+    jobs_by_query: Dict[str, List[DataValidationJob]] = defaultdict(list)
+    for job in validation_jobs:
+        jobs_by_query[job.query_str()].append(job)
+    return list(jobs_by_query.values())
+
+
+def _run_job_batch(job_batch: List[DataValidationJob]) \
+        -> Tuple[List[DataValidationJobResult], List[DataValidationJob]]:
+    """Evaluates all of the given jobs, which must all read the same validation view rows, in a single query that
+    returns only the aggregate values needed for each check.
+
+    If the query for a batch of several jobs fails, e.g. because one of the checks references a column that does not
+    exist, each job is run in its own query instead so that only the broken checks fail to run.
+
+    Returns the results of the jobs that ran, and the jobs that failed to run.
+    """
+    bq_client = BigQueryClientImpl()
+    checkers = [checker_for_validation(job) for job in job_batch]
+    column_prefixes = [f'job_{i}_' for i in range(len(job_batch))]
+
+    aggregate_columns = [column
+                         for job, checker, column_prefix in zip(job_batch, checkers, column_prefixes)
+                         for column in checker.aggregate_columns(job.validation, column_prefix)]
+
+    try:
+        query_job = bq_client.run_query_async(aggregate_query_str(job_batch[0], aggregate_columns), [])
+        row = next(iter(query_job))
+    except Exception as e:
+        if len(job_batch) == 1:
+            raise
+        logging.warning('Batched query for [%s] validation jobs failed due to error: %s. Running each job on its own.',
+                        len(job_batch), e)
+        return _run_jobs_individually(bq_client, job_batch, checkers)
+
+    _record_bytes_processed(job_batch, query_job.total_bytes_processed)
+
+    return [checker.result_from_aggregate_row(job, row, column_prefix)
+            for job, checker, column_prefix in zip(job_batch, checkers, column_prefixes)], []
+
+
+def _run_jobs_individually(bq_client: BigQueryClientImpl,
+                           jobs: List[DataValidationJob],
+                           checkers: List[ValidationChecker]) \
+        -> Tuple[List[DataValidationJobResult], List[DataValidationJob]]:
+    """Runs each of the given jobs in its own query, returning the results of the jobs that ran and the jobs that
+    failed to run."""
+    results = []
+    failed_to_run_jobs = []
+    for job, checker in zip(jobs, checkers):
+        try:
+            query_job = bq_client.run_query_async(
+                aggregate_query_str(job, checker.aggregate_columns(job.validation, '')), [])
+            row = next(iter(query_job))
+            _record_bytes_processed([job], query_job.total_bytes_processed)
+            results.append(checker.result_from_aggregate_row(job, row, ''))
+        except Exception as e:
+            logging.error('Failed to execute query for validation job [%s] due to error: %s', job, e)
+            failed_to_run_jobs.append(job)
+    return results, failed_to_run_jobs
+
+
+def _record_bytes_processed(job_batch: List[DataValidationJob], bytes_processed: Optional[int]) -> None:
+    job = job_batch[0]
+    logging.info('Validation query for view [%s] in region [%s] processed [%s] bytes for validations: %s',
+                 job.validation.view.view_id, job.region_code, bytes_processed,
+                 [batch_job.validation.validation_name for batch_job in job_batch])
+
+    if bytes_processed is None:
+        return
+
+    monitoring_tags = {
+        monitoring.TagKey.REGION: job.region_code,
+        monitoring.TagKey.VALIDATION_VIEW_ID: job.validation.view.view_id
+    }
+    with monitoring.measurements(monitoring_tags) as measurements:
+        measurements.measure_int_put(m_validation_bytes_processed, bytes_processed)
 
 
 def _fetch_validation_jobs_to_perform() -> List[DataValidationJob]: